@@ -0,0 +1,46 @@
+"""Indexes for hot content pipeline queries
+
+Revision ID: 0010_pipeline_indexes
+Revises: 0009_pipeline_mode
+Create Date: 2026-10-17 09:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0010_pipeline_indexes"
+down_revision: Union[str, None] = "0009_pipeline_mode"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, columns, partial WHERE clause or None) — kept in sync with
+# ContentPipelineItem.__table_args__.
+PIPELINE_INDEXES = [
+    ("ix_pipeline_items_status_created", ["status", "created_at"], None),
+    ("ix_pipeline_items_unclaimed_status_created", ["status", "created_at"], "claimed_by IS NULL"),
+    ("ix_pipeline_items_unclaimed_status_updated", ["status", "updated_at"], "claimed_by IS NULL"),
+    (
+        "ix_pipeline_items_errored_status_updated",
+        ["status", "updated_at"],
+        "last_error IS NOT NULL AND claimed_by IS NULL",
+    ),
+    ("ix_pipeline_items_claimed_at", ["claimed_at"], "claimed_by IS NOT NULL"),
+]
+
+
+def upgrade() -> None:
+    for name, columns, where in PIPELINE_INDEXES:
+        kwargs = {}
+        if where:
+            kwargs["postgresql_where"] = sa.text(where)
+            kwargs["sqlite_where"] = sa.text(where)
+        op.create_index(name, "content_pipeline_items", columns, **kwargs)
+
+
+def downgrade() -> None:
+    for name, _columns, _where in reversed(PIPELINE_INDEXES):
+        op.drop_index(name, table_name="content_pipeline_items")
@@ -0,0 +1,24 @@
+"""Index content_pipeline_items.updated_at for the overview cache probe
+
+Revision ID: 0011_pipeline_updated_at_index
+Revises: 0010_pipeline_indexes
+Create Date: 2026-10-17 11:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0011_pipeline_updated_at_index"
+down_revision: Union[str, None] = "0010_pipeline_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_pipeline_items_updated_at", "content_pipeline_items", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pipeline_items_updated_at", table_name="content_pipeline_items")
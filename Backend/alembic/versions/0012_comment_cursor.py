@@ -0,0 +1,49 @@
+"""Per-post comment cursor and unique LinkedIn comment IDs
+
+Revision ID: 0012_comment_cursor
+Revises: 0011_pipeline_updated_at_index
+Create Date: 2026-10-17 14:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0012_comment_cursor"
+down_revision: Union[str, None] = "0011_pipeline_updated_at_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("published_posts", sa.Column("comment_cursor_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("published_posts", sa.Column("comment_cursor_id", sa.String(length=128), nullable=True))
+
+    # Drop duplicate LinkedIn comments left by earlier racing polls, keeping
+    # the earliest row, so the unique index can be built.
+    op.execute(
+        """
+        DELETE FROM comments
+        WHERE linkedin_comment_id IS NOT NULL
+          AND EXISTS (
+            SELECT 1 FROM comments AS earlier
+            WHERE earlier.linkedin_comment_id = comments.linkedin_comment_id
+              AND (
+                earlier.commented_at < comments.commented_at
+                OR (
+                  earlier.commented_at = comments.commented_at
+                  AND CAST(earlier.id AS VARCHAR(36)) < CAST(comments.id AS VARCHAR(36))
+                )
+              )
+          )
+        """
+    )
+    op.create_index("ux_comments_linkedin_comment_id", "comments", ["linkedin_comment_id"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ux_comments_linkedin_comment_id", table_name="comments")
+    op.drop_column("published_posts", "comment_cursor_id")
+    op.drop_column("published_posts", "comment_cursor_at")
@@ -0,0 +1,35 @@
+"""Per-feed HTTP cache validators for conditional research ingestion
+
+Revision ID: 0013_feed_states
+Revises: 0012_comment_cursor
+Create Date: 2026-10-17 16:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0013_feed_states"
+down_revision: Union[str, None] = "0012_comment_cursor"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "feed_states",
+        sa.Column("url", sa.String(length=1024), primary_key=True),
+        sa.Column("etag", sa.String(length=512), nullable=True),
+        sa.Column("last_modified", sa.String(length=128), nullable=True),
+        sa.Column("last_status", sa.Integer(), nullable=True),
+        sa.Column("last_fetched_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_latency_ms", sa.Integer(), nullable=True),
+        sa.Column("last_bytes", sa.Integer(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("feed_states")
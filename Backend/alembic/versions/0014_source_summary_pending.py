@@ -0,0 +1,38 @@
+"""Background summarisation state for source materials
+
+Revision ID: 0014_source_summary_pending
+Revises: 0013_feed_states
+Create Date: 2026-10-17 17:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0014_source_summary_pending"
+down_revision: Union[str, None] = "0013_feed_states"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("source_materials", sa.Column("content_text", sa.Text(), nullable=True))
+    op.add_column(
+        "source_materials",
+        sa.Column("summary_pending", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+    )
+    op.create_index(
+        "ix_source_materials_summary_pending",
+        "source_materials",
+        ["created_at"],
+        postgresql_where=sa.text("summary_pending = true"),
+        sqlite_where=sa.text("summary_pending = true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_source_materials_summary_pending", table_name="source_materials")
+    op.drop_column("source_materials", "summary_pending")
+    op.drop_column("source_materials", "content_text")
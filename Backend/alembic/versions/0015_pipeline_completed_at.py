@@ -0,0 +1,36 @@
+"""Completion timestamp for pipeline cycle-time metrics
+
+Revision ID: 0015_pipeline_completed_at
+Revises: 0014_source_summary_pending
+Create Date: 2026-10-17 19:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0015_pipeline_completed_at"
+down_revision: Union[str, None] = "0014_source_summary_pending"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "content_pipeline_items",
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_pipeline_items_completed_at",
+        "content_pipeline_items",
+        ["completed_at"],
+        postgresql_where=sa.text("completed_at IS NOT NULL"),
+        sqlite_where=sa.text("completed_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pipeline_items_completed_at", table_name="content_pipeline_items")
+    op.drop_column("content_pipeline_items", "completed_at")
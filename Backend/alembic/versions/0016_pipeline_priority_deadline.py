@@ -0,0 +1,51 @@
+"""Priority and deadline scheduling for pipeline claims
+
+Revision ID: 0016_pipeline_priority_deadline
+Revises: 0015_pipeline_completed_at
+Create Date: 2026-10-17 20:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0016_pipeline_priority_deadline"
+down_revision: Union[str, None] = "0015_pipeline_completed_at"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "content_pipeline_items",
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="100"),
+    )
+    op.add_column(
+        "content_pipeline_items",
+        sa.Column("deadline_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Claims now order by (priority, deadline_at, created_at), which
+    # supersedes the (status, created_at) unclaimed index.
+    op.create_index(
+        "ix_pipeline_items_unclaimed_claim_order",
+        "content_pipeline_items",
+        ["status", "priority", "deadline_at", "created_at"],
+        postgresql_where=sa.text("claimed_by IS NULL"),
+        sqlite_where=sa.text("claimed_by IS NULL"),
+    )
+    op.drop_index("ix_pipeline_items_unclaimed_status_created", table_name="content_pipeline_items")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_pipeline_items_unclaimed_status_created",
+        "content_pipeline_items",
+        ["status", "created_at"],
+        postgresql_where=sa.text("claimed_by IS NULL"),
+        sqlite_where=sa.text("claimed_by IS NULL"),
+    )
+    op.drop_index("ix_pipeline_items_unclaimed_claim_order", table_name="content_pipeline_items")
+    op.drop_column("content_pipeline_items", "deadline_at")
+    op.drop_column("content_pipeline_items", "priority")
@@ -0,0 +1,36 @@
+"""Claim fencing tokens and lease-expiry index
+
+Revision ID: 0017_pipeline_claim_leases
+Revises: 0016_pipeline_priority_deadline
+Create Date: 2026-10-17 21:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0017_pipeline_claim_leases"
+down_revision: Union[str, None] = "0016_pipeline_priority_deadline"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "content_pipeline_items",
+        sa.Column("claim_token", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_pipeline_items_claim_expires_at",
+        "content_pipeline_items",
+        ["claim_expires_at"],
+        postgresql_where=sa.text("claimed_by IS NOT NULL"),
+        sqlite_where=sa.text("claimed_by IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pipeline_items_claim_expires_at", table_name="content_pipeline_items")
+    op.drop_column("content_pipeline_items", "claim_token")
@@ -0,0 +1,64 @@
+"""Append-only pipeline transition log
+
+Revision ID: 0018_pipeline_transitions
+Revises: 0017_pipeline_claim_leases
+Create Date: 2026-10-17 22:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0018_pipeline_transitions"
+down_revision: Union[str, None] = "0017_pipeline_claim_leases"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    is_pg = bind.dialect.name == "postgresql"
+
+    # Status columns start as String and are converted to the existing
+    # pipelinestatus enum on PostgreSQL (same pattern as 0008).
+    op.create_table(
+        "pipeline_transitions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("item_id", sa.Uuid(), nullable=False),
+        sa.Column("from_status", sa.String(length=32), nullable=True),
+        sa.Column("to_status", sa.String(length=32), nullable=False),
+        sa.Column("revision_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("actor", sa.String(length=128), nullable=True),
+        sa.ForeignKeyConstraint(["item_id"], ["content_pipeline_items.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    if is_pg:
+        op.execute(
+            "ALTER TABLE pipeline_transitions "
+            "ALTER COLUMN from_status TYPE pipelinestatus USING from_status::pipelinestatus"
+        )
+        op.execute(
+            "ALTER TABLE pipeline_transitions "
+            "ALTER COLUMN to_status TYPE pipelinestatus USING to_status::pipelinestatus"
+        )
+
+    op.create_index(
+        "ix_pipeline_transitions_item_created",
+        "pipeline_transitions",
+        ["item_id", "created_at"],
+    )
+    op.create_index(
+        "ix_pipeline_transitions_created_at",
+        "pipeline_transitions",
+        ["created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pipeline_transitions_created_at", table_name="pipeline_transitions")
+    op.drop_index("ix_pipeline_transitions_item_created", table_name="pipeline_transitions")
+    op.drop_table("pipeline_transitions")
@@ -0,0 +1,63 @@
+"""Keyset pagination indexes for the list endpoints
+
+Revision ID: 0019_list_pagination_indexes
+Revises: 0018_pipeline_transitions
+Create Date: 2026-10-17 23:00:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0019_list_pagination_indexes"
+down_revision: Union[str, None] = "0018_pipeline_transitions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Posts page on their own creation time; backfill existing rows from
+    # the publish/schedule time, falling back to the draft's creation.
+    op.add_column(
+        "published_posts",
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        "UPDATE published_posts SET created_at = COALESCE("
+        "published_at, scheduled_time, "
+        "(SELECT drafts.created_at FROM drafts WHERE drafts.id = published_posts.draft_id), "
+        "CURRENT_TIMESTAMP)"
+    )
+    with op.batch_alter_table("published_posts") as batch_op:
+        batch_op.alter_column("created_at", existing_type=sa.DateTime(timezone=True), nullable=False)
+
+    op.create_index("ix_drafts_created", "drafts", ["created_at", "id"])
+    op.create_index("ix_drafts_status_created", "drafts", ["status", "created_at", "id"])
+    op.create_index("ix_published_posts_created", "published_posts", ["created_at", "id"])
+    op.create_index("ix_comments_commented", "comments", ["commented_at", "id"])
+    op.create_index(
+        "ix_comments_escalated_commented",
+        "comments",
+        ["commented_at", "id"],
+        postgresql_where=sa.text("escalated = true"),
+        sqlite_where=sa.text("escalated = true"),
+    )
+    op.create_index("ix_source_materials_created", "source_materials", ["created_at", "id"])
+    op.create_index(
+        "ix_source_materials_pillar_created", "source_materials", ["pillar_theme", "created_at", "id"],
+    )
+    op.create_index("ix_pipeline_items_created", "content_pipeline_items", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pipeline_items_created", table_name="content_pipeline_items")
+    op.drop_index("ix_source_materials_pillar_created", table_name="source_materials")
+    op.drop_index("ix_source_materials_created", table_name="source_materials")
+    op.drop_index("ix_comments_escalated_commented", table_name="comments")
+    op.drop_index("ix_comments_commented", table_name="comments")
+    op.drop_index("ix_published_posts_created", table_name="published_posts")
+    op.drop_index("ix_drafts_status_created", table_name="drafts")
+    op.drop_index("ix_drafts_created", table_name="drafts")
+    op.drop_column("published_posts", "created_at")
@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     jwt_refresh_token_expire_days: int = 7
     auth_mode: str = "jwt"  # "jwt" or "api_key" for backward compatibility
     database_url: str = backend_local_db_url()
+    db_slow_query_ms: int = 250  # statements at or over this are logged as slow
+    db_query_warn_count: int = 50  # requests/tasks running this many statements log a warning
+    metrics_worker_port: int = 0  # >0: each Celery pool process serves /metrics from this port up
     redis_url: str = "redis://localhost:6379/0"
     timezone: str = "Africa/Johannesburg"
     posting_window_start: str = "08:00"
@@ -32,21 +35,56 @@ class Settings(BaseSettings):
     escalation_follower_threshold: int = 10000
     telegram_bot_token: str | None = None
     telegram_chat_id: str | None = None
+    telegram_api_base_url: str = "https://api.telegram.org"
     kill_switch: bool = False
     llm_provider: str = "claude"
     llm_api_key: str | None = None
     llm_model: str = "claude-3-5-sonnet-latest"
     llm_mock_mode: bool = False  # Force mock mode even if API key is set
     anthropic_base_url: str = "https://api.anthropic.com/v1/messages"
+    llm_max_concurrency: int = 4
+    llm_timeout_seconds: float = 60.0
+    llm_cache_backend: str = "memory"  # memory | redis | sqlite | none
+    llm_cache_ttl_seconds: int = 86400
+    llm_cache_max_bytes: int = 32 * 1024 * 1024  # memory/sqlite; redis relies on maxmemory
+    llm_cache_max_entry_bytes: int = 256 * 1024
+    llm_cache_redis_url: str | None = None  # defaults to redis_url
+    llm_cache_sqlite_path: str | None = None  # defaults to Backend/llm_cache.db
     linkedin_api_mode: str = "manual"
     linkedin_api_token: str | None = None
     linkedin_api_base_url: str = "https://api.linkedin.com"
     linkedin_api_timeout_seconds: int = 10
     linkedin_api_retries: int = 2
     linkedin_api_page_size: int = 25
+    linkedin_api_rate_per_second: float = 5.0
+    linkedin_api_burst: int = 5
+    linkedin_poll_concurrency: int = 4
+    linkedin_organization_urn: str | None = None  # enables batched share statistics
     linkedin_mock_comments_json: str = ""
     linkedin_mock_metrics_json: str = ""
     research_feed_urls: str = ""
+    research_feed_concurrency: int = 8
+    research_feed_timeout_seconds: float = 20.0
+    research_summary_concurrency: int = 4
+    research_summary_batch_size: int = 1  # articles per LLM request
+    research_summary_max_per_run: int = 100
+    editor_review_mode: str = "full"  # full | short_circuit
+    editor_gate_workers: int = 4
+    editor_batch_size: int = 20
+    editor_review_processes: int = 0  # >1 reviews a batch across a process pool
+    pipeline_handoff_enabled: bool = False  # enqueue the next stage's task on each transition
+    claim_ttl_seconds: int = 1800  # claim lease; heartbeats renew it during slow work
+    claim_heartbeat_seconds: int = 0  # 0 = a third of the lease
+    claim_recovery_interval_seconds: int = 60  # how often expired leases are recovered
+    morgan_chunk_size: int = 500  # items per Morgan recovery/reset statement
+    writer_fanout_enabled: bool = False  # one write_item task per TODO item
+    writer_queue: str = "writer"
+    writer_max_in_flight: int = 4  # items generating at once, across all workers
+    writer_fanout_batch: int = 10
+    writer_item_soft_time_limit_seconds: int = 240
+    writer_item_time_limit_seconds: int = 300
+    writer_retry_base_seconds: int = 300  # TODO retry after a failed draft, doubled per revision
+    writer_retry_max_seconds: int = 21600
     zapier_webhook_url: str | None = None
     zapier_webhook_secret: str | None = None
     cors_allowed_origins: str = "http://127.0.0.1:5173,http://localhost:5173"
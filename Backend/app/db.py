@@ -4,6 +4,8 @@ from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from .config import settings
 from .db_url import backend_local_db_url, normalize_sqlite_url
+from .metrics import instrument_pool
+from .query_stats import instrument_engine
 
 
 class Base(DeclarativeBase):
@@ -34,7 +36,9 @@ def _create_engine_with_local_fallback():
     return primary_engine
 
 
-engine = _create_engine_with_local_fallback()
+# Statement counts and DB time per request / Celery task (see query_stats)
+engine = instrument_engine(_create_engine_with_local_fallback())
+instrument_pool(engine)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
 
@@ -2,6 +2,8 @@
 
 In production (log_json=True or app_env=prod), outputs JSON lines.
 In dev mode, uses standard human-readable format.
+JSON lines carry the current request ID and, where logged, the
+per-request/per-task query stats.
 """
 
 import json
@@ -9,6 +11,8 @@ import logging
 import sys
 from datetime import datetime, timezone
 
+from .middleware.request_id import get_request_id
+
 
 class JSONFormatter(logging.Formatter):
     """Minimal JSON log formatter for structured logging."""
@@ -22,9 +26,14 @@ class JSONFormatter(logging.Formatter):
         }
         if record.exc_info and record.exc_info[0] is not None:
             log_entry["exception"] = self.formatException(record.exc_info)
-        request_id = getattr(record, "request_id", None)
+        request_id = getattr(record, "request_id", None) or get_request_id()
         if request_id:
             log_entry["request_id"] = request_id
+        # Query accounting from app.query_stats, per request or Celery task
+        for key in ("task", "task_id", "db"):
+            value = getattr(record, key, None)
+            if value is not None:
+                log_entry[key] = value
         return json.dumps(log_entry, default=str)
 
 
@@ -6,6 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from .config import settings
 from .db import Base, engine
 from .logging_config import configure_logging
+from .middleware.query_stats import QueryStatsMiddleware
 from .middleware.request_id import RequestIdMiddleware
 from .routes import admin, auth, comments, content, drafts, engagement, health, learning, pipeline, posts, reports, sources
 from .services.db_check import SchemaError, startup_schema_check
@@ -21,6 +22,9 @@ logger = logging.getLogger(__name__)
 def create_app() -> FastAPI:
     app = FastAPI(title="LinkedIn Personal Brand Autoposter")
 
+    # Per-request statement counts — innermost, so its log line carries the request ID.
+    app.add_middleware(QueryStatsMiddleware)
+
     # Request ID tracing — added before CORS so the ID is available to all middleware.
     app.add_middleware(RequestIdMiddleware)
 
@@ -32,6 +36,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "X-Request-ID"],
     )
 
     app.include_router(health.router)
@@ -0,0 +1,380 @@
+"""In-process metrics with Prometheus text exposition.
+
+Counters, gauges and histograms live in this process's memory and are
+updated by the code paths they describe: agent runs, pipeline
+transitions, LLM calls, LinkedIn requests, webhook/Telegram deliveries
+and DB pool checkouts. GET /metrics renders them with render_metrics(),
+which never queries the database, so it is cheap to scrape every few
+seconds.
+
+Values are per process. The API serves its own at /metrics; a Celery
+worker pool process serves its own when METRICS_WORKER_PORT is set
+(start_metrics_server, bound on worker_process_init). Pipeline queue
+depth gauges are refreshed whenever the overview, health report or queue
+stats are computed (dashboards, Morgan), and carry the time of that
+refresh so stale values are visible.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "linkedbrand_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers sub-100ms DB/webhook calls up to multi-minute LLM retries
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = METRIC_PREFIX + name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonic count, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_label_text(self.labelnames, key)} {_number(v)}" for key, v in items]
+
+
+class Gauge(_Metric):
+    """Point-in-time value; set directly or read from a callback at render time."""
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._functions: dict[tuple[str, ...], Callable[[], float | None]] = {}
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_function(self, fn: Callable[[], float | None], **labels) -> None:
+        """Read the value from ``fn`` on each render; None omits the sample."""
+        key = self._key(labels)
+        with self._lock:
+            self._functions[key] = fn
+
+    def value(self, **labels) -> float | None:
+        key = self._key(labels)
+        with self._lock:
+            fn = self._functions.get(key)
+            if fn is None:
+                return self._values.get(key)
+        return fn()
+
+    def _samples(self):
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        for key, fn in functions.items():
+            try:
+                value = fn()
+            except Exception:  # noqa: BLE001
+                logger.debug("Gauge callback failed: %s", self.name, exc_info=True)
+                value = None
+            if value is not None:
+                values[key] = value
+        return [f"{self.name}{_label_text(self.labelnames, key)} {_number(v)}" for key, v in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    """Bucketed observations (cumulative on render) with sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], list] = {}  # key -> [bucket counts..., sum, count]
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def time(self, **labels):
+        """Context manager observing the block's duration in seconds."""
+        return _Timer(self, labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return series[-1] if series else 0
+
+    def _samples(self):
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        lines = []
+        for key, series in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, series):
+                cumulative += n
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_label_text(self.labelnames, key, le)} {cumulative}")
+            le = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_label_text(self.labelnames, key, le)} {series[-1]}")
+            labels = _label_text(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_number(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: dict):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Metrics
+# ─────────────────────────────────────────────────────────────────────────────
+
+AGENT_RUNS = Counter("agent_runs_total", "Agent runs by outcome.", ["agent", "outcome"])
+AGENT_RUN_SECONDS = Histogram("agent_run_duration_seconds", "Agent run duration.", ["agent"])
+PIPELINE_TRANSITIONS = Counter(
+    "pipeline_transitions_total", "Pipeline item status changes.", ["from_status", "to_status"],
+)
+PIPELINE_QUEUE_DEPTH = Gauge(
+    "pipeline_items", "Pipeline items per status at the last refresh.", ["status"],
+)
+PIPELINE_QUEUE_READY = Gauge(
+    "pipeline_queue_ready", "Unclaimed, due items per agent-owned status at the last refresh.", ["status"],
+)
+PIPELINE_QUEUE_REFRESHED = Gauge(
+    "pipeline_queue_refreshed_timestamp_seconds", "When the pipeline queue gauges were last refreshed.",
+)
+
+LLM_REQUESTS = Counter("llm_requests_total", "LLM API attempts by HTTP status or error type.", ["status"])
+LLM_REQUEST_SECONDS = Histogram("llm_request_duration_seconds", "LLM API attempt latency.")
+LLM_RETRIES = Counter("llm_retries_total", "LLM API retries by reason.", ["reason"])
+LLM_TOKENS = Counter("llm_tokens_total", "LLM tokens used, excluding cache hits.", ["kind"])
+LLM_CACHE_HITS = Counter("llm_cache_hits_total", "LLM generations served from the response cache.")
+
+LINKEDIN_REQUESTS = Counter("linkedin_requests_total", "LinkedIn API requests by HTTP status or error.", ["status"])
+LINKEDIN_REQUEST_SECONDS = Histogram("linkedin_request_duration_seconds", "LinkedIn API request latency.")
+LINKEDIN_RATE_LIMITED = Counter("linkedin_rate_limited_total", "LinkedIn 429 responses.")
+
+DELIVERIES = Counter("deliveries_total", "Webhook and Telegram deliveries by outcome.", ["channel", "outcome"])
+DELIVERY_SECONDS = Histogram("delivery_duration_seconds", "Webhook and Telegram request latency.", ["channel"])
+
+DB_POOL_CHECKOUTS = Counter("db_pool_checkouts_total", "Connections checked out of the DB pool.")
+DB_POOL_CONNECTIONS = Counter("db_pool_connections_total", "New DB connections opened by the pool.")
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured DB pool size.")
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "DB connections currently checked out.")
+DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "DB connections open beyond the pool size.")
+
+REGISTRY: list[_Metric] = [
+    AGENT_RUNS, AGENT_RUN_SECONDS, PIPELINE_TRANSITIONS,
+    PIPELINE_QUEUE_DEPTH, PIPELINE_QUEUE_READY, PIPELINE_QUEUE_REFRESHED,
+    LLM_REQUESTS, LLM_REQUEST_SECONDS, LLM_RETRIES, LLM_TOKENS, LLM_CACHE_HITS,
+    LINKEDIN_REQUESTS, LINKEDIN_REQUEST_SECONDS, LINKEDIN_RATE_LIMITED,
+    DELIVERIES, DELIVERY_SECONDS,
+    DB_POOL_CHECKOUTS, DB_POOL_CONNECTIONS, DB_POOL_SIZE, DB_POOL_CHECKED_OUT, DB_POOL_OVERFLOW,
+]
+
+
+def render_metrics() -> str:
+    """Render every metric in the Prometheus text format (no DB access)."""
+    return "\n".join(metric.render() for metric in REGISTRY) + "\n"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Instrumentation helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+def observe_agent_run(agent: str):
+    """Decorator counting an agent entry point's runs, failures and duration."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = fn(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                AGENT_RUNS.inc(agent=agent, outcome=outcome)
+                AGENT_RUN_SECONDS.observe(time.perf_counter() - started, agent=agent)
+
+        return wrapper
+
+    return decorator
+
+
+def record_queue_depth(status_counts: dict[str, int]) -> None:
+    """Refresh the per-status item gauges from an overview count."""
+    for status, count in status_counts.items():
+        PIPELINE_QUEUE_DEPTH.set(count, status=status)
+    PIPELINE_QUEUE_REFRESHED.set(time.time())
+
+
+def record_queue_ready(ready_counts: dict[str, int]) -> None:
+    """Refresh the ready-to-claim gauges from get_queue_stats."""
+    for status, count in ready_counts.items():
+        PIPELINE_QUEUE_READY.set(count, status=status)
+    PIPELINE_QUEUE_REFRESHED.set(time.time())
+
+
+def instrument_pool(engine) -> None:
+    """Count pool checkouts/connects and expose pool occupancy (idempotent)."""
+    from sqlalchemy import event
+
+    def _pool_stat(method: str):
+        def read():
+            fn = getattr(engine.pool, method, None)
+            return fn() if fn is not None else None
+        return read
+
+    if not event.contains(engine, "checkout", _on_checkout):
+        event.listen(engine, "checkout", _on_checkout)
+        event.listen(engine, "connect", _on_connect)
+    DB_POOL_SIZE.set_function(_pool_stat("size"))
+    DB_POOL_CHECKED_OUT.set_function(_pool_stat("checkedout"))
+    DB_POOL_OVERFLOW.set_function(_pool_stat("overflow"))
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_POOL_CHECKOUTS.inc()
+
+
+def _on_connect(dbapi_connection, connection_record):
+    DB_POOL_CONNECTIONS.inc()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Worker exposition
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port: int, attempts: int = 32) -> ThreadingHTTPServer | None:
+    """Serve /metrics on the first free port from ``port`` upward.
+
+    Each Celery pool process binds its own port, so a scrape config lists
+    ``port`` .. ``port + concurrency - 1``. Returns None if none is free.
+    """
+    for candidate in range(port, port + attempts):
+        try:
+            server = ThreadingHTTPServer(("0.0.0.0", candidate), _MetricsHandler)
+        except OSError:
+            continue
+        thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+        thread.start()
+        logger.info("Metrics server listening on port %d", candidate)
+        return server
+    logger.warning("No free metrics port in %d-%d", port, port + attempts - 1)
+    return None
+
+
+def instrument_celery_metrics() -> None:
+    """Start a metrics server in each Celery pool process when configured."""
+    from .config import settings
+
+    if not settings.metrics_worker_port:
+        return
+    try:
+        from celery.signals import worker_process_init
+    except ImportError:
+        return
+
+    def _start(**_kwargs):
+        start_metrics_server(settings.metrics_worker_port)
+
+    worker_process_init.connect(_start, weak=False, dispatch_uid="metrics_server")
@@ -0,0 +1,27 @@
+"""Per-request SQL statement accounting.
+
+Opens a query_stats scope around each request and logs one summary line
+(statement count, DB time, slow statements) when the response is ready.
+Runs inside RequestIdMiddleware, so the line carries the request ID.
+"""
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from ..query_stats import begin_scope, end_scope, log_query_stats
+
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """Middleware that counts the DB statements each request runs."""
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        stats, token = begin_scope(f"{request.method} {request.url.path}")
+        status_code = 500
+        try:
+            response: Response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            end_scope(stats, token)
+            log_query_stats(stats, f"{stats.label} -> {status_code}")
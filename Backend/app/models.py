@@ -2,12 +2,17 @@ import enum
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .db import Base
 
 
+def _partial_index(name: str, *columns: str, where: str) -> Index:
+    """Build a partial index that is honoured on both PostgreSQL and SQLite."""
+    return Index(name, *columns, postgresql_where=text(where), sqlite_where=text(where))
+
+
 class DraftStatus(str, enum.Enum):
     pending = "PENDING"
     approved = "APPROVED"
@@ -54,6 +59,11 @@ class PipelineMode(str, enum.Enum):
 
 class Draft(Base):
     __tablename__ = "drafts"
+    # Keyset pagination for GET /drafts (see 0019 migration)
+    __table_args__ = (
+        Index("ix_drafts_created", "created_at", "id"),
+        Index("ix_drafts_status_created", "status", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
@@ -76,8 +86,13 @@ class Draft(Base):
 
 class PublishedPost(Base):
     __tablename__ = "published_posts"
+    # Keyset pagination for GET /posts
+    __table_args__ = (
+        Index("ix_published_posts_created", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     draft_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("drafts.id"))
     linkedin_post_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
     linkedin_post_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
@@ -88,6 +103,9 @@ class PublishedPost(Base):
     comment_monitoring_started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     comment_monitoring_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_comment_poll_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # High-water mark of the newest LinkedIn comment already stored
+    comment_cursor_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    comment_cursor_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
     content_body: Mapped[str] = mapped_column(Text)
     format: Mapped[PostFormat] = mapped_column(Enum(PostFormat))
     tone: Mapped[PostTone] = mapped_column(Enum(PostTone))
@@ -104,6 +122,13 @@ class PublishedPost(Base):
 
 class Comment(Base):
     __tablename__ = "comments"
+    # One row per LinkedIn comment; backs the poller's bulk IN lookup (see 0012 migration).
+    __table_args__ = (
+        Index("ux_comments_linkedin_comment_id", "linkedin_comment_id", unique=True),
+        # Keyset pagination for GET /comments, all and escalated-only
+        Index("ix_comments_commented", "commented_at", "id"),
+        _partial_index("ix_comments_escalated_commented", "commented_at", "id", where="escalated = true"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     published_post_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("published_posts.id"))
@@ -154,6 +179,13 @@ class AppConfig(Base):
 
 class SourceMaterial(Base):
     __tablename__ = "source_materials"
+    __table_args__ = (
+        # summarize_pending_sources
+        _partial_index("ix_source_materials_summary_pending", "created_at", where="summary_pending = true"),
+        # Keyset pagination for GET /sources, all and per pillar
+        Index("ix_source_materials_created", "created_at", "id"),
+        Index("ix_source_materials_pillar_created", "pillar_theme", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
@@ -162,10 +194,28 @@ class SourceMaterial(Base):
     url: Mapped[str] = mapped_column(String(1024), unique=True)
     published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     summary_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Feed excerpt kept for the background summary stage
+    content_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    summary_pending: Mapped[bool] = mapped_column(Boolean, default=False, server_default=text("false"))
     relevance_score: Mapped[float] = mapped_column(Float, default=0.0)
     pillar_theme: Mapped[str | None] = mapped_column(String(120), nullable=True)
 
 
+class FeedState(Base):
+    """HTTP cache validators and last-fetch stats for one research feed."""
+
+    __tablename__ = "feed_states"
+
+    url: Mapped[str] = mapped_column(String(1024), primary_key=True)
+    etag: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    last_status: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_bytes: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
 class AuditLog(Base):
     __tablename__ = "audit_logs"
 
@@ -233,6 +283,46 @@ class RefreshToken(Base):
 
 class ContentPipelineItem(Base):
     __tablename__ = "content_pipeline_items"
+    # Indexes mirror the hot pipeline predicates (see 0010/0011 migrations).
+    __table_args__ = (
+        # GET /pipeline/items?status=, per-status counts
+        Index("ix_pipeline_items_status_created", "status", "created_at"),
+        # GET /pipeline/items without a status filter: keyset pagination
+        Index("ix_pipeline_items_created", "created_at", "id"),
+        # get_unclaimed_items_by_status, claim_batch: claim order
+        _partial_index(
+            "ix_pipeline_items_unclaimed_claim_order",
+            "status", "priority", "deadline_at", "created_at",
+            where="claimed_by IS NULL",
+        ),
+        # Morgan stuck-item detection
+        _partial_index(
+            "ix_pipeline_items_unclaimed_status_updated", "status", "updated_at",
+            where="claimed_by IS NULL",
+        ),
+        # Morgan reset_errored_items and errored counts
+        _partial_index(
+            "ix_pipeline_items_errored_status_updated", "status", "updated_at",
+            where="last_error IS NOT NULL AND claimed_by IS NULL",
+        ),
+        # find_stale_claims: expired leases
+        _partial_index(
+            "ix_pipeline_items_claim_expires_at", "claim_expires_at",
+            where="claimed_by IS NOT NULL",
+        ),
+        # find_stale_claims (claims without a lease) and claimed counts
+        _partial_index(
+            "ix_pipeline_items_claimed_at", "claimed_at",
+            where="claimed_by IS NOT NULL",
+        ),
+        # get_pipeline_overview cache probe: MAX(updated_at)
+        Index("ix_pipeline_items_updated_at", "updated_at"),
+        # get_cycle_time_stats: recently completed items
+        _partial_index(
+            "ix_pipeline_items_completed_at", "completed_at",
+            where="completed_at IS NOT NULL",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
@@ -249,6 +339,8 @@ class ContentPipelineItem(Base):
     claimed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     claim_stage: Mapped[str | None] = mapped_column(String(32), nullable=True)
     claim_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Fencing token, bumped by every claim; writes for a claim are guarded on it
+    claim_token: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     # Quality gate results
     quality_score: Mapped[float | None] = mapped_column(Float, nullable=True)
@@ -264,7 +356,13 @@ class ContentPipelineItem(Base):
 
     # Error and scheduling
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Not claimable before this time
     next_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Claim order: lower priority first, then nearest deadline, then age
+    priority: Mapped[int] = mapped_column(Integer, default=100, server_default="100")
+    deadline_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Set when the item reaches DONE (BACKLOG → DONE cycle time)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Topic metadata (seeded by Scout)
     topic_keyword: Mapped[str | None] = mapped_column(String(256), nullable=True)
@@ -273,3 +371,27 @@ class ContentPipelineItem(Base):
 
     # Relationship
     draft: Mapped[Draft | None] = relationship()
+
+
+class PipelineTransition(Base):
+    """Append-only log of pipeline status changes, one row per move."""
+
+    __tablename__ = "pipeline_transitions"
+    __table_args__ = (
+        # Time-in-stage: each item's moves in order
+        Index("ix_pipeline_transitions_item_created", "item_id", "created_at"),
+        # Analytics window scans
+        Index("ix_pipeline_transitions_created_at", "created_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    item_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True), ForeignKey("content_pipeline_items.id", ondelete="CASCADE")
+    )
+    # NULL for the row written when the item is created
+    from_status: Mapped[PipelineStatus | None] = mapped_column(Enum(PipelineStatus), nullable=True)
+    to_status: Mapped[PipelineStatus] = mapped_column(Enum(PipelineStatus))
+    revision_count: Mapped[int] = mapped_column(Integer, default=0)
+    # Worker id for agent moves, "morgan" for recovery, NULL for manual/API moves
+    actor: Mapped[str | None] = mapped_column(String(128), nullable=True)
@@ -0,0 +1,218 @@
+"""SQL statement counting and slow-query instrumentation.
+
+instrument_engine() hooks an engine's cursor events. While a scope is
+active (track_queries(), one per HTTP request via QueryStatsMiddleware,
+one per Celery task via the task_prerun/task_postrun signals), every
+statement executed in that context adds to its QueryStats: statement
+count, total DB time and the slowest statements over
+settings.db_slow_query_ms. Scope summaries are logged with a ``db``
+field that JSONFormatter emits alongside the request ID or task name.
+
+Scopes live in a ContextVar, so they follow the request into the
+threadpool that runs sync endpoints but not into threads the code starts
+itself (e.g. ClaimHeartbeat).
+
+query_budget() is the test-side helper: it counts every statement on an
+engine, from any thread, and fails if a block exceeds its budget.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Slow statements kept per scope (the log line for each is always written)
+MAX_SLOW_RECORDED = 5
+STATEMENT_PREVIEW_CHARS = 300
+
+
+def _preview(statement: str) -> str:
+    return " ".join(statement.split())[:STATEMENT_PREVIEW_CHARS]
+
+
+@dataclass
+class QueryStats:
+    """Statements executed within one scope."""
+
+    label: str = ""
+    statements: int = 0
+    db_time_ms: float = 0.0
+    slow: list[dict] = field(default_factory=list)
+    slow_count: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, statement: str, elapsed_ms: float, slow: bool) -> None:
+        with self._lock:
+            self.statements += 1
+            self.db_time_ms += elapsed_ms
+            if slow:
+                self.slow_count += 1
+                if len(self.slow) < MAX_SLOW_RECORDED:
+                    self.slow.append({"ms": round(elapsed_ms, 1), "statement": _preview(statement)})
+
+    def merge(self, other: "QueryStats") -> None:
+        with self._lock:
+            self.statements += other.statements
+            self.db_time_ms += other.db_time_ms
+            self.slow_count += other.slow_count
+            room = MAX_SLOW_RECORDED - len(self.slow)
+            self.slow.extend(other.slow[:max(room, 0)])
+
+    def as_dict(self) -> dict:
+        return {
+            "statements": self.statements,
+            "db_time_ms": round(self.db_time_ms, 1),
+            "slow_statements": self.slow_count,
+            "slow": list(self.slow),
+        }
+
+
+_current: contextvars.ContextVar[QueryStats | None] = contextvars.ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    """Return the active scope's stats, or None outside any scope."""
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    slow = elapsed_ms >= settings.db_slow_query_ms
+    if slow:
+        logger.warning("Slow query (%.0f ms): %s", elapsed_ms, _preview(statement))
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed_ms, slow)
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """Attach the statement counters to ``engine`` (idempotent)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
+def begin_scope(label: str) -> tuple[QueryStats, contextvars.Token]:
+    """Start counting statements in the current context; pair with end_scope()."""
+    stats = QueryStats(label=label)
+    return stats, _current.set(stats)
+
+
+def end_scope(stats: QueryStats, token: contextvars.Token) -> QueryStats:
+    """Stop counting; a nested scope's totals are added to the enclosing one."""
+    _current.reset(token)
+    parent = _current.get()
+    if parent is not None:
+        parent.merge(stats)
+    return stats
+
+
+@contextmanager
+def track_queries(label: str = ""):
+    """Count the statements run in this block (and in code it calls)."""
+    stats, token = begin_scope(label)
+    try:
+        yield stats
+    finally:
+        end_scope(stats, token)
+
+
+def log_query_stats(stats: QueryStats, message: str, **extra) -> None:
+    """Log a scope summary; heavy or slow scopes are logged as warnings."""
+    level = logging.INFO
+    if stats.slow_count or stats.statements >= settings.db_query_warn_count:
+        level = logging.WARNING
+    logger.log(
+        level,
+        "%s: %d queries, %.1f ms in DB, %d slow",
+        message, stats.statements, stats.db_time_ms, stats.slow_count,
+        extra={"db": stats.as_dict(), **extra},
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Celery
+# ─────────────────────────────────────────────────────────────────────────────
+
+_task_scopes: dict[str, tuple[QueryStats, contextvars.Token]] = {}
+
+
+def _task_prerun(task_id=None, task=None, **_kwargs):
+    _task_scopes[task_id] = begin_scope(getattr(task, "name", ""))
+
+
+def _task_postrun(task_id=None, task=None, state=None, **_kwargs):
+    scope = _task_scopes.pop(task_id, None)
+    if scope is None:
+        return
+    stats = end_scope(*scope)
+    log_query_stats(
+        stats, f"Task {stats.label} {state or ''}".rstrip(),
+        task=stats.label, task_id=task_id,
+    )
+
+
+def instrument_celery() -> None:
+    """Count statements per Celery task (no-op without Celery)."""
+    try:
+        from celery.signals import task_postrun, task_prerun
+    except ImportError:
+        return
+    task_prerun.connect(_task_prerun, weak=False, dispatch_uid="query_stats_prerun")
+    task_postrun.connect(_task_postrun, weak=False, dispatch_uid="query_stats_postrun")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+@contextmanager
+def query_budget(max_statements: int, engine: Engine | None = None):
+    """Fail if the block runs more than ``max_statements`` statements on ``engine``.
+
+    Counts every statement on the engine (default: app.db.engine), from
+    any thread, so it also covers requests made through TestClient::
+
+        with query_budget(4, engine):
+            client.get("/drafts")
+
+    Yields the list of statements seen, for further assertions.
+    """
+    if engine is None:
+        from .db import engine
+
+    seen: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        yield seen
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    if len(seen) > max_statements:
+        listing = "\n".join(f"  {n}. {_preview(s)}" for n, s in enumerate(seen, start=1))
+        raise AssertionError(
+            f"Query budget exceeded: {len(seen)} statements > {max_statements}\n{listing}"
+        )
@@ -1,49 +1,29 @@
-import enum
-import uuid
+import tempfile
 from datetime import datetime, timezone
+from typing import Literal
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
 
 from ..config import settings
 from ..db import get_db
-from ..models import (
-    AppConfig,
-    AuditLog,
-    Comment,
-    Draft,
-    EngagementMetric,
-    LearningWeight,
-    NotificationLog,
-    PublishedPost,
-    SourceMaterial,
-)
+from ..models import AuditLog, NotificationLog
 from ..schemas import AuditLogRead
 from ..services.audit import log_audit
 from ..services.auth import require_read_access, require_write_access
 from ..models import PipelineMode
 from ..services.config_state import get_or_create_app_config
 from ..services.pipeline_mode import get_pipeline_mode, get_pipeline_status_summary, set_pipeline_mode
+from ..services.state_export import StateImportError, export_state_stream, import_state_stream, resolve_tables
 from ..services.webhook_service import is_webhook_configured, send_test_webhook
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-def _serialize_value(value):
-    if isinstance(value, datetime):
-        return value.isoformat()
-    if isinstance(value, uuid.UUID):
-        return str(value)
-    if isinstance(value, enum.Enum):
-        return value.value
-    return value
-
-
-def _serialize_rows(rows):
-    output = []
-    for row in rows:
-        output.append({column.name: _serialize_value(getattr(row, column.name)) for column in row.__table__.columns})
-    return output
+# Import bodies larger than this spill from memory to a temp file
+IMPORT_SPOOL_BYTES = 8 * 1024 * 1024
 
 
 @router.get("/config")
@@ -123,24 +103,70 @@ def algorithm_alignment(_auth: None = Depends(require_read_access)):
 
 
 @router.get("/export-state")
-def export_state(db: Session = Depends(get_db), _auth: None = Depends(require_read_access)):
-    return {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "meta": {
-            "app": "linkedin_personal_brand",
-            "mode": "single-user",
-            "version_tag": "v4.0",
-        },
-        "config": _serialize_rows(db.query(AppConfig).all()),
-        "drafts": _serialize_rows(db.query(Draft).order_by(Draft.created_at.desc()).all()),
-        "posts": _serialize_rows(db.query(PublishedPost).order_by(PublishedPost.scheduled_time.desc()).all()),
-        "comments": _serialize_rows(db.query(Comment).order_by(Comment.commented_at.desc()).all()),
-        "sources": _serialize_rows(db.query(SourceMaterial).order_by(SourceMaterial.created_at.desc()).all()),
-        "audit_logs": _serialize_rows(db.query(AuditLog).order_by(AuditLog.created_at.desc()).all()),
-        "learning_weights": _serialize_rows(db.query(LearningWeight).all()),
-        "engagement_metrics": _serialize_rows(db.query(EngagementMetric).order_by(EngagementMetric.collected_at.desc()).all()),
-        "notifications": _serialize_rows(db.query(NotificationLog).order_by(NotificationLog.created_at.desc()).all()),
-    }
+def export_state(
+    format: Literal["json", "ndjson"] = "json",
+    gzip: bool = False,
+    tables: list[str] | None = Query(None, description="Export only these tables (repeatable)"),
+    since: datetime | None = Query(None, description="Only rows created/collected at or after this time"),
+    db: Session = Depends(get_db),
+    _auth: None = Depends(require_read_access),
+):
+    """Stream a state backup as one JSON document (default) or NDJSON.
+
+    Rows are streamed from a server-side cursor, so memory use does not
+    grow with history. NDJSON exports can be loaded with /admin/import-state.
+    """
+    try:
+        selected = resolve_tables(tables)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    # The body streams after this handler returns and the request session
+    # closes, so it reads through its own session on the same engine.
+    body = export_state_stream(
+        sessionmaker(bind=db.get_bind()), fmt=format, tables=selected, since=since, compress=gzip,
+    )
+    extension = "ndjson" if format == "ndjson" else "json"
+    media_type = "application/x-ndjson" if format == "ndjson" else "application/json"
+    if gzip:
+        extension += ".gz"
+        media_type = "application/gzip"
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="state_{stamp}.{extension}"'},
+    )
+
+
+def _import_and_audit(db: Session, stream) -> dict[str, int]:
+    counts = import_state_stream(db, stream)
+    log_audit(
+        db=db, actor="api", action="admin.import_state", resource_type="app_state", detail={"rows": counts},
+    )
+    return counts
+
+
+@router.post("/import-state")
+async def import_state(
+    request: Request,
+    db: Session = Depends(get_db),
+    _auth: None = Depends(require_write_access),
+):
+    """Load an NDJSON export (plain or gzipped) sent as the raw request body.
+
+    Rows are upserted by primary key in one transaction; a malformed or
+    truncated file is rejected with 400 and nothing is written.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        try:
+            counts = await run_in_threadpool(_import_and_audit, db, spool)
+        except StateImportError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {"imported": counts}
 
 
 @router.post("/pipeline-mode/{mode}")
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -14,6 +14,7 @@ from ..services.auth import require_read_access, require_write_access
 from ..services.comment_reply import generate_suggested_replies
 from ..services.comment_triage import triage_comment
 from ..services.config_state import is_comment_replies_enabled, is_kill_switch_on
+from ..services.pagination import PageParams, created_range
 
 
 class ResolveEscalationPayload(BaseModel):
@@ -71,8 +72,30 @@ def create_comment(
 
 
 @router.get("", response_model=list[CommentRead])
-def list_comments(db: Session = Depends(get_db), _auth: None = Depends(require_read_access)):
-    return db.query(Comment).order_by(Comment.commented_at.desc()).all()
+def list_comments(
+    response: Response,
+    db: Session = Depends(get_db),
+    _auth: None = Depends(require_read_access),
+    page: PageParams = Depends(),
+    escalated: bool | None = Query(None),
+    high_value: bool | None = Query(None),
+    replied: bool | None = Query(None, description="Only comments that were (true) or were not (false) auto-replied"),
+    post_id: UUID | None = Query(None, description="Only comments on this published post"),
+    created_after: datetime | None = Query(None, description="Commented at or after"),
+    created_before: datetime | None = Query(None, description="Commented before"),
+):
+    """Newest comments first, one keyset page at a time (see services.pagination)."""
+    query = db.query(Comment)
+    if escalated is not None:
+        query = query.filter(Comment.escalated.is_(escalated))
+    if high_value is not None:
+        query = query.filter(Comment.is_high_value.is_(high_value))
+    if replied is not None:
+        query = query.filter(Comment.auto_reply_sent.is_(replied))
+    if post_id is not None:
+        query = query.filter(Comment.published_post_id == post_id)
+    query = created_range(query, Comment.commented_at, created_after, created_before)
+    return page.page(response, query, Comment.commented_at, Comment.id)
 
 
 @router.get("/escalated", response_model=list[CommentRead])
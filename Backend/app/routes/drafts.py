@@ -1,6 +1,7 @@
 import uuid
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from ..db import get_db
@@ -8,6 +9,7 @@ from ..models import Draft, DraftStatus
 from ..schemas import DraftApprove, DraftCreate, DraftRead, DraftReject
 from ..services.audit import log_audit
 from ..services.auth import require_read_access, require_write_access
+from ..services.pagination import PageParams, created_range
 from ..services.webhook_service import send_webhook
 from ..services.workflow import approve_draft_and_schedule, create_system_draft
 
@@ -52,8 +54,24 @@ def generate_draft(db: Session = Depends(get_db), _auth: None = Depends(require_
 
 
 @router.get("", response_model=list[DraftRead])
-def list_drafts(db: Session = Depends(get_db), _auth: None = Depends(require_read_access)):
-    return db.query(Draft).order_by(Draft.created_at.desc()).all()
+def list_drafts(
+    response: Response,
+    db: Session = Depends(get_db),
+    _auth: None = Depends(require_read_access),
+    page: PageParams = Depends(),
+    status: DraftStatus | None = Query(None, description="PENDING, APPROVED, REJECTED or EXPIRED"),
+    pillar: str | None = Query(None, description="Exact pillar theme"),
+    created_after: datetime | None = Query(None),
+    created_before: datetime | None = Query(None),
+):
+    """Newest drafts first, one keyset page at a time (see services.pagination)."""
+    query = db.query(Draft)
+    if status is not None:
+        query = query.filter(Draft.status == status)
+    if pillar:
+        query = query.filter(Draft.pillar_theme == pillar)
+    query = created_range(query, Draft.created_at, created_after, created_before)
+    return page.page(response, query, Draft.created_at, Draft.id)
 
 
 @router.post("/{draft_id}/approve", response_model=DraftRead)
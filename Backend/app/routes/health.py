@@ -1,13 +1,15 @@
 import re
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from ..config import settings
 from ..db import engine, get_db
+from ..metrics import CONTENT_TYPE, render_metrics
 from ..middleware.request_id import get_request_id
 from ..services.db_check import check_schema
+from ..services.llm_cache import get_llm_cache_stats
 
 import redis as redis_lib
 
@@ -94,6 +96,18 @@ def db_diagnostic():
     }
 
 
+@router.get("/health/llm-cache")
+def llm_cache_health():
+    """LLM response cache hit/miss counters for this process."""
+    return get_llm_cache_stats()
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus exposition of this process's in-memory metrics (no DB access)."""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
+
+
 @router.get("/health/full")
 def full_health(db: Session = Depends(get_db)):
     """Aggregated health check combining all sub-checks into a single response."""
@@ -138,5 +152,6 @@ def full_health(db: Session = Depends(get_db)):
             "redis": {"ok": redis_ok, "error": redis_error},
             "schema": {"ok": schema["ok"], "missing": schema["missing"]},
             "migration": migration,
+            "llm_cache": get_llm_cache_stats(),
         },
     }
@@ -2,15 +2,19 @@
 
 Provides visibility and manual control over the V6 content pipeline:
 - Pipeline overview with status counts
-- Item listing with optional status filter
+- Keyset-paginated item listing with status/pillar/date filters
 - Individual item detail
 - Manual status transition
 - Manual agent trigger endpoints
+- BACKLOG → DONE cycle-time metrics
+- Item scheduling (priority, deadline, next run) and queue depth/wait time
+- Transition-log analytics (time in stage, revision loops, throughput)
 """
 
 import uuid
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -18,10 +22,14 @@ from ..db import get_db
 from ..models import ContentPipelineItem, PipelineStatus
 from ..services.audit import log_audit
 from ..services.auth import require_read_access, require_write_access
+from ..services.pagination import PageParams, created_range
 from ..services.pipeline import (
-    get_items_by_status,
+    get_cycle_time_stats,
+    get_pipeline_analytics,
     get_pipeline_overview,
+    get_queue_stats,
     is_valid_transition,
+    schedule_item,
     transition,
     TransitionError,
 )
@@ -36,6 +44,17 @@ class TransitionRequest(BaseModel):
     to_status: str
 
 
+class ScheduleRequest(BaseModel):
+    """Request body for rescheduling a pipeline item.
+
+    Only the fields sent are changed; send null to clear a deadline or
+    next run time.
+    """
+    priority: int | None = None
+    deadline_at: datetime | None = None
+    next_run_at: datetime | None = None
+
+
 class PipelineItemResponse(BaseModel):
     """Serialized pipeline item for API responses."""
     id: str
@@ -53,6 +72,9 @@ class PipelineItemResponse(BaseModel):
     max_revisions: int = 3
     social_status: str | None = None
     last_error: str | None = None
+    priority: int = 100
+    deadline_at: str | None = None
+    next_run_at: str | None = None
     topic_keyword: str | None = None
     pillar_theme: str | None = None
     sub_theme: str | None = None
@@ -79,6 +101,9 @@ def _serialize_item(item: ContentPipelineItem) -> dict:
         "max_revisions": item.max_revisions,
         "social_status": item.social_status.value if item.social_status else None,
         "last_error": item.last_error,
+        "priority": item.priority,
+        "deadline_at": item.deadline_at.isoformat() if item.deadline_at else None,
+        "next_run_at": item.next_run_at.isoformat() if item.next_run_at else None,
         "topic_keyword": item.topic_keyword,
         "pillar_theme": item.pillar_theme,
         "sub_theme": item.sub_theme,
@@ -96,13 +121,52 @@ def pipeline_overview(
     return get_pipeline_overview(db)
 
 
+@router.get("/latency")
+def pipeline_latency(
+    db: Session = Depends(get_db),
+    _auth: None = Depends(require_read_access),
+    days: int = Query(7, ge=1, le=90, description="Completion window in days"),
+):
+    """Return end-to-end BACKLOG → DONE cycle-time percentiles."""
+    return get_cycle_time_stats(db, days=days)
+
+
+@router.get("/queue")
+def pipeline_queue(
+    db: Session = Depends(get_db),
+    _auth: None = Depends(require_read_access),
+):
+    """Return queue depth and wait time for each agent-owned status."""
+    return get_queue_stats(db)
+
+
+@router.get("/analytics")
+def pipeline_analytics(
+    db: Session = Depends(get_db),
+    _auth: None = Depends(require_read_access),
+    days: int = Query(7, ge=1, le=90, description="Transition window in days"),
+):
+    """Return time-in-stage percentiles, revision loops and daily throughput."""
+    return get_pipeline_analytics(db, days=days)
+
+
 @router.get("/items")
 def list_pipeline_items(
+    response: Response,
     db: Session = Depends(get_db),
     _auth: None = Depends(require_read_access),
+    page: PageParams = Depends(),
     status: str | None = Query(None, description="Filter by pipeline status"),
+    pillar: str | None = Query(None, description="Exact pillar theme"),
+    created_after: datetime | None = Query(None),
+    created_before: datetime | None = Query(None),
 ):
-    """List pipeline items, optionally filtered by status."""
+    """List pipeline items one keyset page at a time.
+
+    Filtered by status, items come oldest first (queue order); otherwise
+    newest first.
+    """
+    query = db.query(ContentPipelineItem)
     if status:
         # Validate and convert status string to enum
         status_upper = status.upper()
@@ -114,15 +178,14 @@ def list_pipeline_items(
                 status_code=400,
                 detail=f"Invalid status '{status}'. Valid values: {valid}",
             )
-        items = get_items_by_status(db, ps)
-    else:
-        items = (
-            db.query(ContentPipelineItem)
-            .order_by(ContentPipelineItem.created_at.desc())
-            .limit(100)
-            .all()
-        )
-
+        query = query.filter(ContentPipelineItem.status == ps)
+    if pillar:
+        query = query.filter(ContentPipelineItem.pillar_theme == pillar)
+    query = created_range(query, ContentPipelineItem.created_at, created_after, created_before)
+    items = page.page(
+        response, query, ContentPipelineItem.created_at, ContentPipelineItem.id,
+        descending=not status,
+    )
     return [_serialize_item(item) for item in items]
 
 
@@ -199,6 +262,37 @@ def transition_pipeline_item(
     return _serialize_item(updated)
 
 
+@router.post("/items/{item_id}/schedule")
+def schedule_pipeline_item(
+    item_id: uuid.UUID,
+    body: ScheduleRequest,
+    db: Session = Depends(get_db),
+    _auth: None = Depends(require_write_access),
+):
+    """Change a pipeline item's priority, deadline or next run time."""
+    changes = {field: getattr(body, field) for field in body.model_fields_set}
+    if not changes:
+        raise HTTPException(status_code=400, detail="No schedule fields provided")
+    if changes.get("priority", 0) is None:
+        raise HTTPException(status_code=400, detail="priority cannot be null")
+
+    try:
+        updated = schedule_item(db, item_id, changes)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Pipeline item not found")
+
+    log_audit(
+        db=db,
+        actor="api",
+        action="pipeline.schedule",
+        resource_type="pipeline_item",
+        resource_id=str(item_id),
+        detail={k: v.isoformat() if isinstance(v, datetime) else v for k, v in changes.items()},
+    )
+
+    return _serialize_item(updated)
+
+
 @router.post("/run/scout")
 def run_scout_agent(
     db: Session = Depends(get_db),
@@ -241,8 +335,8 @@ def run_editor_agent(
     _auth: None = Depends(require_write_access),
 ):
     """Manually trigger the Editor agent."""
-    from ..services.agents.editor import run_editor
-    passed = run_editor(db)
+    from ..services.agents.editor import run_editor_batch
+    passed = run_editor_batch(db)
     log_audit(
         db=db,
         actor="api",
@@ -293,16 +387,18 @@ def run_promoter_agent(
 def run_morgan_agent(
     db: Session = Depends(get_db),
     _auth: None = Depends(require_write_access),
+    dry_run: bool = Query(False, description="Report what would be recovered/reset without writing"),
 ):
     """Manually trigger the Morgan PM self-healing agent."""
     from ..services.agents.morgan import run_morgan
-    result = run_morgan(db)
+    result = run_morgan(db, dry_run=dry_run)
     log_audit(
         db=db,
         actor="api",
         action="pipeline.run_morgan",
         resource_type="pipeline",
         detail={
+            "dry_run": dry_run,
             "stale_claims_recovered": result["stale_claims_recovered"],
             "errored_items_reset": result["errored_items_reset"],
             "health_status": result["health"]["health_status"],
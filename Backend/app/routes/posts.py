@@ -1,14 +1,15 @@
 import uuid
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from ..db import get_db
-from ..models import PublishedPost
+from ..models import Draft, PublishedPost
 from ..schemas import ManualPublishConfirm, PostMetricsUpdate, PublishedPostRead
 from ..services.audit import log_audit
 from ..services.auth import require_read_access, require_write_access
+from ..services.pagination import PageParams, created_range
 from ..services.learning import record_post_metrics
 from ..services.webhook_service import send_webhook
 from ..services.workflow import publish_due_manual_posts, send_golden_hour_engagement_prompt
@@ -26,8 +27,32 @@ def _extract_linkedin_post_id(url: str) -> str | None:
 
 
 @router.get("", response_model=list[PublishedPostRead])
-def list_posts(db: Session = Depends(get_db), _auth: None = Depends(require_read_access)):
-    return db.query(PublishedPost).order_by(PublishedPost.scheduled_time.desc().nullslast()).all()
+def list_posts(
+    response: Response,
+    db: Session = Depends(get_db),
+    _auth: None = Depends(require_read_access),
+    page: PageParams = Depends(),
+    pillar: str | None = Query(None, description="Exact pillar theme of the source draft"),
+    published: bool | None = Query(None, description="Only posts that are (true) or are not yet (false) published"),
+    due: bool = Query(False, description="Only unpublished posts whose scheduled time has passed"),
+    created_after: datetime | None = Query(None),
+    created_before: datetime | None = Query(None),
+):
+    """Newest posts first, one keyset page at a time (see services.pagination)."""
+    query = db.query(PublishedPost)
+    if pillar:
+        query = query.join(Draft, PublishedPost.draft_id == Draft.id).filter(Draft.pillar_theme == pillar)
+    if published is not None:
+        query = query.filter(
+            PublishedPost.published_at.is_not(None) if published else PublishedPost.published_at.is_(None)
+        )
+    if due:
+        query = query.filter(
+            PublishedPost.published_at.is_(None),
+            PublishedPost.scheduled_time <= datetime.now(timezone.utc),
+        )
+    query = created_range(query, PublishedPost.created_at, created_after, created_before)
+    return page.page(response, query, PublishedPost.created_at, PublishedPost.id)
 
 
 @router.get("/{post_id}", response_model=PublishedPostRead)
@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from datetime import date
 
 from fastapi import APIRouter, Depends
@@ -6,7 +7,7 @@ from sqlalchemy.orm import Session
 from ..db import get_db
 from ..services.audit import log_audit
 from ..services.auth import require_read_access, require_write_access
-from ..services.reporting import build_daily_report, send_daily_report_telegram
+from ..services.reporting import build_daily_report, build_dashboard_summary, send_daily_report_telegram
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
@@ -27,6 +28,12 @@ def daily_report(for_date: date | None = None, db: Session = Depends(get_db), _a
     }
 
 
+@router.get("/summary")
+def dashboard_summary(db: Session = Depends(get_db), _auth: None = Depends(require_read_access)):
+    """Post, comment, draft and source counts for the dashboard views."""
+    return asdict(build_dashboard_summary(db=db))
+
+
 @router.post("/daily/send")
 def send_daily_report(
     for_date: date | None = None,
@@ -1,30 +1,53 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Response
 from sqlalchemy.orm import Session
 
-from ..config import settings
-from ..db import get_db
+from ..db import SessionLocal, get_db
 from ..models import SourceMaterial
 from ..schemas import SourceIngestRequest, SourceMaterialRead
 from ..services.audit import log_audit
 from ..services.auth import require_read_access, require_write_access
-from ..services.research_ingestion import DEFAULT_FEEDS, ingest_feeds
+from ..services.pagination import PageParams, created_range
+from ..services.research_ingestion import configured_feed_urls, ingest_feeds, summarize_pending_sources
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
 
 @router.get("", response_model=list[SourceMaterialRead])
-def list_sources(db: Session = Depends(get_db), _auth: None = Depends(require_read_access)):
-    return db.query(SourceMaterial).order_by(SourceMaterial.created_at.desc()).limit(100).all()
+def list_sources(
+    response: Response,
+    db: Session = Depends(get_db),
+    _auth: None = Depends(require_read_access),
+    page: PageParams = Depends(),
+    pillar: str | None = Query(None, description="Exact pillar theme"),
+    created_after: datetime | None = Query(None),
+    created_before: datetime | None = Query(None),
+):
+    """Newest sources first, one keyset page at a time (see services.pagination)."""
+    query = db.query(SourceMaterial)
+    if pillar:
+        query = query.filter(SourceMaterial.pillar_theme == pillar)
+    query = created_range(query, SourceMaterial.created_at, created_after, created_before)
+    return page.page(response, query, SourceMaterial.created_at, SourceMaterial.id)
+
+
+def _summarize_pending_sources() -> None:
+    db = SessionLocal()
+    try:
+        summarize_pending_sources(db)
+    finally:
+        db.close()
 
 
 @router.post("/ingest")
 def ingest_sources(
     payload: SourceIngestRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     _auth: None = Depends(require_write_access),
 ):
-    configured = [item.strip() for item in settings.research_feed_urls.split(",") if item.strip()]
-    feeds = payload.feed_urls or configured or DEFAULT_FEEDS
+    feeds = payload.feed_urls or configured_feed_urls()
     created = ingest_feeds(db=db, feed_urls=feeds, max_items_per_feed=payload.max_items_per_feed)
     log_audit(
         db=db,
@@ -33,4 +56,6 @@ def ingest_sources(
         resource_type="source_material",
         detail={"created": created, "feeds_count": len(feeds)},
     )
+    # Summaries are written after the response; rows are readable meanwhile
+    background_tasks.add_task(_summarize_pending_sources)
     return {"created": created, "feeds_count": len(feeds)}
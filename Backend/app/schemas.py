@@ -97,6 +97,7 @@ class SourceMaterialRead(BaseModel):
     url: str
     published_at: datetime | None
     summary_text: str | None
+    summary_pending: bool = False
     relevance_score: float
     pillar_theme: str | None
 
@@ -4,27 +4,35 @@ Claims REVIEW pipeline items and validates them against 7 quality gates.
 On pass: transitions to READY_TO_PUBLISH with quality scores.
 On fail: increments revision, records structured feedback, sends back to TODO.
 On max revisions exceeded: sends to BACKLOG for human review.
+
+run_editor() handles one item at a time; run_editor_batch() reviews a whole
+claimed batch and applies every outcome in a single transaction.
 """
 
 from __future__ import annotations
 
 import logging
-import re
+import multiprocessing
+import os
+import threading
 import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable
 
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.orm import Session
 
+from ...config import settings
+from ...metrics import observe_agent_run
 from ...models import ContentPipelineItem, Draft, PipelineStatus
-from ..claim_lock import attempt_claim, release_claim, verify_claim
-from ..guardrails import validate_post
-from ..pipeline import (
-    get_unclaimed_items_by_status,
-    has_exceeded_max_revisions,
-    increment_revision,
-    transition,
-)
+from ..claim_lock import ClaimHeartbeat, claim_batch, release_claim
+from ..guardrails import GUARDRAIL_GATES, validate_post
+from ..pipeline import TransitionError, advance_item, is_valid_transition, record_transitions, transition_row
 from ..product_context import ProductContext, get_product_context
+from ..stage_handoff import on_transition
+from ..text_analysis import PhraseMatcher, TextScan
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +42,59 @@ WORKER_ID_PREFIX = "editor"
 READABILITY_MIN_GRADE = 6
 READABILITY_MAX_GRADE = 14
 
+# Gate execution modes
+REVIEW_MODE_FULL = "full"                    # run every gate, report every failure
+REVIEW_MODE_SHORT_CIRCUIT = "short_circuit"  # stop at the first failing gate
+REVIEW_MODES = (REVIEW_MODE_FULL, REVIEW_MODE_SHORT_CIRCUIT)
+
+# Relative gate costs; gates at or above EXPENSIVE_GATE_COST run on the
+# gate executor instead of inline.
+GATE_COST_SCAN = 1        # reads the shared phrase scan
+GATE_COST_REGEX = 2       # scan plus a few regex passes
+EXPENSIVE_GATE_COST = 10  # e.g. textstat readability
+
+# Titles the post must not claim (gate 1)
+TITLE_CLAIMS = ["ceo", "founder", "vp of", "vice president", "chief", "director"]
+
+# Unsupported superlatives and guarantee language (gate 5)
+UNSUPPORTED_CLAIM_PATTERNS = [
+    "the best",
+    "the only",
+    "the most advanced",
+    "guaranteed",
+    "proven results",
+    "roi of",
+    "return of",
+    "increases revenue by",
+]
+
+# Core domain keywords, at least one of which should appear (gate 6)
+DOMAIN_SIGNALS = {
+    "adtech": ["adtech", "advertising", "programmatic", "media", "campaign", "publisher"],
+    "ai": ["ai", "artificial intelligence", "machine learning", "automation", "agent"],
+    "retail": ["retail media", "e-commerce", "shopper", "commerce"],
+    "measurement": ["measurement", "attribution", "analytics", "tracking"],
+    "creative": ["creative", "generative", "format", "content"],
+}
+
+# First-person narrative patterns (gate 7)
+FIRST_PERSON_PATTERNS = [
+    "i have seen",
+    "i have observed",
+    "i have learned",
+    "in my experience",
+    "over the past",
+    "one lesson",
+    "when i first",
+    "a pattern i",
+    "what worked",
+    "the mistake i",
+    "i have spent",
+    "i've seen",
+    "i've observed",
+    "i've learned",
+]
+
 
 @dataclass
 class GateResult:
@@ -42,6 +103,7 @@ class GateResult:
     gate_name: str
     passed: bool
     message: str = ""
+    skipped: bool = False  # not run because an earlier gate failed (short-circuit mode)
 
 
 @dataclass
@@ -52,10 +114,11 @@ class EditorVerdict:
     gate_results: list[GateResult] = field(default_factory=list)
     quality_score: float = 0.0
     readability_score: float = 0.0
+    short_circuited: bool = False
 
     @property
     def failed_gates(self) -> list[GateResult]:
-        return [g for g in self.gate_results if not g.passed]
+        return [g for g in self.gate_results if not g.passed and not g.skipped]
 
     @property
     def failure_summary(self) -> str:
@@ -65,40 +128,113 @@ class EditorVerdict:
         return "; ".join(f"{g.gate_name}: {g.message}" for g in failed)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Compiled phrase matcher (all gates, one pass)
+# ─────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class EditorPhrases:
+    """Every Editor and guardrail phrase list for one ProductContext, compiled."""
+
+    matcher: PhraseMatcher
+    # Out-of-scope topic -> the (up to two) key words that must all appear
+    out_of_scope: list[tuple[str, tuple[str, ...]]]
+    out_of_scope_by_word: dict[str, list[int]]
+
+
+def build_editor_phrases(ctx: ProductContext) -> EditorPhrases:
+    """Compile the phrase lists the gates check for ``ctx``."""
+    matcher = PhraseMatcher(GUARDRAIL_GATES)
+
+    if ctx.title:
+        matcher.add("identity", ctx.title.lower())
+    matcher.add("identity", "head of sales")
+    for claim in TITLE_CLAIMS:
+        matcher.add("title_claim", claim)
+    for claim in ctx.banned_claims:
+        if len(claim) > 10:
+            # Simplified fragment match on the first four words
+            matcher.add("banned_claim", " ".join(claim.lower().split()[:4]), key=claim)
+
+    out_of_scope: list[tuple[str, tuple[str, ...]]] = []
+    by_word: dict[str, list[int]] = {}
+    for topic in ctx.out_of_scope_topics:
+        key_words = tuple(w for w in topic.lower().split() if len(w) > 4)[:2]
+        if not key_words:
+            continue
+        for word in key_words:
+            matcher.add("out_of_scope_word", word)
+            by_word.setdefault(word, []).append(len(out_of_scope))
+        out_of_scope.append((topic, key_words))
+
+    for pattern in UNSUPPORTED_CLAIM_PATTERNS:
+        matcher.add("unsupported_claim", pattern)
+    for keywords in DOMAIN_SIGNALS.values():
+        for keyword in keywords:
+            matcher.add("domain", keyword)
+    for marker in ctx.experience_markers:
+        marker_key = marker.lower().rstrip(".").replace("...", "").strip()
+        matcher.add("experience_marker", marker_key)
+    for pattern in FIRST_PERSON_PATTERNS:
+        matcher.add("first_person", pattern)
+
+    return EditorPhrases(matcher.compile(), out_of_scope, by_word)
+
+
+_phrases_lock = threading.Lock()
+_phrases_cache: tuple[ProductContext, EditorPhrases] | None = None
+
+
+def get_editor_phrases(ctx: ProductContext | None = None) -> EditorPhrases:
+    """Compiled phrases for ``ctx``, rebuilt only when the context object changes."""
+    global _phrases_cache
+    if ctx is None:
+        ctx = get_product_context()
+    cached = _phrases_cache
+    if cached is not None and cached[0] is ctx:
+        return cached[1]
+    with _phrases_lock:
+        if _phrases_cache is None or _phrases_cache[0] is not ctx:
+            _phrases_cache = (ctx, build_editor_phrases(ctx))
+        return _phrases_cache[1]
+
+
+def scan_content(content: str, ctx: ProductContext | None = None) -> TextScan:
+    """Scan ``content`` once for every gate's phrases."""
+    return get_editor_phrases(ctx).matcher.scan(content)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Gate 1: Factual Accuracy (PRODUCT_CONTEXT.md)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _check_factual_accuracy(content: str, ctx: ProductContext) -> GateResult:
+def _check_factual_accuracy(
+    content: str,
+    ctx: ProductContext,
+    scan: TextScan | None = None,
+) -> GateResult:
     """Check content against PRODUCT_CONTEXT.md constraints."""
-    lowered = content.lower()
+    phrases = get_editor_phrases(ctx)
+    if scan is None:
+        scan = phrases.matcher.scan(content)
     issues = []
 
     # Check identity constraints
-    if ctx.title and ctx.title.lower() not in lowered and "head of sales" not in lowered:
+    if ctx.title and not scan.has("identity"):
         # Only flag if the content claims a different title
-        title_claims = ["ceo", "founder", "vp of", "vice president", "chief", "director"]
-        for claim in title_claims:
-            if claim in lowered:
-                issues.append(f"Claims title '{claim}' — should be '{ctx.title}'")
+        for claim in scan.found("title_claim"):
+            issues.append(f"Claims title '{claim}' — should be '{ctx.title}'")
 
     # Check banned claims
-    for claim in ctx.banned_claims:
-        claim_lower = claim.lower()
-        # Check for key phrases from banned claims
-        if len(claim_lower) > 10:
-            # Use a simplified fragment match
-            words = claim_lower.split()[:4]
-            fragment = " ".join(words)
-            if fragment in lowered:
-                issues.append(f"Potentially banned claim: {claim[:60]}")
-
-    # Check out-of-scope topics
-    for topic in ctx.out_of_scope_topics:
-        topic_lower = topic.lower()
-        # Extract key words (skip generic words)
-        key_words = [w for w in topic_lower.split() if len(w) > 4]
-        if key_words and all(w in lowered for w in key_words[:2]):
+    for claim in scan.found("banned_claim"):
+        issues.append(f"Potentially banned claim: {claim[:60]}")
+
+    # Check out-of-scope topics (only topics with at least one key word present)
+    found_words = set(scan.found("out_of_scope_word"))
+    candidates = sorted({i for word in found_words for i in phrases.out_of_scope_by_word[word]})
+    for index in candidates:
+        topic, key_words = phrases.out_of_scope[index]
+        if all(w in found_words for w in key_words):
             issues.append(f"Out-of-scope topic: {topic[:60]}")
 
     if issues:
@@ -154,9 +290,9 @@ def _check_readability(content: str) -> GateResult:
 # Gate 3: Guardrail Compliance
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _check_guardrails(content: str) -> GateResult:
+def _check_guardrails(content: str, scan: TextScan | None = None) -> GateResult:
     """Run existing guardrail validation."""
-    result = validate_post(content)
+    result = validate_post(content, scan=scan or scan_content(content))
     if result.passed:
         return GateResult(gate_name="guardrails", passed=True)
 
@@ -171,10 +307,9 @@ def _check_guardrails(content: str) -> GateResult:
 # Gate 4: No External URLs
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _check_no_urls(content: str) -> GateResult:
+def _check_no_urls(content: str, scan: TextScan | None = None) -> GateResult:
     """Verify no external URLs appear in the post body."""
-    url_pattern = re.compile(r"https?://", re.IGNORECASE)
-    if url_pattern.search(content):
+    if (scan or scan_content(content)).has("url"):
         return GateResult(
             gate_name="no_external_urls",
             passed=False,
@@ -187,22 +322,9 @@ def _check_no_urls(content: str) -> GateResult:
 # Gate 5: No Unsupported Feature Claims
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _check_no_unsupported_claims(content: str) -> GateResult:
+def _check_no_unsupported_claims(content: str, scan: TextScan | None = None) -> GateResult:
     """Check for unsupported superlatives and guarantee language."""
-    lowered = content.lower()
-
-    forbidden_patterns = [
-        "the best",
-        "the only",
-        "the most advanced",
-        "guaranteed",
-        "proven results",
-        "roi of",
-        "return of",
-        "increases revenue by",
-    ]
-
-    found = [p for p in forbidden_patterns if p in lowered]
+    found = (scan or scan_content(content)).found("unsupported_claim")
     if found:
         return GateResult(
             gate_name="no_unsupported_claims",
@@ -217,27 +339,13 @@ def _check_no_unsupported_claims(content: str) -> GateResult:
 # Gate 6: Topical Relevance
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _check_topical_relevance(content: str, item: ContentPipelineItem) -> GateResult:
+def _check_topical_relevance(
+    content: str,
+    item: ContentPipelineItem,
+    scan: TextScan | None = None,
+) -> GateResult:
     """Check that content stays within the assigned domain pillar."""
-    lowered = content.lower()
-
-    # Core domain keywords that should appear
-    domain_signals = {
-        "adtech": ["adtech", "advertising", "programmatic", "media", "campaign", "publisher"],
-        "ai": ["ai", "artificial intelligence", "machine learning", "automation", "agent"],
-        "retail": ["retail media", "e-commerce", "shopper", "commerce"],
-        "measurement": ["measurement", "attribution", "analytics", "tracking"],
-        "creative": ["creative", "generative", "format", "content"],
-    }
-
-    # Check if any domain signals are present
-    has_domain_signal = False
-    for _domain, keywords in domain_signals.items():
-        if any(kw in lowered for kw in keywords):
-            has_domain_signal = True
-            break
-
-    if not has_domain_signal:
+    if not (scan or scan_content(content)).has("domain"):
         return GateResult(
             gate_name="topical_relevance",
             passed=False,
@@ -251,47 +359,32 @@ def _check_topical_relevance(content: str, item: ContentPipelineItem) -> GateRes
 # Gate 7: Experience Signal
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _check_experience_signal(content: str, ctx: ProductContext) -> GateResult:
+def _check_experience_signal(
+    content: str,
+    ctx: ProductContext,
+    scan: TextScan | None = None,
+) -> GateResult:
     """Check for at least one personal experience marker."""
-    lowered = content.lower()
+    if scan is None:
+        scan = scan_content(content, ctx)
 
     # Check markers from PRODUCT_CONTEXT.md
-    for marker in ctx.experience_markers:
-        marker_clean = marker.lower().rstrip(".")
-        # Strip the "..." and match the key phrase
-        marker_key = marker_clean.replace("...", "").strip()
-        if marker_key and marker_key in lowered:
-            return GateResult(
-                gate_name="experience_signal",
-                passed=True,
-                message=f"Found marker: {marker_key[:40]}",
-            )
+    markers = scan.found("experience_marker")
+    if markers:
+        return GateResult(
+            gate_name="experience_signal",
+            passed=True,
+            message=f"Found marker: {markers[0][:40]}",
+        )
 
     # Also check for first-person narrative patterns
-    first_person_patterns = [
-        "i have seen",
-        "i have observed",
-        "i have learned",
-        "in my experience",
-        "over the past",
-        "one lesson",
-        "when i first",
-        "a pattern i",
-        "what worked",
-        "the mistake i",
-        "i have spent",
-        "i've seen",
-        "i've observed",
-        "i've learned",
-    ]
-
-    for pattern in first_person_patterns:
-        if pattern in lowered:
-            return GateResult(
-                gate_name="experience_signal",
-                passed=True,
-                message=f"Found pattern: {pattern}",
-            )
+    patterns = scan.found("first_person")
+    if patterns:
+        return GateResult(
+            gate_name="experience_signal",
+            passed=True,
+            message=f"Found pattern: {patterns[0]}",
+        )
 
     return GateResult(
         gate_name="experience_signal",
@@ -304,41 +397,130 @@ def _check_experience_signal(content: str, ctx: ProductContext) -> GateResult:
 # Aggregate Editor Review
 # ─────────────────────────────────────────────────────────────────────────────
 
+@dataclass(frozen=True)
+class GateInput:
+    """Everything a gate may read; built once per review."""
+
+    content: str
+    item: ContentPipelineItem
+    ctx: ProductContext
+    scan: TextScan
+
+
+@dataclass(frozen=True)
+class EditorGate:
+    """A registered quality gate and its relative cost."""
+
+    name: str
+    cost: int
+    check: Callable[[GateInput], GateResult]
+
+    @property
+    def expensive(self) -> bool:
+        return self.cost >= EXPENSIVE_GATE_COST
+
+
+# Gate registry in report order. Execution order is by cost: cheap gates
+# run inline first, expensive gates run concurrently on the gate executor.
+EDITOR_GATES: list[EditorGate] = [
+    EditorGate("factual_accuracy", GATE_COST_SCAN, lambda g: _check_factual_accuracy(g.content, g.ctx, g.scan)),
+    EditorGate("readability", EXPENSIVE_GATE_COST, lambda g: _check_readability(g.content)),
+    EditorGate("guardrails", GATE_COST_REGEX, lambda g: _check_guardrails(g.content, g.scan)),
+    EditorGate("no_external_urls", GATE_COST_SCAN, lambda g: _check_no_urls(g.content, g.scan)),
+    EditorGate("no_unsupported_claims", GATE_COST_SCAN, lambda g: _check_no_unsupported_claims(g.content, g.scan)),
+    EditorGate("topical_relevance", GATE_COST_SCAN, lambda g: _check_topical_relevance(g.content, g.item, g.scan)),
+    EditorGate("experience_signal", GATE_COST_SCAN, lambda g: _check_experience_signal(g.content, g.ctx, g.scan)),
+]
+
+
+_executor_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_executor_pid: int | None = None
+
+
+def _gate_executor() -> ThreadPoolExecutor:
+    """Process-wide pool for expensive gates (recreated after fork)."""
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.editor_gate_workers),
+                thread_name_prefix="editor-gate",
+            )
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def _run_gates(
+    gates: list[EditorGate],
+    gate_input: GateInput,
+    short_circuit: bool,
+) -> tuple[dict[str, GateResult], bool]:
+    """Run ``gates`` cheapest first; returns (results by name, stopped early)."""
+    ordered = sorted(gates, key=lambda gate: gate.cost)
+    cheap = [gate for gate in ordered if not gate.expensive]
+    expensive = [gate for gate in ordered if gate.expensive]
+    results: dict[str, GateResult] = {}
+
+    # In full mode expensive gates start straight away and overlap the cheap
+    # ones; in short-circuit mode they only start once every cheap gate passed.
+    futures: dict[str, Future] = {}
+    if not short_circuit:
+        futures = {gate.name: _gate_executor().submit(gate.check, gate_input) for gate in expensive}
+
+    for gate in cheap:
+        result = gate.check(gate_input)
+        results[gate.name] = result
+        if short_circuit and not result.passed:
+            return results, True
+
+    if short_circuit:
+        futures = {gate.name: _gate_executor().submit(gate.check, gate_input) for gate in expensive}
+    for gate in expensive:
+        results[gate.name] = futures[gate.name].result()
+    return results, False
+
+
 def review_content(
     content: str,
     item: ContentPipelineItem,
     ctx: ProductContext | None = None,
+    mode: str | None = None,
 ) -> EditorVerdict:
-    """Run all 7 quality gates on a piece of content.
+    """Run the registered quality gates on a piece of content.
 
     Args:
         content: The draft text to review
         item: The pipeline item being reviewed
         ctx: Product context (loaded from singleton if not provided)
+        mode: "full" reports every gate; "short_circuit" stops at the first
+            failure and marks the remaining gates skipped. Defaults to
+            settings.editor_review_mode.
 
     Returns:
-        EditorVerdict with gate results and scores
+        EditorVerdict with gate results (in registry order) and scores
     """
     if ctx is None:
         ctx = get_product_context()
+    mode = mode or settings.editor_review_mode
+    if mode not in REVIEW_MODES:
+        raise ValueError(f"Unknown editor review mode {mode!r}; expected one of {REVIEW_MODES}")
 
+    # One pass over the text serves every phrase-based gate
+    gate_input = GateInput(content=content, item=item, ctx=ctx, scan=scan_content(content, ctx))
+    results, short_circuited = _run_gates(EDITOR_GATES, gate_input, mode == REVIEW_MODE_SHORT_CIRCUIT)
     gates = [
-        _check_factual_accuracy(content, ctx),
-        _check_readability(content),
-        _check_guardrails(content),
-        _check_no_urls(content),
-        _check_no_unsupported_claims(content),
-        _check_topical_relevance(content, item),
-        _check_experience_signal(content, ctx),
+        results.get(gate.name) or GateResult(gate_name=gate.name, passed=False, skipped=True)
+        for gate in EDITOR_GATES
     ]
 
     passed_count = sum(1 for g in gates if g.passed)
     quality_score = passed_count / len(gates)
 
-    # Get readability score from gate 2
+    # Get readability score from the readability gate
     readability_score = 0.0
-    readability_gate = gates[1]
-    if readability_gate.message and "Grade level" in readability_gate.message:
+    readability_gate = results.get("readability")
+    if readability_gate and readability_gate.message and "Grade level" in readability_gate.message:
         try:
             readability_score = float(
                 readability_gate.message.split("Grade level ")[1].split(" ")[0]
@@ -353,6 +535,7 @@ def review_content(
         gate_results=gates,
         quality_score=quality_score,
         readability_score=readability_score,
+        short_circuited=short_circuited,
     )
 
 
@@ -375,72 +558,74 @@ def process_one_item(db: Session, item: ContentPipelineItem, worker_id: str) ->
     Returns:
         True if item passed all gates and transitioned to READY_TO_PUBLISH
     """
+    token = item.claim_token
+
     # Get the draft content
     if not item.draft_id:
         logger.warning("Editor: item %s has no draft_id — skipping", item.id)
-        release_claim(db, item.id, "review")
+        release_claim(db, item.id, "review", claim_token=token)
         return False
 
     draft = db.query(Draft).filter_by(id=item.draft_id).first()
 
     if not draft:
         logger.warning("Editor: draft %s not found for item %s", item.draft_id, item.id)
-        release_claim(db, item.id, "review")
+        release_claim(db, item.id, "review", claim_token=token)
         return False
 
     content = draft.content_body
 
     # Run quality gates
     verdict = review_content(content, item)
+    scores = {
+        "quality_score": verdict.quality_score,
+        "readability_score": verdict.readability_score,
+    }
 
     if verdict.passed:
-        # All gates passed — update quality fields and advance
-        item.quality_score = verdict.quality_score
-        item.readability_score = verdict.readability_score
-        item.fact_check_status = "passed"
-        db.commit()
-
-        transition(db, item.id, PipelineStatus.review, PipelineStatus.ready_to_publish)
-        release_claim(db, item.id, "review")
+        # All gates passed — record scores, advance and release in one write
+        advance_item(
+            db, item.id, PipelineStatus.review, PipelineStatus.ready_to_publish,
+            worker_id=worker_id,
+            claim_token=token,
+            values={**scores, "fact_check_status": "passed"},
+        )
 
         logger.info(
             "Editor: item %s PASSED all gates — quality=%.2f readability=%.1f",
             item.id, verdict.quality_score, verdict.readability_score,
         )
         return True
-    else:
-        # Some gates failed — record feedback and handle revision
-        failure_msg = verdict.failure_summary
-        increment_revision(db, item.id, failure_msg)
-
-        item.quality_score = verdict.quality_score
-        item.readability_score = verdict.readability_score
-        item.fact_check_status = "failed"
-        db.commit()
-
-        # Refresh item to get updated revision_count
-        db.refresh(item)
-
-        if has_exceeded_max_revisions(item):
-            # Max revisions — send to BACKLOG for human review
-            transition(db, item.id, PipelineStatus.review, PipelineStatus.backlog)
-            release_claim(db, item.id, "review")
-            logger.warning(
-                "Editor: item %s exceeded max revisions (%d) — sent to BACKLOG",
-                item.id, item.revision_count,
-            )
-        else:
-            # Send back to TODO for Writer retry
-            transition(db, item.id, PipelineStatus.review, PipelineStatus.todo)
-            release_claim(db, item.id, "review")
-            logger.info(
-                "Editor: item %s FAILED gates (revision %d/%d): %s",
-                item.id, item.revision_count, item.max_revisions, failure_msg,
-            )
 
-        return False
+    # Some gates failed — record feedback, bump the revision and send the
+    # item back to TODO (or to BACKLOG for human review once the next
+    # revision would exceed the limit)
+    failure_msg = verdict.failure_summary
+    exceeded = item.revision_count + 1 >= item.max_revisions
+    target = PipelineStatus.backlog if exceeded else PipelineStatus.todo
+    item = advance_item(
+        db, item.id, PipelineStatus.review, target,
+        worker_id=worker_id,
+        claim_token=token,
+        bump_revision=True,
+        error=failure_msg,
+        values={**scores, "fact_check_status": "failed"},
+    )
+
+    if exceeded:
+        logger.warning(
+            "Editor: item %s exceeded max revisions (%d) — sent to BACKLOG",
+            item.id, item.revision_count,
+        )
+    else:
+        logger.info(
+            "Editor: item %s FAILED gates (revision %d/%d): %s",
+            item.id, item.revision_count, item.max_revisions, failure_msg,
+        )
+    return False
 
 
+@observe_agent_run("editor")
 def run_editor(db: Session, max_items: int = 3) -> int:
     """Execute the Editor agent.
 
@@ -454,23 +639,241 @@ def run_editor(db: Session, max_items: int = 3) -> int:
     Returns:
         Number of items that passed all gates
     """
-    unclaimed = get_unclaimed_items_by_status(db, PipelineStatus.review)
-    if not unclaimed:
+    worker_id = _worker_id()
+    claimed = claim_batch(db, PipelineStatus.review, "review", worker_id, limit=max_items)
+    if not claimed:
         logger.debug("Editor: no unclaimed REVIEW items")
         return 0
 
-    worker_id = _worker_id()
     passed_count = 0
 
-    for item in unclaimed[:max_items]:
-        if not attempt_claim(db, item.id, "review", worker_id):
-            continue
+    for item in claimed:
+        if process_one_item(db, item, worker_id):
+            passed_count += 1
 
-        if not verify_claim(db, item.id, "review", worker_id):
-            continue
+    logger.info("Editor: %d/%d items passed review", passed_count, len(claimed))
+    return passed_count
 
-        if process_one_item(db, item, worker_id):
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Batch Review
+# ─────────────────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class ReviewSubject:
+    """Picklable stand-in for a pipeline item, sent to review processes."""
+
+    id: uuid.UUID
+    pillar_theme: str | None = None
+    sub_theme: str | None = None
+    topic_keyword: str | None = None
+
+
+def _review_job(job: tuple[str, ReviewSubject, ProductContext, str]) -> EditorVerdict:
+    content, subject, ctx, mode = job
+    return review_content(content, subject, ctx, mode)
+
+
+_process_pool_lock = threading.Lock()
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_key: tuple[int, int] | None = None
+
+
+def _review_process_pool(processes: int) -> ProcessPoolExecutor:
+    """Process-wide review pool (recreated after fork or a size change).
+
+    Uses spawn so children never inherit the gate executor's threads.
+    """
+    global _process_pool, _process_pool_key
+    key = (os.getpid(), processes)
+    with _process_pool_lock:
+        if _process_pool is None or _process_pool_key != key:
+            if _process_pool is not None and _process_pool_key[0] == os.getpid():
+                _process_pool.shutdown(wait=False)
+            _process_pool = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _process_pool_key = key
+        return _process_pool
+
+
+def review_batch(
+    jobs: list[tuple[str, ContentPipelineItem]],
+    processes: int | None = None,
+    ctx: ProductContext | None = None,
+) -> list[EditorVerdict]:
+    """Review several (content, item) pairs; verdicts come back in input order.
+
+    With ``processes`` > 1 (default settings.editor_review_processes) the
+    batch is spread over a process pool, which sidesteps the GIL for the
+    CPU-bound gates (textstat, the phrase scan). Items are sent as
+    ReviewSubject snapshots.
+    """
+    if ctx is None:
+        ctx = get_product_context()
+    mode = settings.editor_review_mode
+    processes = settings.editor_review_processes if processes is None else processes
+
+    if processes <= 1 or len(jobs) < 2:
+        return [review_content(content, item, ctx, mode) for content, item in jobs]
+
+    payload = [
+        (
+            content,
+            ReviewSubject(
+                id=item.id,
+                pillar_theme=item.pillar_theme,
+                sub_theme=item.sub_theme,
+                topic_keyword=item.topic_keyword,
+            ),
+            ctx,
+            mode,
+        )
+        for content, item in jobs
+    ]
+    chunksize = max(1, len(payload) // (processes * 4))
+    return list(_review_process_pool(processes).map(_review_job, payload, chunksize=chunksize))
+
+
+def _batch_outcome(item: ContentPipelineItem, verdict: EditorVerdict | None) -> dict:
+    """Target values for one reviewed item (``verdict`` None = no draft, release only)."""
+    values = {
+        "b_id": item.id,
+        "b_claim_token": item.claim_token,
+        "b_status": item.status,
+        "b_revision_count": item.revision_count,
+        "b_last_error": item.last_error,
+        "b_quality_score": item.quality_score,
+        "b_readability_score": item.readability_score,
+        "b_fact_check_status": item.fact_check_status,
+    }
+    if verdict is None:
+        return values
+
+    values["b_quality_score"] = verdict.quality_score
+    values["b_readability_score"] = verdict.readability_score
+    if verdict.passed:
+        values["b_status"] = PipelineStatus.ready_to_publish
+        values["b_fact_check_status"] = "passed"
+    else:
+        values["b_revision_count"] = item.revision_count + 1
+        values["b_last_error"] = verdict.failure_summary
+        values["b_fact_check_status"] = "failed"
+        exceeded = values["b_revision_count"] >= item.max_revisions
+        values["b_status"] = PipelineStatus.backlog if exceeded else PipelineStatus.todo
+
+    if not is_valid_transition(PipelineStatus.review, values["b_status"]):
+        raise TransitionError(
+            f"Invalid transition: {PipelineStatus.review.name} → {values['b_status'].name}"
+        )
+    return values
+
+
+@observe_agent_run("editor")
+def run_editor_batch(
+    db: Session,
+    max_items: int | None = None,
+    processes: int | None = None,
+) -> int:
+    """Execute the Editor agent over one claimed batch.
+
+    Claims up to ``max_items`` REVIEW items (default settings.editor_batch_size),
+    loads their drafts with one IN query, reviews them (see review_batch) and
+    applies every verdict, revision increment, transition and claim release
+    as one executemany UPDATE, plus one batched transition-log INSERT, in
+    a single transaction. Reviews run under a
+    ClaimHeartbeat for the whole batch. Each row is guarded on
+    status=REVIEW and this worker's claim and fencing token, so an item
+    recovered by Morgan mid-review is left alone.
+
+    Returns:
+        Number of items that passed all gates
+    """
+    limit = settings.editor_batch_size if max_items is None else max_items
+    worker_id = _worker_id()
+    claimed = claim_batch(db, PipelineStatus.review, "review", worker_id, limit=limit)
+    if not claimed:
+        logger.debug("Editor: no unclaimed REVIEW items")
+        return 0
+
+    draft_ids = {item.draft_id for item in claimed if item.draft_id}
+    bodies = dict(
+        db.query(Draft.id, Draft.content_body).filter(Draft.id.in_(draft_ids)).all()
+    ) if draft_ids else {}
+
+    reviewable = [item for item in claimed if item.draft_id in bodies]
+    for item in claimed:
+        if item.draft_id not in bodies:
+            logger.warning("Editor: item %s has no draft (draft_id=%s) — skipping", item.id, item.draft_id)
+
+    with ClaimHeartbeat(db, {item.id: item.claim_token for item in claimed}, worker_id):
+        verdicts = dict(zip(
+            (item.id for item in reviewable),
+            review_batch([(bodies[item.draft_id], item) for item in reviewable], processes=processes),
+        ))
+    rows = [_batch_outcome(item, verdicts.get(item.id)) for item in claimed]
+
+    now = datetime.now(timezone.utc)
+    table = ContentPipelineItem.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .where(table.c.status == PipelineStatus.review)
+        .where(table.c.claimed_by == worker_id)
+        .where(table.c.claim_token == bindparam("b_claim_token"))
+        .values(
+            status=bindparam("b_status"),
+            revision_count=bindparam("b_revision_count"),
+            last_error=bindparam("b_last_error"),
+            quality_score=bindparam("b_quality_score"),
+            readability_score=bindparam("b_readability_score"),
+            fact_check_status=bindparam("b_fact_check_status"),
+            updated_at=now,
+            claimed_by=None,
+            claimed_at=None,
+            claim_stage=None,
+            claim_expires_at=None,
+        )
+    )
+    result = db.execute(stmt, rows)
+    all_applied = result.supports_sane_multi_rowcount() and result.rowcount == len(rows)
+    if not all_applied and result.supports_sane_multi_rowcount():
+        logger.warning(
+            "Editor: %d/%d batch outcomes not applied (claim lost or status changed)",
+            len(rows) - result.rowcount, len(rows),
+        )
+
+    moved = [row for row in rows if row["b_id"] in verdicts]
+    if moved and not all_applied:
+        # Only log the rows this batch actually wrote
+        applied = set(db.scalars(
+            select(table.c.id)
+            .where(table.c.id.in_([row["b_id"] for row in moved]))
+            .where(table.c.updated_at == now)
+        ))
+        moved = [row for row in moved if row["b_id"] in applied]
+    record_transitions(db, [
+        transition_row(
+            row["b_id"], PipelineStatus.review, row["b_status"], row["b_revision_count"], worker_id, now,
+        )
+        for row in moved
+    ])
+    db.commit()
+
+    # Count, hand off and log only what this batch applied: a row whose
+    # claim was lost belongs to whoever holds the item now
+    passed_count = 0
+    for row in moved:
+        verdict = verdicts[row["b_id"]]
+        if verdict.passed:
             passed_count += 1
+        on_transition(row["b_id"], row["b_status"], row["b_revision_count"])
+        logger.info(
+            "Editor: item %s %s — quality=%.2f revision=%d → %s",
+            row["b_id"], "PASSED" if verdict.passed else "FAILED",
+            verdict.quality_score, row["b_revision_count"], row["b_status"].name,
+        )
 
-    logger.info("Editor: %d/%d items passed review", passed_count, len(unclaimed[:max_items]))
+    logger.info("Editor: %d/%d items passed batch review", passed_count, len(claimed))
     return passed_count
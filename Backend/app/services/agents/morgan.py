@@ -3,8 +3,11 @@
 Morgan is the operational overseer of the V6 content pipeline.
 It runs periodically to:
 
-1. **Recover stale claims** — release pipeline items stuck with expired
-   claim locks so other agents can pick them up.
+1. **Recover stale claims** — release pipeline items whose claim lease
+   has expired (the holder stopped heartbeating) so other agents can pick
+   them up. This step also runs on its own every minute
+   (v6_recover_claims), so a dead worker's items are back within a
+   minute or so of its lease running out.
 2. **Reset errored items** — items stuck with last_error set and no
    forward progress get reset to an earlier status for retry.
 3. **Generate pipeline health report** — aggregated pipeline statistics
@@ -19,17 +22,23 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
+from ...config import settings
+from ...metrics import observe_agent_run
 from ...models import ContentPipelineItem, PipelineStatus
-from ..claim_lock import find_stale_claims, force_release_claim
+from ..claim_lock import stale_clause
 from ..pipeline import (
     ALLOWED_TRANSITIONS,
     get_pipeline_overview,
-    transition,
+    is_valid_transition,
+    record_transitions,
+    transition_row,
     TransitionError,
 )
 from ..audit import log_audit
+from ..stage_handoff import on_transition
 
 logger = logging.getLogger(__name__)
 
@@ -41,50 +50,107 @@ ERROR_STALE_MINUTES = 60
 # Maximum times Morgan will attempt to auto-reset an errored item before giving up.
 MORGAN_MAX_AUTO_RESETS = 2
 
-
-def recover_stale_claims(db: Session, max_age_minutes: int = 30) -> list[dict]:
-    """Find and release pipeline items with stale claims.
+# Where reset_errored_items sends errored items, by current status.
+RESET_TARGETS: dict[PipelineStatus, PipelineStatus] = {
+    PipelineStatus.writing: PipelineStatus.todo,
+    PipelineStatus.review: PipelineStatus.todo,
+    PipelineStatus.ready_to_publish: PipelineStatus.backlog,
+}
+
+
+def _chunk_candidates(db: Session, stmt, chunk_size: int):
+    """Limit a candidate SELECT to one chunk, locking its rows on PostgreSQL."""
+    stmt = stmt.order_by(ContentPipelineItem.id).limit(chunk_size)
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = stmt.with_for_update(skip_locked=True)
+    return db.execute(stmt).all()
+
+
+def recover_stale_claims(
+    db: Session,
+    max_age_minutes: int = 30,
+    dry_run: bool = False,
+    chunk_size: int | None = None,
+) -> list[dict]:
+    """Find and release pipeline items whose claim lease has expired.
+
+    ``max_age_minutes`` only applies to claims written without a lease.
+    Works in chunks of ``chunk_size`` (default settings.morgan_chunk_size):
+    one SELECT for the previous holders, one UPDATE ... RETURNING that
+    re-checks the lease (a holder that renewed in the meantime keeps its
+    claim) and one audit row, committed together. With ``dry_run`` only
+    the SELECT runs and nothing is written.
 
     Returns a list of recovery records with item details.
     """
-    stale_items = find_stale_claims(db, max_age_minutes=max_age_minutes)
-    recoveries = []
-
-    for item in stale_items:
-        item_id = item.id
-        prev_worker = item.claimed_by
-        prev_stage = item.claim_stage
-        prev_status = item.status.name if item.status else "unknown"
-
-        released = force_release_claim(db, item_id)
-
-        if released:
-            record = {
-                "item_id": str(item_id),
+    chunk_size = chunk_size or settings.morgan_chunk_size
+    item = ContentPipelineItem
+    candidates = select(item.id, item.claimed_by, item.claim_stage, item.claim_token, item.status)
+    recoveries: list[dict] = []
+
+    while True:
+        now = datetime.now(timezone.utc)
+        stale = stale_clause(now, max_age_minutes)
+        if dry_run:
+            rows = db.execute(candidates.where(stale)).all()
+        else:
+            rows = _chunk_candidates(db, candidates.where(stale), chunk_size)
+        if not rows:
+            break
+
+        released = rows if dry_run else {
+            row.id for row in db.execute(
+                update(item)
+                .where(item.id.in_([row.id for row in rows]))
+                .where(stale)
+                .values(claimed_by=None, claimed_at=None, claim_stage=None, claim_expires_at=None)
+                .returning(item.id)
+                .execution_options(synchronize_session=False)
+            )
+        }
+        chunk = [
+            {
+                "item_id": str(row.id),
                 "action": "stale_claim_released",
-                "previous_worker": prev_worker,
-                "previous_stage": prev_stage,
-                "status": prev_status,
+                "previous_worker": row.claimed_by,
+                "previous_stage": row.claim_stage,
+                "claim_token": row.claim_token,
+                "status": row.status.name if row.status else "unknown",
             }
-            recoveries.append(record)
-            logger.warning(
-                "Morgan: released stale claim on item=%s worker=%s stage=%s status=%s",
-                item_id, prev_worker, prev_stage, prev_status,
+            for row in rows
+            if dry_run or row.id in released
+        ]
+        recoveries.extend(chunk)
+
+        if dry_run:
+            break
+        if chunk:
+            log_audit(
+                db=db,
+                actor="morgan",
+                action="pipeline.stale_claims_recovered",
+                resource_type="pipeline",
+                detail={"count": len(chunk), "items": chunk},
             )
-
-    if recoveries:
-        log_audit(
-            db=db,
-            actor="morgan",
-            action="pipeline.stale_claims_recovered",
-            resource_type="pipeline",
-            detail={"count": len(recoveries), "items": recoveries},
+        else:
+            db.commit()
+        logger.warning(
+            "Morgan: released %d stale claims (%d candidates in chunk)", len(chunk), len(rows),
         )
+        if len(rows) < chunk_size or not chunk:
+            break
 
+    if dry_run and recoveries:
+        logger.info("Morgan: dry run — %d stale claims would be released", len(recoveries))
     return recoveries
 
 
-def reset_errored_items(db: Session, stale_minutes: int = ERROR_STALE_MINUTES) -> list[dict]:
+def reset_errored_items(
+    db: Session,
+    stale_minutes: int = ERROR_STALE_MINUTES,
+    dry_run: bool = False,
+    chunk_size: int | None = None,
+) -> list[dict]:
     """Find pipeline items stuck with errors and reset them for retry.
 
     An item is considered stuck if:
@@ -92,89 +158,115 @@ def reset_errored_items(db: Session, stale_minutes: int = ERROR_STALE_MINUTES) -
     - It is not in a terminal state (DONE)
     - It is not currently claimed by another agent
     - Its updated_at is older than stale_minutes ago
+    - Morgan has not already reset it MORGAN_MAX_AUTO_RESETS times past
+      its max_revisions
 
     Reset behavior by status:
     - WRITING → TODO (so Writer can retry)
     - REVIEW → TODO (so Writer can regenerate)
-    - READY_TO_PUBLISH → REVIEW (so Editor can re-check)
+    - READY_TO_PUBLISH → BACKLOG (for human review)
     - TODO, BACKLOG → left alone (already at starting points)
     - PUBLISHED, AMPLIFIED, DONE → left alone (past the production boundary)
 
+    Each status is reset in chunks like recover_stale_claims: one SELECT
+    for the errors being cleared, one UPDATE ... RETURNING guarded on the
+    item still being unclaimed and errored, one batched transition-log
+    INSERT and one audit row per chunk, committed together.
+    With ``dry_run`` only the SELECTs run.
+
     Returns a list of reset records.
     """
+    chunk_size = chunk_size or settings.morgan_chunk_size
     cutoff = datetime.now(timezone.utc) - timedelta(minutes=stale_minutes)
-    resets = []
+    item = ContentPipelineItem
+    resets: list[dict] = []
 
-    # Statuses we attempt to reset
-    reset_targets = {
-        PipelineStatus.writing: PipelineStatus.todo,
-        PipelineStatus.review: PipelineStatus.todo,
-        PipelineStatus.ready_to_publish: PipelineStatus.backlog,
-    }
+    for from_status, to_status in RESET_TARGETS.items():
+        if not is_valid_transition(from_status, to_status):
+            raise TransitionError(f"Invalid transition: {from_status.name} → {to_status.name}")
 
-    for from_status, to_status in reset_targets.items():
-        errored_items = (
-            db.query(ContentPipelineItem)
-            .filter(ContentPipelineItem.status == from_status)
-            .filter(ContentPipelineItem.last_error.is_not(None))
-            .filter(ContentPipelineItem.claimed_by.is_(None))
-            .filter(ContentPipelineItem.updated_at <= cutoff)
-            .all()
+        errored = (
+            (item.status == from_status)
+            & item.last_error.is_not(None)
+            & item.claimed_by.is_(None)
+        )
+        candidates = (
+            select(item.id, item.last_error, item.revision_count)
+            .where(errored)
+            .where(item.updated_at <= cutoff)
+            .where(item.revision_count < item.max_revisions + MORGAN_MAX_AUTO_RESETS)
         )
 
-        for item in errored_items:
-            # Check if Morgan has already reset this item too many times
-            # We track this by counting how many times the revision count
-            # exceeds a threshold relative to max_revisions
-            if item.revision_count >= (item.max_revisions + MORGAN_MAX_AUTO_RESETS):
-                logger.info(
-                    "Morgan: skipping item=%s — exceeded max auto-resets "
-                    "(revision_count=%d, max_revisions=%d, morgan_max=%d)",
-                    item.id, item.revision_count, item.max_revisions,
-                    MORGAN_MAX_AUTO_RESETS,
+        while True:
+            if dry_run:
+                rows = db.execute(candidates).all()
+            else:
+                rows = _chunk_candidates(db, candidates, chunk_size)
+            if not rows:
+                break
+
+            now = datetime.now(timezone.utc)
+            reset_ids = {row.id for row in rows} if dry_run else {
+                row.id for row in db.execute(
+                    update(item)
+                    .where(item.id.in_([row.id for row in rows]))
+                    .where(errored)
+                    .values(status=to_status, last_error=None, updated_at=now)
+                    .returning(item.id)
+                    .execution_options(synchronize_session=False)
                 )
-                continue
-
-            try:
-                transition(db, item.id, from_status, to_status)
-                # Clear the error after successful reset
-                item.last_error = None
-                item.updated_at = datetime.now(timezone.utc)
-                db.commit()
-
-                record = {
-                    "item_id": str(item.id),
+            }
+            chunk = [
+                {
+                    "item_id": str(row.id),
                     "action": "error_reset",
                     "from_status": from_status.name,
                     "to_status": to_status.name,
-                    "previous_error": item.last_error,
-                    "revision_count": item.revision_count,
+                    "previous_error": row.last_error,
+                    "revision_count": row.revision_count,
                 }
-                resets.append(record)
-                logger.info(
-                    "Morgan: reset errored item=%s %s → %s (revision %d)",
-                    item.id, from_status.name, to_status.name, item.revision_count,
-                )
-            except (TransitionError, ValueError) as exc:
-                logger.warning(
-                    "Morgan: failed to reset item=%s: %s", item.id, exc,
+                for row in rows
+                if row.id in reset_ids
+            ]
+            resets.extend(chunk)
+
+            if dry_run:
+                break
+            if chunk:
+                record_transitions(db, [
+                    transition_row(row.id, from_status, to_status, row.revision_count, "morgan", now)
+                    for row in rows
+                    if row.id in reset_ids
+                ])
+                log_audit(
+                    db=db,
+                    actor="morgan",
+                    action="pipeline.errored_items_reset",
+                    resource_type="pipeline",
+                    detail={"count": len(chunk), "items": chunk},
                 )
+            else:
+                db.commit()
+            logger.info(
+                "Morgan: reset %d errored items %s → %s",
+                len(chunk), from_status.name, to_status.name,
+            )
+            for record in chunk:
+                on_transition(record["item_id"], to_status, record["revision_count"])
+            if len(rows) < chunk_size or not chunk:
+                break
 
-    if resets:
-        log_audit(
-            db=db,
-            actor="morgan",
-            action="pipeline.errored_items_reset",
-            resource_type="pipeline",
-            detail={"count": len(resets), "items": resets},
-        )
-
+    if dry_run and resets:
+        logger.info("Morgan: dry run — %d errored items would be reset", len(resets))
     return resets
 
 
 def generate_health_report(db: Session) -> dict:
     """Generate a pipeline health report for operational monitoring.
 
+    All counts come from the single cached get_pipeline_overview()
+    aggregate, so the report costs at most one round trip.
+
     Returns a summary dict with:
     - overview: status counts from pipeline service
     - stale_claims: count of items with expired claims
@@ -183,37 +275,9 @@ def generate_health_report(db: Session) -> dict:
     - health_status: "healthy", "degraded", or "unhealthy"
     """
     overview = get_pipeline_overview(db)
-
-    # Count stale claims (expired but not released)
-    stale_claims = find_stale_claims(db, max_age_minutes=30)
-    stale_count = len(stale_claims)
-
-    # Count errored unclaimed items
-    errored_count = (
-        db.query(ContentPipelineItem)
-        .filter(ContentPipelineItem.last_error.is_not(None))
-        .filter(ContentPipelineItem.claimed_by.is_(None))
-        .filter(ContentPipelineItem.status.notin_([PipelineStatus.done, PipelineStatus.backlog]))
-        .count()
-    )
-
-    # Count stuck items (not updated in 4+ hours, not terminal, not claimed)
-    stuck_cutoff = datetime.now(timezone.utc) - timedelta(hours=4)
-    non_terminal = [
-        PipelineStatus.todo,
-        PipelineStatus.writing,
-        PipelineStatus.review,
-        PipelineStatus.ready_to_publish,
-        PipelineStatus.published,
-        PipelineStatus.amplified,
-    ]
-    stuck_count = (
-        db.query(ContentPipelineItem)
-        .filter(ContentPipelineItem.status.in_(non_terminal))
-        .filter(ContentPipelineItem.claimed_by.is_(None))
-        .filter(ContentPipelineItem.updated_at <= stuck_cutoff)
-        .count()
-    )
+    stale_count = overview["stale_claims"]
+    errored_count = overview["errored"]
+    stuck_count = overview["stuck"]
 
     # Determine overall health
     if stale_count > 0 or errored_count >= 3:
@@ -240,20 +304,23 @@ def generate_health_report(db: Session) -> dict:
     return report
 
 
-def run_morgan(db: Session, max_age_minutes: int = 30) -> dict:
+@observe_agent_run("morgan")
+def run_morgan(db: Session, max_age_minutes: int = 30, dry_run: bool = False) -> dict:
     """Run the full Morgan PM self-healing cycle.
 
     1. Recover stale claims
     2. Reset errored items
     3. Generate health report
 
-    Returns a summary of all actions taken.
+    With ``dry_run`` steps 1 and 2 report what they would change without
+    writing anything. Returns a summary of all actions taken.
     """
-    recoveries = recover_stale_claims(db, max_age_minutes=max_age_minutes)
-    resets = reset_errored_items(db)
+    recoveries = recover_stale_claims(db, max_age_minutes=max_age_minutes, dry_run=dry_run)
+    resets = reset_errored_items(db, dry_run=dry_run)
     health = generate_health_report(db)
 
     return {
+        "dry_run": dry_run,
         "stale_claims_recovered": len(recoveries),
         "errored_items_reset": len(resets),
         "health": health,
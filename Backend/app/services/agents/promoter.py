@@ -16,9 +16,10 @@ import uuid
 
 from sqlalchemy.orm import Session
 
+from ...metrics import observe_agent_run
 from ...models import ContentPipelineItem, Draft, PipelineStatus, SocialStatus
-from ..claim_lock import attempt_claim, release_claim, verify_claim
-from ..pipeline import get_unclaimed_items_by_status, transition
+from ..claim_lock import claim_batch
+from ..pipeline import advance_item
 from ..telegram_service import send_telegram_message
 
 logger = logging.getLogger(__name__)
@@ -45,6 +46,8 @@ def process_one_item(db: Session, item: ContentPipelineItem, worker_id: str) ->
     Returns:
         True if item was successfully promoted
     """
+    token = item.claim_token
+
     # Build engagement prompt message
     draft = None
     if item.draft_id:
@@ -71,26 +74,27 @@ def process_one_item(db: Session, item: ContentPipelineItem, worker_id: str) ->
         event_type="V6_ENGAGEMENT_PROMPT",
     )
 
-    # Update social status
-    item.social_status = SocialStatus.amplified
-    db.commit()
-
-    # Transition PUBLISHED → AMPLIFIED
-    transition(db, item.id, PipelineStatus.published, PipelineStatus.amplified)
+    # Transition PUBLISHED → AMPLIFIED (claim kept for the final step)
+    advance_item(
+        db, item.id, PipelineStatus.published, PipelineStatus.amplified,
+        worker_id=worker_id, claim_token=token, release_claim=False,
+        values={"social_status": SocialStatus.amplified},
+    )
 
     # Transition AMPLIFIED → DONE (completes the pipeline lifecycle)
-    transition(db, item.id, PipelineStatus.amplified, PipelineStatus.done)
-
-    # Update social status to monitoring complete
-    item.social_status = SocialStatus.monitoring_complete
-    db.commit()
-
-    release_claim(db, item.id, "promote")
+    # and mark monitoring complete
+    advance_item(
+        db, item.id, PipelineStatus.amplified, PipelineStatus.done,
+        worker_id=worker_id,
+        claim_token=token,
+        values={"social_status": SocialStatus.monitoring_complete},
+    )
 
     logger.info("Promoter: item %s → DONE (engagement prompt sent)", item.id)
     return True
 
 
+@observe_agent_run("promoter")
 def run_promoter(db: Session, max_items: int = 3) -> int:
     """Execute the Promoter agent.
 
@@ -104,26 +108,20 @@ def run_promoter(db: Session, max_items: int = 3) -> int:
     Returns:
         Number of items successfully promoted
     """
-    unclaimed = get_unclaimed_items_by_status(db, PipelineStatus.published)
-    if not unclaimed:
+    worker_id = _worker_id()
+    claimed = claim_batch(db, PipelineStatus.published, "promote", worker_id, limit=max_items)
+    if not claimed:
         logger.debug("Promoter: no unclaimed PUBLISHED items")
         return 0
 
-    worker_id = _worker_id()
     promoted_count = 0
 
-    for item in unclaimed[:max_items]:
-        if not attempt_claim(db, item.id, "promote", worker_id):
-            continue
-
-        if not verify_claim(db, item.id, "promote", worker_id):
-            continue
-
+    for item in claimed:
         if process_one_item(db, item, worker_id):
             promoted_count += 1
 
     logger.info(
         "Promoter: %d/%d items promoted",
-        promoted_count, len(unclaimed[:max_items]),
+        promoted_count, len(claimed),
     )
     return promoted_count
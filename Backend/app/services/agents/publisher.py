@@ -17,6 +17,7 @@ from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
 
+from ...metrics import observe_agent_run
 from ...models import (
     ContentPipelineItem,
     Draft,
@@ -25,8 +26,8 @@ from ...models import (
     PostTone,
     PublishedPost,
 )
-from ..claim_lock import attempt_claim, release_claim, verify_claim
-from ..pipeline import get_unclaimed_items_by_status, transition
+from ..claim_lock import ClaimHeartbeat, claim_batch, release_claim
+from ..pipeline import advance_item
 from ..telegram_service import send_telegram_message
 from ..time_utils import random_schedule_for_day
 from ..webhook_service import send_webhook
@@ -58,10 +59,13 @@ def process_one_item(db: Session, item: ContentPipelineItem, worker_id: str, sha
     Returns:
         True if item was successfully published
     """
+    # Fencing token of this claim — commits below expire the item
+    token = item.claim_token
+
     # Get the linked draft
     if not item.draft_id:
         logger.warning("Publisher: item %s has no draft_id — skipping", item.id)
-        release_claim(db, item.id, "publish")
+        release_claim(db, item.id, "publish", claim_token=token)
         return False
 
     draft = db.query(Draft).filter_by(id=item.draft_id).first()
@@ -70,7 +74,7 @@ def process_one_item(db: Session, item: ContentPipelineItem, worker_id: str, sha
             "Publisher: draft %s not found for item %s — skipping",
             item.draft_id, item.id,
         )
-        release_claim(db, item.id, "publish")
+        release_claim(db, item.id, "publish", claim_token=token)
         return False
 
     # Create a PublishedPost record (bridges V6 pipeline to legacy publish model)
@@ -97,37 +101,42 @@ def process_one_item(db: Session, item: ContentPipelineItem, worker_id: str, sha
             item.id,
         )
     else:
-        # Fire Zapier webhook — primary automated publishing path
-        send_webhook(
-            db=db,
-            event="post.publish_ready",
-            data={
-                "post_id": str(published_post.id),
-                "pipeline_item_id": str(item.id),
-                "content": draft.content_body,
-                "format": draft.format.value if draft.format else "TEXT",
-                "pillar_theme": item.pillar_theme or draft.pillar_theme or "",
-                "sub_theme": item.sub_theme or draft.sub_theme or "",
-            },
-        )
-
-        # Send Telegram manual-publish reminder as fallback
-        send_telegram_message(
-            db=db,
-            text=(
-                "V6 Pipeline — Ready to Publish\n\n"
-                f"Pipeline item: {str(item.id)[:8]}...\n"
-                f"Theme: {item.pillar_theme or 'N/A'}\n"
-                f"Sub-theme: {item.sub_theme or 'N/A'}\n\n"
-                f"{draft.content_body[:500]}\n\n"
-                "Zapier webhook has been fired. Confirm publication when live."
-            ),
-            event_type="V6_PUBLISH_READY",
-        )
-
-    # Transition pipeline item to PUBLISHED
-    transition(db, item.id, PipelineStatus.ready_to_publish, PipelineStatus.published)
-    release_claim(db, item.id, "publish")
+        # Webhook retries back off for a while; keep the lease alive meanwhile
+        with ClaimHeartbeat(db, {item.id: token}, worker_id):
+            # Fire Zapier webhook — primary automated publishing path
+            send_webhook(
+                db=db,
+                event="post.publish_ready",
+                data={
+                    "post_id": str(published_post.id),
+                    "pipeline_item_id": str(item.id),
+                    "content": draft.content_body,
+                    "format": draft.format.value if draft.format else "TEXT",
+                    "pillar_theme": item.pillar_theme or draft.pillar_theme or "",
+                    "sub_theme": item.sub_theme or draft.sub_theme or "",
+                },
+            )
+
+            # Send Telegram manual-publish reminder as fallback
+            send_telegram_message(
+                db=db,
+                text=(
+                    "V6 Pipeline — Ready to Publish\n\n"
+                    f"Pipeline item: {str(item.id)[:8]}...\n"
+                    f"Theme: {item.pillar_theme or 'N/A'}\n"
+                    f"Sub-theme: {item.sub_theme or 'N/A'}\n\n"
+                    f"{draft.content_body[:500]}\n\n"
+                    "Zapier webhook has been fired. Confirm publication when live."
+                ),
+                event_type="V6_PUBLISH_READY",
+            )
+
+    # Transition pipeline item to PUBLISHED and release the claim
+    advance_item(
+        db, item.id, PipelineStatus.ready_to_publish, PipelineStatus.published,
+        worker_id=worker_id,
+        claim_token=token,
+    )
 
     logger.info(
         "Publisher: item %s → PUBLISHED (post=%s)",
@@ -136,6 +145,7 @@ def process_one_item(db: Session, item: ContentPipelineItem, worker_id: str, sha
     return True
 
 
+@observe_agent_run("publisher")
 def run_publisher(db: Session, max_items: int = 3, shadow_mode: bool = False) -> int:
     """Execute the Publisher agent.
 
@@ -153,27 +163,21 @@ def run_publisher(db: Session, max_items: int = 3, shadow_mode: bool = False) ->
     Returns:
         Number of items successfully published
     """
-    unclaimed = get_unclaimed_items_by_status(db, PipelineStatus.ready_to_publish)
-    if not unclaimed:
+    worker_id = _worker_id()
+    claimed = claim_batch(db, PipelineStatus.ready_to_publish, "publish", worker_id, limit=max_items)
+    if not claimed:
         logger.debug("Publisher: no unclaimed READY_TO_PUBLISH items")
         return 0
 
-    worker_id = _worker_id()
     published_count = 0
 
-    for item in unclaimed[:max_items]:
-        if not attempt_claim(db, item.id, "publish", worker_id):
-            continue
-
-        if not verify_claim(db, item.id, "publish", worker_id):
-            continue
-
+    for item in claimed:
         if process_one_item(db, item, worker_id, shadow_mode=shadow_mode):
             published_count += 1
 
     mode_label = " (SHADOW)" if shadow_mode else ""
     logger.info(
         "Publisher%s: %d/%d items published",
-        mode_label, published_count, len(unclaimed[:max_items]),
+        mode_label, published_count, len(claimed),
     )
     return published_count
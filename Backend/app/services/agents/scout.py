@@ -1,7 +1,9 @@
 """V6 Scout Agent.
 
 Scans source_materials for recent Adtech content and seeds
-pipeline items at BACKLOG with topic metadata.
+pipeline items at BACKLOG with topic metadata. Items seeded from fresh
+news get news priority and a deadline, so every later stage takes them
+ahead of evergreen topics.
 
 The Scout does not claim items — it creates them.
 """
@@ -13,9 +15,10 @@ from datetime import datetime, timedelta, timezone
 
 from sqlalchemy.orm import Session
 
+from ...metrics import observe_agent_run
 from ...models import ContentPipelineItem, PipelineStatus, SourceMaterial
 from ..content_pyramid import PILLAR_SUB_THEMES, PILLAR_THEMES
-from ..pipeline import create_pipeline_item
+from ..pipeline import PRIORITY_NEWS, PRIORITY_NORMAL, create_pipeline_item
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +28,10 @@ BACKLOG_FLOOR = 5
 # How far back to look for source material
 SOURCE_LOOKBACK_DAYS = 7
 
+# Sources published within this many hours are news; commentary on them
+# should be out before the story is this old.
+NEWS_SHELF_LIFE_HOURS = 48
+
 
 def _count_backlog(db: Session) -> int:
     """Count current items at BACKLOG status."""
@@ -53,6 +60,19 @@ def _find_recent_sources(db: Session, days: int = SOURCE_LOOKBACK_DAYS) -> list[
     )
 
 
+def _schedule_for_source(source: SourceMaterial, now: datetime) -> tuple[int, datetime | None]:
+    """Return (priority, deadline_at) for an item seeded from ``source``."""
+    published = source.published_at
+    if published is None:
+        return PRIORITY_NORMAL, None
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    deadline = published + timedelta(hours=NEWS_SHELF_LIFE_HOURS)
+    if deadline <= now:
+        return PRIORITY_NORMAL, None
+    return PRIORITY_NEWS, deadline
+
+
 def _source_already_in_pipeline(db: Session, source: SourceMaterial) -> bool:
     """Check if a source's topic is already represented in an active pipeline item."""
     keyword = source.title[:256] if source.title else None
@@ -68,6 +88,7 @@ def _source_already_in_pipeline(db: Session, source: SourceMaterial) -> bool:
     return existing is not None
 
 
+@observe_agent_run("scout")
 def run_scout(db: Session, max_items: int = 5) -> list[ContentPipelineItem]:
     """Execute the Scout agent.
 
@@ -115,12 +136,15 @@ def run_scout(db: Session, max_items: int = 5) -> list[ContentPipelineItem]:
             full_pillar = pillar
 
         sub_theme = _pick_sub_theme_for_pillar(full_pillar)
+        priority, deadline_at = _schedule_for_source(source, datetime.now(timezone.utc))
 
         item = create_pipeline_item(
             db=db,
             pillar_theme=full_pillar,
             sub_theme=sub_theme or "",
             topic_keyword=source.title[:256] if source.title else "untitled",
+            priority=priority,
+            deadline_at=deadline_at,
         )
 
         logger.info(
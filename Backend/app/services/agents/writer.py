@@ -4,24 +4,37 @@ Claims TODO pipeline items, generates LinkedIn post drafts using the
 existing content engine, links the draft back to the pipeline item,
 and transitions to REVIEW.
 
-On generation failure, transitions back to TODO with error details.
+On generation failure, transitions back to TODO with error details and
+an exponential next_run_at backoff (no stage handoff), or to BACKLOG for
+human review once the item has used up its max_revisions.
+
+run_writer() generates sequentially inside one task. In fan-out mode
+(WRITER_FANOUT_ENABLED) run_writer_fanout() only claims items and
+dispatches one write_item task per item to the writer queue, so slow LLM
+calls run side by side and throughput scales with writer workers.
+Handed-off write_item tasks claim for themselves but respect the same
+WRITER_MAX_IN_FLIGHT limit.
+
+Generation runs under a ClaimHeartbeat, so the claim lease stays short
+however long the LLM retries take, and every write is fenced on the
+claim_token the item was claimed with.
 """
 
 from __future__ import annotations
 
 import logging
 import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable
 
 from sqlalchemy.orm import Session
 
+from ...config import settings
+from ...metrics import observe_agent_run
 from ...models import ContentPipelineItem, PipelineStatus
-from ..claim_lock import attempt_claim, release_claim, verify_claim
+from ..claim_lock import ClaimHeartbeat, attempt_claim, claim_batch, release_claim, verify_claim
 from ..content_engine import generate_draft
-from ..pipeline import (
-    get_unclaimed_items_by_status,
-    increment_revision,
-    transition,
-)
+from ..pipeline import advance_item
 from ..research_ingestion import select_research_context
 
 logger = logging.getLogger(__name__)
@@ -33,6 +46,49 @@ def _worker_id() -> str:
     return f"{WORKER_ID_PREFIX}-{uuid.uuid4().hex[:8]}"
 
 
+def retry_delay(revision_count: int) -> timedelta:
+    """Wait before a failed item is retried: doubles with every revision, capped."""
+    seconds = settings.writer_retry_base_seconds * 2 ** revision_count
+    return timedelta(seconds=min(seconds, settings.writer_retry_max_seconds))
+
+
+def _send_back(
+    db: Session,
+    item_id,
+    worker_id: str,
+    token: int | None,
+    revision_count: int,
+    max_revisions: int,
+    error: str,
+    values: dict | None = None,
+) -> PipelineStatus:
+    """WRITING → TODO with a retry backoff, or → BACKLOG once revisions run out.
+
+    Not handed off: the retry waits for next_run_at and the beat schedule.
+    """
+    changes = dict(values or {})
+    exceeded = revision_count + 1 >= max_revisions
+    if exceeded:
+        target = PipelineStatus.backlog
+    else:
+        target = PipelineStatus.todo
+        changes["next_run_at"] = datetime.now(timezone.utc) + retry_delay(revision_count)
+    advance_item(
+        db, item_id, PipelineStatus.writing, target,
+        worker_id=worker_id,
+        claim_token=token,
+        bump_revision=True,
+        error=error,
+        values=changes,
+        handoff=False,
+    )
+    if exceeded:
+        logger.warning(
+            "Writer: item %s exceeded max revisions (%d) — sent to BACKLOG", item_id, max_revisions,
+        )
+    return target
+
+
 def process_one_item(db: Session, item: ContentPipelineItem, worker_id: str) -> bool:
     """Process a single pipeline item through the Writer stage.
 
@@ -44,37 +100,46 @@ def process_one_item(db: Session, item: ContentPipelineItem, worker_id: str) ->
     Returns:
         True if draft was generated and item transitioned to REVIEW
     """
-    # Transition TODO → WRITING
+    # Fencing token of this claim — read now, before anything can reload it
+    token = item.claim_token
+    revision_count, max_revisions = item.revision_count, item.max_revisions
+
+    # Transition TODO → WRITING (the claim is kept while the draft is generated)
     try:
-        transition(db, item.id, PipelineStatus.todo, PipelineStatus.writing)
+        advance_item(
+            db, item.id, PipelineStatus.todo, PipelineStatus.writing,
+            worker_id=worker_id, claim_token=token, release_claim=False,
+        )
     except Exception as e:
         logger.warning("Writer: failed to transition item %s to WRITING: %s", item.id, e)
-        release_claim(db, item.id, "writing")
+        release_claim(db, item.id, "writing", claim_token=token)
         return False
 
     # Generate draft using content engine
     try:
-        research_context, _ = select_research_context(
-            db=db,
-            pillar=item.pillar_theme or "Adtech fundamentals and market dynamics",
-        )
+        with ClaimHeartbeat(db, {item.id: token}, worker_id) as heartbeat:
+            research_context, _ = select_research_context(
+                db=db,
+                pillar=item.pillar_theme or "Adtech fundamentals and market dynamics",
+            )
 
-        result = generate_draft(
-            db=db,
-            research_context=research_context,
-            pillar_override=item.pillar_theme,
-            sub_theme_override=item.sub_theme,
-        )
+            result = generate_draft(
+                db=db,
+                research_context=research_context,
+                pillar_override=item.pillar_theme,
+                sub_theme_override=item.sub_theme,
+            )
+        if heartbeat.lost:
+            logger.warning("Writer: lease on item %s was recovered during generation", item.id)
 
         if result.success and result.draft:
-            # Link draft to pipeline item
-            item.draft_id = result.draft.id
-            item.updated_at = result.draft.created_at
-            db.commit()
-
-            # Transition WRITING → REVIEW
-            transition(db, item.id, PipelineStatus.writing, PipelineStatus.review)
-            release_claim(db, item.id, "writing")
+            # Link draft, transition WRITING → REVIEW and release in one write
+            advance_item(
+                db, item.id, PipelineStatus.writing, PipelineStatus.review,
+                worker_id=worker_id,
+                claim_token=token,
+                values={"draft_id": result.draft.id},
+            )
 
             logger.info(
                 "Writer: generated draft %s for pipeline item %s",
@@ -82,17 +147,13 @@ def process_one_item(db: Session, item: ContentPipelineItem, worker_id: str) ->
             )
             return True
         else:
-            # Generation failed but produced a manual-required draft
+            # Generation failed but produced a manual-required draft;
+            # send back to TODO for a later retry
             error_msg = result.error_message or "Draft generation failed guardrails"
-            increment_revision(db, item.id, error_msg)
-
-            if result.draft:
-                item.draft_id = result.draft.id
-                db.commit()
-
-            # Send back to TODO for retry
-            transition(db, item.id, PipelineStatus.writing, PipelineStatus.todo)
-            release_claim(db, item.id, "writing")
+            _send_back(
+                db, item.id, worker_id, token, revision_count, max_revisions, error_msg,
+                values={"draft_id": result.draft.id} if result.draft else None,
+            )
 
             logger.warning(
                 "Writer: draft generation failed for item %s — %s",
@@ -102,18 +163,21 @@ def process_one_item(db: Session, item: ContentPipelineItem, worker_id: str) ->
 
     except Exception as e:
         logger.error("Writer: error processing item %s: %s", item.id, e)
-        increment_revision(db, item.id, f"Writer error: {str(e)[:200]}")
+        db.rollback()
 
         # Try to send back to TODO
         try:
-            transition(db, item.id, PipelineStatus.writing, PipelineStatus.todo)
+            _send_back(
+                db, item.id, worker_id, token, revision_count, max_revisions,
+                f"Writer error: {str(e)[:200]}",
+            )
         except Exception:
             logger.error("Writer: failed to revert item %s to TODO", item.id)
-
-        release_claim(db, item.id, "writing")
+            release_claim(db, item.id, "writing", claim_token=token)
         return False
 
 
+@observe_agent_run("writer")
 def run_writer(db: Session, max_items: int = 3) -> int:
     """Execute the Writer agent.
 
@@ -127,25 +191,106 @@ def run_writer(db: Session, max_items: int = 3) -> int:
     Returns:
         Number of items successfully processed
     """
-    unclaimed = get_unclaimed_items_by_status(db, PipelineStatus.todo)
-    if not unclaimed:
+    worker_id = _worker_id()
+    claimed = claim_batch(db, PipelineStatus.todo, "writing", worker_id, limit=max_items)
+    if not claimed:
         logger.debug("Writer: no unclaimed TODO items")
         return 0
 
-    worker_id = _worker_id()
     processed = 0
 
-    for item in unclaimed[:max_items]:
-        # Attempt to claim
-        if not attempt_claim(db, item.id, "writing", worker_id):
-            continue
-
-        # Verify claim
-        if not verify_claim(db, item.id, "writing", worker_id):
-            continue
-
+    for item in claimed:
         if process_one_item(db, item, worker_id):
             processed += 1
 
-    logger.info("Writer: processed %d/%d items", processed, len(unclaimed[:max_items]))
+    logger.info("Writer: processed %d/%d items", processed, len(claimed))
     return processed
+
+
+def count_in_flight(db: Session) -> int:
+    """Number of items currently claimed by the Writer stage."""
+    return (
+        db.query(ContentPipelineItem)
+        .filter(ContentPipelineItem.claimed_by.is_not(None))
+        .filter(ContentPipelineItem.claim_stage == "writing")
+        .count()
+    )
+
+
+@observe_agent_run("writer")
+def run_writer_fanout(
+    db: Session,
+    dispatch: Callable[[uuid.UUID, str, int], None],
+    max_items: int | None = None,
+) -> int:
+    """Claim TODO items and hand each to its own write_item task.
+
+    At most settings.writer_max_in_flight items are claimed by the Writer
+    stage at any time, across all dispatchers and workers, so the LLM
+    provider sees bounded concurrency however many workers consume the
+    writer queue. ``dispatch(item_id, worker_id, claim_token)`` enqueues the
+    task; the claim and its fencing token travel with it. Items that fail
+    to dispatch are released.
+
+    Returns:
+        Number of items dispatched
+    """
+    limit = settings.writer_fanout_batch if max_items is None else max_items
+    slots = min(limit, settings.writer_max_in_flight - count_in_flight(db))
+    if slots <= 0:
+        logger.info("Writer: %d items already in flight — not dispatching", settings.writer_max_in_flight)
+        return 0
+
+    worker_id = _worker_id()
+    claimed = claim_batch(db, PipelineStatus.todo, "writing", worker_id, limit=slots)
+    if not claimed:
+        logger.debug("Writer: no unclaimed TODO items")
+        return 0
+
+    dispatched = 0
+    for item in claimed:
+        try:
+            dispatch(item.id, worker_id, item.claim_token)
+            dispatched += 1
+        except Exception as exc:
+            logger.warning("Writer: dispatch failed for item %s — releasing: %s", item.id, exc)
+            release_claim(db, item.id, "writing", claim_token=item.claim_token)
+
+    logger.info("Writer: dispatched %d/%d items to write_item tasks", dispatched, len(claimed))
+    return dispatched
+
+
+@observe_agent_run("writer_item")
+def write_item(
+    db: Session,
+    item_id,
+    worker_id: str | None = None,
+    claim_token: int | None = None,
+) -> str:
+    """Generate the draft for one item (body of the write_item task).
+
+    With ``worker_id`` the item was claimed by run_writer_fanout and that
+    claim (``claim_token``, when sent) must still be held; without it
+    (stage handoff) the item is claimed here, provided it is still
+    unclaimed and at TODO and a settings.writer_max_in_flight slot is
+    free. Without a slot the item stays at TODO for the dispatcher.
+
+    Returns "processed", "failed" or "skipped:<reason>".
+    """
+    if worker_id is None:
+        if count_in_flight(db) >= settings.writer_max_in_flight:
+            return "skipped:no_slot"
+        worker_id = _worker_id()
+        if not attempt_claim(db, item_id, "writing", worker_id, status=PipelineStatus.todo):
+            return "skipped:claimed_or_moved"
+        item = db.get(ContentPipelineItem, item_id)
+        if count_in_flight(db) > settings.writer_max_in_flight:
+            # Another handoff took the last slot between the check and the claim
+            release_claim(db, item_id, "writing", claim_token=item.claim_token)
+            return "skipped:no_slot"
+    elif not verify_claim(db, item_id, "writing", worker_id, claim_token):
+        # Claim expired and was recovered while the task sat in the queue
+        return "skipped:claim_lost"
+
+    item = db.get(ContentPipelineItem, item_id)
+    return "processed" if process_one_item(db, item, worker_id) else "failed"
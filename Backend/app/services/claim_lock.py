@@ -9,49 +9,126 @@ can process a pipeline item at a time.  The pattern is:
     4. release_claim(db, item_id, stage)
 
 If step 2 fails, another worker won the race — back off gracefully.
+
+Agents that process several items per run should prefer claim_batch(),
+which claims and returns up to N items of a status in one statement.
+
+Claims only take items that are due (next_run_at unset or passed) and
+take them in scheduling order: priority (lower first), then the nearest
+deadline, then age.
+
+Claims are leases. Each one expires CLAIM_TTL_SECONDS after it was taken
+or last renewed; a worker doing slow work keeps it alive with
+ClaimHeartbeat (or renew_claims). Morgan recovers only claims whose
+lease has run out. Every claim also bumps the item's claim_token, a
+fencing token: writes made on behalf of a claim are guarded on the token
+the worker was given, so a worker whose lease was recovered (and whose
+item may since have been claimed again) cannot commit stale results.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import or_, select, tuple_, update
 from sqlalchemy.orm import Session
 
-from ..models import ContentPipelineItem
+from ..config import settings
+from ..models import ContentPipelineItem, PipelineStatus
 
 logger = logging.getLogger(__name__)
 
-# Default claim TTL — claims older than this are considered stale.
+# Claims written without a lease (claim_expires_at NULL) are stale once
+# they are this old.
 DEFAULT_CLAIM_TTL_MINUTES = 30
 
 
+def _lease(ttl_minutes: float | None) -> timedelta:
+    if ttl_minutes is None:
+        return timedelta(seconds=settings.claim_ttl_seconds)
+    return timedelta(minutes=ttl_minutes)
+
+
+def stale_clause(now: datetime, max_age_minutes: float = DEFAULT_CLAIM_TTL_MINUTES):
+    """Filter for held claims whose lease has expired.
+
+    Claims without a lease fall back to ``claimed_at`` older than
+    ``max_age_minutes``.
+    """
+    item = ContentPipelineItem
+    return item.claimed_by.is_not(None) & or_(
+        item.claim_expires_at <= now,
+        item.claim_expires_at.is_(None) & (item.claimed_at <= now - timedelta(minutes=max_age_minutes)),
+    )
+
+
+def due_clause(now: datetime):
+    """Filter for items whose next_run_at has arrived (or was never set)."""
+    return or_(
+        ContentPipelineItem.next_run_at.is_(None),
+        ContentPipelineItem.next_run_at <= now,
+    )
+
+
+def claim_order() -> tuple:
+    """ORDER BY for claims, matching ix_pipeline_items_unclaimed_claim_order.
+
+    Items without a deadline sort after those with one at the same
+    priority (PostgreSQL's default for ASC, spelled out for SQLite).
+    """
+    return (
+        ContentPipelineItem.priority.asc(),
+        ContentPipelineItem.deadline_at.asc().nulls_last(),
+        ContentPipelineItem.created_at.asc(),
+    )
+
+
+def _claim_sort_key(item: ContentPipelineItem) -> tuple:
+    return (
+        item.priority,
+        item.deadline_at is None,
+        item.deadline_at or item.created_at,
+        item.created_at,
+    )
+
+
 def attempt_claim(
     db: Session,
     item_id,
     stage: str,
     worker_id: str,
-    ttl_minutes: int = DEFAULT_CLAIM_TTL_MINUTES,
+    ttl_minutes: float | None = None,
+    status: PipelineStatus | None = None,
 ) -> bool:
     """Attempt to atomically claim a pipeline item.
 
     Uses UPDATE ... WHERE claimed_by IS NULL to ensure only one worker
-    wins. Returns True if the claim was written, False if another worker
-    already holds the claim.
+    wins. With ``status`` the claim also requires the item to still be
+    at that status and due. Returns True if the claim was written, False
+    if another worker already holds the claim (or the item has moved on
+    or is scheduled for later). The new fencing token is on the item's
+    claim_token once the caller reloads it.
     """
     now = datetime.now(timezone.utc)
-    expires = now + timedelta(minutes=ttl_minutes)
+    expires = now + _lease(ttl_minutes)
 
-    rows = (
+    query = (
         db.query(ContentPipelineItem)
         .filter(ContentPipelineItem.id == item_id)
         .filter(ContentPipelineItem.claimed_by.is_(None))
-        .update(
+    )
+    if status is not None:
+        query = query.filter(ContentPipelineItem.status == status).filter(due_clause(now))
+    rows = (
+        query.update(
             {
                 ContentPipelineItem.claimed_by: worker_id,
                 ContentPipelineItem.claimed_at: now,
                 ContentPipelineItem.claim_stage: stage,
                 ContentPipelineItem.claim_expires_at: expires,
+                ContentPipelineItem.claim_token: ContentPipelineItem.claim_token + 1,
             },
             synchronize_session="fetch",
         )
@@ -66,16 +143,94 @@ def attempt_claim(
     return False
 
 
+def claim_batch(
+    db: Session,
+    status: PipelineStatus,
+    stage: str,
+    worker_id: str,
+    limit: int,
+    ttl_minutes: float | None = None,
+) -> list[ContentPipelineItem]:
+    """Atomically claim up to ``limit`` unclaimed, due items at ``status``.
+
+    Issues a single UPDATE ... WHERE id IN (SELECT ... LIMIT n) RETURNING
+    statement and one commit.  On PostgreSQL the inner SELECT uses
+    FOR UPDATE SKIP LOCKED so concurrent workers each take a disjoint set
+    of rows instead of blocking on each other.  SQLite serialises writers,
+    so the same statement without the lock clause is already atomic there.
+
+    Returns the claimed items in claim order, already loaded (including
+    their new claim_token) — no verify_claim() round trip is needed.
+    """
+    if limit <= 0:
+        return []
+
+    now = datetime.now(timezone.utc)
+    expires = now + _lease(ttl_minutes)
+
+    candidates = (
+        select(ContentPipelineItem.id)
+        .where(ContentPipelineItem.status == status)
+        .where(ContentPipelineItem.claimed_by.is_(None))
+        .where(due_clause(now))
+        .order_by(*claim_order())
+        .limit(limit)
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        candidates = candidates.with_for_update(skip_locked=True)
+
+    stmt = (
+        update(ContentPipelineItem)
+        .where(ContentPipelineItem.id.in_(candidates.scalar_subquery()))
+        .where(ContentPipelineItem.claimed_by.is_(None))
+        .values(
+            claimed_by=worker_id,
+            claimed_at=now,
+            claim_stage=stage,
+            claim_expires_at=expires,
+            claim_token=ContentPipelineItem.claim_token + 1,
+        )
+        .returning(ContentPipelineItem)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    items = list(db.scalars(stmt))
+    commit_keep_loaded(db)
+
+    items.sort(key=_claim_sort_key)
+    if items:
+        logger.info(
+            "Batch claim acquired: count=%d status=%s stage=%s worker=%s",
+            len(items), status.name, stage, worker_id,
+        )
+    return items
+
+
+def commit_keep_loaded(db: Session) -> None:
+    """Commit without expiring instances, so RETURNING rows stay usable.
+
+    A normal commit expires every loaded object, which would turn the
+    first attribute access on each claimed item into its own SELECT.
+    """
+    previous = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = previous
+
+
 def verify_claim(
     db: Session,
     item_id,
     stage: str,
     worker_id: str,
+    claim_token: int | None = None,
 ) -> bool:
     """Re-fetch the item and verify this worker still holds the claim.
 
     Must be called after attempt_claim() before doing actual work,
-    to guard against very tight race windows.
+    to guard against very tight race windows. With ``claim_token`` the
+    claim must also be that one, not a newer claim by the same worker.
     """
     item = db.query(ContentPipelineItem).filter(ContentPipelineItem.id == item_id).first()
     if item is None:
@@ -84,6 +239,7 @@ def verify_claim(
     return (
         item.claimed_by == worker_id
         and item.claim_stage == stage
+        and (claim_token is None or item.claim_token == claim_token)
     )
 
 
@@ -91,16 +247,23 @@ def release_claim(
     db: Session,
     item_id,
     stage: str,
+    claim_token: int | None = None,
 ) -> bool:
     """Release a claim after processing is complete.
 
-    Clears all claim fields. Returns True if the release matched a row.
+    Clears all claim fields. With ``claim_token`` only that claim is
+    released, never a newer one taken after a recovery. Returns True if
+    the release matched a row.
     """
-    rows = (
+    query = (
         db.query(ContentPipelineItem)
         .filter(ContentPipelineItem.id == item_id)
         .filter(ContentPipelineItem.claim_stage == stage)
-        .update(
+    )
+    if claim_token is not None:
+        query = query.filter(ContentPipelineItem.claim_token == claim_token)
+    rows = (
+        query.update(
             {
                 ContentPipelineItem.claimed_by: None,
                 ContentPipelineItem.claimed_at: None,
@@ -120,18 +283,17 @@ def release_claim(
 
 def find_stale_claims(
     db: Session,
-    max_age_minutes: int = DEFAULT_CLAIM_TTL_MINUTES,
+    max_age_minutes: float = DEFAULT_CLAIM_TTL_MINUTES,
 ) -> list[ContentPipelineItem]:
-    """Return pipeline items with claims older than the given threshold.
+    """Return pipeline items whose claim lease has expired.
 
-    These are candidates for automatic recovery by Morgan PM.
+    These are candidates for automatic recovery by Morgan PM. A claim
+    that is still being renewed is never stale, however old it is;
+    ``max_age_minutes`` only applies to claims written without a lease.
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(minutes=max_age_minutes)
-
     stale = (
         db.query(ContentPipelineItem)
-        .filter(ContentPipelineItem.claimed_by.is_not(None))
-        .filter(ContentPipelineItem.claimed_at <= cutoff)
+        .filter(stale_clause(datetime.now(timezone.utc), max_age_minutes))
         .all()
     )
     return stale
@@ -140,16 +302,24 @@ def find_stale_claims(
 def force_release_claim(
     db: Session,
     item_id,
+    stale_only: bool = False,
+    max_age_minutes: float = DEFAULT_CLAIM_TTL_MINUTES,
 ) -> bool:
-    """Unconditionally release a claim regardless of stage or worker.
+    """Release a claim regardless of stage or worker.
 
-    Used by Morgan PM for stale claim recovery.
+    Used by Morgan PM for stale claim recovery. With ``stale_only`` the
+    release only happens if the lease is still expired, so a holder that
+    renewed since the claim was found stale keeps it.
     """
-    rows = (
+    query = (
         db.query(ContentPipelineItem)
         .filter(ContentPipelineItem.id == item_id)
         .filter(ContentPipelineItem.claimed_by.is_not(None))
-        .update(
+    )
+    if stale_only:
+        query = query.filter(stale_clause(datetime.now(timezone.utc), max_age_minutes))
+    rows = (
+        query.update(
             {
                 ContentPipelineItem.claimed_by: None,
                 ContentPipelineItem.claimed_at: None,
@@ -165,3 +335,98 @@ def force_release_claim(
         logger.info("Claim force-released: item=%s", item_id)
         return True
     return False
+
+
+def renew_claims(
+    db: Session,
+    claims: dict,
+    worker_id: str,
+    ttl_minutes: float | None = None,
+) -> int:
+    """Extend the lease on claims ``worker_id`` still holds.
+
+    ``claims`` maps each item id to the claim_token it was claimed with.
+    One UPDATE for all of them, guarded on worker and token, so claims
+    that were recovered (or re-claimed since, even by this worker) are
+    left alone. Returns the number renewed.
+    """
+    if not claims:
+        return 0
+    expires = datetime.now(timezone.utc) + _lease(ttl_minutes)
+    result = db.execute(
+        update(ContentPipelineItem)
+        .where(tuple_(ContentPipelineItem.id, ContentPipelineItem.claim_token).in_(list(claims.items())))
+        .where(ContentPipelineItem.claimed_by == worker_id)
+        .values(claim_expires_at=expires)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+    if result.rowcount < len(claims):
+        logger.warning(
+            "Claim renewal: %d/%d leases lost for worker=%s",
+            len(claims) - result.rowcount, len(claims), worker_id,
+        )
+    return result.rowcount
+
+
+class ClaimHeartbeat:
+    """Renew claim leases in the background while slow work runs.
+
+        with ClaimHeartbeat(db, {item.id: token}, worker_id) as heartbeat:
+            ... LLM call with retries ...
+        if heartbeat.lost:
+            ... the lease was recovered; skip or expect the guarded write to fail ...
+
+    Renewals run on a daemon thread with their own session bound to the
+    same engine, every ``interval_seconds`` (default
+    settings.claim_heartbeat_seconds, or a third of the lease). The
+    thread stops after the first renewal that finds a claim gone.
+    ``claims`` maps item ids to the claim tokens captured at claim time.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        claims: dict,
+        worker_id: str,
+        ttl_minutes: float | None = None,
+        interval_seconds: float | None = None,
+    ):
+        self._bind = db.get_bind()
+        self.claims = dict(claims)
+        self.worker_id = worker_id
+        self.ttl_minutes = ttl_minutes
+        if interval_seconds is None:
+            interval_seconds = settings.claim_heartbeat_seconds or _lease(ttl_minutes).total_seconds() / 3
+        self.interval_seconds = interval_seconds
+        self.renewals = 0
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "ClaimHeartbeat":
+        self._thread = threading.Thread(
+            target=self._run, name=f"claim-heartbeat-{self.worker_id}", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            session = Session(bind=self._bind)
+            try:
+                renewed = renew_claims(session, self.claims, self.worker_id, self.ttl_minutes)
+            except Exception as exc:
+                logger.warning("Claim heartbeat failed for worker=%s: %s", self.worker_id, exc)
+                continue
+            finally:
+                session.close()
+            self.renewals += 1
+            if renewed < len(self.claims):
+                self.lost = True
+                return
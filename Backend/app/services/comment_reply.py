@@ -103,7 +103,8 @@ Reply rules:
 Generate a reply."""
 
     try:
-        response = generate_text(user_prompt=prompt, max_tokens=150)
+        # Identical comments ("Great post!") should still get varied replies
+        response = generate_text(user_prompt=prompt, max_tokens=150, cache=False)
         reply = response.content
         # Clean up any quotes or prefixes
         reply = reply.strip().strip('"').strip("'")
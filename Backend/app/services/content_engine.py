@@ -292,11 +292,13 @@ def _generate_content(params: ContentParameters, stricter: bool = False) -> str:
     system_prompt = _build_system_prompt()
     user_prompt = _build_user_prompt(params, stricter=stricter)
 
+    # Never cached: a retry after a guardrail failure must get a fresh draft
     response = generate_text(
         user_prompt=user_prompt,
         system_prompt=system_prompt,
         max_tokens=800,
         temperature=0.7 if not stricter else 0.5,
+        cache=False,
     )
 
     logger.info(
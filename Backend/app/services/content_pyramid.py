@@ -178,15 +178,16 @@ def get_recent_sub_themes(db: Session, days: int = 7) -> list[str]:
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
-    # Query published posts within the window
-    recent_posts = (
-        db.query(PublishedPost)
-        .join(Draft)
+    # Select the sub-theme column directly: loading posts and touching
+    # post.draft would lazy-load one draft per post
+    rows = (
+        db.query(Draft.sub_theme)
+        .join(PublishedPost, PublishedPost.draft_id == Draft.id)
         .filter(PublishedPost.published_at >= cutoff)
         .all()
     )
 
-    return [post.draft.sub_theme for post in recent_posts if post.draft]
+    return [sub_theme for (sub_theme,) in rows]
 
 
 def get_sub_theme_coverage(db: Session, days: int = 30) -> list[CoverageStats]:
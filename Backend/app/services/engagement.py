@@ -1,21 +1,44 @@
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import Iterator
+from uuid import UUID, uuid4
 
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
 from ..config import settings
-from ..models import Comment, PublishedPost
+from ..models import Comment, EngagementMetric, PublishedPost
 from .comment_reply import generate_auto_reply, generate_suggested_replies
 from .comment_triage import triage_comment
 from .config_state import is_comment_replies_enabled, is_kill_switch_on
 from .linkedin import (
     LinkedInApiError,
-    fetch_post_metrics,
+    LinkedInComment,
+    LinkedInRateLimitError,
+    fetch_metrics_batch,
     fetch_recent_comments_for_post,
+    newest_comment,
 )
 from .telegram_service import send_escalation_notification
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _PollTarget:
+    """Plain snapshot of a post to poll, safe to hand to worker threads."""
+
+    post_id: UUID
+    linkedin_post_id: str
+    post_summary: str | None
+    post_url: str | None
+    cursor_at: datetime | None
+    cursor_id: str | None
+
 
 def _as_utc(dt: datetime | None) -> datetime | None:
     if dt is None:
@@ -52,6 +75,10 @@ def _is_post_due_for_poll(post: PublishedPost, now: datetime) -> bool:
 def poll_and_store_comments(db: Session, since_minutes: int = 15) -> dict:
     """Poll LinkedIn for new comments and process them.
 
+    Due posts are fetched concurrently (up to linkedin_poll_concurrency at
+    a time, sharing one pooled client and rate limiter) and each post's
+    results are committed as soon as they arrive.
+
     For each new comment:
     - Triages to determine if high-value
     - Generates auto-reply if eligible (using LLM or fallback)
@@ -62,7 +89,8 @@ def poll_and_store_comments(db: Session, since_minutes: int = 15) -> dict:
         since_minutes: Look back window for comments
 
     Returns:
-        Dict with processed_posts, new_comments, escalations, errors, status
+        Dict with processed_posts, new_comments, escalations, errors,
+        rate_limited, status
     """
     if is_kill_switch_on(db):
         return {"processed_posts": 0, "new_comments": 0, "escalations": 0, "status": "kill_switch"}
@@ -80,103 +108,213 @@ def poll_and_store_comments(db: Session, since_minutes: int = 15) -> dict:
         .filter(PublishedPost.comment_monitoring_until.is_not(None))
         .all()
     )
-    posts = [post for post in candidate_posts if _is_post_due_for_poll(post, now)]
+    targets = [
+        _PollTarget(
+            post_id=post.id,
+            linkedin_post_id=post.linkedin_post_id or "",
+            post_summary=post.content_body[:200] if post.content_body else None,
+            post_url=post.linkedin_post_url,
+            cursor_at=_as_utc(post.comment_cursor_at),
+            cursor_id=post.comment_cursor_id,
+        )
+        for post in candidate_posts
+        if _is_post_due_for_poll(post, now)
+    ]
     new_comments = 0
     escalations = 0
     errors = 0
+    rate_limited = 0
 
-    for post in posts:
-        try:
-            fetched = fetch_recent_comments_for_post(post.linkedin_post_id or "", since_minutes=since_minutes)
-        except LinkedInApiError:
+    # Fetches run concurrently; each post is stored and committed as soon as
+    # its fetch completes so one slow post never holds back the others.
+    for target, fetched, error in _fetch_comments_concurrently(targets, since_minutes):
+        stored = False
+        if error is not None:
             errors += 1
-            post.last_comment_poll_at = now
-            continue
+            if isinstance(error, LinkedInRateLimitError):
+                rate_limited += 1
+        else:
+            try:
+                added, escalated = _store_post_comments(db, target, fetched)
+                stored = True
+            except Exception:  # noqa: BLE001
+                db.rollback()
+                logger.exception("Storing comments failed for post %s", target.post_id)
+                errors += 1
+                added, escalated = 0, 0
+            new_comments += added
+            escalations += escalated
+
+        values: dict = {"last_comment_poll_at": now}
+        # The cursor only moves past comments that were actually stored
+        newest = newest_comment(fetched) if stored else None
+        if newest is not None:
+            values["comment_cursor_at"] = newest.created_at or target.cursor_at
+            values["comment_cursor_id"] = newest.linkedin_comment_id
+        db.execute(update(PublishedPost).where(PublishedPost.id == target.post_id).values(**values))
+        db.commit()
 
-        # Get post summary for context in replies
-        post_summary = post.content_body[:200] if post.content_body else None
+    return {
+        "processed_posts": len(targets),
+        "new_comments": new_comments,
+        "escalations": escalations,
+        "errors": errors,
+        "rate_limited": rate_limited,
+        "status": "ok",
+    }
 
-        for item in fetched:
-            exists = db.query(Comment).filter(Comment.linkedin_comment_id == item.linkedin_comment_id).first()
-            if exists:
-                continue
 
-            row = Comment(
-                published_post_id=post.id,
-                linkedin_comment_id=item.linkedin_comment_id,
-                commenter_name=item.commenter_name,
-                commenter_profile_url=item.commenter_profile_url,
-                commenter_follower_count=item.commenter_follower_count,
-                comment_text=item.comment_text,
-            )
+def _fetch_comments_concurrently(
+    targets: list[_PollTarget],
+    since_minutes: int,
+) -> Iterator[tuple[_PollTarget, list[LinkedInComment], LinkedInApiError | None]]:
+    """Fetch comments for every target on a bounded thread pool.
 
-            triage = triage_comment(comment_text=row.comment_text, follower_count=row.commenter_follower_count)
-            row.is_high_value = triage.high_value
-            row.high_value_reason = triage.reason
-            row.escalated = triage.high_value
-            row.escalated_at = datetime.now(timezone.utc) if triage.high_value else None
-
-            # Handle auto-reply for non-high-value comments
-            auto_reply_count = (
-                db.query(Comment)
-                .filter(Comment.published_post_id == row.published_post_id)
-                .filter(Comment.auto_reply_sent.is_(True))
-                .count()
-            )
-            if (
-                triage.auto_reply
-                and is_comment_replies_enabled(db)
-                and auto_reply_count < settings.max_auto_replies
-            ):
-                # Generate contextual auto-reply using LLM or fallback
-                row.auto_reply_sent = True
-                row.auto_reply_text = generate_auto_reply(
-                    comment_text=row.comment_text,
-                    post_summary=post_summary,
-                )
-                row.auto_reply_sent_at = datetime.now(timezone.utc)
-
-            db.add(row)
-            db.flush()  # Get the row ID for escalation notification
-            new_comments += 1
-
-            # Send escalation notification for high-value comments
-            if triage.high_value:
-                suggested_replies = generate_suggested_replies(
-                    comment_text=row.comment_text,
-                    high_value_reason=triage.reason,
-                    post_summary=post_summary,
+    Yields (target, comments, error) in completion order. Only network I/O
+    runs on the pool; callers keep the DB session on their own thread.
+    """
+    if not targets:
+        return
+
+    workers = max(1, min(settings.linkedin_poll_concurrency, len(targets)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="comment-poll") as pool:
+        futures = {
+            pool.submit(
+                fetch_recent_comments_for_post,
+                target.linkedin_post_id,
+                since_minutes,
+                cursor_at=target.cursor_at,
+                cursor_id=target.cursor_id,
+            ): target
+            for target in targets
+        }
+        for future in as_completed(futures):
+            target = futures[future]
+            try:
+                yield target, future.result(), None
+            except LinkedInApiError as exc:
+                yield target, [], exc
+
+
+def _store_post_comments(
+    db: Session,
+    target: _PollTarget,
+    fetched: list[LinkedInComment],
+) -> tuple[int, int]:
+    """Triage, reply to and store new comments for one post.
+
+    Returns (new_comments, escalations). The caller commits.
+    """
+    new_comments = 0
+    escalations = 0
+    auto_reply_count: int | None = None
+    page_size = max(1, settings.linkedin_api_page_size)
+
+    for page_start in range(0, len(fetched), page_size):
+        page = fetched[page_start:page_start + page_size]
+        existing = set(
+            db.scalars(
+                select(Comment.linkedin_comment_id).where(
+                    Comment.linkedin_comment_id.in_([item.linkedin_comment_id for item in page])
                 )
-                send_escalation_notification(
-                    db=db,
-                    comment_id=str(row.id),
-                    comment_text=row.comment_text,
-                    commenter_name=row.commenter_name,
-                    commenter_profile_url=row.commenter_profile_url,
-                    commenter_follower_count=row.commenter_follower_count,
-                    high_value_reason=triage.reason,
-                    post_url=post.linkedin_post_url,
-                    suggested_replies=suggested_replies,
+            )
+        )
+        for item in page:
+            if item.linkedin_comment_id in existing:
+                continue
+            existing.add(item.linkedin_comment_id)
+            if auto_reply_count is None:
+                auto_reply_count = (
+                    db.query(Comment)
+                    .filter(Comment.published_post_id == target.post_id)
+                    .filter(Comment.auto_reply_sent.is_(True))
+                    .count()
                 )
-                escalations += 1
+            added, escalated, replied = _store_comment(db, target, item, auto_reply_count)
+            new_comments += added
+            escalations += escalated
+            auto_reply_count += replied
 
-        post.last_comment_poll_at = now
+    return new_comments, escalations
 
-    db.commit()
-    return {
-        "processed_posts": len(posts),
-        "new_comments": new_comments,
-        "escalations": escalations,
-        "errors": errors,
-        "status": "ok",
-    }
+
+def _store_comment(
+    db: Session,
+    target: _PollTarget,
+    item: LinkedInComment,
+    auto_reply_count: int,
+) -> tuple[int, int, int]:
+    """Triage and store one new comment.
+
+    Returns (new_comments, escalations, auto_replies) increments for the
+    caller's tallies.
+    """
+    row = Comment(
+        published_post_id=target.post_id,
+        linkedin_comment_id=item.linkedin_comment_id,
+        commenter_name=item.commenter_name,
+        commenter_profile_url=item.commenter_profile_url,
+        commenter_follower_count=item.commenter_follower_count,
+        comment_text=item.comment_text,
+    )
+    if item.created_at is not None:
+        row.commented_at = item.created_at
+
+    triage = triage_comment(comment_text=row.comment_text, follower_count=row.commenter_follower_count)
+    row.is_high_value = triage.high_value
+    row.high_value_reason = triage.reason
+    row.escalated = triage.high_value
+    row.escalated_at = datetime.now(timezone.utc) if triage.high_value else None
+
+    # Handle auto-reply for non-high-value comments
+    replied = 0
+    if (
+        triage.auto_reply
+        and is_comment_replies_enabled(db)
+        and auto_reply_count < settings.max_auto_replies
+    ):
+        # Generate contextual auto-reply using LLM or fallback
+        row.auto_reply_sent = True
+        row.auto_reply_text = generate_auto_reply(
+            comment_text=row.comment_text,
+            post_summary=target.post_summary,
+        )
+        row.auto_reply_sent_at = datetime.now(timezone.utc)
+        replied = 1
+
+    db.add(row)
+    db.flush()  # Get the row ID for escalation notification
+
+    # Send escalation notification for high-value comments
+    if triage.high_value:
+        suggested_replies = generate_suggested_replies(
+            comment_text=row.comment_text,
+            high_value_reason=triage.reason,
+            post_summary=target.post_summary,
+        )
+        send_escalation_notification(
+            db=db,
+            comment_id=str(row.id),
+            comment_text=row.comment_text,
+            commenter_name=row.commenter_name,
+            commenter_profile_url=row.commenter_profile_url,
+            commenter_follower_count=row.commenter_follower_count,
+            high_value_reason=triage.reason,
+            post_url=target.post_url,
+            suggested_replies=suggested_replies,
+        )
+
+    return 1, int(triage.high_value), replied
 
 
 def poll_and_store_metrics(db: Session) -> dict:
     """Poll LinkedIn for post metrics and update the database.
 
     Fetches metrics for all posts with a linkedin_post_id that were
-    published in the last 7 days (active engagement window).
+    published in the last 7 days (active engagement window) through
+    fetch_metrics_batch, then writes every post's counters and an
+    EngagementMetric snapshot per post in one bulk UPDATE and one bulk
+    INSERT.
 
     Args:
         db: Database session
@@ -196,33 +334,41 @@ def poll_and_store_metrics(db: Session) -> dict:
     seven_days_ago = now - timedelta(days=7)
 
     # Get posts from the last 7 days with LinkedIn post IDs
-    candidate_posts = (
-        db.query(PublishedPost)
-        .filter(PublishedPost.linkedin_post_id.is_not(None))
-        .filter(PublishedPost.published_at.is_not(None))
-        .filter(PublishedPost.published_at >= seven_days_ago)
-        .all()
-    )
-
-    updated = 0
-    errors = 0
-
-    for post in candidate_posts:
-        try:
-            metrics = fetch_post_metrics(post.linkedin_post_id or "")
-
-            # Update post metrics
-            post.impressions = metrics.impressions
-            post.reactions = metrics.reactions
-            post.comments_count = metrics.comments_count
-            post.shares = metrics.shares
-            post.engagement_rate = metrics.engagement_rate
-            post.last_metrics_update = now
-
-            updated += 1
-        except LinkedInApiError:
-            errors += 1
+    candidates = db.execute(
+        select(PublishedPost.id, PublishedPost.linkedin_post_id)
+        .where(PublishedPost.linkedin_post_id.is_not(None))
+        .where(PublishedPost.published_at.is_not(None))
+        .where(PublishedPost.published_at >= seven_days_ago)
+    ).all()
+
+    try:
+        fetched = fetch_metrics_batch([row.linkedin_post_id for row in candidates])
+    except LinkedInApiError:
+        return {"updated_posts": 0, "errors": len(candidates), "status": "ok"}
+
+    post_rows = []
+    snapshot_rows = []
+    for row in candidates:
+        metrics = fetched.get(row.linkedin_post_id)
+        if metrics is None:
             continue
-
+        values = {
+            "impressions": metrics.impressions,
+            "reactions": metrics.reactions,
+            "comments_count": metrics.comments_count,
+            "shares": metrics.shares,
+            "engagement_rate": metrics.engagement_rate,
+        }
+        post_rows.append({"id": row.id, **values, "last_metrics_update": now})
+        snapshot_rows.append({"id": uuid4(), "published_post_id": row.id, "collected_at": now, **values})
+
+    # One executemany UPDATE by primary key plus one bulk INSERT of snapshots.
+    if post_rows:
+        db.execute(update(PublishedPost), post_rows)
+        db.execute(insert(EngagementMetric), snapshot_rows)
     db.commit()
-    return {"updated_posts": updated, "errors": errors, "status": "ok"}
+    return {
+        "updated_posts": len(post_rows),
+        "errors": len(candidates) - len(post_rows),
+        "status": "ok",
+    }
@@ -0,0 +1,147 @@
+"""Concurrent research feed fetcher.
+
+Downloads every feed at once over one pooled client and sends conditional
+requests (If-None-Match / If-Modified-Since) from the validators stored in
+``feed_states``. Unchanged feeds answer 304 and are never parsed. Each
+result carries its latency and byte count so ingestion can record them.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import httpx
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "personal-brand-research/1.0 (+feed ingestion)"
+
+
+@dataclass(frozen=True)
+class FeedValidators:
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class FeedFetchResult:
+    url: str
+    status_code: int | None = None
+    content: bytes | None = None
+    headers: dict[str, str] | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    latency_ms: int = 0
+    bytes: int = 0
+    error: str | None = None
+
+    @property
+    def changed(self) -> bool:
+        return self.status_code == 200 and self.content is not None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status_code == 304
+
+
+_client_lock = threading.Lock()
+_client: httpx.Client | None = None
+_client_pid: int | None = None
+
+
+def get_feed_client() -> httpx.Client:
+    """Process-wide pooled client for feed downloads (recreated after fork)."""
+    global _client, _client_pid
+    with _client_lock:
+        if _client_pid != os.getpid():
+            _client = None
+            _client_pid = os.getpid()
+        if _client is None or _client.is_closed:
+            pool_size = max(1, settings.research_feed_concurrency)
+            _client = httpx.Client(
+                timeout=settings.research_feed_timeout_seconds,
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT},
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            )
+        return _client
+
+
+def _conditional_headers(validators: FeedValidators | None) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if validators is None:
+        return headers
+    if validators.etag:
+        headers["If-None-Match"] = validators.etag
+    if validators.last_modified:
+        headers["If-Modified-Since"] = validators.last_modified
+    return headers
+
+
+def fetch_feed(
+    client: httpx.Client,
+    url: str,
+    validators: FeedValidators | None = None,
+) -> FeedFetchResult:
+    """Fetch one feed; network and HTTP errors are returned, not raised."""
+    started = time.perf_counter()
+    try:
+        response = client.get(url, headers=_conditional_headers(validators))
+    except httpx.HTTPError as exc:
+        return FeedFetchResult(
+            url=url,
+            latency_ms=int((time.perf_counter() - started) * 1000),
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    latency_ms = int((time.perf_counter() - started) * 1000)
+
+    result = FeedFetchResult(
+        url=url,
+        status_code=response.status_code,
+        latency_ms=latency_ms,
+        bytes=len(response.content),
+        etag=response.headers.get("etag"),
+        last_modified=response.headers.get("last-modified"),
+    )
+    if response.status_code == 200:
+        result.content = response.content
+        result.headers = dict(response.headers)
+    elif response.status_code != 304:
+        result.error = f"HTTP {response.status_code}"
+    return result
+
+
+def fetch_feeds(
+    feeds: dict[str, FeedValidators | None],
+    _client: httpx.Client | None = None,
+) -> list[FeedFetchResult]:
+    """Fetch every feed concurrently; results are in the order of ``feeds``.
+
+    Total time is bounded by the slowest feed rather than the sum, with at
+    most RESEARCH_FEED_CONCURRENCY downloads in flight.
+    """
+    if not feeds:
+        return []
+    client = _client or get_feed_client()
+    urls = list(feeds)
+    workers = max(1, min(settings.research_feed_concurrency, len(urls)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feed-fetch") as pool:
+        results = list(pool.map(lambda url: fetch_feed(client, url, feeds[url]), urls))
+
+    for result in results:
+        logger.info(
+            "Feed fetch %s status=%s latency_ms=%d bytes=%d%s",
+            result.url,
+            result.status_code,
+            result.latency_ms,
+            result.bytes,
+            f" error={result.error}" if result.error else "",
+        )
+    return results
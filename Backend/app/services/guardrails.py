@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 
+from .text_analysis import PhraseMatcher, TextScan
+
 BANNED_PHRASES = [
     "game changer",
     "disrupt",
@@ -23,8 +25,9 @@ UNVERIFIED_CLAIM_MARKERS = [
 ]
 
 SUSPICIOUS_PERCENT_RE = re.compile(r"(?<!\d)\d{1,3}%")
-URL_RE = re.compile(r"https?://")
 TAG_RE = re.compile(r"@\w+")
+HASHTAG_RE = re.compile(r"#[A-Za-z0-9_]+")
+URL_MARKERS = ["http://", "https://"]
 ENGAGEMENT_BAIT_MARKERS = [
     "like if you agree",
     "comment yes",
@@ -34,21 +37,42 @@ ENGAGEMENT_BAIT_MARKERS = [
 ]
 
 
+# Phrase gates checked by validate_post (matcher gate name -> phrases)
+GUARDRAIL_GATES = {
+    "banned_phrase": BANNED_PHRASES,
+    "unverified_claim": UNVERIFIED_CLAIM_MARKERS,
+    "engagement_bait": ENGAGEMENT_BAIT_MARKERS,
+    "url": URL_MARKERS,
+}
+
+_matcher = PhraseMatcher(GUARDRAIL_GATES).compile()
+
+
+def scan_guardrail_phrases(content: str) -> TextScan:
+    """Scan ``content`` against the guardrail phrase lists only."""
+    return _matcher.scan(content)
+
+
 class GuardrailResult:
     def __init__(self, passed: bool, violations: list[str]):
         self.passed = passed
         self.violations = violations
 
 
-def validate_post(content: str) -> GuardrailResult:
+def validate_post(content: str, scan: TextScan | None = None) -> GuardrailResult:
+    """Check a post against the publishing guardrails.
+
+    ``scan`` may be a TextScan from a matcher that includes GUARDRAIL_GATES
+    (the Editor passes its combined scan); otherwise one is made here.
+    """
+    if scan is None:
+        scan = scan_guardrail_phrases(content)
     violations: list[str] = []
-    lowered = content.lower()
 
-    for phrase in BANNED_PHRASES:
-        if phrase in lowered:
-            violations.append(f"BANNED_PHRASE:{phrase}")
+    for phrase in scan.found("banned_phrase"):
+        violations.append(f"BANNED_PHRASE:{phrase}")
 
-    hashtags = re.findall(r"#[A-Za-z0-9_]+", content)
+    hashtags = HASHTAG_RE.findall(content)
     if len(hashtags) > 3:
         violations.append("HASHTAG_LIMIT_EXCEEDED")
 
@@ -59,21 +83,22 @@ def validate_post(content: str) -> GuardrailResult:
     if len(content.split()) > 300:
         violations.append("WORD_LIMIT_EXCEEDED")
 
-    if any(marker in lowered for marker in UNVERIFIED_CLAIM_MARKERS):
+    if scan.has("unverified_claim"):
         violations.append("UNVERIFIED_CLAIM_LANGUAGE")
 
+    has_url = scan.has("url")
     percent_claims = SUSPICIOUS_PERCENT_RE.findall(content)
-    if percent_claims and not URL_RE.search(content):
+    if percent_claims and not has_url:
         violations.append("STAT_WITHOUT_SOURCE")
 
     quote_count = content.count('"') + content.count("'")
-    if quote_count >= 4 and not URL_RE.search(content):
+    if quote_count >= 4 and not has_url:
         violations.append("QUOTE_WITHOUT_SOURCE")
 
-    if URL_RE.search(content):
+    if has_url:
         violations.append("EXTERNAL_LINK_IN_BODY")
 
-    if any(marker in lowered for marker in ENGAGEMENT_BAIT_MARKERS):
+    if scan.has("engagement_bait"):
         violations.append("ENGAGEMENT_BAIT_LANGUAGE")
 
     return GuardrailResult(passed=len(violations) == 0, violations=violations)
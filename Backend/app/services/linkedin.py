@@ -1,11 +1,24 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from urllib.parse import quote
 
 import httpx
 
 from ..config import settings
+from ..metrics import LINKEDIN_RATE_LIMITED, LINKEDIN_REQUEST_SECONDS, LINKEDIN_REQUESTS
+
+# Cool-down applied to the shared rate limiter when a 429 carries no Retry-After
+RATE_LIMIT_COOLDOWN_SECONDS = 60.0
+
+# Max share URNs per organizationalEntityShareStatistics request
+METRICS_BATCH_SIZE = 20
 
 
 class LinkedInApiError(RuntimeError):
@@ -20,6 +33,147 @@ class LinkedInRateLimitError(LinkedInApiError):
     pass
 
 
+class TokenBucket:
+    """Thread-safe token bucket shared by every LinkedIn call in the process.
+
+    ``acquire`` blocks until a token is free. A 429 calls ``pause`` so every
+    thread backs off together; if the pause outlasts ``max_wait`` callers get
+    LinkedInRateLimitError straight away instead of queueing behind it.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = max(rate_per_second, 0.001)
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, max_wait: float | None = None) -> None:
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise LinkedInRateLimitError("LinkedIn rate limit reached (client-side backoff)")
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = now
+
+
+_shared_lock = threading.Lock()
+_shared_client: httpx.Client | None = None
+_shared_limiter: TokenBucket | None = None
+_shared_pid: int | None = None
+
+
+def _reset_shared_after_fork() -> None:
+    global _shared_client, _shared_limiter, _shared_pid
+    if _shared_pid != os.getpid():
+        _shared_client = None
+        _shared_limiter = None
+        _shared_pid = os.getpid()
+
+
+def get_linkedin_client() -> httpx.Client:
+    """Process-wide pooled client reused by every LinkedIn call."""
+    global _shared_client
+    with _shared_lock:
+        _reset_shared_after_fork()
+        if _shared_client is None or _shared_client.is_closed:
+            pool_size = max(1, settings.linkedin_poll_concurrency)
+            _shared_client = httpx.Client(
+                timeout=settings.linkedin_api_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size,
+                ),
+            )
+        return _shared_client
+
+
+def get_linkedin_rate_limiter() -> TokenBucket:
+    """Process-wide token bucket for LinkedIn API calls."""
+    global _shared_limiter
+    with _shared_lock:
+        _reset_shared_after_fork()
+        if _shared_limiter is None:
+            _shared_limiter = TokenBucket(
+                settings.linkedin_api_rate_per_second,
+                settings.linkedin_api_burst,
+            )
+        return _shared_limiter
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    try:
+        return max(0.0, float(response.headers.get("retry-after", "")))
+    except ValueError:
+        return RATE_LIMIT_COOLDOWN_SECONDS
+
+
+def _api_get(client: httpx.Client, url: str, params: dict | None = None) -> dict:
+    """GET a LinkedIn REST resource through the shared rate limiter.
+
+    Retries transport errors and 5xx up to linkedin_api_retries times and
+    maps 401/403, 429 and other 4xx to the LinkedIn exception types.
+    """
+    limiter = get_linkedin_rate_limiter()
+    headers = {"Authorization": f"Bearer {settings.linkedin_api_token}"}
+
+    last_exc: Exception | None = None
+    response: httpx.Response | None = None
+    for _attempt in range(settings.linkedin_api_retries + 1):
+        limiter.acquire(max_wait=settings.linkedin_api_timeout_seconds)
+        started = time.perf_counter()
+        try:
+            response = client.get(url, headers=headers, params=params)
+            LINKEDIN_REQUESTS.inc(status=str(response.status_code))
+            if response.status_code >= 500:
+                raise LinkedInApiError(f"LinkedIn server error {response.status_code}")
+            break
+        except httpx.HTTPError as exc:
+            LINKEDIN_REQUESTS.inc(status=type(exc).__name__)
+            last_exc = exc
+            response = None
+        except Exception as exc:  # noqa: BLE001
+            last_exc = exc
+            response = None
+        finally:
+            LINKEDIN_REQUEST_SECONDS.observe(time.perf_counter() - started)
+
+    if response is None:
+        raise LinkedInApiError(f"LinkedIn request failed: {last_exc}")
+
+    if response.status_code in (401, 403):
+        raise LinkedInAuthError("LinkedIn auth failed")
+    if response.status_code == 429:
+        LINKEDIN_RATE_LIMITED.inc()
+        limiter.pause(_retry_after_seconds(response))
+        raise LinkedInRateLimitError("LinkedIn rate limit reached")
+    if response.status_code >= 400:
+        raise LinkedInApiError(f"LinkedIn API error {response.status_code}: {response.text}")
+
+    return response.json()
+
+
 @dataclass
 class LinkedInComment:
     linkedin_comment_id: str
@@ -27,6 +181,7 @@ class LinkedInComment:
     comment_text: str
     commenter_profile_url: str | None = None
     commenter_follower_count: int | None = None
+    created_at: datetime | None = None
 
 
 @dataclass
@@ -65,9 +220,80 @@ def _parse_comment_item(row: dict) -> LinkedInComment | None:
         comment_text=str(comment_text),
         commenter_profile_url=profile.get("profile_url") or row.get("commenter_profile_url"),
         commenter_follower_count=profile.get("follower_count") or row.get("commenter_follower_count"),
+        created_at=_parse_comment_time(row),
     )
 
 
+def _parse_comment_time(row: dict) -> datetime | None:
+    """Read a comment's creation time from LinkedIn or mock payload shapes."""
+    created = row.get("created")
+    raw = created.get("time") if isinstance(created, dict) else None
+    if raw is None:
+        raw = row.get("createdAt") or row.get("created_at") or row.get("commented_at")
+    if raw is None:
+        return None
+    try:
+        if isinstance(raw, (int, float)):
+            # LinkedIn REST timestamps are epoch milliseconds
+            return datetime.fromtimestamp(raw / 1000, tz=timezone.utc)
+        parsed = datetime.fromisoformat(str(raw).replace("Z", "+00:00"))
+    except (ValueError, OverflowError, OSError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _is_newest_first(page: list[LinkedInComment]) -> bool:
+    """Whether a page is ordered newest-first (assumed when undeterminable)."""
+    stamps = [c.created_at for c in page if c.created_at is not None]
+    return len(stamps) < 2 or stamps[0] >= stamps[-1]
+
+
+def _split_at_cursor(
+    page: list[LinkedInComment],
+    cursor_at: datetime | None,
+    cursor_id: str | None,
+) -> tuple[list[LinkedInComment], bool]:
+    """Return (comments newer than the cursor, whether the cursor was reached).
+
+    Comments are ordered by (created_at, linkedin_comment_id), so a comment
+    sharing the cursor's timestamp is only behind it if its id sorts at or
+    before the cursor's id. A timestamp-only cursor covers its whole second.
+    """
+    if cursor_at is None and cursor_id is None:
+        return page, False
+
+    newer: list[LinkedInComment] = []
+    reached = False
+    for comment in page:
+        if cursor_id is not None and comment.linkedin_comment_id == cursor_id:
+            reached = True
+            continue
+        if cursor_at is not None and comment.created_at is not None:
+            if cursor_id is None:
+                behind = comment.created_at <= cursor_at
+            else:
+                behind = _cursor_key(comment) <= (cursor_at, cursor_id)
+            if behind:
+                reached = True
+                continue
+        newer.append(comment)
+    return newer, reached
+
+
+def _cursor_key(comment: LinkedInComment) -> tuple[datetime, str]:
+    return comment.created_at, comment.linkedin_comment_id
+
+
+def newest_comment(comments: list[LinkedInComment]) -> LinkedInComment | None:
+    """The comment to use as the next high-water mark."""
+    if not comments:
+        return None
+    stamped = [c for c in comments if c.created_at is not None]
+    if stamped:
+        return max(stamped, key=_cursor_key)
+    return comments[0]
+
+
 
 def _parse_comments_page(payload: dict) -> tuple[list[LinkedInComment], int | None]:
     rows = payload.get("elements") or payload.get("comments") or payload.get("data") or []
@@ -127,7 +353,19 @@ def fetch_recent_comments_for_post(
     linkedin_post_id: str,
     since_minutes: int = 15,
     _client: httpx.Client | None = None,
+    cursor_at: datetime | None = None,
+    cursor_id: str | None = None,
 ) -> list[LinkedInComment]:
+    """Fetch comments newer than the post's high-water mark.
+
+    LinkedIn pages comments newest-first, so pagination stops at the first
+    page that reaches the cursor (``cursor_at`` timestamp or ``cursor_id``)
+    and polling cost scales with new comments rather than the post's total.
+    If a page turns out to be oldest-first, the cursor is only used to filter
+    and every page is read. With no cursor, every page is read.
+
+    ``since_minutes`` is kept for API compatibility; the cursor replaces it.
+    """
     _ = since_minutes
 
     mock_comments = _mock_comments_for_post(linkedin_post_id)
@@ -137,57 +375,27 @@ def fetch_recent_comments_for_post(
     if settings.linkedin_api_mode != "api" or not settings.linkedin_api_token:
         return []
 
-    own_client = _client is None
-    client = _client or httpx.Client(timeout=settings.linkedin_api_timeout_seconds)
+    client = _client or get_linkedin_client()
+    start = 0
+    count = max(1, settings.linkedin_api_page_size)
+    output: list[LinkedInComment] = []
+    seen: set[str] = set()
 
-    try:
-        headers = {"Authorization": f"Bearer {settings.linkedin_api_token}"}
-        start = 0
-        count = max(1, settings.linkedin_api_page_size)
-        output: list[LinkedInComment] = []
-        seen: set[str] = set()
-
-        while True:
-            url = f"{settings.linkedin_api_base_url.rstrip('/')}/rest/socialActions/{linkedin_post_id}/comments"
-            params = {"start": start, "count": count}
-
-            last_exc: Exception | None = None
-            response: httpx.Response | None = None
-            for _attempt in range(settings.linkedin_api_retries + 1):
-                try:
-                    response = client.get(url, headers=headers, params=params)
-                    if response.status_code >= 500:
-                        raise LinkedInApiError(f"LinkedIn server error {response.status_code}")
-                    break
-                except Exception as exc:  # noqa: BLE001
-                    last_exc = exc
-                    response = None
+    while True:
+        url = f"{settings.linkedin_api_base_url.rstrip('/')}/rest/socialActions/{linkedin_post_id}/comments"
+        payload = _api_get(client, url, params={"start": start, "count": count})
+        parsed, next_start = _parse_comments_page(payload)
+        newer, reached_cursor = _split_at_cursor(parsed, cursor_at, cursor_id)
+        for comment in newer:
+            if comment.linkedin_comment_id not in seen:
+                seen.add(comment.linkedin_comment_id)
+                output.append(comment)
 
-            if response is None:
-                raise LinkedInApiError(f"LinkedIn request failed: {last_exc}")
+        if next_start is None or (reached_cursor and _is_newest_first(parsed)):
+            break
+        start = next_start
 
-            if response.status_code in (401, 403):
-                raise LinkedInAuthError("LinkedIn auth failed")
-            if response.status_code == 429:
-                raise LinkedInRateLimitError("LinkedIn rate limit reached")
-            if response.status_code >= 400:
-                raise LinkedInApiError(f"LinkedIn API error {response.status_code}: {response.text}")
-
-            payload = response.json()
-            parsed, next_start = _parse_comments_page(payload)
-            for comment in parsed:
-                if comment.linkedin_comment_id not in seen:
-                    seen.add(comment.linkedin_comment_id)
-                    output.append(comment)
-
-            if next_start is None:
-                break
-            start = next_start
-
-        return output
-    finally:
-        if own_client:
-            client.close()
+    return output
 
 
 def _parse_metrics_response(payload: dict) -> LinkedInPostMetrics:
@@ -251,7 +459,7 @@ def fetch_post_metrics(
 
     Args:
         linkedin_post_id: The LinkedIn post URN or ID
-        _client: Optional httpx client for connection reuse
+        _client: Optional httpx client (defaults to the shared pooled client)
 
     Returns:
         LinkedInPostMetrics with impressions, reactions, comments, shares
@@ -270,76 +478,120 @@ def fetch_post_metrics(
     if settings.linkedin_api_mode != "api" or not settings.linkedin_api_token:
         return LinkedInPostMetrics()
 
-    own_client = _client is None
-    client = _client or httpx.Client(timeout=settings.linkedin_api_timeout_seconds)
+    client = _client or get_linkedin_client()
 
-    try:
-        headers = {"Authorization": f"Bearer {settings.linkedin_api_token}"}
+    # LinkedIn Marketing API endpoint for share statistics
+    # Format: /rest/organizationalEntityShareStatistics?q=organizationalEntity&shares=List(urn:li:share:{id})
+    # Or for UGC posts: /rest/shares/{id}/statistics
+    url = f"{settings.linkedin_api_base_url.rstrip('/')}/rest/shares/{linkedin_post_id}/statistics"
+    return _parse_metrics_response(_api_get(client, url))
 
-        # LinkedIn Marketing API endpoint for share statistics
-        # Format: /rest/organizationalEntityShareStatistics?q=organizationalEntity&shares=List(urn:li:share:{id})
-        # Or for UGC posts: /rest/shares/{id}/statistics
-        url = f"{settings.linkedin_api_base_url.rstrip('/')}/rest/shares/{linkedin_post_id}/statistics"
 
-        last_exc: Exception | None = None
-        response: httpx.Response | None = None
+def _share_urn(linkedin_post_id: str) -> str:
+    return linkedin_post_id if linkedin_post_id.startswith("urn:li:") else f"urn:li:share:{linkedin_post_id}"
 
-        for _attempt in range(settings.linkedin_api_retries + 1):
-            try:
-                response = client.get(url, headers=headers)
-                if response.status_code >= 500:
-                    raise LinkedInApiError(f"LinkedIn server error {response.status_code}")
-                break
-            except Exception as exc:  # noqa: BLE001
-                last_exc = exc
-                response = None
 
-        if response is None:
-            raise LinkedInApiError(f"LinkedIn request failed: {last_exc}")
+def _fetch_share_statistics_chunk(
+    client: httpx.Client,
+    urns: list[str],
+) -> dict[str, LinkedInPostMetrics]:
+    """One multi-entity statistics request for up to METRICS_BATCH_SIZE shares."""
+    org = quote(settings.linkedin_organization_urn or "", safe="")
+    shares = ",".join(quote(urn, safe="") for urn in urns)
+    # Rest.li List(...) syntax must reach LinkedIn unencoded, so build the query by hand.
+    url = (
+        f"{settings.linkedin_api_base_url.rstrip('/')}/rest/organizationalEntityShareStatistics"
+        f"?q=organizationalEntity&organizationalEntity={org}&shares=List({shares})"
+    )
+    payload = _api_get(client, url)
+
+    results: dict[str, LinkedInPostMetrics] = {}
+    for element in payload.get("elements") or []:
+        if not isinstance(element, dict):
+            continue
+        urn = element.get("share") or element.get("ugcPost")
+        stats = element.get("totalShareStatistics") or element
+        if urn:
+            results[urn] = _parse_metrics_response({"elements": [stats]})
+    return results
+
 
-        if response.status_code in (401, 403):
-            raise LinkedInAuthError("LinkedIn auth failed")
-        if response.status_code == 429:
-            raise LinkedInRateLimitError("LinkedIn rate limit reached")
-        if response.status_code >= 400:
-            raise LinkedInApiError(f"LinkedIn API error {response.status_code}: {response.text}")
+def _fetch_metrics_parallel(
+    client: httpx.Client,
+    post_ids: list[str],
+) -> dict[str, LinkedInPostMetrics]:
+    """Per-post fallback, run on a bounded thread pool; failed posts are omitted.
+
+    An auth failure is not a per-post failure: it is re-raised for the caller.
+    """
+    if not post_ids:
+        return {}
 
-        payload = response.json()
-        return _parse_metrics_response(payload)
+    def _one(post_id: str) -> LinkedInPostMetrics | None:
+        try:
+            return fetch_post_metrics(post_id, _client=client)
+        except LinkedInAuthError:
+            raise
+        except LinkedInApiError:
+            return None
 
-    finally:
-        if own_client:
-            client.close()
+    workers = max(1, min(settings.linkedin_poll_concurrency, len(post_ids)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="metrics-fetch") as pool:
+        fetched = pool.map(_one, post_ids)
+        return {post_id: metrics for post_id, metrics in zip(post_ids, fetched) if metrics is not None}
 
 
 def fetch_metrics_batch(
     post_ids: list[str],
     _client: httpx.Client | None = None,
 ) -> dict[str, LinkedInPostMetrics]:
-    """Fetch metrics for multiple posts.
+    """Fetch metrics for multiple posts in as few requests as possible.
+
+    With LINKEDIN_ORGANIZATION_URN set, posts are fetched through the
+    multi-entity share statistics query, METRICS_BATCH_SIZE shares per
+    request. Posts that query cannot answer (no organization configured, a
+    failed chunk, or a share missing from the response) fall back to
+    per-post requests run in parallel.
 
     Args:
         post_ids: List of LinkedIn post IDs
-        _client: Optional httpx client for connection reuse
+        _client: Optional httpx client (defaults to the shared pooled client)
 
     Returns:
-        Dict mapping post_id to LinkedInPostMetrics
+        Dict mapping post_id to LinkedInPostMetrics. Posts whose metrics
+        could not be fetched are omitted.
+
+    Raises:
+        LinkedInAuthError: If authentication fails
     """
-    results: dict[str, LinkedInPostMetrics] = {}
+    post_ids = list(dict.fromkeys(post_ids))
+    if not post_ids:
+        return {}
 
-    own_client = _client is None
-    client = _client or httpx.Client(timeout=settings.linkedin_api_timeout_seconds)
+    if settings.linkedin_mock_metrics_json:
+        mocked = {post_id: _mock_metrics_for_post(post_id) for post_id in post_ids}
+        return {post_id: metrics for post_id, metrics in mocked.items() if metrics is not None}
 
-    try:
-        for post_id in post_ids:
+    if settings.linkedin_api_mode != "api" or not settings.linkedin_api_token:
+        return {post_id: LinkedInPostMetrics() for post_id in post_ids}
+
+    client = _client or get_linkedin_client()
+    results: dict[str, LinkedInPostMetrics] = {}
+
+    if settings.linkedin_organization_urn:
+        for start in range(0, len(post_ids), METRICS_BATCH_SIZE):
+            chunk = post_ids[start:start + METRICS_BATCH_SIZE]
             try:
-                metrics = fetch_post_metrics(post_id, _client=client)
-                results[post_id] = metrics
+                by_urn = _fetch_share_statistics_chunk(client, [_share_urn(p) for p in chunk])
+            except LinkedInAuthError:
+                raise
             except LinkedInApiError:
-                # Continue with other posts on error
-                results[post_id] = LinkedInPostMetrics()
-    finally:
-        if own_client:
-            client.close()
-
+                continue
+            for post_id in chunk:
+                metrics = by_urn.get(_share_urn(post_id))
+                if metrics is not None:
+                    results[post_id] = metrics
+
+    missing = [post_id for post_id in post_ids if post_id not in results]
+    results.update(_fetch_metrics_parallel(client, missing))
     return results
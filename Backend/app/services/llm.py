@@ -6,6 +6,10 @@ import httpx
 
 from ..config import settings
 from ..models import PostFormat, PostTone
+from .llm_cache import cache_key, get_llm_cache
+
+CLAUDE_MAX_TOKENS = 900
+CLAUDE_TEMPERATURE = 0.4
 
 
 def _fallback_post(pillar: str, sub_theme: str, tone: PostTone) -> str:
@@ -62,10 +66,30 @@ def _build_summary_prompt(source_name: str, title: str, content: str) -> str:
     )
 
 
-def _call_claude(prompt: str) -> str:
+def _build_batch_summary_prompt(articles: list[tuple[str, str, str]]) -> str:
+    per_article = max(1500, 7000 // len(articles))
+    sections = [
+        f"Article {index}\\nSource: {source_name}\\nTitle: {title}\\nContent:\\n{content[:per_article]}"
+        for index, (source_name, title, content) in enumerate(articles, start=1)
+    ]
+    return (
+        "Summarise each numbered article below in 3 to 5 sentences, focusing on adtech/AI implications and uncertainty flags.\\n"
+        f"Return only a JSON array of {len(articles)} strings: one summary per article, in article order.\\n\\n"
+        + "\\n\\n".join(sections)
+    )
+
+
+def _call_claude(prompt: str, cache: bool = True, max_tokens: int = CLAUDE_MAX_TOKENS) -> str:
     if not settings.llm_api_key:
         raise RuntimeError("Missing LLM_API_KEY")
 
+    response_cache = get_llm_cache() if cache else None
+    key = cache_key(settings.llm_model, "", prompt, CLAUDE_TEMPERATURE, max_tokens)
+    if response_cache is not None:
+        hit = response_cache.get(key)
+        if hit is not None:
+            return hit["content"]
+
     headers = {
         "x-api-key": settings.llm_api_key,
         "anthropic-version": "2023-06-01",
@@ -73,8 +97,8 @@ def _call_claude(prompt: str) -> str:
     }
     payload = {
         "model": settings.llm_model,
-        "max_tokens": 900,
-        "temperature": 0.4,
+        "max_tokens": max_tokens,
+        "temperature": CLAUDE_TEMPERATURE,
         "messages": [{"role": "user", "content": prompt}],
     }
     response = httpx.post(settings.anthropic_base_url, headers=headers, json=payload, timeout=30)
@@ -87,6 +111,17 @@ def _call_claude(prompt: str) -> str:
     result = "\\n".join([t.strip() for t in text_blocks if t.strip()]).strip()
     if not result:
         raise RuntimeError("Claude API returned empty content")
+    if response_cache is not None:
+        usage = body.get("usage", {})
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+        response_cache.set(key, {
+            "content": result,
+            "model": body.get("model", settings.llm_model),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        })
     return result
 
 
@@ -102,22 +137,61 @@ def generate_linkedin_post(
 
     prompt = _build_generation_prompt(pillar, sub_theme, post_format, tone, research_context)
     try:
-        return _call_claude(prompt)
+        # Creative generation: the same brief should still yield a fresh post
+        return _call_claude(prompt, cache=False)
     except Exception:
         return _fallback_post(pillar, sub_theme, tone)
 
 
+def llm_summaries_enabled() -> bool:
+    return settings.llm_provider.lower() == "claude" and bool(settings.llm_api_key)
+
+
+def fallback_summary(title: str, content: str) -> str:
+    sentence = content.strip().replace("\n", " ")
+    return sentence[:420] if sentence else f"Summary unavailable for {title}."
+
+
 def summarize_source(source_name: str, title: str, content: str) -> str:
-    if settings.llm_provider.lower() != "claude" or not settings.llm_api_key:
-        sentence = content.strip().replace("\n", " ")
-        return sentence[:420] if sentence else f"Summary unavailable for {title}."
+    if not llm_summaries_enabled():
+        return fallback_summary(title, content)
 
     prompt = _build_summary_prompt(source_name, title, content)
     try:
         return _call_claude(prompt)
     except Exception:
-        sentence = content.strip().replace("\n", " ")
-        return sentence[:420] if sentence else f"Summary unavailable for {title}."
+        return fallback_summary(title, content)
+
+
+def _parse_summary_array(raw: str, expected: int) -> list[str]:
+    # Tolerate prose or code fences around the array
+    start, end = raw.find("["), raw.rfind("]")
+    parsed = json.loads(raw[start:end + 1]) if start != -1 and end > start else None
+    if not isinstance(parsed, list) or len(parsed) != expected:
+        raise ValueError("Batch summary did not return one summary per article")
+    summaries = [item.strip() if isinstance(item, str) else "" for item in parsed]
+    if not all(summaries):
+        raise ValueError("Batch summary returned an empty summary")
+    return summaries
+
+
+def summarize_sources(articles: list[tuple[str, str, str]]) -> list[str]:
+    """Summarise several (source_name, title, content) articles in one request.
+
+    Falls back to one request per article if the batched answer cannot be
+    matched back to its articles.
+    """
+    if not articles:
+        return []
+    if len(articles) == 1 or not llm_summaries_enabled():
+        return [summarize_source(*article) for article in articles]
+
+    prompt = _build_batch_summary_prompt(articles)
+    try:
+        raw = _call_claude(prompt, max_tokens=min(CLAUDE_MAX_TOKENS * len(articles), 4000))
+        return _parse_summary_array(raw, len(articles))
+    except Exception:
+        return [summarize_source(*article) for article in articles]
 
 
 def parse_citations(raw: str) -> str:
@@ -0,0 +1,371 @@
+"""LLM Response Cache.
+
+Content-addressed cache for LLM completions, keyed on a hash of
+(model, system prompt, user prompt, temperature, max_tokens).
+
+Backends:
+- memory: in-process LRU bounded by total bytes (default)
+- redis:  shared across workers; entries expire via Redis TTL, total size
+          is bounded by the server's maxmemory (LLM_CACHE_MAX_BYTES is ignored)
+- sqlite: on-disk LRU bounded by total bytes, for single-host deployments
+- none:   caching disabled
+
+A cache failure never fails a generation: backend errors are logged,
+counted and treated as a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from ..config import settings
+from ..db_url import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Configuration
+# ─────────────────────────────────────────────────────────────────────────────
+
+CACHE_BACKENDS = ("memory", "redis", "sqlite", "none")
+REDIS_KEY_PREFIX = "llm-cache:"
+DEFAULT_SQLITE_PATH = PROJECT_ROOT / "llm_cache.db"
+
+
+def cache_key(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Return the content address for one LLM request."""
+    material = json.dumps(
+        [model, system_prompt, user_prompt, float(temperature), int(max_tokens)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Backends
+# ─────────────────────────────────────────────────────────────────────────────
+
+class LLMCache:
+    """Base cache: counters plus the get/set contract.
+
+    Values are JSON-serialisable dicts. Subclasses implement ``_get``,
+    ``_set`` and ``_clear``; this class handles TTL bookkeeping, entry-size
+    limits, error isolation and hit/miss counters.
+    """
+
+    backend = "none"
+    # Whether get/set may block on I/O (async callers push these to a thread)
+    blocking = False
+
+    def __init__(self, ttl_seconds: int, max_bytes: int, max_entry_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._counter_lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "oversize": 0,
+            "errors": 0,
+        }
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._counter_lock:
+            self._counters[name] += amount
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached value for ``key`` or None on miss."""
+        try:
+            raw = self._get(key)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("LLM cache get failed (%s): %s", self.backend, exc)
+            self._count("errors")
+            raw = None
+        if raw is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return json.loads(raw)
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store ``value`` under ``key`` unless it exceeds the entry limit."""
+        raw = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        if len(raw) > self.max_entry_bytes:
+            self._count("oversize")
+            return
+        try:
+            self._set(key, raw)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("LLM cache set failed (%s): %s", self.backend, exc)
+            self._count("errors")
+            return
+        self._count("stores")
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        self._clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters and sizing for health endpoints."""
+        with self._counter_lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "backend": self.backend,
+            "ttl_seconds": self.ttl_seconds,
+            "max_bytes": self.max_bytes,
+            "max_entry_bytes": self.max_entry_bytes,
+            **counters,
+            "hit_ratio": round(counters["hits"] / lookups, 4) if lookups else None,
+            **self._size(),
+        }
+
+    # Backend hooks
+    def _get(self, key: str) -> bytes | None:
+        return None
+
+    def _set(self, key: str, raw: bytes) -> None:
+        return None
+
+    def _clear(self) -> None:
+        return None
+
+    def _size(self) -> dict[str, Any]:
+        return {}
+
+
+class MemoryLLMCache(LLMCache):
+    """In-process LRU bounded by the total size of stored values."""
+
+    backend = "memory"
+
+    def __init__(self, ttl_seconds: int, max_bytes: int, max_entry_bytes: int):
+        super().__init__(ttl_seconds, max_bytes, max_entry_bytes)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+
+    def _get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, raw = entry
+            if expires_at <= time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return raw
+
+    def _set(self, key: str, raw: bytes) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, raw)
+            self._bytes += len(raw)
+            evicted = 0
+            while self._bytes > self.max_bytes and self._entries:
+                self._drop(next(iter(self._entries)))
+                evicted += 1
+        if evicted:
+            self._count("evictions", evicted)
+
+    def _drop(self, key: str) -> None:
+        _, raw = self._entries.pop(key)
+        self._bytes -= len(raw)
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _size(self) -> dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes}
+
+
+class RedisLLMCache(LLMCache):
+    """Redis-backed cache shared by every API and worker process.
+
+    Expiry uses Redis TTLs and only the entry limit is enforced here.
+    LLM_CACHE_MAX_BYTES does not apply: bound the total size with the
+    server's ``maxmemory`` and ``allkeys-lru`` policy. stats() reports
+    ``max_bytes`` as None accordingly.
+    """
+
+    backend = "redis"
+    blocking = True
+
+    def __init__(self, ttl_seconds: int, max_bytes: int, max_entry_bytes: int, url: str):
+        super().__init__(ttl_seconds, max_bytes, max_entry_bytes)
+        self.max_bytes = None  # not enforced; see class docstring
+        import redis as redis_lib
+
+        self._client = redis_lib.Redis.from_url(url, socket_timeout=2)
+
+    def _get(self, key: str) -> bytes | None:
+        return self._client.get(REDIS_KEY_PREFIX + key)
+
+    def _set(self, key: str, raw: bytes) -> None:
+        self._client.set(REDIS_KEY_PREFIX + key, raw, ex=self.ttl_seconds)
+
+    def _clear(self) -> None:
+        keys = list(self._client.scan_iter(match=REDIS_KEY_PREFIX + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+class SQLiteLLMCache(LLMCache):
+    """On-disk LRU in its own SQLite file (not the application database)."""
+
+    backend = "sqlite"
+    blocking = True
+
+    def __init__(self, ttl_seconds: int, max_bytes: int, max_entry_bytes: int, path: str):
+        super().__init__(ttl_seconds, max_bytes, max_entry_bytes)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_cache_accessed_at ON llm_cache (accessed_at)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_cache_expires_at ON llm_cache (expires_at)"
+        )
+
+    def _get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def _set(self, key: str, raw: bytes) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, size, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, raw, len(raw), now + self.ttl_seconds, now),
+                )
+                self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+                evicted = self._evict_over_budget()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if evicted:
+            self._count("evictions", evicted)
+
+    def _evict_over_budget(self) -> int:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        evicted = 0
+        while total > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT key, size FROM llm_cache ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (row[0],))
+            total -= row[1]
+            evicted += 1
+        return evicted
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+
+    def _size(self) -> dict[str, Any]:
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+        return {"entries": entries, "bytes": total}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Singleton
+# ─────────────────────────────────────────────────────────────────────────────
+
+_cache: LLMCache | None = None
+_cache_lock = threading.Lock()
+
+
+def build_llm_cache(backend: str | None = None) -> LLMCache:
+    """Build a cache for ``backend`` (defaults to settings.llm_cache_backend)."""
+    backend = (backend or settings.llm_cache_backend).lower()
+    sizing = {
+        "ttl_seconds": settings.llm_cache_ttl_seconds,
+        "max_bytes": settings.llm_cache_max_bytes,
+        "max_entry_bytes": settings.llm_cache_max_entry_bytes,
+    }
+    if backend == "memory":
+        return MemoryLLMCache(**sizing)
+    if backend == "redis":
+        return RedisLLMCache(**sizing, url=settings.llm_cache_redis_url or settings.redis_url)
+    if backend == "sqlite":
+        return SQLiteLLMCache(**sizing, path=settings.llm_cache_sqlite_path or str(DEFAULT_SQLITE_PATH))
+    if backend == "none":
+        return LLMCache(**sizing)
+    raise ValueError(f"Unknown LLM cache backend {backend!r}; expected one of {CACHE_BACKENDS}")
+
+
+def get_llm_cache() -> LLMCache:
+    """Get the process-wide LLM cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = build_llm_cache()
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("LLM cache unavailable, caching disabled: %s", exc)
+                    _cache = build_llm_cache("none")
+    return _cache
+
+
+def set_llm_cache(cache: LLMCache | None) -> None:
+    """Replace the process-wide cache (None rebuilds from settings on next use)."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def get_llm_cache_stats() -> dict[str, Any]:
+    """Counters for health endpoints."""
+    return get_llm_cache().stats()
@@ -2,23 +2,37 @@
 
 Provides a clean interface to the Anthropic Claude API with:
 - Mock mode for testing without live credentials
-- Exponential backoff retry for transient failures
-- Token usage tracking
+- Pooled keep-alive connections with bounded concurrency
+- Jittered backoff retry for transient failures, honouring Retry-After
+- Token usage tracking, plus latency/retry/token metrics (app.metrics)
+- Content-addressed response caching (see llm_cache)
+- A blocking façade (LLMClient / generate_text) over the async client
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import random
+import threading
 import time
+from collections.abc import Coroutine
 from dataclasses import dataclass
-from typing import Any
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
 
 import httpx
 
 from ..config import settings
+from ..metrics import LLM_CACHE_HITS, LLM_REQUEST_SECONDS, LLM_REQUESTS, LLM_RETRIES, LLM_TOKENS
+from .llm_cache import LLMCache, cache_key, get_llm_cache
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Configuration
@@ -29,9 +43,16 @@ DEFAULT_MODEL = "claude-3-5-sonnet-latest"
 DEFAULT_MAX_TOKENS = 1024
 DEFAULT_TEMPERATURE = 0.7
 
-# Retry configuration (3 attempts: 30s, 1m, 2m)
+# Retry configuration (3 attempts: 30s, 1m, 2m, each +/- 20% jitter)
 RETRY_DELAYS = [30, 60, 120]
+RETRY_JITTER = 0.2
 MAX_RETRIES = 3
+MAX_RETRY_AFTER_SECONDS = 120
+
+# Connection pool configuration
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_TIMEOUT_SECONDS = 60.0
+KEEPALIVE_EXPIRY_SECONDS = 60.0
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -48,6 +69,7 @@ class LLMResponse:
     output_tokens: int
     total_tokens: int
     is_mock: bool = False
+    cached: bool = False
 
 
 @dataclass
@@ -174,39 +196,170 @@ def _generate_mock_summary(prompt: str) -> str:
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# API Client
+# Async API Client
 # ─────────────────────────────────────────────────────────────────────────────
 
-class LLMClient:
-    """Client for interacting with the Anthropic Claude API."""
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package (``httpx[http2]``)."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header given as seconds or an HTTP date."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+def _backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Delay before the next attempt.
+
+    A server-supplied Retry-After wins; otherwise use the RETRY_DELAYS
+    schedule with +/- RETRY_JITTER so parallel callers don't retry in lockstep.
+    """
+    if retry_after is not None:
+        return retry_after
+    base = RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
+    return base * random.uniform(1 - RETRY_JITTER, 1 + RETRY_JITTER)
+
+
+def _parse_api_response(data: dict[str, Any], default_model: str) -> LLMResponse:
+    """Build an LLMResponse from a Messages API response body."""
+    content_blocks = data.get("content", [])
+    text_parts = [
+        block.get("text", "")
+        for block in content_blocks
+        if block.get("type") == "text"
+    ]
+    content = "\n".join(text_parts).strip()
+
+    if not content:
+        raise RuntimeError("Claude API returned empty content")
+
+    usage = data.get("usage", {})
+    input_tokens = usage.get("input_tokens", 0)
+    output_tokens = usage.get("output_tokens", 0)
+
+    return LLMResponse(
+        content=content,
+        model=data.get("model", default_model),
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        total_tokens=input_tokens + output_tokens,
+        is_mock=False,
+    )
+
+
+def _cache_value(response: LLMResponse) -> dict[str, Any]:
+    return {
+        "content": response.content,
+        "model": response.model,
+        "input_tokens": response.input_tokens,
+        "output_tokens": response.output_tokens,
+        "total_tokens": response.total_tokens,
+    }
+
+
+async def _cache_call(response_cache: LLMCache, fn, *args):
+    """Run a cache operation without blocking the loop on network/disk I/O."""
+    if response_cache.blocking:
+        return await asyncio.to_thread(fn, *args)
+    return fn(*args)
+
+
+class AsyncLLMClient:
+    """Async client for the Anthropic Claude API.
+
+    Holds one long-lived ``httpx.AsyncClient`` so TLS sessions and
+    keep-alive connections are reused across calls (HTTP/2 when ``h2`` is
+    installed), and caps in-flight requests with a semaphore. Retries wait
+    with ``asyncio.sleep`` so other generations keep running meanwhile.
+
+    An instance is bound to the event loop it is first used on; use one
+    instance per loop and ``aclose()`` it when the loop is done.
+    """
 
     def __init__(
         self,
         api_key: str | None = None,
         model: str | None = None,
         base_url: str | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
     ):
-        """Initialize the LLM client.
+        """Initialize the async LLM client.
 
         Args:
             api_key: Anthropic API key (defaults to settings.llm_api_key)
             model: Model to use (defaults to settings.llm_model)
             base_url: API base URL (defaults to settings.anthropic_base_url)
+            max_concurrency: Max in-flight requests (defaults to settings.llm_max_concurrency)
+            timeout: Per-request timeout in seconds (defaults to settings.llm_timeout_seconds)
         """
         self.api_key = api_key or getattr(settings, "llm_api_key", None)
         self.model = model or getattr(settings, "llm_model", DEFAULT_MODEL)
         self.base_url = base_url or getattr(settings, "anthropic_base_url", ANTHROPIC_API_URL)
+        self.max_concurrency = max(
+            1, max_concurrency or getattr(settings, "llm_max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        )
+        self.timeout = timeout or getattr(settings, "llm_timeout_seconds", DEFAULT_TIMEOUT_SECONDS)
+        self._http: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
 
     def is_mock_mode(self) -> bool:
         """Check if client is operating in mock mode."""
         return _is_mock_mode()
 
-    def generate(
+    def _get_http(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=_http2_available(),
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+                ),
+                headers={
+                    "anthropic-version": "2023-06-01",
+                    "content-type": "application/json",
+                },
+            )
+        return self._http
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def generate(
         self,
         user_prompt: str,
         system_prompt: str = "",
         max_tokens: int = DEFAULT_MAX_TOKENS,
         temperature: float = DEFAULT_TEMPERATURE,
+        cache: bool = True,
     ) -> LLMResponse:
         """Generate a response from the LLM.
 
@@ -215,40 +368,73 @@ class LLMClient:
             system_prompt: Optional system prompt for context
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            cache: Serve/store this call via the response cache. Pass False
+                for creative calls where identical prompts should still get
+                fresh output.
 
         Returns:
             LLMResponse with content and metadata
 
         Raises:
-            LLMError: If the API call fails after all retries
+            httpx.HTTPStatusError: On a non-retryable 4xx response
+            RuntimeError: If the API call fails after all retries
         """
         if self.is_mock_mode():
             logger.info("LLM client operating in mock mode")
             return _generate_mock_response(system_prompt, user_prompt)
 
-        return self._call_api_with_retry(
+        response_cache = get_llm_cache() if cache else None
+        key = cache_key(self.model, system_prompt, user_prompt, temperature, max_tokens)
+        if response_cache is not None:
+            hit = await _cache_call(response_cache, response_cache.get, key)
+            if hit is not None:
+                LLM_CACHE_HITS.inc()
+                return LLMResponse(**hit, is_mock=False, cached=True)
+
+        response = await self._call_api_with_retry(
             user_prompt=user_prompt,
             system_prompt=system_prompt,
             max_tokens=max_tokens,
             temperature=temperature,
         )
 
-    def _call_api_with_retry(
+        if response_cache is not None:
+            await _cache_call(response_cache, response_cache.set, key, _cache_value(response))
+        return response
+
+    async def generate_many(
+        self,
+        requests: list[dict[str, Any]],
+    ) -> list[LLMResponse | BaseException]:
+        """Run several generations concurrently.
+
+        Each request is a dict of ``generate`` keyword arguments. Results come
+        back in request order; a failed request yields its exception instead
+        of cancelling the rest.
+        """
+        return await asyncio.gather(
+            *(self.generate(**request) for request in requests),
+            return_exceptions=True,
+        )
+
+    async def _call_api_with_retry(
         self,
         user_prompt: str,
         system_prompt: str,
         max_tokens: int,
         temperature: float,
     ) -> LLMResponse:
-        """Call the API with exponential backoff retry.
+        """Call the API with jittered backoff retry.
 
-        Retries up to 3 times with delays of 30s, 1m, 2m.
+        Retries 429, 5xx and transport errors up to MAX_RETRIES attempts,
+        honouring Retry-After when the server sends one.
         """
         last_error: Exception | None = None
 
         for attempt in range(MAX_RETRIES):
+            retry_after: float | None = None
             try:
-                return self._call_api(
+                return await self._call_api(
                     user_prompt=user_prompt,
                     system_prompt=system_prompt,
                     max_tokens=max_tokens,
@@ -259,25 +445,26 @@ class LLMClient:
                 # Don't retry client errors (4xx) except rate limits (429)
                 if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
                     raise
-                logger.warning(
-                    f"LLM API error (attempt {attempt + 1}/{MAX_RETRIES}): "
-                    f"{e.response.status_code} - retrying in {RETRY_DELAYS[attempt]}s"
-                )
+                retry_after = _retry_after_seconds(e.response)
+                reason = str(e.response.status_code)
             except (httpx.RequestError, httpx.TimeoutException) as e:
                 last_error = e
-                logger.warning(
-                    f"LLM API request error (attempt {attempt + 1}/{MAX_RETRIES}): "
-                    f"{type(e).__name__} - retrying in {RETRY_DELAYS[attempt]}s"
-                )
+                reason = type(e).__name__
 
             if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAYS[attempt])
+                LLM_RETRIES.inc(reason=reason)
+                delay = _backoff_delay(attempt, retry_after)
+                logger.warning(
+                    f"LLM API error (attempt {attempt + 1}/{MAX_RETRIES}): "
+                    f"{reason} - retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
 
         # All retries exhausted
         error_msg = str(last_error) if last_error else "Unknown error"
         raise RuntimeError(f"LLM API failed after {MAX_RETRIES} attempts: {error_msg}")
 
-    def _call_api(
+    async def _call_api(
         self,
         user_prompt: str,
         system_prompt: str,
@@ -285,12 +472,6 @@ class LLMClient:
         temperature: float,
     ) -> LLMResponse:
         """Make a single API call to Claude."""
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01",
-            "content-type": "application/json",
-        }
-
         payload: dict[str, Any] = {
             "model": self.model,
             "max_tokens": max_tokens,
@@ -301,41 +482,189 @@ class LLMClient:
         if system_prompt:
             payload["system"] = system_prompt
 
-        response = httpx.post(
-            self.base_url,
-            headers=headers,
-            json=payload,
-            timeout=60.0,
-        )
+        async with self._get_semaphore():
+            started = time.perf_counter()
+            try:
+                response = await self._get_http().post(
+                    self.base_url,
+                    headers={"x-api-key": self.api_key or ""},
+                    json=payload,
+                )
+            except httpx.HTTPError as e:
+                LLM_REQUESTS.inc(status=type(e).__name__)
+                raise
+            finally:
+                LLM_REQUEST_SECONDS.observe(time.perf_counter() - started)
+        LLM_REQUESTS.inc(status=str(response.status_code))
         response.raise_for_status()
 
-        data = response.json()
-
-        # Extract text content from response
-        content_blocks = data.get("content", [])
-        text_parts = [
-            block.get("text", "")
-            for block in content_blocks
-            if block.get("type") == "text"
-        ]
-        content = "\n".join(text_parts).strip()
-
-        if not content:
-            raise RuntimeError("Claude API returned empty content")
-
-        # Extract usage stats
-        usage = data.get("usage", {})
-        input_tokens = usage.get("input_tokens", 0)
-        output_tokens = usage.get("output_tokens", 0)
-
-        return LLMResponse(
-            content=content,
-            model=data.get("model", self.model),
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            total_tokens=input_tokens + output_tokens,
-            is_mock=False,
+        result = _parse_api_response(response.json(), self.model)
+        LLM_TOKENS.inc(result.input_tokens, kind="input")
+        LLM_TOKENS.inc(result.output_tokens, kind="output")
+        return result
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Sync Façade
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _LoopThread:
+    """A private event loop running on a daemon thread.
+
+    Sync callers submit coroutines here so one AsyncLLMClient (and its
+    connection pool) lives for the life of the process. The loop is started
+    lazily and restarted after a fork, so Celery prefork children each get
+    their own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pid: int | None = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid() or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="llm-client-loop", daemon=True
+                )
+                thread.start()
+                self._loop = loop
+                self._pid = os.getpid()
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop thread and block for its result."""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+# Shared by every LLMClient in the process
+_background_loop = _LoopThread()
+
+
+class LLMClient:
+    """Blocking client for interacting with the Anthropic Claude API.
+
+    Thin wrapper over AsyncLLMClient: calls run on a shared background event
+    loop, so every caller reuses the same pooled connections.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str | None = None,
+        base_url: str | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+    ):
+        """Initialize the LLM client.
+
+        Args:
+            api_key: Anthropic API key (defaults to settings.llm_api_key)
+            model: Model to use (defaults to settings.llm_model)
+            base_url: API base URL (defaults to settings.anthropic_base_url)
+            max_concurrency: Max in-flight requests (defaults to settings.llm_max_concurrency)
+            timeout: Per-request timeout in seconds (defaults to settings.llm_timeout_seconds)
+        """
+        self._async_client = AsyncLLMClient(
+            api_key=api_key,
+            model=model,
+            base_url=base_url,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
         )
+        self._async_pid = os.getpid()
+
+    @property
+    def api_key(self) -> str | None:
+        return self._async_client.api_key
+
+    @property
+    def model(self) -> str:
+        return self._async_client.model
+
+    @property
+    def base_url(self) -> str:
+        return self._async_client.base_url
+
+    def is_mock_mode(self) -> bool:
+        """Check if client is operating in mock mode."""
+        return _is_mock_mode()
+
+    def _client(self) -> AsyncLLMClient:
+        # A forked child must not touch the parent's sockets or loop.
+        if self._async_pid != os.getpid():
+            old = self._async_client
+            self._async_client = AsyncLLMClient(
+                api_key=old.api_key,
+                model=old.model,
+                base_url=old.base_url,
+                max_concurrency=old.max_concurrency,
+                timeout=old.timeout,
+            )
+            self._async_pid = os.getpid()
+        return self._async_client
+
+    def generate(
+        self,
+        user_prompt: str,
+        system_prompt: str = "",
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        cache: bool = True,
+    ) -> LLMResponse:
+        """Generate a response from the LLM.
+
+        Args:
+            user_prompt: The user message to send
+            system_prompt: Optional system prompt for context
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            cache: Serve/store this call via the response cache
+
+        Returns:
+            LLMResponse with content and metadata
+
+        Raises:
+            httpx.HTTPStatusError: On a non-retryable 4xx response
+            RuntimeError: If the API call fails after all retries
+        """
+        if self.is_mock_mode():
+            logger.info("LLM client operating in mock mode")
+            return _generate_mock_response(system_prompt, user_prompt)
+
+        return _background_loop.run(
+            self._client().generate(
+                user_prompt=user_prompt,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                cache=cache,
+            )
+        )
+
+    def generate_many(
+        self,
+        requests: list[dict[str, Any]],
+    ) -> list[LLMResponse | BaseException]:
+        """Run several generations concurrently and wait for all of them.
+
+        See AsyncLLMClient.generate_many.
+        """
+        if not requests:
+            return []
+        if self.is_mock_mode():
+            return [
+                _generate_mock_response(r.get("system_prompt", ""), r["user_prompt"])
+                for r in requests
+            ]
+        return _background_loop.run(self._client().generate_many(requests))
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        _background_loop.run(self._client().aclose())
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -359,6 +688,7 @@ def generate_text(
     system_prompt: str = "",
     max_tokens: int = DEFAULT_MAX_TOKENS,
     temperature: float = DEFAULT_TEMPERATURE,
+    cache: bool = True,
 ) -> LLMResponse:
     """Generate text using the default LLM client.
 
@@ -367,6 +697,7 @@ def generate_text(
         system_prompt: Optional system prompt for context
         max_tokens: Maximum tokens to generate
         temperature: Sampling temperature
+        cache: Serve/store this call via the response cache
 
     Returns:
         LLMResponse with content and metadata
@@ -377,6 +708,7 @@ def generate_text(
         system_prompt=system_prompt,
         max_tokens=max_tokens,
         temperature=temperature,
+        cache=cache,
     )
 
 
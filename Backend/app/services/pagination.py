@@ -0,0 +1,115 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+Pages are ordered by a non-null timestamp column with the primary key as
+tie-breaker, and each page starts strictly after the last row of the
+previous one. The WHERE clause is a row-value comparison on the same
+columns as the list indexes, so every page is an index range scan of
+``limit + 1`` rows no matter how deep the client has paged.
+
+Cursors are opaque to clients: URL-safe base64 of "<timestamp>|<id>".
+List endpoints keep returning a plain JSON array and put the next
+page's cursor in the X-Next-Cursor response header (absent on the last
+page).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import bindparam, tuple_
+from sqlalchemy.orm import Query as OrmQuery
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor cannot be decoded."""
+
+
+def encode_cursor(sort_value: datetime, row_id: uuid.UUID) -> str:
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        sort_text, id_text = raw.split("|", 1)
+        return datetime.fromisoformat(sort_text), uuid.UUID(id_text)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from exc
+
+
+def keyset_page(
+    query: OrmQuery,
+    sort_column,
+    id_column,
+    *,
+    limit: int,
+    cursor: str | None = None,
+    descending: bool = True,
+) -> tuple[list, str | None]:
+    """Return one page of ``query`` and the cursor for the next page.
+
+    ``sort_column`` must be non-null. Raises InvalidCursorError for a
+    malformed cursor.
+    """
+    key = tuple_(sort_column, id_column)
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        after = tuple_(
+            bindparam(None, sort_value, type_=sort_column.type),
+            bindparam(None, row_id, type_=id_column.type),
+        )
+        query = query.filter(key < after if descending else key > after)
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+
+class PageParams:
+    """FastAPI dependency for the shared ``cursor`` / ``limit`` query parameters."""
+
+    def __init__(
+        self,
+        cursor: str | None = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+    def page(self, response: Response, query: OrmQuery, sort_column, id_column, *, descending: bool = True) -> list:
+        """Fetch the page, set X-Next-Cursor, and map bad cursors to 400."""
+        try:
+            rows, next_cursor = keyset_page(
+                query, sort_column, id_column,
+                limit=self.limit, cursor=self.cursor, descending=descending,
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return rows
+
+
+def created_range(query: OrmQuery, column, created_after: datetime | None, created_before: datetime | None) -> OrmQuery:
+    """Apply the optional ``created_after`` / ``created_before`` filters."""
+    if created_after is not None:
+        query = query.filter(column >= created_after)
+    if created_before is not None:
+        query = query.filter(column < created_before)
+    return query
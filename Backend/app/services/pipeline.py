@@ -2,19 +2,63 @@
 
 Handles pipeline item creation, status transitions with validation,
 and filtered queries by status.
+
+Agents move items with advance_item(), which applies the transition, the
+claim release and any revision/error/field updates as one UPDATE ...
+RETURNING and one commit. Every committed transition is handed to
+stage_handoff, which enqueues the next agent's task for that item.
+
+Claims follow the item schedule: priority (lower first), then deadline,
+then age, skipping items whose next_run_at has not arrived.
+get_queue_stats() reports the resulting queue depth and wait time.
+
+Every status change also appends a pipeline_transitions row in the same
+transaction (record_transitions); get_pipeline_analytics() reads that
+log for time-in-stage, revision loops and throughput. Transitions and
+the queue counts computed here also feed the in-process /metrics gauges;
+transitions are counted only once their transaction commits.
 """
 
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import case, event, func, insert, select, update
 from sqlalchemy.orm import Session
 
-from ..models import ContentPipelineItem, PipelineStatus, SocialStatus
+from ..metrics import PIPELINE_TRANSITIONS, record_queue_depth, record_queue_ready
+from ..models import ContentPipelineItem, PipelineStatus, PipelineTransition, SocialStatus
+from .claim_lock import claim_order, commit_keep_loaded, due_clause, stale_clause
+from .stage_handoff import STAGE_CLAIMS, on_transition
 
 logger = logging.getLogger(__name__)
 
+# Unclaimed, non-terminal items untouched for this long count as stuck.
+STUCK_AFTER_HOURS = 4
+
+# Overview results are reused for this long while the newest updated_at
+# is unchanged, so dashboards and Morgan polling share one aggregate.
+OVERVIEW_CACHE_TTL_SECONDS = 10
+
+# Claim priorities — lower runs first. Time-sensitive news commentary
+# jumps ahead of evergreen topics at every agent stage.
+PRIORITY_URGENT = 10
+PRIORITY_NEWS = 50
+PRIORITY_NORMAL = 100
+PRIORITY_EVERGREEN = 150
+
+# Fields an operator may change with schedule_item().
+SCHEDULE_FIELDS = frozenset({"priority", "deadline_at", "next_run_at"})
+
+# Statuses that count towards the errored / stuck health signals.
+_ERROR_TRACKED_STATUSES = frozenset(
+    s for s in PipelineStatus if s not in (PipelineStatus.done, PipelineStatus.backlog)
+)
+
 # Allowed status transitions.  Key is current status, value is set of
 # valid target statuses.  Any transition not in this map is rejected.
 ALLOWED_TRANSITIONS: dict[PipelineStatus, set[PipelineStatus]] = {
@@ -50,6 +94,61 @@ def is_valid_transition(from_status: PipelineStatus, to_status: PipelineStatus)
     return to_status in allowed
 
 
+# Session.info key for transition counts waiting on their commit
+_PENDING_TRANSITIONS_KEY = "pipeline_pending_transitions"
+
+
+def record_transitions(db: Session, rows: list[dict]) -> None:
+    """Append rows to the pipeline_transitions log without committing.
+
+    Each row needs item_id, from_status, to_status, revision_count,
+    actor and created_at. Callers write the log in the same transaction
+    as the status change, so a move and its log row commit together;
+    bulk moves pass all their rows here for one batched INSERT. The
+    PIPELINE_TRANSITIONS counter moves when that transaction commits and
+    not at all if it rolls back.
+    """
+    if rows:
+        db.execute(insert(PipelineTransition), rows)
+        pending = db.info.setdefault(_PENDING_TRANSITIONS_KEY, [])
+        for row in rows:
+            from_status = row["from_status"]
+            pending.append((
+                from_status.value if from_status is not None else "NONE",
+                row["to_status"].value,
+            ))
+
+
+@event.listens_for(Session, "after_commit")
+def _count_committed_transitions(session: Session) -> None:
+    for from_status, to_status in session.info.pop(_PENDING_TRANSITIONS_KEY, ()):
+        PIPELINE_TRANSITIONS.inc(from_status=from_status, to_status=to_status)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_transitions(session: Session) -> None:
+    session.info.pop(_PENDING_TRANSITIONS_KEY, None)
+
+
+def transition_row(
+    item_id,
+    from_status: PipelineStatus | None,
+    to_status: PipelineStatus,
+    revision_count: int,
+    actor: str | None,
+    at: datetime,
+) -> dict:
+    """Build one record_transitions row."""
+    return {
+        "item_id": item_id,
+        "from_status": from_status,
+        "to_status": to_status,
+        "revision_count": revision_count,
+        "actor": actor,
+        "created_at": at,
+    }
+
+
 def transition(
     db: Session,
     item_id,
@@ -72,21 +171,21 @@ def transition(
         )
 
     now = datetime.now(timezone.utc)
+    changes = {
+        ContentPipelineItem.status: to_status,
+        ContentPipelineItem.updated_at: now,
+    }
+    if to_status == PipelineStatus.done:
+        changes[ContentPipelineItem.completed_at] = now
     rows = (
         db.query(ContentPipelineItem)
         .filter(ContentPipelineItem.id == item_id)
         .filter(ContentPipelineItem.status == from_status)
-        .update(
-            {
-                ContentPipelineItem.status: to_status,
-                ContentPipelineItem.updated_at: now,
-            },
-            synchronize_session="fetch",
-        )
+        .update(changes, synchronize_session="fetch")
     )
-    db.commit()
 
     if rows == 0:
+        db.rollback()
         # Could be missing or concurrently changed
         item = db.query(ContentPipelineItem).filter(ContentPipelineItem.id == item_id).first()
         if item is None:
@@ -97,10 +196,114 @@ def transition(
         )
 
     item = db.query(ContentPipelineItem).filter(ContentPipelineItem.id == item_id).first()
+    record_transitions(db, [transition_row(item_id, from_status, to_status, item.revision_count, None, now)])
+    commit_keep_loaded(db)
     logger.info(
         "Pipeline transition: item=%s %s → %s",
         item_id, from_status.name, to_status.name,
     )
+    on_transition(item_id, to_status, item.revision_count)
+    return item
+
+
+def advance_item(
+    db: Session,
+    item_id,
+    from_status: PipelineStatus,
+    to_status: PipelineStatus,
+    *,
+    worker_id: str | None = None,
+    claim_token: int | None = None,
+    unclaimed_only: bool = False,
+    release_claim: bool = True,
+    bump_revision: bool = False,
+    error: str | None = None,
+    values: dict | None = None,
+    handoff: bool = True,
+) -> ContentPipelineItem:
+    """Move an item to ``to_status`` in one statement and one commit.
+
+    Validates the transition, then issues a single UPDATE ... RETURNING
+    guarded on the current status (and on ``worker_id`` holding the claim
+    under fencing token ``claim_token``, or on the item being unclaimed
+    when ``unclaimed_only``). In the same
+    write it can clear the claim fields, increment revision_count, set
+    last_error and apply extra column ``values`` (e.g. draft_id,
+    quality_score). The returned item is fully loaded; no re-SELECT.
+    Pass ``handoff=False`` for failure transitions that should wait for
+    their next_run_at instead of being picked up again at once.
+
+    Raises:
+        TransitionError: if the transition is invalid, or the item is no
+            longer at ``from_status`` / held by ``worker_id``.
+        ValueError: if the item does not exist.
+    """
+    if not is_valid_transition(from_status, to_status):
+        raise TransitionError(
+            f"Invalid transition: {from_status.name} → {to_status.name}"
+        )
+
+    now = datetime.now(timezone.utc)
+    changes = dict(values or {})
+    changes["status"] = to_status
+    changes["updated_at"] = now
+    if to_status == PipelineStatus.done:
+        changes["completed_at"] = now
+    if release_claim:
+        changes.update(claimed_by=None, claimed_at=None, claim_stage=None, claim_expires_at=None)
+    if bump_revision:
+        changes["revision_count"] = ContentPipelineItem.revision_count + 1
+    if error is not None:
+        changes["last_error"] = error
+
+    stmt = (
+        update(ContentPipelineItem)
+        .where(ContentPipelineItem.id == item_id)
+        .where(ContentPipelineItem.status == from_status)
+    )
+    if worker_id is not None:
+        stmt = stmt.where(ContentPipelineItem.claimed_by == worker_id)
+    if claim_token is not None:
+        stmt = stmt.where(ContentPipelineItem.claim_token == claim_token)
+    if unclaimed_only:
+        stmt = stmt.where(ContentPipelineItem.claimed_by.is_(None))
+    stmt = (
+        stmt.values(**changes)
+        .returning(ContentPipelineItem)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    item = db.scalars(stmt).first()
+
+    if item is None:
+        db.rollback()
+        current = db.query(ContentPipelineItem).filter(ContentPipelineItem.id == item_id).first()
+        if current is None:
+            raise ValueError(f"Pipeline item not found: {item_id}")
+        if current.status != from_status:
+            raise TransitionError(
+                f"Concurrent modification: expected status={from_status.name}, "
+                f"actual={current.status.name}"
+            )
+        expected = "no claim" if unclaimed_only else f"claimed_by={worker_id} token={claim_token}"
+        raise TransitionError(
+            f"Claim lost: item={item_id} expected {expected}, "
+            f"actual claimed_by={current.claimed_by} token={current.claim_token}"
+        )
+
+    record_transitions(db, [transition_row(item_id, from_status, to_status, item.revision_count, worker_id, now)])
+    commit_keep_loaded(db)
+    logger.info(
+        "Pipeline transition: item=%s %s → %s (revision=%d)",
+        item_id, from_status.name, to_status.name, item.revision_count,
+    )
+    if to_status == PipelineStatus.done and item.created_at is not None:
+        logger.info(
+            "Pipeline item completed: item=%s cycle_time=%.0fs",
+            item_id, _seconds_between(item.created_at, now),
+        )
+    if release_claim and handoff:
+        # A claim kept for the next step means this agent carries on itself
+        on_transition(item_id, to_status, item.revision_count)
     return item
 
 
@@ -111,26 +314,68 @@ def create_pipeline_item(
     topic_keyword: str | None = None,
     draft_id=None,
     status: PipelineStatus = PipelineStatus.backlog,
+    priority: int = PRIORITY_NORMAL,
+    deadline_at: datetime | None = None,
+    next_run_at: datetime | None = None,
 ) -> ContentPipelineItem:
-    """Create a new pipeline item at the specified status (default: BACKLOG)."""
+    """Create a new pipeline item at the specified status (default: BACKLOG).
+
+    The item's first transition-log row (from_status NULL) is written in
+    the same commit.
+    """
     item = ContentPipelineItem(
         pillar_theme=pillar_theme,
         sub_theme=sub_theme,
         topic_keyword=topic_keyword,
         draft_id=draft_id,
         status=status,
+        priority=priority,
+        deadline_at=deadline_at,
+        next_run_at=next_run_at,
     )
     db.add(item)
+    db.flush()
+    record_transitions(db, [transition_row(item.id, None, status, 0, None, item.created_at)])
     db.commit()
     db.refresh(item)
 
     logger.info(
-        "Pipeline item created: id=%s status=%s pillar=%s",
-        item.id, item.status.name, pillar_theme,
+        "Pipeline item created: id=%s status=%s pillar=%s priority=%d",
+        item.id, item.status.name, pillar_theme, priority,
     )
     return item
 
 
+def schedule_item(db: Session, item_id, changes: dict) -> ContentPipelineItem:
+    """Change an item's priority, deadline_at and/or next_run_at.
+
+    Only keys in SCHEDULE_FIELDS are accepted; a None deadline_at or
+    next_run_at clears it. Takes effect on the next claim.
+    """
+    unknown = set(changes) - SCHEDULE_FIELDS
+    if unknown:
+        raise ValueError(f"Not schedule fields: {sorted(unknown)}")
+
+    item = (
+        db.execute(
+            update(ContentPipelineItem)
+            .where(ContentPipelineItem.id == item_id)
+            .values(**changes, updated_at=datetime.now(timezone.utc))
+            .returning(ContentPipelineItem)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        .scalars()
+        .first()
+    )
+    if item is None:
+        db.rollback()
+        raise ValueError(f"Pipeline item {item_id} not found")
+    commit_keep_loaded(db)
+
+    logger.info("Pipeline item rescheduled: id=%s %s", item_id, changes)
+    return item
+
+
 def get_items_by_status(
     db: Session,
     status: PipelineStatus,
@@ -148,40 +393,95 @@ def get_unclaimed_items_by_status(
     db: Session,
     status: PipelineStatus,
 ) -> list[ContentPipelineItem]:
-    """Return unclaimed pipeline items with the given status."""
+    """Return unclaimed, due pipeline items with the given status, in claim order."""
     return (
         db.query(ContentPipelineItem)
         .filter(ContentPipelineItem.status == status)
         .filter(ContentPipelineItem.claimed_by.is_(None))
-        .order_by(ContentPipelineItem.created_at.asc())
+        .filter(due_clause(datetime.now(timezone.utc)))
+        .order_by(*claim_order())
         .all()
     )
 
 
-def get_pipeline_overview(db: Session) -> dict:
-    """Return a summary of item counts per pipeline status."""
-    counts = {}
-    for ps in PipelineStatus:
-        count = (
-            db.query(ContentPipelineItem)
-            .filter(ContentPipelineItem.status == ps)
-            .count()
-        )
-        counts[ps.name] = count
+_overview_cache: dict[str, tuple[float, object, dict]] = {}
+_overview_cache_lock = threading.Lock()
 
-    claimed_count = (
-        db.query(ContentPipelineItem)
-        .filter(ContentPipelineItem.claimed_by.is_not(None))
-        .count()
+
+def clear_pipeline_overview_cache() -> None:
+    """Drop cached overview results (used by tests and admin tooling)."""
+    with _overview_cache_lock:
+        _overview_cache.clear()
+
+
+def _aggregate_pipeline_counts(db: Session) -> dict:
+    """Compute every overview and health count in one GROUP BY status query."""
+    now = datetime.now(timezone.utc)
+    stuck_cutoff = now - timedelta(hours=STUCK_AFTER_HOURS)
+
+    item = ContentPipelineItem
+    claimed = item.claimed_by.is_not(None)
+    unclaimed = item.claimed_by.is_(None)
+
+    rows = (
+        db.query(
+            item.status,
+            func.count(item.id),
+            func.sum(case((claimed, 1), else_=0)),
+            func.sum(case((stale_clause(now), 1), else_=0)),
+            func.sum(case((unclaimed & item.last_error.is_not(None), 1), else_=0)),
+            func.sum(case((unclaimed & (item.updated_at <= stuck_cutoff), 1), else_=0)),
+        )
+        .group_by(item.status)
+        .all()
     )
 
+    counts = {ps.name: 0 for ps in PipelineStatus}
+    claimed_count = stale_count = errored_count = stuck_count = 0
+    for status, total, n_claimed, n_stale, n_errored, n_stuck in rows:
+        counts[status.name] = total
+        claimed_count += n_claimed or 0
+        stale_count += n_stale or 0
+        if status in _ERROR_TRACKED_STATUSES:
+            errored_count += n_errored or 0
+            stuck_count += n_stuck or 0
+
+    record_queue_depth({PipelineStatus[name].value: total for name, total in counts.items()})
     return {
         "status_counts": counts,
         "total": sum(counts.values()),
         "claimed": claimed_count,
+        "stale_claims": stale_count,
+        "errored": errored_count,
+        "stuck": stuck_count,
     }
 
 
+def get_pipeline_overview(db: Session) -> dict:
+    """Return a summary of item counts per pipeline status.
+
+    Besides per-status counts the summary carries the claimed, stale-claim,
+    errored and stuck counts Morgan's health report needs, all from a
+    single aggregate query.  Results are cached in-process for
+    OVERVIEW_CACHE_TTL_SECONDS, keyed on the newest updated_at, so repeated
+    dashboard and health calls cost one indexed MAX() lookup.
+    """
+    cache_key = str(db.get_bind().url)
+    latest_update = db.query(func.max(ContentPipelineItem.updated_at)).scalar()
+
+    with _overview_cache_lock:
+        cached = _overview_cache.get(cache_key)
+    if cached is not None:
+        cached_at, cached_marker, cached_result = cached
+        if cached_marker == latest_update and time.monotonic() - cached_at < OVERVIEW_CACHE_TTL_SECONDS:
+            return {**cached_result, "status_counts": dict(cached_result["status_counts"])}
+
+    result = _aggregate_pipeline_counts(db)
+    with _overview_cache_lock:
+        _overview_cache[cache_key] = (time.monotonic(), latest_update, result)
+    return {**result, "status_counts": dict(result["status_counts"])}
+
+
 def increment_revision(
     db: Session,
     item_id,
@@ -211,3 +511,232 @@ def increment_revision(
 def has_exceeded_max_revisions(item: ContentPipelineItem) -> bool:
     """Check if the item has exceeded its maximum allowed revisions."""
     return item.revision_count >= item.max_revisions
+
+
+def _seconds_between(start: datetime, end: datetime) -> float:
+    # SQLite returns naive datetimes; treat them as UTC
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return (end - start).total_seconds()
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float | None:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def get_cycle_time_stats(db: Session, days: int = 7) -> dict:
+    """End-to-end BACKLOG → DONE latency for items completed in the last ``days``.
+
+    Cycle time runs from created_at (items are seeded at BACKLOG) to
+    completed_at, which advance_item/transition stamp on DONE. Reads only
+    the completed window via ix_pipeline_items_completed_at.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    rows = (
+        db.query(ContentPipelineItem.created_at, ContentPipelineItem.completed_at)
+        .filter(ContentPipelineItem.completed_at.is_not(None))
+        .filter(ContentPipelineItem.completed_at >= cutoff)
+        .all()
+    )
+    durations = sorted(_seconds_between(created, completed) for created, completed in rows)
+    return {
+        "window_days": days,
+        "completed": len(durations),
+        "p50_seconds": _percentile(durations, 0.50),
+        "p95_seconds": _percentile(durations, 0.95),
+        "max_seconds": durations[-1] if durations else None,
+        "mean_seconds": sum(durations) / len(durations) if durations else None,
+    }
+
+
+def get_queue_stats(db: Session) -> dict:
+    """Queue depth and wait time for each agent-owned status.
+
+    Per status: ``ready`` (unclaimed and due), ``deferred`` (next_run_at
+    still ahead), ``claimed``, wait-time percentiles of the ready items
+    (time since they entered the status, i.e. their last update),
+    ``overdue`` ready items past their deadline, the earliest deadline and
+    the ready count per priority. Reads only the active statuses.
+    """
+    now = datetime.now(timezone.utc)
+    rows = (
+        db.query(
+            ContentPipelineItem.status,
+            ContentPipelineItem.claimed_by,
+            ContentPipelineItem.priority,
+            ContentPipelineItem.updated_at,
+            ContentPipelineItem.next_run_at,
+            ContentPipelineItem.deadline_at,
+        )
+        .filter(ContentPipelineItem.status.in_(list(STAGE_CLAIMS)))
+        .all()
+    )
+
+    queues = {
+        status.value: {
+            "ready": 0, "deferred": 0, "claimed": 0, "overdue": 0,
+            "waits": [], "deadlines": [], "by_priority": {},
+        }
+        for status in STAGE_CLAIMS
+    }
+    for status, claimed_by, priority, updated_at, next_run_at, deadline_at in rows:
+        queue = queues[status.value]
+        if claimed_by is not None:
+            queue["claimed"] += 1
+            continue
+        if next_run_at is not None and _seconds_between(now, next_run_at) > 0:
+            queue["deferred"] += 1
+            continue
+        queue["ready"] += 1
+        queue["waits"].append(_seconds_between(updated_at, now))
+        queue["by_priority"][priority] = queue["by_priority"].get(priority, 0) + 1
+        if deadline_at is not None:
+            queue["deadlines"].append(deadline_at)
+            if _seconds_between(deadline_at, now) > 0:
+                queue["overdue"] += 1
+
+    for queue in queues.values():
+        waits = sorted(queue.pop("waits"))
+        deadlines = queue.pop("deadlines")
+        queue["oldest_wait_seconds"] = waits[-1] if waits else None
+        queue["p50_wait_seconds"] = _percentile(waits, 0.50)
+        queue["p95_wait_seconds"] = _percentile(waits, 0.95)
+        queue["next_deadline"] = min(deadlines).isoformat() if deadlines else None
+        queue["by_priority"] = dict(sorted(queue["by_priority"].items()))
+
+    record_queue_ready({status: queue["ready"] for status, queue in queues.items()})
+    return {"generated_at": now.isoformat(), "queues": queues}
+
+
+def _elapsed_seconds(db: Session, start, end):
+    """SQL expression for the seconds between two timestamp columns."""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.extract("epoch", end - start)
+    # SQLite stores timestamps as text; julianday() parses them to days
+    return (func.julianday(end) - func.julianday(start)) * 86400.0
+
+
+def _utc_day(db: Session, column):
+    """SQL expression for the UTC calendar day of a timestamp column."""
+    if db.get_bind().dialect.name == "postgresql":
+        # date() of a timestamptz would use the session time zone
+        return func.date(func.timezone("UTC", column))
+    # SQLite keeps the UTC wall-clock time the app wrote
+    return func.date(column)
+
+
+def get_pipeline_analytics(db: Session, days: int = 7) -> dict:
+    """Time-in-stage, revision loops and daily throughput from the transition log.
+
+    All aggregation happens in SQL over pipeline_transitions rows from the
+    last ``days``:
+
+    - ``time_in_stage``: per status, the time from entering it to the next
+      transition (LEAD over each item's moves), with nearest-rank p50/p95
+      from ROW_NUMBER/COUNT windows. Stays still in progress are skipped.
+    - ``revision_loops``: REVIEW → TODO send-backs, items that looped and
+      the most loops any one item took.
+    - ``throughput``: items created, published and completed per UTC day.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    t = PipelineTransition
+
+    stays = (
+        select(
+            t.to_status.label("stage"),
+            t.created_at.label("entered_at"),
+            func.lead(t.created_at)
+            .over(partition_by=t.item_id, order_by=(t.created_at, t.id))
+            .label("left_at"),
+        )
+        .where(t.created_at >= cutoff)
+        .subquery()
+    )
+    durations = (
+        select(
+            stays.c.stage,
+            _elapsed_seconds(db, stays.c.entered_at, stays.c.left_at).label("seconds"),
+        )
+        .where(stays.c.left_at.is_not(None))
+        .subquery()
+    )
+    ranked = select(
+        durations.c.stage,
+        durations.c.seconds,
+        func.row_number()
+        .over(partition_by=durations.c.stage, order_by=durations.c.seconds)
+        .label("rn"),
+        func.count().over(partition_by=durations.c.stage).label("n"),
+    ).subquery()
+
+    def _nearest_rank(fraction: float):
+        return func.min(case((ranked.c.rn >= fraction * ranked.c.n, ranked.c.seconds)))
+
+    time_in_stage = {
+        row.stage.value: {
+            "count": row.count,
+            "p50_seconds": row.p50,
+            "p95_seconds": row.p95,
+            "mean_seconds": row.mean,
+            "max_seconds": row.max,
+        }
+        for row in db.execute(
+            select(
+                ranked.c.stage,
+                func.count().label("count"),
+                _nearest_rank(0.50).label("p50"),
+                _nearest_rank(0.95).label("p95"),
+                func.avg(ranked.c.seconds).label("mean"),
+                func.max(ranked.c.seconds).label("max"),
+            ).group_by(ranked.c.stage)
+        )
+    }
+
+    per_item = (
+        select(t.item_id, func.count().label("loops"))
+        .where(t.created_at >= cutoff)
+        .where(t.from_status == PipelineStatus.review)
+        .where(t.to_status == PipelineStatus.todo)
+        .group_by(t.item_id)
+        .subquery()
+    )
+    loops = db.execute(
+        select(
+            func.coalesce(func.sum(per_item.c.loops), 0),
+            func.count(),
+            func.max(per_item.c.loops),
+        )
+    ).one()
+
+    day = _utc_day(db, t.created_at).label("day")
+    throughput = [
+        {"day": str(row.day), "created": row.created, "published": row.published, "done": row.done}
+        for row in db.execute(
+            select(
+                day,
+                func.sum(case((t.from_status.is_(None), 1), else_=0)).label("created"),
+                func.sum(case((t.to_status == PipelineStatus.published, 1), else_=0)).label("published"),
+                func.sum(case((t.to_status == PipelineStatus.done, 1), else_=0)).label("done"),
+            )
+            .where(t.created_at >= cutoff)
+            .group_by(day)
+            .order_by(day)
+        )
+    ]
+
+    return {
+        "window_days": days,
+        "time_in_stage": time_in_stage,
+        "revision_loops": {
+            "loops": int(loops[0]),
+            "items_with_loops": loops[1],
+            "max_loops_per_item": loops[2] or 0,
+        },
+        "throughput": throughput,
+    }
@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta, timezone
 
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
-from ..models import Comment, PublishedPost
+from ..models import Comment, Draft, DraftStatus, PublishedPost, SourceMaterial
 from .telegram_service import send_telegram_message
 
 
@@ -22,6 +23,21 @@ class DailyReport:
     escalations: int
 
 
+@dataclass
+class DashboardSummary:
+    posts_total: int
+    posts_published: int
+    posts_unpublished: int
+    posts_due_now: int
+    total_impressions: int
+    comments_total: int
+    comments_escalated: int
+    comments_replied: int
+    drafts_total: int
+    drafts_pending: int
+    sources_total: int
+
+
 
 def _day_bounds(day: date) -> tuple[datetime, datetime]:
     start = datetime.combine(day, time.min).replace(tzinfo=timezone.utc)
@@ -71,6 +87,44 @@ def build_daily_report(db: Session, for_date: date | None = None) -> DailyReport
 
 
 
+def _count_where(condition):
+    return func.count(case((condition, 1)))
+
+
+
+def build_dashboard_summary(db: Session) -> DashboardSummary:
+    """Counts the dashboard views show, aggregated in SQL rather than by listing rows."""
+    now = datetime.now(timezone.utc)
+    posts = db.query(
+        func.count(PublishedPost.id),
+        _count_where(PublishedPost.published_at.is_not(None)),
+        _count_where(PublishedPost.published_at.is_(None) & (PublishedPost.scheduled_time <= now)),
+        func.coalesce(func.sum(PublishedPost.impressions), 0),
+    ).one()
+    comments = db.query(
+        func.count(Comment.id),
+        _count_where(Comment.escalated.is_(True)),
+        _count_where(Comment.auto_reply_sent.is_(True)),
+    ).one()
+    drafts = db.query(func.count(Draft.id), _count_where(Draft.status == DraftStatus.pending)).one()
+    sources_total = db.query(func.count(SourceMaterial.id)).scalar()
+
+    return DashboardSummary(
+        posts_total=posts[0],
+        posts_published=posts[1],
+        posts_unpublished=posts[0] - posts[1],
+        posts_due_now=posts[2],
+        total_impressions=int(posts[3]),
+        comments_total=comments[0],
+        comments_escalated=comments[1],
+        comments_replied=comments[2],
+        drafts_total=drafts[0],
+        drafts_pending=drafts[1],
+        sources_total=sources_total,
+    )
+
+
+
 def send_daily_report_telegram(db: Session, report: DailyReport) -> bool:
     text = (
         f"Daily LinkedIn Summary - {report.report_date.isoformat()}\\n\\n"
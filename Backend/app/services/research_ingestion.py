@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
 import feedparser
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
-from ..models import SourceMaterial
-from .llm import summarize_source
+from ..config import settings
+from ..models import FeedState, SourceMaterial
+from .feed_fetcher import FeedValidators, fetch_feeds
+from .llm import fallback_summary, llm_summaries_enabled, summarize_sources
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_FEEDS = [
     "https://digiday.com/feed/",
@@ -23,6 +30,11 @@ PILLAR_KEYWORDS = {
 }
 
 
+def configured_feed_urls() -> list[str]:
+    configured = [item.strip() for item in settings.research_feed_urls.split(",") if item.strip()]
+    return configured or list(DEFAULT_FEEDS)
+
+
 def _parse_published(value: str | None) -> datetime | None:
     if not value:
         return None
@@ -48,52 +60,147 @@ def _score_item(text: str) -> tuple[float, str | None]:
 
 
 def ingest_feed_entries(db: Session, source_name: str, entries: list[dict], max_items: int = 10) -> int:
-    created = 0
+    """Insert unseen entries straight away; LLM summaries follow later.
+
+    URL existence is checked with one IN query per feed. When LLM summaries
+    are enabled, rows carry the feed excerpt as a placeholder summary and
+    ``summary_pending`` until summarize_pending_sources replaces it.
+    """
+    candidates: dict[str, dict] = {}
     for entry in entries[:max_items]:
         url = entry.get("link")
-        title = (entry.get("title") or "Untitled").strip()
-        if not url:
+        if url:
+            candidates.setdefault(url[:1024], entry)
+    if not candidates:
+        return 0
+
+    existing = set(db.scalars(select(SourceMaterial.url).where(SourceMaterial.url.in_(list(candidates)))))
+    pending = llm_summaries_enabled()
+    rows = []
+    for url, entry in candidates.items():
+        if url in existing:
             continue
-
-        exists = db.query(SourceMaterial).filter(SourceMaterial.url == url).first()
-        if exists:
-            continue
-
+        title = (entry.get("title") or "Untitled").strip()
         content = entry.get("summary") or entry.get("description") or title
         score, pillar = _score_item(f"{title} {content}")
-        summary = summarize_source(source_name=source_name, title=title, content=content)
-
-        source = SourceMaterial(
-            source_name=source_name,
-            title=title[:512],
-            url=url[:1024],
-            published_at=_parse_published(entry.get("published")),
-            summary_text=summary,
-            relevance_score=score,
-            pillar_theme=pillar,
-        )
-        db.add(source)
-        created += 1
-
+        rows.append({
+            "source_name": source_name[:120],
+            "title": title[:512],
+            "url": url,
+            "published_at": _parse_published(entry.get("published")),
+            "summary_text": fallback_summary(title, content),
+            "content_text": content,
+            "summary_pending": pending,
+            "relevance_score": score,
+            "pillar_theme": pillar,
+        })
+
+    if rows:
+        db.execute(insert(SourceMaterial), rows)
     db.commit()
-    return created
+    return len(rows)
+
+
+def summarize_pending_sources(db: Session, limit: int | None = None) -> int:
+    """Replace placeholder summaries with LLM summaries.
+
+    Pending rows are read and the transaction is closed before any LLM
+    call. Requests run on a bounded thread pool (RESEARCH_SUMMARY_CONCURRENCY),
+    each covering up to RESEARCH_SUMMARY_BATCH_SIZE articles, and the results
+    are written back in one bulk UPDATE.
+    """
+    limit = limit or settings.research_summary_max_per_run
+    pending = db.execute(
+        select(SourceMaterial.id, SourceMaterial.source_name, SourceMaterial.title, SourceMaterial.content_text)
+        .where(SourceMaterial.summary_pending.is_(True))
+        .order_by(SourceMaterial.created_at)
+        .limit(limit)
+    ).all()
+    db.commit()
+    if not pending:
+        return 0
+
+    if llm_summaries_enabled():
+        batch_size = max(1, settings.research_summary_batch_size)
+        chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        workers = max(1, min(settings.research_summary_concurrency, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="source-summary") as pool:
+            summaries = pool.map(
+                lambda chunk: summarize_sources(
+                    [(row.source_name, row.title, row.content_text or row.title) for row in chunk]
+                ),
+                chunks,
+            )
+            rows = [
+                {"id": row.id, "summary_text": summary, "summary_pending": False}
+                for chunk, chunk_summaries in zip(chunks, summaries)
+                for row, summary in zip(chunk, chunk_summaries)
+            ]
+    else:
+        # LLM switched off since ingestion: the excerpt placeholder is final
+        rows = [{"id": row.id, "summary_pending": False} for row in pending]
+
+    db.execute(update(SourceMaterial), rows)
+    db.commit()
+    logger.info("Summarised %d pending sources", len(rows))
+    return len(rows)
+
+
+def _feed_entries(parsed) -> list[dict]:
+    return [
+        {
+            "title": e.get("title"),
+            "link": e.get("link"),
+            "summary": e.get("summary") or e.get("description"),
+            "published": e.get("published"),
+        }
+        for e in parsed.entries
+    ]
 
 
 def ingest_feeds(db: Session, feed_urls: list[str], max_items_per_feed: int = 10) -> int:
+    """Fetch feeds concurrently with conditional GETs and ingest changed ones.
+
+    Feeds answering 304 Not Modified are skipped without parsing. Each
+    feed's validators, status, latency and size are kept in feed_states.
+    """
+    feed_urls = list(dict.fromkeys(feed_urls))
+    if not feed_urls:
+        return 0
+
+    states = {
+        state.url: state
+        for state in db.query(FeedState).filter(FeedState.url.in_(feed_urls)).all()
+    }
+    results = fetch_feeds({
+        url: FeedValidators(states[url].etag, states[url].last_modified) if url in states else None
+        for url in feed_urls
+    })
+
+    fetched_at = datetime.now(timezone.utc)
     total_created = 0
-    for url in feed_urls:
-        parsed = feedparser.parse(url)
-        source_name = parsed.feed.get("title") or url
-        entries = [
-            {
-                "title": e.get("title"),
-                "link": e.get("link"),
-                "summary": e.get("summary") or e.get("description"),
-                "published": e.get("published"),
-            }
-            for e in parsed.entries
-        ]
-        total_created += ingest_feed_entries(db, source_name=source_name, entries=entries, max_items=max_items_per_feed)
+    for result in results:
+        state = states.get(result.url)
+        if state is None:
+            state = FeedState(url=result.url)
+            db.add(state)
+        state.last_status = result.status_code
+        state.last_fetched_at = fetched_at
+        state.last_latency_ms = result.latency_ms
+        state.last_bytes = result.bytes
+        state.last_error = result.error
+        if not result.changed:
+            continue
+
+        state.etag = result.etag
+        state.last_modified = result.last_modified
+        parsed = feedparser.parse(result.content, response_headers=result.headers)
+        source_name = parsed.feed.get("title") or result.url
+        total_created += ingest_feed_entries(
+            db, source_name=source_name, entries=_feed_entries(parsed), max_items=max_items_per_feed
+        )
+
+    db.commit()
     return total_created
 
 
@@ -0,0 +1,150 @@
+"""Event-driven handoff between V6 pipeline stages.
+
+When an item moves into a status that another agent works on, the
+transition enqueues that agent's task for this one item instead of
+leaving it for the next beat tick (up to 2 hours for Writer/Editor).
+The beat schedule stays in place as a safety net for anything a
+handoff misses (broker down, worker restart, handoff disabled).
+
+Duplicates are cheap by design. The producer suppresses repeat
+handoffs for the same (item, status, revision) within
+HANDOFF_DEDUP_SECONDS, and the consumer claims the item with the normal
+claim lock *and* its expected status, so a second delivery, or a beat
+run that got there first, finds nothing to do.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..metrics import observe_agent_run
+from ..models import ContentPipelineItem, PipelineStatus
+from .claim_lock import attempt_claim, release_claim
+
+logger = logging.getLogger(__name__)
+
+HANDOFF_TASK_NAME = "v6_process_item"
+WRITE_ITEM_TASK_NAME = "v6_write_item"
+
+# Producer-side suppression window for repeat handoffs of one transition.
+HANDOFF_DEDUP_SECONDS = 60
+
+# Status → claim stage of the agent that picks the item up from there.
+# WRITING and AMPLIFIED are internal to one agent; BACKLOG waits for a
+# human or Morgan; DONE is terminal.
+STAGE_CLAIMS: dict[PipelineStatus, str] = {
+    PipelineStatus.todo: "writing",
+    PipelineStatus.review: "review",
+    PipelineStatus.ready_to_publish: "publish",
+    PipelineStatus.published: "promote",
+}
+
+_recent_lock = threading.Lock()
+_recent: dict[tuple[str, str, int], float] = {}
+
+
+def clear_handoff_dedup() -> None:
+    """Forget recent handoffs (used by tests)."""
+    with _recent_lock:
+        _recent.clear()
+
+
+def _first_enqueue(key: tuple[str, str, int]) -> bool:
+    now = time.monotonic()
+    with _recent_lock:
+        for stale in [k for k, at in _recent.items() if now - at > HANDOFF_DEDUP_SECONDS]:
+            del _recent[stale]
+        if key in _recent:
+            return False
+        _recent[key] = now
+        return True
+
+
+def on_transition(item_id, to_status: PipelineStatus, revision_count: int = 0) -> bool:
+    """Enqueue the next agent's task for an item that just moved to ``to_status``.
+
+    Call only after the transition is committed. Never raises: if the
+    broker is unavailable the beat schedule picks the item up later.
+    Returns True if a task was sent.
+    """
+    if not settings.pipeline_handoff_enabled or to_status not in STAGE_CLAIMS:
+        return False
+
+    key = (str(item_id), to_status.value, revision_count)
+    if not _first_enqueue(key):
+        logger.debug("Handoff suppressed (duplicate): item=%s status=%s", item_id, to_status.name)
+        return False
+
+    try:
+        from ..worker import celery_app
+        if celery_app is None:
+            return False
+        if to_status == PipelineStatus.todo and settings.writer_fanout_enabled:
+            # Generation goes to the writer queue with its time limits
+            celery_app.send_task(WRITE_ITEM_TASK_NAME, args=[str(item_id)], queue=settings.writer_queue)
+        else:
+            celery_app.send_task(HANDOFF_TASK_NAME, args=[str(item_id), to_status.value])
+    except Exception as exc:
+        with _recent_lock:
+            _recent.pop(key, None)
+        logger.warning(
+            "Handoff enqueue failed for item=%s status=%s — beat will retry: %s",
+            item_id, to_status.name, exc,
+        )
+        return False
+
+    logger.info("Handoff enqueued: item=%s → %s agent", item_id, STAGE_CLAIMS[to_status])
+    return True
+
+
+def _stage_agent(status: PipelineStatus):
+    from .agents import editor, promoter, publisher, writer
+
+    return {
+        PipelineStatus.todo: writer,
+        PipelineStatus.review: editor,
+        PipelineStatus.ready_to_publish: publisher,
+        PipelineStatus.published: promoter,
+    }[status]
+
+
+@observe_agent_run("handoff")
+def process_handed_off_item(
+    db: Session,
+    item_id,
+    status: PipelineStatus,
+    shadow_mode: bool = False,
+) -> str:
+    """Run the owning agent on one handed-off item.
+
+    Claims the item only if it is still unclaimed and at ``status``, then
+    calls that agent's process_one_item. Returns "processed", "failed",
+    or "skipped:<reason>" when there is nothing to do.
+    """
+    stage = STAGE_CLAIMS.get(status)
+    if stage is None:
+        return "skipped:no_stage"
+
+    agent = _stage_agent(status)
+    worker_id = agent._worker_id()
+    if not attempt_claim(db, item_id, stage, worker_id, status=status):
+        return "skipped:claimed_or_moved"
+
+    item = db.get(ContentPipelineItem, item_id)
+    # Fencing token of this claim, so a failure never releases a newer one
+    token = item.claim_token
+    try:
+        if status == PipelineStatus.ready_to_publish:
+            ok = agent.process_one_item(db, item, worker_id, shadow_mode=shadow_mode)
+        else:
+            ok = agent.process_one_item(db, item, worker_id)
+    except Exception:
+        db.rollback()
+        release_claim(db, item_id, stage, claim_token=token)
+        raise
+    return "processed" if ok else "failed"
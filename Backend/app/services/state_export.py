@@ -0,0 +1,306 @@
+"""Streaming export and import of the single-user state backup.
+
+Rows are read with ``yield_per`` (a server-side cursor on PostgreSQL)
+and written out as they arrive, so memory stays flat however many years
+of drafts, comments and audit logs the database holds.
+
+Two export shapes share the same rows:
+
+- ``json``: the original ``{"generated_at", "meta", "config": [...], ...}``
+  document the dashboard downloads, written incrementally.
+- ``ndjson``: one JSON object per line. A header line, then one
+  ``{"table": ..., "row": {...}}`` line per row, then an ``{"end": ...}``
+  line with per-table counts. Only this shape can be imported.
+
+Either shape can be gzip-compressed. Tables are written parents first
+(drafts before posts before comments), so an import can insert each
+batch as it reads it.
+"""
+
+from __future__ import annotations
+
+import enum
+import gzip
+import io
+import json
+import uuid
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import IO, Iterable, Iterator
+
+from sqlalchemy import DateTime, Enum, Uuid, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models import (
+    AppConfig,
+    AuditLog,
+    Comment,
+    Draft,
+    EngagementMetric,
+    LearningWeight,
+    NotificationLog,
+    PublishedPost,
+    SourceMaterial,
+)
+
+EXPORT_FORMAT = "linkedbrand-state"
+EXPORT_VERSION = 1
+EXPORT_META = {
+    "app": "linkedin_personal_brand",
+    "mode": "single-user",
+    "version_tag": "v4.0",
+}
+
+# Rows per server-side fetch, and per INSERT/UPDATE batch on import
+EXPORT_BATCH_SIZE = 500
+IMPORT_BATCH_SIZE = 500
+# Bytes buffered before a chunk is handed to the response
+CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class ExportTable:
+    key: str
+    model: type
+    # Column compared against ``since``; None means always exported in full
+    since_column: str | None
+
+
+# Parents before children so an import never references a missing row
+EXPORT_TABLES: tuple[ExportTable, ...] = (
+    ExportTable("config", AppConfig, None),
+    ExportTable("sources", SourceMaterial, "created_at"),
+    ExportTable("drafts", Draft, "created_at"),
+    ExportTable("posts", PublishedPost, "created_at"),
+    ExportTable("comments", Comment, "commented_at"),
+    ExportTable("engagement_metrics", EngagementMetric, "collected_at"),
+    ExportTable("learning_weights", LearningWeight, "updated_at"),
+    ExportTable("audit_logs", AuditLog, "created_at"),
+    ExportTable("notifications", NotificationLog, "created_at"),
+)
+TABLES_BY_KEY = {table.key: table for table in EXPORT_TABLES}
+
+
+class StateImportError(ValueError):
+    """Raised when an import stream is malformed; nothing is committed."""
+
+
+def resolve_tables(keys: Iterable[str] | None) -> list[ExportTable]:
+    """Map requested table keys to ExportTables in dependency order."""
+    if not keys:
+        return list(EXPORT_TABLES)
+    wanted = set(keys)
+    unknown = wanted - TABLES_BY_KEY.keys()
+    if unknown:
+        raise ValueError(f"Unknown tables: {sorted(unknown)}. Valid: {list(TABLES_BY_KEY)}")
+    return [table for table in EXPORT_TABLES if table.key in wanted]
+
+
+def _serialize_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def iter_table_rows(db: Session, table: ExportTable, since: datetime | None = None) -> Iterator[dict]:
+    """Yield one table's rows as JSON-ready dicts, oldest first."""
+    sa_table = table.model.__table__
+    order = [sa_table.c[table.since_column]] if table.since_column else []
+    query = select(sa_table).order_by(*order, *sa_table.primary_key.columns)
+    if since is not None and table.since_column:
+        query = query.where(sa_table.c[table.since_column] >= since)
+    result = db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    for row in result.mappings():
+        yield {key: _serialize_value(value) for key, value in row.items()}
+
+
+def _header(tables: list[ExportTable], since: datetime | None) -> dict:
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "meta": EXPORT_META,
+        "format": EXPORT_FORMAT,
+        "version": EXPORT_VERSION,
+        "tables": [table.key for table in tables],
+        "since": since.isoformat() if since else None,
+    }
+
+
+def iter_ndjson_lines(db: Session, tables: list[ExportTable], since: datetime | None = None) -> Iterator[str]:
+    yield _dumps(_header(tables, since)) + "\n"
+    counts = {}
+    for table in tables:
+        counts[table.key] = 0
+        for row in iter_table_rows(db, table, since):
+            counts[table.key] += 1
+            yield _dumps({"table": table.key, "row": row}) + "\n"
+    yield _dumps({"end": True, "counts": counts}) + "\n"
+
+
+def iter_json_document(db: Session, tables: list[ExportTable], since: datetime | None = None) -> Iterator[str]:
+    """The legacy single-document export, produced piece by piece."""
+    header = _header(tables, since)
+    yield "{" + _dumps("generated_at") + ":" + _dumps(header["generated_at"])
+    yield "," + _dumps("meta") + ":" + _dumps(header["meta"])
+    for table in tables:
+        yield "," + _dumps(table.key) + ":["
+        separator = ""
+        for row in iter_table_rows(db, table, since):
+            yield separator + _dumps(row)
+            separator = ","
+        yield "]"
+    yield "}"
+
+
+def iter_chunks(pieces: Iterable[str], *, compress: bool = False) -> Iterator[bytes]:
+    """Batch text pieces into ~CHUNK_BYTES byte chunks, gzip-compressed if asked."""
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    buffer: list[bytes] = []
+    size = 0
+    for piece in pieces:
+        data = piece.encode()
+        buffer.append(data)
+        size += len(data)
+        if size >= CHUNK_BYTES:
+            chunk = b"".join(buffer)
+            buffer, size = [], 0
+            chunk = compressor.compress(chunk) if compressor else chunk
+            if chunk:
+                yield chunk
+    chunk = b"".join(buffer)
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+
+def export_state_stream(
+    session_factory,
+    *,
+    fmt: str = "json",
+    tables: list[ExportTable] | None = None,
+    since: datetime | None = None,
+    compress: bool = False,
+) -> Iterator[bytes]:
+    """Response body for an export, reading through its own session.
+
+    The session is opened when the body starts streaming and closed when
+    it ends, so it outlives the request handler that returned it.
+    """
+    tables = tables or list(EXPORT_TABLES)
+    db = session_factory()
+    try:
+        pieces = iter_ndjson_lines(db, tables, since) if fmt == "ndjson" else iter_json_document(db, tables, since)
+        yield from iter_chunks(pieces, compress=compress)
+    finally:
+        db.close()
+
+
+def _column_parsers(model) -> dict:
+    """Per-column converters from exported JSON values back to Python values."""
+    parsers = {}
+    for column in model.__table__.columns:
+        if isinstance(column.type, DateTime):
+            parsers[column.key] = datetime.fromisoformat
+        elif isinstance(column.type, Uuid):
+            parsers[column.key] = uuid.UUID
+        elif isinstance(column.type, Enum) and column.type.enum_class is not None:
+            parsers[column.key] = column.type.enum_class
+    return parsers
+
+
+def _upsert_batch(db: Session, table: ExportTable, rows: list[dict]) -> None:
+    """Insert new rows and update existing ones, matched by primary key."""
+    pk = table.model.__mapper__.primary_key[0]
+    existing = set(db.scalars(select(pk).where(pk.in_([row[pk.key] for row in rows]))))
+    inserts = [row for row in rows if row[pk.key] not in existing]
+    updates = [row for row in rows if row[pk.key] in existing]
+    if inserts:
+        db.execute(insert(table.model), inserts)
+    if updates:
+        db.execute(update(table.model), updates)
+
+
+def _open_text(stream: IO[bytes]) -> IO[str]:
+    """Wrap a seekable binary stream for line reading, un-gzipping if needed."""
+    magic = stream.read(2)
+    stream.seek(0)
+    if magic == b"\x1f\x8b":
+        stream = gzip.GzipFile(fileobj=stream, mode="rb")
+    return io.TextIOWrapper(stream, encoding="utf-8")
+
+
+def import_state_stream(db: Session, stream: IO[bytes]) -> dict[str, int]:
+    """Load an NDJSON export (optionally gzipped) from a seekable binary stream.
+
+    Returns the number of rows imported per table.
+
+    Rows are upserted by primary key in batches as they are read, and the
+    whole import is one transaction: a malformed or truncated stream
+    (no end line) raises StateImportError and leaves the database as it was.
+    """
+    parsers = {table.key: _column_parsers(table.model) for table in EXPORT_TABLES}
+    counts: dict[str, int] = {}
+    batch: list[dict] = []
+    batch_table: ExportTable | None = None
+    finished = False
+    line_no = 0
+
+    def flush() -> None:
+        if batch:
+            _upsert_batch(db, batch_table, batch)
+            counts[batch_table.key] = counts.get(batch_table.key, 0) + len(batch)
+            batch.clear()
+
+    try:
+        for line_no, line in enumerate(_open_text(stream), start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if line_no == 1:
+                if record.get("format") != EXPORT_FORMAT or record.get("version") != EXPORT_VERSION:
+                    raise StateImportError(f"Not a {EXPORT_FORMAT} v{EXPORT_VERSION} NDJSON export")
+                continue
+            if finished:
+                raise StateImportError(f"line {line_no}: data after end line")
+            if record.get("end"):
+                flush()
+                finished = True
+                continue
+            table = TABLES_BY_KEY.get(record.get("table"))
+            if table is None:
+                raise StateImportError(f"line {line_no}: unknown table {record.get('table')!r}")
+            if table is not batch_table:
+                flush()
+                batch_table = table
+            row = record["row"]
+            for key, parse in parsers[table.key].items():
+                if row.get(key) is not None:
+                    row[key] = parse(row[key])
+            batch.append(row)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                flush()
+        if line_no == 0:
+            raise StateImportError("Empty import stream")
+        if not finished:
+            raise StateImportError("Import stream is truncated (no end line)")
+        db.commit()
+    except StateImportError:
+        db.rollback()
+        raise
+    except (ValueError, KeyError, TypeError, AttributeError, OSError, EOFError, IntegrityError) as exc:
+        db.rollback()
+        raise StateImportError(f"line {line_no}: {exc}") from exc
+    except Exception:
+        db.rollback()
+        raise
+    return counts
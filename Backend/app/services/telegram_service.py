@@ -10,12 +10,14 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from typing import TYPE_CHECKING
 
 import httpx
 from sqlalchemy.orm import Session
 
 from ..config import settings
+from ..metrics import DELIVERIES, DELIVERY_SECONDS
 from ..models import NotificationLog
 
 if TYPE_CHECKING:
@@ -53,6 +55,21 @@ def _log_notification(
     db.commit()
 
 
+def _post_message(url: str, payload: dict) -> tuple[bool, httpx.Response]:
+    """POST to the Bot API, recording delivery latency and outcome."""
+    started = time.perf_counter()
+    try:
+        response = httpx.post(url, json=payload, timeout=10)
+    except Exception:
+        DELIVERIES.inc(channel="telegram", outcome="failed")
+        raise
+    finally:
+        DELIVERY_SECONDS.observe(time.perf_counter() - started, channel="telegram")
+    ok = response.status_code == 200
+    DELIVERIES.inc(channel="telegram", outcome="delivered" if ok else "failed")
+    return ok, response
+
+
 def send_telegram_message(db: Session, text: str, event_type: str) -> bool:
     """Send a simple text message via Telegram.
 
@@ -73,10 +90,9 @@ def send_telegram_message(db: Session, text: str, event_type: str) -> bool:
         )
         return False
 
-    url = f"https://api.telegram.org/bot{settings.telegram_bot_token}/sendMessage"
+    url = f"{settings.telegram_api_base_url}/bot{settings.telegram_bot_token}/sendMessage"
     try:
-        response = httpx.post(url, json=payload, timeout=10)
-        ok = response.status_code == 200
+        ok, response = _post_message(url, payload)
         _log_notification(db, event_type, payload, ok, None if ok else response.text)
         return ok
     except Exception as exc:
@@ -119,10 +135,9 @@ def send_telegram_message_with_keyboard(
         )
         return False
 
-    url = f"https://api.telegram.org/bot{settings.telegram_bot_token}/sendMessage"
+    url = f"{settings.telegram_api_base_url}/bot{settings.telegram_bot_token}/sendMessage"
     try:
-        response = httpx.post(url, json=payload, timeout=10)
-        ok = response.status_code == 200
+        ok, response = _post_message(url, payload)
         _log_notification(db, event_type, payload, ok, None if ok else response.text)
         return ok
     except Exception as exc:
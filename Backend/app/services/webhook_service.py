@@ -23,6 +23,7 @@ import httpx
 from sqlalchemy.orm import Session
 
 from ..config import settings
+from ..metrics import DELIVERIES, DELIVERY_SECONDS
 from ..models import NotificationLog
 
 logger = logging.getLogger(__name__)
@@ -116,12 +117,15 @@ def send_webhook(
     for attempt in range(MAX_RETRIES):
         try:
             start = time.monotonic()
-            response = httpx.post(
-                webhook_url,
-                content=payload_bytes,
-                headers=headers,
-                timeout=TIMEOUT_SECONDS,
-            )
+            try:
+                response = httpx.post(
+                    webhook_url,
+                    content=payload_bytes,
+                    headers=headers,
+                    timeout=TIMEOUT_SECONDS,
+                )
+            finally:
+                DELIVERY_SECONDS.observe(time.monotonic() - start, channel="webhook")
             elapsed_ms = (time.monotonic() - start) * 1000
 
             if response.status_code < 400:
@@ -139,6 +143,7 @@ def send_webhook(
                     response.status_code,
                     elapsed_ms,
                 )
+                DELIVERIES.inc(channel="webhook", outcome="delivered")
                 return True
 
             last_error = f"HTTP {response.status_code}: {response.text[:200]}"
@@ -162,6 +167,7 @@ def send_webhook(
             time.sleep(BACKOFF_SECONDS[attempt])
 
     # All retries exhausted
+    DELIVERIES.inc(channel="webhook", outcome="failed")
     _log_webhook(
         db,
         event,
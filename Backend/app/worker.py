@@ -4,7 +4,9 @@ Defines:
 - Celery app configuration
 - Task definitions for all workflow operations
 - V6 pipeline agent tasks (Scout, Writer, Editor, Publisher, Promoter)
-- Beat schedule for automated scheduling
+- Per-item stage handoff task, enqueued on each pipeline transition
+- Per-item Writer task (write_item) on its own queue for fan-out mode
+- Beat schedule for automated scheduling (a safety net once handoff is on)
 
 Requires Redis as broker/backend. Gracefully imports when Redis
 is unavailable (tasks can still be called synchronously in tests).
@@ -33,6 +35,8 @@ def create_celery_app() -> "Celery | None":
     if not CELERY_AVAILABLE:
         return None
 
+    from .config import settings
+
     broker_url = os.environ.get("CELERY_BROKER_URL", os.environ.get("REDIS_URL", "redis://localhost:6379/0"))
     result_backend = os.environ.get("CELERY_RESULT_BACKEND", broker_url)
 
@@ -51,6 +55,9 @@ def create_celery_app() -> "Celery | None":
         task_track_started=True,
         task_acks_late=True,
         worker_prefetch_multiplier=1,
+        # LLM-bound generation runs on its own queue; size it with
+        # `celery worker -Q <writer_queue> -c <n>`
+        task_routes={"v6_write_item": {"queue": settings.writer_queue}},
     )
 
     return app
@@ -58,6 +65,13 @@ def create_celery_app() -> "Celery | None":
 
 celery_app = create_celery_app()
 
+if celery_app is not None:
+    from .metrics import instrument_celery_metrics
+    from .query_stats import instrument_celery
+
+    instrument_celery()
+    instrument_celery_metrics()
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Helper: get a fresh DB session for each task
@@ -165,9 +179,11 @@ def _task_ingest_research():
     """Ingest research sources (daily at 02:00)."""
     db = _get_db_session()
     try:
-        from .services.research_ingestion import ingest_feeds
-        count = ingest_feeds(db, feed_urls=[])
+        from .services.research_ingestion import configured_feed_urls, ingest_feeds, summarize_pending_sources
+        count = ingest_feeds(db, feed_urls=configured_feed_urls())
         logger.info("Task: research ingestion got %d sources", count)
+        summarized = summarize_pending_sources(db)
+        logger.info("Task: research ingestion summarised %d sources", summarized)
         return count
     except Exception as exc:
         logger.error("Task: research ingestion failed: %s", exc)
@@ -226,12 +242,34 @@ def _task_run_scout():
         db.close()
 
 
+def _dispatch_write_item(item_id, worker_id: str, claim_token: int) -> None:
+    """Enqueue one write_item task on the writer queue."""
+    from .config import settings
+    if celery_app is None:
+        raise RuntimeError("Celery not available")
+    celery_app.send_task(
+        "v6_write_item",
+        args=[str(item_id), worker_id, claim_token],
+        queue=settings.writer_queue,
+    )
+
+
 def _task_run_writer():
-    """Run the Writer agent to generate drafts (every 2 hours)."""
+    """Run the Writer agent to generate drafts (every 2 hours).
+
+    In fan-out mode this only claims TODO items and dispatches one
+    write_item task per item.
+    """
     db = _get_db_session()
     try:
         if not _check_should_run_v6(db):
             return "skipped:pipeline_mode"
+        from .config import settings
+        if settings.writer_fanout_enabled:
+            from .services.agents.writer import run_writer_fanout
+            count = run_writer_fanout(db, dispatch=_dispatch_write_item)
+            logger.info("Task: writer dispatched %d items", count)
+            return count
         from .services.agents.writer import run_writer
         count = run_writer(db)
         logger.info("Task: writer processed %d items", count)
@@ -249,8 +287,8 @@ def _task_run_editor():
     try:
         if not _check_should_run_v6(db):
             return "skipped:pipeline_mode"
-        from .services.agents.editor import run_editor
-        count = run_editor(db)
+        from .services.agents.editor import run_editor_batch
+        count = run_editor_batch(db)
         logger.info("Task: editor passed %d items", count)
         return count
     except Exception as exc:
@@ -300,6 +338,59 @@ def _task_run_promoter():
         db.close()
 
 
+def _task_write_item(item_id: str, worker_id: str | None = None, claim_token: int | None = None):
+    """Generate the draft for one TODO item (writer queue, per-item time limits)."""
+    import uuid
+
+    db = _get_db_session()
+    try:
+        if not _check_should_run_v6(db):
+            if worker_id:
+                # Release only the dispatcher's own claim, never a newer one
+                from .services.claim_lock import release_claim, verify_claim
+                if verify_claim(db, uuid.UUID(item_id), "writing", worker_id, claim_token):
+                    release_claim(db, uuid.UUID(item_id), "writing", claim_token=claim_token)
+            return "skipped:pipeline_mode"
+        from .services.agents.writer import write_item
+        result = write_item(db, uuid.UUID(item_id), worker_id=worker_id, claim_token=claim_token)
+        logger.info("Task: write_item item=%s → %s", item_id, result)
+        return result
+    except Exception as exc:
+        logger.error("Task: write_item item=%s failed: %s", item_id, exc)
+        raise
+    finally:
+        db.close()
+
+
+def _task_process_item(item_id: str, status: str):
+    """Run the owning agent on one item handed off by a transition."""
+    import uuid
+
+    from .models import PipelineStatus
+
+    db = _get_db_session()
+    try:
+        if not _check_should_run_v6(db):
+            return "skipped:pipeline_mode"
+        from .services.stage_handoff import process_handed_off_item
+        pipeline_status = PipelineStatus(status)
+        shadow = False
+        if pipeline_status == PipelineStatus.ready_to_publish:
+            try:
+                from .services.pipeline_mode import is_shadow_mode
+                shadow = is_shadow_mode(db)
+            except Exception:
+                shadow = False
+        result = process_handed_off_item(db, uuid.UUID(item_id), pipeline_status, shadow_mode=shadow)
+        logger.info("Task: handoff item=%s status=%s → %s", item_id, status, result)
+        return result
+    except Exception as exc:
+        logger.error("Task: handoff item=%s failed: %s", item_id, exc)
+        raise
+    finally:
+        db.close()
+
+
 def _task_run_morgan():
     """Run the Morgan PM self-healing agent (every 15 minutes)."""
     db = _get_db_session()
@@ -322,6 +413,24 @@ def _task_run_morgan():
         db.close()
 
 
+def _task_recover_claims():
+    """Release claims whose lease expired (every CLAIM_RECOVERY_INTERVAL_SECONDS)."""
+    db = _get_db_session()
+    try:
+        if not _check_should_run_v6(db):
+            return "skipped:pipeline_mode"
+        from .services.agents.morgan import recover_stale_claims
+        recovered = len(recover_stale_claims(db))
+        if recovered:
+            logger.info("Task: recover_claims — recovered=%d", recovered)
+        return recovered
+    except Exception as exc:
+        logger.error("Task: recover_claims failed: %s", exc)
+        raise
+    finally:
+        db.close()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Register tasks and beat schedule with Celery
 # ─────────────────────────────────────────────────────────────────────────────
@@ -342,6 +451,14 @@ if celery_app is not None:
     run_publisher = celery_app.task(name="v6_run_publisher")(_task_run_publisher)
     run_promoter = celery_app.task(name="v6_run_promoter")(_task_run_promoter)
     run_morgan = celery_app.task(name="v6_run_morgan")(_task_run_morgan)
+    recover_claims = celery_app.task(name="v6_recover_claims")(_task_recover_claims)
+    process_item = celery_app.task(name="v6_process_item")(_task_process_item)
+    from .config import settings as _settings
+    write_item = celery_app.task(
+        name="v6_write_item",
+        soft_time_limit=_settings.writer_item_soft_time_limit_seconds,
+        time_limit=_settings.writer_item_time_limit_seconds,
+    )(_task_write_item)
 
     # Beat schedule
     celery_app.conf.beat_schedule = {
@@ -370,7 +487,8 @@ if celery_app is not None:
             "task": "send_daily_summary",
             "schedule": crontab(hour=18, minute=30),
         },
-        # V6 pipeline agent tasks
+        # V6 pipeline agent tasks. With PIPELINE_HANDOFF_ENABLED items move
+        # between stages via v6_process_item; these sweeps catch the rest.
         "v6-scout-scan": {
             "task": "v6_run_scout",
             "schedule": crontab(hour="*/6", minute=15),  # Every 6 hours at :15
@@ -395,13 +513,18 @@ if celery_app is not None:
             "task": "v6_run_morgan",
             "schedule": crontab(minute="*/15"),  # Every 15 minutes
         },
+        "v6-claim-recovery": {
+            "task": "v6_recover_claims",
+            "schedule": float(_settings.claim_recovery_interval_seconds),
+        },
     }
 
     logger.info(
         "Celery configured: %d tasks, %d beat schedules",
         len([create_system_draft, publish_due, poll_comments, ingest_research,
              recompute_learning, send_daily_summary, run_scout, run_writer,
-             run_editor, run_publisher, run_promoter, run_morgan]),
+             run_editor, run_publisher, run_promoter, run_morgan, process_item,
+             write_item, recover_claims]),
         len(celery_app.conf.beat_schedule),
     )
 else:
@@ -426,4 +549,7 @@ TASK_REGISTRY = {
     "v6_run_publisher": _task_run_publisher,
     "v6_run_promoter": _task_run_promoter,
     "v6_run_morgan": _task_run_morgan,
+    "v6_process_item": _task_process_item,
+    "v6_write_item": _task_write_item,
+    "v6_recover_claims": _task_recover_claims,
 }
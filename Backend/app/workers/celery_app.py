@@ -2,6 +2,8 @@ from celery import Celery
 from celery.schedules import crontab
 
 from ..config import settings
+from ..metrics import instrument_celery_metrics
+from ..query_stats import instrument_celery
 
 celery_app = Celery(
     "linkedbrand",
@@ -10,6 +12,9 @@ celery_app = Celery(
     include=["app.workers.tasks"],
 )
 
+instrument_celery()
+instrument_celery_metrics()
+
 celery_app.conf.update(
     timezone=settings.timezone,
     enable_utc=True,
@@ -1,11 +1,10 @@
 from datetime import datetime, timezone
 
-from ..config import settings
 from ..db import SessionLocal
 from ..services.audit import log_audit
 from ..services.engagement import poll_and_store_comments
 from ..services.learning import recompute_learning_weights
-from ..services.research_ingestion import DEFAULT_FEEDS, ingest_feeds
+from ..services.research_ingestion import configured_feed_urls, ingest_feeds, summarize_pending_sources
 from ..services.reporting import build_daily_report, send_daily_report_telegram
 from ..services.workflow import create_system_draft, publish_due_manual_posts
 from .celery_app import celery_app
@@ -58,19 +57,20 @@ def recompute_learning():
 def ingest_research_sources():
     db = SessionLocal()
     try:
-        configured = [item.strip() for item in settings.research_feed_urls.split(",") if item.strip()]
-        feeds = configured or DEFAULT_FEEDS
+        feeds = configured_feed_urls()
         created = ingest_feeds(db=db, feed_urls=feeds, max_items_per_feed=10)
+        summarized = summarize_pending_sources(db)
         log_audit(
             db=db,
             actor="worker",
             action="source.ingest",
             resource_type="source_material",
-            detail={"created": created, "feeds_count": len(feeds)},
+            detail={"created": created, "summarized": summarized, "feeds_count": len(feeds)},
         )
         return {
             "status": "ok",
             "created": created,
+            "summarized": summarized,
             "feeds_count": len(feeds),
             "ran_at": datetime.now(timezone.utc).isoformat(),
         }
@@ -0,0 +1 @@
+"""Benchmarks that drive the app against simulated external services."""
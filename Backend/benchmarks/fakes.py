@@ -0,0 +1,137 @@
+"""Local stand-ins for the LLM, LinkedIn, Zapier and Telegram APIs.
+
+FakeServices runs one threaded HTTP server on 127.0.0.1 that answers
+every external call the V6 pipeline makes, after a configurable delay:
+
+    POST /v1/messages            Anthropic Messages API (Writer generation)
+    POST /zapier                 Zapier catch hook (Publisher)
+    POST /bot<token>/sendMessage Telegram Bot API (Publisher, Promoter)
+    *    /rest/...               LinkedIn REST API (empty pages)
+
+It only uses the standard library, so it can be started before the app
+is imported and its URLs handed to the app through environment variables
+(see FakeServices.environ).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Passes the Writer guardrails and every Editor gate
+POST_BODY = (
+    "In my experience, programmatic advertising in African markets has matured over the past decade. "
+    "Media buyers now evaluate several supply paths in real time, and AI bidding agents help them "
+    "identify the inventory sources that actually perform before spend is committed.\n\n"
+    "Measurement and attribution remain the hardest part of the conversation with finance teams.\n\n"
+    "#Adtech #AI"
+)
+
+
+class FakeServices:
+    """Threaded fake of the pipeline's external HTTP dependencies.
+
+    Use as a context manager. ``calls`` counts requests per service
+    ("llm", "zapier", "telegram", "linkedin", "unknown").
+    """
+
+    def __init__(
+        self,
+        llm_latency: float = 0.5,
+        webhook_latency: float = 0.05,
+        telegram_latency: float = 0.05,
+        linkedin_latency: float = 0.05,
+    ):
+        self.latency = {
+            "llm": llm_latency,
+            "zapier": webhook_latency,
+            "telegram": telegram_latency,
+            "linkedin": linkedin_latency,
+            "unknown": 0.0,
+        }
+        self.calls: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def environ(self) -> dict[str, str]:
+        """Settings that point the app at this server (set before importing app)."""
+        return {
+            "LLM_PROVIDER": "claude",
+            "LLM_API_KEY": "bench-key",
+            "LLM_MOCK_MODE": "false",
+            "LLM_CACHE_BACKEND": "none",
+            "ANTHROPIC_BASE_URL": f"{self.base_url}/v1/messages",
+            "ZAPIER_WEBHOOK_URL": f"{self.base_url}/zapier",
+            "ZAPIER_WEBHOOK_SECRET": "",
+            "TELEGRAM_BOT_TOKEN": "bench-token",
+            "TELEGRAM_CHAT_ID": "1",
+            "TELEGRAM_API_BASE_URL": self.base_url,
+            "LINKEDIN_API_BASE_URL": self.base_url,
+        }
+
+    def _record(self, service: str) -> None:
+        with self._lock:
+            self.calls[service] += 1
+
+    def __enter__(self) -> "FakeServices":
+        services = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, payload: dict) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                if self.path.startswith("/v1/messages"):
+                    service = "llm"
+                    payload = {
+                        "model": "bench-model",
+                        "content": [{"type": "text", "text": POST_BODY}],
+                        "usage": {"input_tokens": 400, "output_tokens": 120},
+                    }
+                elif self.path.startswith("/zapier"):
+                    service, payload = "zapier", {"status": "success"}
+                elif self.path.startswith("/bot"):
+                    service, payload = "telegram", {"ok": True, "result": {"message_id": 1}}
+                elif self.path.startswith("/rest/"):
+                    service, payload = "linkedin", {"elements": [], "paging": {"start": 0, "count": 0}}
+                else:
+                    service, payload = "unknown", {}
+                services._record(service)
+                time.sleep(services.latency[service])
+                self._reply(payload)
+
+            do_GET = _handle
+            do_POST = _handle
+
+            def log_message(self, format, *args):  # noqa: A002 - stdlib signature
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
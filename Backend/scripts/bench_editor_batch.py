@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark: per-item Editor loop vs one batch review.
+
+Seeds N REVIEW items with drafts in a throwaway SQLite database, then
+times run_editor (load, review and 3-4 commits per item) against
+run_editor_batch (one IN query, one executemany UPDATE, one commit),
+counting SQL statements and commits for each.
+
+Usage:
+    python scripts/bench_editor_batch.py
+    python scripts/bench_editor_batch.py --items 200 --processes 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_bench_editor_batch.db")
+os.environ.setdefault("APP_ENV", "test")
+
+# Add the app directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, ContentPipelineItem, Draft, PipelineStatus, PostFormat, PostTone
+from app.services.agents.editor import run_editor, run_editor_batch
+
+POSTS = [
+    (
+        "In my experience, programmatic advertising in African markets has matured over the past decade. "
+        "Media buyers now evaluate several supply paths in real time, and AI bidding agents help them "
+        "identify the inventory sources that actually perform before spend is committed.\n\n"
+        "Measurement and attribution remain the hardest part of the conversation with finance teams.\n\n"
+        "#Adtech #AI"
+    ),
+    (
+        "Today I made a delicious pasta recipe with fresh tomatoes and basil. "
+        "The secret is to use slow roasted garlic and a pinch of sea salt."
+    ),
+]
+
+
+def _seed(Session, count: int) -> None:
+    db = Session()
+    db.query(ContentPipelineItem).delete()
+    db.query(Draft).delete()
+    base = datetime.now(timezone.utc) - timedelta(hours=1)
+    for n in range(count):
+        draft = Draft(
+            pillar_theme="Adtech fundamentals",
+            sub_theme="Programmatic buying",
+            format=PostFormat.text,
+            tone=PostTone.educational,
+            content_body=POSTS[n % len(POSTS)],
+        )
+        db.add(draft)
+        db.flush()
+        db.add(ContentPipelineItem(
+            status=PipelineStatus.review,
+            pillar_theme="Adtech fundamentals",
+            draft_id=draft.id,
+            created_at=base + timedelta(seconds=n),
+        ))
+    db.commit()
+    db.close()
+
+
+def _measure(engine, Session, fn) -> tuple[float, int, int, int]:
+    counts = {"statements": 0, "commits": 0}
+
+    def _statement(*_args):
+        counts["statements"] += 1
+
+    def _commit(_conn):
+        counts["commits"] += 1
+
+    event.listen(engine, "before_cursor_execute", _statement)
+    event.listen(engine, "commit", _commit)
+    db = Session()
+    try:
+        started = time.perf_counter()
+        passed = fn(db)
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", _statement)
+        event.remove(engine, "commit", _commit)
+    return elapsed, counts["statements"], counts["commits"], passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch Editor review")
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--processes", type=int, default=0, help="Review processes for the batch path")
+    args = parser.parse_args()
+
+    engine = create_engine(f"sqlite+pysqlite:///{DB_PATH}", connect_args={"check_same_thread": False})
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+
+    runs = [
+        ("per-item run_editor", lambda db: run_editor(db, max_items=args.items)),
+        ("run_editor_batch", lambda db: run_editor_batch(db, max_items=args.items, processes=0)),
+    ]
+    if args.processes > 1:
+        runs.append((
+            f"run_editor_batch x{args.processes} procs",
+            lambda db: run_editor_batch(db, max_items=args.items, processes=args.processes),
+        ))
+
+    print(f"{args.items} REVIEW items ({len(POSTS)} alternating drafts)\n")
+    print(f"{'path':<28}  {'seconds':>8}  {'items/s':>8}  {'statements':>10}  {'commits':>7}  {'passed':>6}")
+    for name, fn in runs:
+        _seed(Session, args.items)
+        elapsed, statements, commits, passed = _measure(engine, Session, fn)
+        print(
+            f"{name:<28}  {elapsed:>8.3f}  {args.items / elapsed:>8.1f}  "
+            f"{statements:>10}  {commits:>7}  {passed:>6}"
+        )
+
+    engine.dispose()
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
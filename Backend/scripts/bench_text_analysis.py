@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-post phrase scan cost as the phrase lists grow.
+
+Compares the PhraseMatcher (an ``in`` test per phrase up to
+DIRECT_SCAN_MAX_PHRASES, one Aho-Corasick pass above it) with the naive
+``phrase in lowered`` loop it replaces, and times a full Editor
+review_content call against the real PRODUCT_CONTEXT.md.
+
+Usage:
+    python scripts/bench_text_analysis.py
+    python scripts/bench_text_analysis.py --sizes 10 100 1000 10000 --repeat 50
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add the app directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.agents.editor import get_editor_phrases, review_content
+from app.services.product_context import get_product_context
+from app.services.text_analysis import DIRECT_SCAN_MAX_PHRASES, PhraseMatcher
+
+POST = (
+    "In my experience, the hardest part of programmatic buying is not the bidding logic. "
+    "Over the past decade I have seen retail media teams chase attribution models that "
+    "finance never trusted. One lesson: agree the measurement framework before the first "
+    "campaign launches, and let AI agents optimise inside it rather than around it.\n\n"
+    "What is the one metric your CFO actually reads? #Adtech #RetailMedia"
+)
+
+
+def _phrases(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    words = POST.lower().replace("\n", " ").split() + [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+        for _ in range(200)
+    ]
+    return sorted({" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(count)})
+
+
+def _best_us(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-pass phrase scanning")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=30, help="Timed runs per size (best is reported)")
+    args = parser.parse_args()
+
+    print(f"Post length: {len(POST)} chars\n")
+    print(f"{'phrases':>8}  {'path':>9}  {'matcher us/post':>16}  {'naive us/post':>14}  {'hits':>5}")
+    for size in args.sizes:
+        phrases = _phrases(size, seed=size)
+        matcher = PhraseMatcher({"bench": phrases}).compile()
+        lowered = POST.lower()
+        matcher_us = _best_us(lambda: matcher.scan(POST), args.repeat)
+        naive_us = _best_us(lambda: [p for p in phrases if p in lowered], args.repeat)
+        hits = len(matcher.scan(POST).hits)
+        path = "direct" if len(phrases) <= DIRECT_SCAN_MAX_PHRASES else "automaton"
+        print(f"{len(phrases):>8}  {path:>9}  {matcher_us:>16.1f}  {naive_us:>14.1f}  {hits:>5}")
+
+    ctx = get_product_context()
+    editor_phrases = get_editor_phrases(ctx)
+    item = MagicMock()
+    review_us = _best_us(lambda: review_content(POST, item, ctx=ctx), args.repeat)
+    scan_us = _best_us(lambda: editor_phrases.matcher.scan(POST), args.repeat)
+    print(
+        f"\nEditor ({editor_phrases.matcher.phrase_count} compiled phrases): "
+        f"scan {scan_us:.1f} us, full review_content {review_us:.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
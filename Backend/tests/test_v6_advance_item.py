@@ -0,0 +1,212 @@
+"""V6 advance_item tests.
+
+Covers:
+- One UPDATE ... RETURNING, its transition-log INSERT and one commit per
+  state change, no re-SELECT
+- Claim release, revision bump, last_error and extra values in the same write
+- Invalid transitions, concurrent status changes, lost claims and missing items
+- Editor and Morgan state changes go through the single write
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_advance_item_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models import (
+    AuditLog,
+    Base,
+    ContentPipelineItem,
+    Draft,
+    PipelineStatus,
+    PostFormat,
+    PostTone,
+)
+from app.services.claim_lock import attempt_claim
+from app.services.pipeline import TransitionError, advance_item
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+
+class _Recorder:
+    """Collects statements and commits issued against the test engine."""
+
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self._statement)
+        event.listen(engine, "commit", self._commit)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self._statement)
+        event.remove(engine, "commit", self._commit)
+
+    def _statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement.lstrip().split(" ")[0])
+
+    def _commit(self, conn):
+        self.commits += 1
+
+
+class _ItemCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(ContentPipelineItem).delete()
+        self.db.query(Draft).delete()
+        self.db.query(AuditLog).delete()
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    def _item(self, status, claimed_by=None, **kwargs):
+        item = ContentPipelineItem(status=status, pillar_theme="Adtech fundamentals", **kwargs)
+        self.db.add(item)
+        self.db.commit()
+        if claimed_by:
+            attempt_claim(self.db, item.id, "stage", claimed_by)
+        # Loaded, as claim_batch returns it
+        self.db.refresh(item)
+        return item
+
+
+class TestAdvanceItem(_ItemCase):
+
+    def test_single_statement_and_commit(self):
+        item = self._item(PipelineStatus.review, claimed_by="editor-1")
+
+        with _Recorder() as rec:
+            updated = advance_item(
+                self.db, item.id, PipelineStatus.review, PipelineStatus.todo,
+                worker_id="editor-1",
+                bump_revision=True,
+                error="gate failed",
+                values={"quality_score": 0.5, "fact_check_status": "failed"},
+            )
+            # The returned row is loaded — reading it costs nothing
+            snapshot = (
+                updated.status, updated.revision_count, updated.last_error,
+                updated.quality_score, updated.claimed_by, updated.claim_stage,
+            )
+
+        self.assertEqual(rec.statements, ["UPDATE", "INSERT"])
+        self.assertEqual(rec.commits, 1)
+        self.assertEqual(
+            snapshot,
+            (PipelineStatus.todo, 1, "gate failed", 0.5, None, None),
+        )
+
+    def test_keep_claim_between_stages(self):
+        item = self._item(PipelineStatus.todo, claimed_by="writer-1")
+        updated = advance_item(
+            self.db, item.id, PipelineStatus.todo, PipelineStatus.writing,
+            worker_id="writer-1", release_claim=False,
+        )
+        self.assertEqual(updated.status, PipelineStatus.writing)
+        self.assertEqual(updated.claimed_by, "writer-1")
+
+    def test_invalid_transition_is_rejected_without_a_write(self):
+        item = self._item(PipelineStatus.backlog)
+        with _Recorder() as rec, self.assertRaises(TransitionError):
+            advance_item(self.db, item.id, PipelineStatus.backlog, PipelineStatus.done)
+        self.assertEqual(rec.statements, [])
+
+    def test_concurrent_status_change(self):
+        item = self._item(PipelineStatus.review)
+        with self.assertRaisesRegex(TransitionError, "Concurrent modification"):
+            advance_item(self.db, item.id, PipelineStatus.todo, PipelineStatus.writing)
+
+    def test_lost_claim_leaves_item_untouched(self):
+        item = self._item(PipelineStatus.review, claimed_by="editor-2")
+        with self.assertRaisesRegex(TransitionError, "Claim lost"):
+            advance_item(
+                self.db, item.id, PipelineStatus.review, PipelineStatus.ready_to_publish,
+                worker_id="editor-other",
+            )
+        self.db.expire_all()
+        item = self.db.get(ContentPipelineItem, item.id)
+        self.assertEqual(item.status, PipelineStatus.review)
+        self.assertEqual(item.claimed_by, "editor-2")
+
+    def test_unclaimed_only_skips_claimed_items(self):
+        item = self._item(PipelineStatus.writing, claimed_by="writer-2")
+        with self.assertRaises(TransitionError):
+            advance_item(
+                self.db, item.id, PipelineStatus.writing, PipelineStatus.todo,
+                unclaimed_only=True,
+            )
+
+    def test_missing_item(self):
+        with self.assertRaises(ValueError):
+            advance_item(self.db, uuid.uuid4(), PipelineStatus.review, PipelineStatus.todo)
+
+
+class TestAgentsUseSingleWrite(_ItemCase):
+
+    def test_editor_failure_is_one_update_and_commit(self):
+        from app.services.agents.editor import process_one_item
+
+        draft = Draft(
+            pillar_theme="Adtech fundamentals",
+            sub_theme="Programmatic buying",
+            format=PostFormat.text,
+            tone=PostTone.educational,
+            content_body="Today I made a delicious pasta recipe with fresh tomatoes and basil.",
+        )
+        self.db.add(draft)
+        self.db.commit()
+        item = self._item(PipelineStatus.review, claimed_by="editor-3", draft_id=draft.id, revision_count=2)
+
+        with _Recorder() as rec:
+            self.assertFalse(process_one_item(self.db, item, "editor-3"))
+
+        self.assertEqual(rec.statements, ["SELECT", "UPDATE", "INSERT"])
+        self.assertEqual(rec.commits, 1)
+        self.db.expire_all()
+        item = self.db.get(ContentPipelineItem, item.id)
+        self.assertEqual(item.status, PipelineStatus.backlog)
+        self.assertEqual(item.revision_count, 3)
+        self.assertIsNone(item.claimed_by)
+
+    def test_morgan_reset_clears_error_and_reports_it(self):
+        from app.services.agents.morgan import reset_errored_items
+
+        item = self._item(
+            PipelineStatus.review,
+            last_error="timeout",
+            updated_at=datetime.now(timezone.utc) - timedelta(hours=3),
+        )
+        resets = reset_errored_items(self.db)
+
+        self.assertEqual([r["item_id"] for r in resets], [str(item.id)])
+        self.assertEqual(resets[0]["previous_error"], "timeout")
+        self.db.expire_all()
+        item = self.db.get(ContentPipelineItem, item.id)
+        self.assertEqual(item.status, PipelineStatus.todo)
+        self.assertIsNone(item.last_error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,259 @@
+"""V6 async LLM client tests.
+
+Runs the client against a local fake Messages API server.
+
+Covers:
+- N concurrent generations finish in about one request latency
+- Sequential calls reuse one keep-alive connection
+- The concurrency cap bounds in-flight requests
+- 429/5xx retries honour Retry-After; other 4xx fail fast
+- The sync façade (LLMClient / generate_text) still works
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+
+from app.config import settings
+from app.services import llm_cache, llm_client
+from app.services.llm_client import AsyncLLMClient, LLMClient, _retry_after_seconds
+
+LATENCY = 0.3
+
+
+class _FakeAnthropic(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["content-length"])))
+        with server.lock:
+            server.ports.add(self.client_address[1])
+            server.in_flight += 1
+            server.peak = max(server.peak, server.in_flight)
+            scripted = server.script.pop(0) if server.script else None
+        time.sleep(server.latency)
+        with server.lock:
+            server.in_flight -= 1
+
+        if scripted is not None:
+            status, headers = scripted
+            payload = b'{"error": "scripted"}'
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+        else:
+            payload = json.dumps({
+                "model": body["model"],
+                "content": [{"type": "text", "text": f"echo: {body['messages'][0]['content']}"}],
+                "usage": {"input_tokens": 3, "output_tokens": 2},
+            }).encode()
+            self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def setUpModule():
+    global server, base_url
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeAnthropic)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}/v1/messages"
+
+
+def tearDownModule():
+    server.shutdown()
+    server.server_close()
+
+
+class _LiveServerCase(unittest.TestCase):
+
+    def setUp(self):
+        server.latency = LATENCY
+        server.script = []
+        server.ports = set()
+        server.in_flight = 0
+        server.peak = 0
+        llm_cache.set_llm_cache(llm_cache.build_llm_cache("none"))
+        self.addCleanup(llm_cache.set_llm_cache, None)
+        for name, value in (("llm_mock_mode", False), ("llm_api_key", "test-key")):
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestAsyncLLMClient(_LiveServerCase):
+
+    def _run(self, client, coro):
+        async def _main():
+            try:
+                return await coro
+            finally:
+                await client.aclose()
+        return asyncio.run(_main())
+
+    def test_concurrent_generations_take_about_one_latency(self):
+        n = 8
+        client = AsyncLLMClient(api_key="test-key", base_url=base_url, max_concurrency=n)
+        requests = [{"user_prompt": f"prompt {i}"} for i in range(n)]
+
+        started = time.perf_counter()
+        results = self._run(client, client.generate_many(requests))
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual([r.content for r in results], [f"echo: prompt {i}" for i in range(n)])
+        self.assertEqual(server.peak, n)
+        self.assertLess(elapsed, LATENCY * 2.5, f"{n} generations took {elapsed:.2f}s")
+
+    def test_concurrency_cap_bounds_in_flight_requests(self):
+        client = AsyncLLMClient(api_key="test-key", base_url=base_url, max_concurrency=2)
+        server.latency = 0.05
+        results = self._run(client, client.generate_many([{"user_prompt": "x"}] * 6))
+        self.assertTrue(all(r.content == "echo: x" for r in results))
+        self.assertEqual(server.peak, 2)
+
+    def test_sequential_calls_reuse_one_connection(self):
+        client = AsyncLLMClient(api_key="test-key", base_url=base_url)
+        server.latency = 0
+
+        async def _sequential():
+            for _ in range(5):
+                await client.generate("hello")
+
+        self._run(client, _sequential())
+        self.assertEqual(len(server.ports), 1)
+
+    def test_rate_limit_retry_honours_retry_after(self):
+        client = AsyncLLMClient(api_key="test-key", base_url=base_url)
+        server.latency = 0
+        server.script = [(429, {"retry-after": "0"}), (503, {"retry-after": "0"})]
+
+        started = time.perf_counter()
+        response = self._run(client, client.generate("hello"))
+
+        self.assertEqual(response.content, "echo: hello")
+        self.assertLess(time.perf_counter() - started, 5)
+
+    def test_retries_exhausted_raises(self):
+        client = AsyncLLMClient(api_key="test-key", base_url=base_url)
+        server.latency = 0
+        server.script = [(500, {})] * 3
+
+        with patch.object(llm_client, "RETRY_DELAYS", [0.01, 0.01, 0.01]):
+            with self.assertRaises(RuntimeError):
+                self._run(client, client.generate("hello"))
+
+    def test_client_error_is_not_retried(self):
+        client = AsyncLLMClient(api_key="test-key", base_url=base_url)
+        server.latency = 0
+        server.script = [(400, {}), (400, {})]
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            self._run(client, client.generate("hello"))
+        self.assertEqual(len(server.script), 1)
+
+    def test_retry_does_not_block_other_generations(self):
+        client = AsyncLLMClient(api_key="test-key", base_url=base_url, max_concurrency=4)
+        server.latency = 0.05
+        server.script = [(429, {"retry-after": "1"})]
+
+        async def _mixed():
+            retried = asyncio.create_task(client.generate("slow"))
+            await asyncio.sleep(0.02)
+            started = time.perf_counter()
+            await client.generate_many([{"user_prompt": "fast"}] * 3)
+            fast_elapsed = time.perf_counter() - started
+            await retried
+            return fast_elapsed
+
+        fast_elapsed = self._run(client, _mixed())
+        self.assertLess(fast_elapsed, 0.8)
+
+
+class TestSyncFacade(_LiveServerCase):
+
+    def test_generate_and_generate_many(self):
+        client = LLMClient(api_key="test-key", base_url=base_url, max_concurrency=4)
+        try:
+            self.assertEqual(client.generate("hi").content, "echo: hi")
+
+            started = time.perf_counter()
+            results = client.generate_many([{"user_prompt": str(i)} for i in range(4)])
+            self.assertLess(time.perf_counter() - started, LATENCY * 2.5)
+            self.assertEqual([r.content for r in results], ["echo: 0", "echo: 1", "echo: 2", "echo: 3"])
+        finally:
+            client.close()
+
+    def test_threads_share_the_pooled_client(self):
+        client = LLMClient(api_key="test-key", base_url=base_url, max_concurrency=4)
+        results = []
+        try:
+            threads = [
+                threading.Thread(target=lambda i=i: results.append(client.generate(f"t{i}").content))
+                for i in range(4)
+            ]
+            started = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertLess(time.perf_counter() - started, LATENCY * 2.5)
+        finally:
+            client.close()
+        self.assertEqual(sorted(results), ["echo: t0", "echo: t1", "echo: t2", "echo: t3"])
+
+    def test_generate_text_uses_singleton(self):
+        with patch.object(llm_client, "_client", LLMClient(api_key="test-key", base_url=base_url)):
+            response = llm_client.generate_text("singleton")
+        self.assertEqual(response.content, "echo: singleton")
+        self.assertFalse(response.is_mock)
+
+    def test_mock_mode_skips_network(self):
+        client = LLMClient(api_key="test-key", base_url=base_url)
+        with patch.object(settings, "llm_mock_mode", True):
+            response = client.generate("Adtech fundamentals post")
+        self.assertTrue(response.is_mock)
+        self.assertEqual(server.ports, set())
+
+
+class TestRetryAfterParsing(unittest.TestCase):
+
+    def _response(self, value):
+        return httpx.Response(429, headers={"retry-after": value} if value else {})
+
+    def test_seconds(self):
+        self.assertEqual(_retry_after_seconds(self._response("7")), 7)
+
+    def test_missing_or_garbage(self):
+        self.assertIsNone(_retry_after_seconds(self._response(None)))
+        self.assertIsNone(_retry_after_seconds(self._response("soon")))
+
+    def test_http_date_in_past_is_zero(self):
+        self.assertEqual(_retry_after_seconds(self._response("Wed, 21 Oct 2015 07:28:00 GMT")), 0)
+
+    def test_capped(self):
+        self.assertEqual(_retry_after_seconds(self._response("100000")), llm_client.MAX_RETRY_AFTER_SECONDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
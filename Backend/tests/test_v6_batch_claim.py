@@ -0,0 +1,195 @@
+"""V6 batch claim tests.
+
+Covers:
+- claim_batch claims up to N oldest unclaimed items of one status
+- Already-claimed items and other statuses are never returned
+- Repeated and concurrent batch claims never hand out the same item twice
+- Claimed rows come back fully loaded (no per-item refresh SELECTs)
+- Agents claim their work through claim_batch
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_batch_claim_test.db")
+os.environ["DATABASE_URL"] = f"sqlite+pysqlite:///{DB_PATH}"
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+os.environ["LLM_MOCK_MODE"] = "true"
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, ContentPipelineItem, PipelineStatus
+from app.services.claim_lock import claim_batch
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+
+def _fresh_db():
+    db = Session()
+    db.query(ContentPipelineItem).delete()
+    db.commit()
+    return db
+
+
+def _seed(db, count, status=PipelineStatus.todo, **kwargs):
+    base = datetime.now(timezone.utc) - timedelta(hours=1)
+    items = []
+    for i in range(count):
+        item = ContentPipelineItem(
+            status=status,
+            pillar_theme="Adtech fundamentals",
+            created_at=base + timedelta(seconds=i),
+            **kwargs,
+        )
+        db.add(item)
+        items.append(item)
+    db.commit()
+    return [item.id for item in items]
+
+
+class TestClaimBatch(unittest.TestCase):
+
+    def test_claims_oldest_items_up_to_limit(self):
+        db = _fresh_db()
+        ids = _seed(db, 5)
+
+        claimed = claim_batch(db, PipelineStatus.todo, "writing", "writer-a", limit=3)
+
+        self.assertEqual([i.id for i in claimed], ids[:3])
+        for item in claimed:
+            self.assertEqual(item.claimed_by, "writer-a")
+            self.assertEqual(item.claim_stage, "writing")
+            self.assertIsNotNone(item.claimed_at)
+            self.assertIsNotNone(item.claim_expires_at)
+        db.close()
+
+    def test_skips_claimed_items_and_other_statuses(self):
+        db = _fresh_db()
+        _seed(db, 2, claimed_by="someone-else", claim_stage="writing")
+        _seed(db, 2, status=PipelineStatus.review)
+        free = _seed(db, 1)
+
+        claimed = claim_batch(db, PipelineStatus.todo, "writing", "writer-a", limit=10)
+
+        self.assertEqual([i.id for i in claimed], free)
+        db.close()
+
+    def test_second_batch_gets_remaining_items(self):
+        db = _fresh_db()
+        ids = _seed(db, 4)
+
+        first = claim_batch(db, PipelineStatus.todo, "writing", "writer-a", limit=3)
+        second = claim_batch(db, PipelineStatus.todo, "writing", "writer-b", limit=3)
+        third = claim_batch(db, PipelineStatus.todo, "writing", "writer-c", limit=3)
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual([i.id for i in second], ids[3:])
+        self.assertEqual(third, [])
+        db.close()
+
+    def test_zero_limit_claims_nothing(self):
+        db = _fresh_db()
+        _seed(db, 2)
+        self.assertEqual(claim_batch(db, PipelineStatus.todo, "writing", "writer-a", limit=0), [])
+        db.close()
+
+    def test_returned_items_need_no_extra_queries(self):
+        db = _fresh_db()
+        _seed(db, 3)
+
+        statements = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            claimed = claim_batch(db, PipelineStatus.todo, "writing", "writer-a", limit=3)
+            for item in claimed:
+                _ = (item.id, item.status, item.pillar_theme, item.claimed_by)
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].lstrip().upper().startswith("UPDATE"))
+        db.close()
+
+    def test_concurrent_workers_claim_disjoint_sets(self):
+        db = _fresh_db()
+        ids = _seed(db, 20)
+        db.close()
+
+        results: dict[str, list] = {}
+
+        def _worker(name):
+            session = Session()
+            try:
+                got = []
+                while True:
+                    batch = claim_batch(session, PipelineStatus.todo, "writing", name, limit=2)
+                    if not batch:
+                        break
+                    got.extend(i.id for i in batch)
+                results[name] = got
+            finally:
+                session.close()
+
+        threads = [threading.Thread(target=_worker, args=(f"writer-{n}",)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        all_claimed = [i for got in results.values() for i in got]
+        self.assertEqual(len(all_claimed), len(set(all_claimed)))
+        self.assertEqual(set(all_claimed), set(ids))
+
+
+class TestAgentsUseBatchClaim(unittest.TestCase):
+
+    def test_run_promoter_claims_through_batch(self):
+        db = _fresh_db()
+        _seed(db, 4, status=PipelineStatus.published)
+
+        from app.services.agents import promoter
+
+        with patch.object(promoter, "claim_batch", wraps=claim_batch) as spy, \
+                patch.object(promoter, "send_telegram_message"):
+            count = promoter.run_promoter(db, max_items=3)
+
+        self.assertEqual(count, 3)
+        spy.assert_called_once()
+        self.assertEqual(spy.call_args.kwargs["limit"], 3)
+        remaining = (
+            db.query(ContentPipelineItem)
+            .filter(ContentPipelineItem.status == PipelineStatus.published)
+            .count()
+        )
+        self.assertEqual(remaining, 1)
+        db.close()
+
+    def test_run_editor_with_no_items_returns_zero(self):
+        db = _fresh_db()
+        from app.services.agents.editor import run_editor
+        self.assertEqual(run_editor(db), 0)
+        db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
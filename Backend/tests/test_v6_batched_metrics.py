@@ -0,0 +1,255 @@
+"""V6 batched LinkedIn metrics tests.
+
+Covers:
+- fetch_metrics_batch uses the multi-entity share statistics query, chunked
+- Shares missing from a batch response, or a failed chunk, fall back to per-post calls
+- Without an organization URN, per-post calls run in parallel
+- A per-post auth failure is raised, not dropped like other per-post errors
+- poll_and_store_metrics writes posts and EngagementMetric snapshots in bulk
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from urllib.parse import unquote
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_batched_metrics_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.models import Base, EngagementMetric, PostFormat, PostTone, PublishedPost
+from app.services import engagement, linkedin
+from app.services.linkedin import (
+    METRICS_BATCH_SIZE,
+    LinkedInAuthError,
+    TokenBucket,
+    fetch_metrics_batch,
+)
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+
+def _stats(n):
+    return {"impressionCount": 1000 + n, "likeCount": 10 + n, "commentCount": 2, "shareCount": 1}
+
+
+class _FakeLinkedIn:
+    """Answers batch and per-post statistics requests, recording each call."""
+
+    def __init__(self, drop=(), fail_batches=False, latency=0.0, single_status=None):
+        self.drop = set(drop)
+        self.fail_batches = fail_batches
+        # post_id -> HTTP status for per-post requests that should fail
+        self.single_status = dict(single_status or {})
+        self.latency = latency
+        self.batch_calls: list[list[str]] = []
+        self.single_calls: list[str] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.latency)
+        path = request.url.path
+        if path.endswith("/organizationalEntityShareStatistics"):
+            query = unquote(request.url.query.decode())
+            urns = query.split("shares=List(", 1)[1].rstrip(")").split(",")
+            with self.lock:
+                self.batch_calls.append(urns)
+            if self.fail_batches:
+                return httpx.Response(400, text="bad request")
+            elements = [
+                {"share": urn, "totalShareStatistics": _stats(int(urn.rsplit(":", 1)[1]))}
+                for urn in urns
+                if urn not in self.drop
+            ]
+            return httpx.Response(200, json={"elements": elements})
+
+        post_id = path.split("/rest/shares/", 1)[1].split("/", 1)[0]
+        with self.lock:
+            self.single_calls.append(post_id)
+        if post_id in self.single_status:
+            return httpx.Response(self.single_status[post_id], text="error")
+        return httpx.Response(200, json={"elements": [_stats(int(post_id.rsplit(":", 1)[1]))]})
+
+
+class _MetricsCase(unittest.TestCase):
+
+    def setUp(self):
+        overrides = {
+            "linkedin_api_mode": "api",
+            "linkedin_api_token": "token",
+            "linkedin_mock_metrics_json": "",
+            "linkedin_organization_urn": "urn:li:organization:42",
+            "linkedin_poll_concurrency": 8,
+        }
+        for name, value in overrides.items():
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        bucket = TokenBucket(rate_per_second=1000, burst=100)
+        patcher = patch.object(linkedin, "get_linkedin_rate_limiter", return_value=bucket)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _client(self, fake):
+        return httpx.Client(transport=httpx.MockTransport(fake))
+
+
+class TestFetchMetricsBatch(_MetricsCase):
+
+    def test_chunks_share_statistics_requests(self):
+        fake = _FakeLinkedIn()
+        ids = [f"urn:li:share:{n}" for n in range(45)]
+
+        results = fetch_metrics_batch(ids, _client=self._client(fake))
+
+        self.assertEqual([len(c) for c in fake.batch_calls], [METRICS_BATCH_SIZE, METRICS_BATCH_SIZE, 5])
+        self.assertEqual(fake.single_calls, [])
+        self.assertEqual(set(results), set(ids))
+        self.assertEqual(results["urn:li:share:7"].impressions, 1007)
+        self.assertEqual(results["urn:li:share:7"].reactions, 17)
+
+    def test_bare_ids_are_sent_as_share_urns(self):
+        fake = _FakeLinkedIn()
+        results = fetch_metrics_batch(["5"], _client=self._client(fake))
+        self.assertEqual(fake.batch_calls, [["urn:li:share:5"]])
+        self.assertEqual(results["5"].impressions, 1005)
+
+    def test_missing_shares_fall_back_to_single_requests(self):
+        fake = _FakeLinkedIn(drop={"urn:li:share:3"})
+        ids = [f"urn:li:share:{n}" for n in range(5)]
+
+        results = fetch_metrics_batch(ids, _client=self._client(fake))
+
+        self.assertEqual(len(fake.batch_calls), 1)
+        self.assertEqual(fake.single_calls, ["urn:li:share:3"])
+        self.assertEqual(set(results), set(ids))
+
+    def test_failed_chunk_falls_back_to_single_requests(self):
+        fake = _FakeLinkedIn(fail_batches=True)
+        ids = [f"urn:li:share:{n}" for n in range(3)]
+
+        results = fetch_metrics_batch(ids, _client=self._client(fake))
+
+        self.assertEqual(sorted(fake.single_calls), ids)
+        self.assertEqual(set(results), set(ids))
+
+    def test_without_organization_single_requests_run_in_parallel(self):
+        fake = _FakeLinkedIn(latency=0.1)
+        ids = [f"urn:li:share:{n}" for n in range(8)]
+
+        started = time.perf_counter()
+        with patch.object(settings, "linkedin_organization_urn", None):
+            results = fetch_metrics_batch(ids, _client=self._client(fake))
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(fake.batch_calls, [])
+        self.assertEqual(len(fake.single_calls), 8)
+        self.assertEqual(set(results), set(ids))
+        self.assertLess(elapsed, 0.4)
+
+    def test_per_post_auth_failure_is_raised(self):
+        ids = [f"urn:li:share:{n}" for n in range(3)]
+
+        dropped = _FakeLinkedIn(fail_batches=True, single_status={"urn:li:share:1": 404})
+        results = fetch_metrics_batch(ids, _client=self._client(dropped))
+        self.assertEqual(set(results), {"urn:li:share:0", "urn:li:share:2"})
+
+        expired = _FakeLinkedIn(fail_batches=True, single_status={"urn:li:share:1": 401})
+        with self.assertRaises(LinkedInAuthError):
+            fetch_metrics_batch(ids, _client=self._client(expired))
+
+
+class TestPollAndStoreMetrics(_MetricsCase):
+
+    def setUp(self):
+        super().setUp()
+        self.db = Session()
+        self.db.query(EngagementMetric).delete()
+        self.db.query(PublishedPost).delete()
+        now = datetime.now(timezone.utc)
+        for n in range(30):
+            self.db.add(PublishedPost(
+                draft_id=uuid.uuid4(),
+                linkedin_post_id=f"urn:li:share:{n}",
+                published_at=now - timedelta(days=1),
+                content_body="Post",
+                format=PostFormat.text,
+                tone=PostTone.direct,
+            ))
+        # Outside the 7-day window
+        self.db.add(PublishedPost(
+            draft_id=uuid.uuid4(),
+            linkedin_post_id="urn:li:share:999",
+            published_at=now - timedelta(days=9),
+            content_body="Old",
+            format=PostFormat.text,
+            tone=PostTone.direct,
+        ))
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_bulk_writes_posts_and_snapshots(self):
+        fake = _FakeLinkedIn()
+        writes = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            head = statement.lstrip().upper()
+            if head.startswith(("UPDATE", "INSERT")):
+                writes.append((head.split("(")[0].split(" SET")[0], executemany))
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            with patch("app.services.linkedin.get_linkedin_client", return_value=self._client(fake)):
+                result = engagement.poll_and_store_metrics(self.db)
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+        self.assertEqual(result, {"updated_posts": 30, "errors": 0, "status": "ok"})
+        self.assertEqual(len(fake.batch_calls), 2)
+        post_writes = [w for w in writes if "PUBLISHED_POSTS" in w[0]]
+        metric_writes = [w for w in writes if "ENGAGEMENT_METRICS" in w[0]]
+        self.assertEqual(post_writes, [("UPDATE PUBLISHED_POSTS", True)])
+        self.assertEqual(metric_writes, [("INSERT INTO ENGAGEMENT_METRICS ", True)])
+
+        self.assertEqual(self.db.query(EngagementMetric).count(), 30)
+        post = self.db.query(PublishedPost).filter_by(linkedin_post_id="urn:li:share:4").one()
+        self.assertEqual(post.impressions, 1004)
+        self.assertIsNotNone(post.last_metrics_update)
+        snapshot = self.db.query(EngagementMetric).filter_by(published_post_id=post.id).one()
+        self.assertEqual(snapshot.reactions, post.reactions)
+        old = self.db.query(PublishedPost).filter_by(linkedin_post_id="urn:li:share:999").one()
+        self.assertIsNone(old.impressions)
+
+    def test_failed_posts_are_counted_not_zeroed(self):
+        with patch.object(engagement, "fetch_metrics_batch", return_value={}):
+            result = engagement.poll_and_store_metrics(self.db)
+
+        self.assertEqual(result["updated_posts"], 0)
+        self.assertEqual(result["errors"], 30)
+        self.assertEqual(self.db.query(EngagementMetric).count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
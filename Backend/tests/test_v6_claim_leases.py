@@ -0,0 +1,265 @@
+"""V6 claim lease, heartbeat and fencing-token tests.
+
+Covers:
+- Claims take a settings-driven lease and bump the fencing token
+- renew_claims / ClaimHeartbeat extend the lease for the holder and token only
+- find_stale_claims and Morgan recovery go by claim_expires_at
+- A worker whose lease was recovered cannot commit stale results
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_claim_leases_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import worker
+from app.config import settings
+from app.models import AuditLog, Base, ContentPipelineItem, Draft, PipelineStatus, PostFormat, PostTone
+from app.services.agents import writer
+from app.services.agents.morgan import recover_stale_claims
+from app.services.claim_lock import (
+    ClaimHeartbeat,
+    attempt_claim,
+    claim_batch,
+    find_stale_claims,
+    force_release_claim,
+    release_claim,
+    renew_claims,
+)
+from app.services.pipeline import TransitionError, advance_item
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+
+def _utc(value):
+    # SQLite returns naive datetimes
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class _LeaseCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(ContentPipelineItem).delete()
+        self.db.query(Draft).delete()
+        self.db.query(AuditLog).delete()
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    def _item(self, status=PipelineStatus.todo, **kwargs):
+        item = ContentPipelineItem(status=status, pillar_theme="Adtech fundamentals", **kwargs)
+        self.db.add(item)
+        self.db.commit()
+        return item.id
+
+    def _get(self, item_id):
+        self.db.expire_all()
+        return self.db.get(ContentPipelineItem, item_id)
+
+    def _expire_lease(self, item_id):
+        item = self._get(item_id)
+        item.claim_expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        self.db.commit()
+
+
+class TestLease(_LeaseCase):
+
+    def test_lease_length_comes_from_settings(self):
+        item_id = self._item()
+        with patch.object(settings, "claim_ttl_seconds", 90):
+            attempt_claim(self.db, item_id, "writing", "writer-1")
+        item = self._get(item_id)
+        lease = (_utc(item.claim_expires_at) - _utc(item.claimed_at)).total_seconds()
+        self.assertAlmostEqual(lease, 90, delta=1)
+
+    def test_every_claim_bumps_the_fencing_token(self):
+        item_id = self._item()
+        attempt_claim(self.db, item_id, "writing", "writer-1")
+        self.assertEqual(self._get(item_id).claim_token, 1)
+        force_release_claim(self.db, item_id)
+        (item,) = claim_batch(self.db, PipelineStatus.todo, "writing", "writer-2", limit=1)
+        self.assertEqual(item.claim_token, 2)
+
+    def test_renewal_is_for_the_holder_only(self):
+        held = self._item()
+        other = self._item()
+        attempt_claim(self.db, held, "writing", "writer-1", ttl_minutes=1)
+        attempt_claim(self.db, other, "writing", "writer-2", ttl_minutes=1)
+        before = _utc(self._get(held).claim_expires_at)
+
+        claims = {held: self._get(held).claim_token, other: self._get(other).claim_token}
+        self.assertEqual(renew_claims(self.db, claims, "writer-1", ttl_minutes=10), 1)
+        self.assertGreater(_utc(self._get(held).claim_expires_at), before + timedelta(minutes=5))
+        self.assertLess(_utc(self._get(other).claim_expires_at), before + timedelta(minutes=2))
+
+    def test_renewal_never_extends_a_newer_claim(self):
+        item_id = self._item()
+        attempt_claim(self.db, item_id, "writing", "writer-1", ttl_minutes=1)
+        old_token = self._get(item_id).claim_token
+        force_release_claim(self.db, item_id)
+        attempt_claim(self.db, item_id, "writing", "writer-1", ttl_minutes=1)
+        before = _utc(self._get(item_id).claim_expires_at)
+
+        self.assertEqual(renew_claims(self.db, {item_id: old_token}, "writer-1", ttl_minutes=10), 0)
+        self.assertEqual(_utc(self._get(item_id).claim_expires_at), before)
+
+    def test_heartbeat_renews_until_the_claim_is_recovered(self):
+        item_id = self._item()
+        attempt_claim(self.db, item_id, "writing", "writer-1", ttl_minutes=0.01)
+        first = _utc(self._get(item_id).claim_expires_at)
+
+        claims = {item_id: self._get(item_id).claim_token}
+        with ClaimHeartbeat(self.db, claims, "writer-1", ttl_minutes=0.01, interval_seconds=0.05) as hb:
+            time.sleep(0.3)
+            self.assertGreater(_utc(self._get(item_id).claim_expires_at), first)
+            self.assertFalse(hb.lost)
+            force_release_claim(self.db, item_id)
+            time.sleep(0.2)
+        self.assertTrue(hb.lost)
+        self.assertGreater(hb.renewals, 1)
+
+
+class TestStaleDetection(_LeaseCase):
+
+    def test_old_but_renewed_claim_is_not_stale(self):
+        item_id = self._item()
+        attempt_claim(self.db, item_id, "writing", "writer-1")
+        item = self._get(item_id)
+        item.claimed_at = datetime.now(timezone.utc) - timedelta(hours=3)
+        self.db.commit()
+        self.assertEqual(find_stale_claims(self.db), [])
+
+    def test_expired_lease_is_stale_within_a_minute(self):
+        item_id = self._item()
+        with patch.object(settings, "claim_ttl_seconds", 60):
+            attempt_claim(self.db, item_id, "writing", "writer-dead")
+        self._expire_lease(item_id)
+
+        recoveries = recover_stale_claims(self.db)
+        self.assertEqual([r["item_id"] for r in recoveries], [str(item_id)])
+        self.assertEqual(recoveries[0]["claim_token"], 1)
+        self.assertIsNone(self._get(item_id).claimed_by)
+
+    def test_claim_without_lease_falls_back_to_claimed_at(self):
+        item_id = self._item(
+            claimed_by="writer-legacy",
+            claim_stage="writing",
+            claimed_at=datetime.now(timezone.utc) - timedelta(minutes=45),
+        )
+        self.assertEqual([i.id for i in find_stale_claims(self.db, max_age_minutes=30)], [item_id])
+        self.assertEqual(find_stale_claims(self.db, max_age_minutes=60), [])
+
+    def test_recovery_skips_a_claim_renewed_after_detection(self):
+        item_id = self._item()
+        attempt_claim(self.db, item_id, "writing", "writer-1")
+        self._expire_lease(item_id)
+        self.assertEqual(len(find_stale_claims(self.db)), 1)
+
+        renew_claims(self.db, {item_id: self._get(item_id).claim_token}, "writer-1")
+        self.assertFalse(force_release_claim(self.db, item_id, stale_only=True))
+        self.assertEqual(self._get(item_id).claimed_by, "writer-1")
+
+    def test_recovery_task_is_registered(self):
+        with patch.object(worker, "_get_db_session", side_effect=Session), \
+                patch.object(worker, "_check_should_run_v6", return_value=True):
+            item_id = self._item()
+            attempt_claim(self.db, item_id, "writing", "writer-dead")
+            self._expire_lease(item_id)
+            self.assertEqual(worker.TASK_REGISTRY["v6_recover_claims"](), 1)
+
+
+class TestFencing(_LeaseCase):
+
+    def _reclaimed(self, worker_id="writer-1"):
+        """An item whose first claim was recovered and claimed again by the same worker id."""
+        item_id = self._item(status=PipelineStatus.review)
+        attempt_claim(self.db, item_id, "review", worker_id)
+        stale_token = self._get(item_id).claim_token
+        self._expire_lease(item_id)
+        recover_stale_claims(self.db)
+        attempt_claim(self.db, item_id, "review", worker_id)
+        return item_id, stale_token
+
+    def test_stale_token_cannot_advance(self):
+        item_id, stale_token = self._reclaimed()
+        with self.assertRaisesRegex(TransitionError, "Claim lost"):
+            advance_item(
+                self.db, item_id, PipelineStatus.review, PipelineStatus.ready_to_publish,
+                worker_id="writer-1", claim_token=stale_token,
+            )
+        item = self._get(item_id)
+        self.assertEqual(item.status, PipelineStatus.review)
+
+        # The current holder's token still works
+        advance_item(
+            self.db, item_id, PipelineStatus.review, PipelineStatus.ready_to_publish,
+            worker_id="writer-1", claim_token=item.claim_token,
+        )
+
+    def test_stale_token_cannot_release_the_new_claim(self):
+        item_id, stale_token = self._reclaimed()
+        self.assertFalse(release_claim(self.db, item_id, "review", claim_token=stale_token))
+        self.assertEqual(self._get(item_id).claimed_by, "writer-1")
+
+    def test_writer_recovered_mid_generation_commits_nothing(self):
+        item_id = self._item()
+        (item,) = claim_batch(self.db, PipelineStatus.todo, "writing", "writer-slow", limit=1)
+
+        def _slow_generate(db, research_context, pillar_override, sub_theme_override):
+            # Meanwhile: the lease runs out, Morgan recovers it and the
+            # item goes back to TODO and on to another writer
+            other = Session()
+            try:
+                row = other.get(ContentPipelineItem, item_id)
+                row.claim_expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+                other.commit()
+                recover_stale_claims(other)
+                advance_item(other, item_id, PipelineStatus.writing, PipelineStatus.todo)
+                attempt_claim(other, item_id, "writing", "writer-fresh")
+            finally:
+                other.close()
+            draft = Draft(
+                pillar_theme=pillar_override,
+                sub_theme="Programmatic buying",
+                format=PostFormat.text,
+                tone=PostTone.educational,
+                content_body="Stale draft",
+            )
+            db.add(draft)
+            db.commit()
+            return SimpleNamespace(success=True, draft=draft, error_message=None)
+
+        with patch.object(writer, "generate_draft", side_effect=_slow_generate), \
+                patch.object(writer, "select_research_context", return_value=("", [])):
+            self.assertFalse(writer.process_one_item(self.db, item, "writer-slow"))
+
+        item = self._get(item_id)
+        self.assertEqual(item.status, PipelineStatus.todo)
+        self.assertEqual(item.claimed_by, "writer-fresh")
+        self.assertIsNone(item.draft_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
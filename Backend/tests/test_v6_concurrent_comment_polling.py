@@ -0,0 +1,268 @@
+"""V6 concurrent comment polling tests.
+
+Covers:
+- Due posts are fetched concurrently (total time ~ one fetch, not the sum)
+- Each post is committed as soon as its fetch completes
+- A rate-limited post is counted without blocking the rest
+- The shared token bucket paces calls and honours 429 Retry-After
+- LinkedIn fetches reuse one pooled client
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_comment_polling_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.models import Base, Comment, PostFormat, PostTone, PublishedPost
+from app.services import engagement, linkedin
+from app.services.linkedin import LinkedInComment, LinkedInRateLimitError, TokenBucket
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+FETCH_LATENCY = 0.2
+
+
+def _seed_posts(db, count):
+    db.query(Comment).delete()
+    db.query(PublishedPost).delete()
+    now = datetime.now(timezone.utc)
+    ids = []
+    for i in range(count):
+        post = PublishedPost(
+            draft_id=uuid.uuid4(),
+            linkedin_post_id=f"urn:li:share:{i}",
+            published_at=now - timedelta(minutes=30),
+            comment_monitoring_until=now + timedelta(hours=47),
+            content_body=f"Post {i}",
+            format=PostFormat.text,
+            tone=PostTone.educational,
+        )
+        db.add(post)
+        ids.append(post.linkedin_post_id)
+    db.commit()
+    return ids
+
+
+def _comment(post_id, n=0):
+    return LinkedInComment(
+        linkedin_comment_id=f"{post_id}-c{n}",
+        commenter_name="Reader",
+        comment_text="Useful breakdown of the auction mechanics.",
+    )
+
+
+class _PollingCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        overrides = {
+            "linkedin_api_mode": "api",
+            "linkedin_api_token": "token",
+            "linkedin_poll_concurrency": 8,
+            "llm_mock_mode": True,
+            "comment_replies_enabled": False,
+        }
+        for name, value in overrides.items():
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.db.close()
+
+
+class TestConcurrentPolling(_PollingCase):
+
+    def test_posts_are_fetched_concurrently(self):
+        post_ids = _seed_posts(self.db, 8)
+        in_flight = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def _fetch(linkedin_post_id, since_minutes=15, **kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(FETCH_LATENCY)
+            with lock:
+                in_flight["now"] -= 1
+            return [_comment(linkedin_post_id)]
+
+        started = time.perf_counter()
+        with patch.object(engagement, "fetch_recent_comments_for_post", side_effect=_fetch):
+            result = engagement.poll_and_store_comments(self.db)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(result["processed_posts"], 8)
+        self.assertEqual(result["new_comments"], 8)
+        self.assertEqual(in_flight["peak"], 8)
+        self.assertLess(elapsed, FETCH_LATENCY * len(post_ids) / 2)
+        self.assertEqual(self.db.query(Comment).count(), 8)
+        self.assertEqual(
+            self.db.query(PublishedPost).filter(PublishedPost.last_comment_poll_at.is_(None)).count(),
+            0,
+        )
+
+    def test_concurrency_cap_is_respected(self):
+        _seed_posts(self.db, 6)
+        in_flight = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def _fetch(linkedin_post_id, since_minutes=15, **kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            return []
+
+        with patch.object(settings, "linkedin_poll_concurrency", 2), \
+                patch.object(engagement, "fetch_recent_comments_for_post", side_effect=_fetch):
+            engagement.poll_and_store_comments(self.db)
+
+        self.assertEqual(in_flight["peak"], 2)
+
+    def test_slow_post_does_not_delay_other_commits(self):
+        _seed_posts(self.db, 3)
+        seen_while_slow = []
+
+        def _fetch(linkedin_post_id, since_minutes=15, **kwargs):
+            if linkedin_post_id != "urn:li:share:0":
+                return [_comment(linkedin_post_id)]
+            # Wait until the other posts' comments are committed.
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                with Session() as other:
+                    count = other.query(Comment).count()
+                if count == 2:
+                    break
+                time.sleep(0.02)
+            seen_while_slow.append(count)
+            return [_comment(linkedin_post_id)]
+
+        with patch.object(engagement, "fetch_recent_comments_for_post", side_effect=_fetch):
+            result = engagement.poll_and_store_comments(self.db)
+
+        self.assertEqual(seen_while_slow, [2])
+        self.assertEqual(result["new_comments"], 3)
+
+    def test_rate_limited_post_is_counted_and_others_stored(self):
+        _seed_posts(self.db, 4)
+
+        def _fetch(linkedin_post_id, since_minutes=15, **kwargs):
+            if linkedin_post_id == "urn:li:share:1":
+                raise LinkedInRateLimitError("LinkedIn rate limit reached")
+            return [_comment(linkedin_post_id)]
+
+        with patch.object(engagement, "fetch_recent_comments_for_post", side_effect=_fetch):
+            result = engagement.poll_and_store_comments(self.db)
+
+        self.assertEqual(result["errors"], 1)
+        self.assertEqual(result["rate_limited"], 1)
+        self.assertEqual(result["new_comments"], 3)
+
+    def test_repeat_poll_skips_existing_comments(self):
+        _seed_posts(self.db, 2)
+        fetch = lambda linkedin_post_id, since_minutes=15, **kwargs: [_comment(linkedin_post_id)]  # noqa: E731
+
+        with patch.object(engagement, "fetch_recent_comments_for_post", side_effect=fetch):
+            engagement.poll_and_store_comments(self.db)
+            self.db.query(PublishedPost).update({PublishedPost.last_comment_poll_at: None})
+            self.db.commit()
+            second = engagement.poll_and_store_comments(self.db)
+
+        self.assertEqual(second["new_comments"], 0)
+        self.assertEqual(self.db.query(Comment).count(), 2)
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_then_paced(self):
+        bucket = TokenBucket(rate_per_second=20, burst=3)
+        started = time.perf_counter()
+        for _ in range(5):
+            bucket.acquire()
+        elapsed = time.perf_counter() - started
+        # 3 immediate tokens, then 2 more at 20/s
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 0.5)
+
+    def test_pause_blocks_every_caller(self):
+        bucket = TokenBucket(rate_per_second=100, burst=10)
+        bucket.pause(0.2)
+        started = time.perf_counter()
+        bucket.acquire()
+        self.assertGreaterEqual(time.perf_counter() - started, 0.19)
+
+    def test_long_pause_fails_fast(self):
+        bucket = TokenBucket(rate_per_second=100, burst=10)
+        bucket.pause(60)
+        started = time.perf_counter()
+        with self.assertRaises(LinkedInRateLimitError):
+            bucket.acquire(max_wait=0.1)
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+
+class TestSharedClient(unittest.TestCase):
+
+    def setUp(self):
+        for name, value in (("linkedin_api_mode", "api"), ("linkedin_api_token", "token"),
+                            ("linkedin_mock_comments_json", "")):
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_rate_limit_response_pauses_shared_bucket(self):
+        bucket = TokenBucket(rate_per_second=100, burst=10)
+        client = httpx.Client(transport=httpx.MockTransport(
+            lambda request: httpx.Response(429, headers={"retry-after": "30"})
+        ))
+        with patch.object(linkedin, "get_linkedin_rate_limiter", return_value=bucket):
+            with self.assertRaises(LinkedInRateLimitError):
+                linkedin.fetch_recent_comments_for_post("post-429", _client=client)
+            # Other callers now back off instead of hitting the API.
+            with self.assertRaises(LinkedInRateLimitError):
+                bucket.acquire(max_wait=0.05)
+
+    def test_fetches_reuse_one_pooled_client(self):
+        calls = []
+        pooled = httpx.Client(transport=httpx.MockTransport(
+            lambda request: calls.append(request) or httpx.Response(200, json={"elements": []})
+        ))
+        with patch.object(linkedin, "get_linkedin_client", return_value=pooled) as factory:
+            linkedin.fetch_recent_comments_for_post("post-a")
+            linkedin.fetch_recent_comments_for_post("post-b")
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(factory.call_count, 2)
+        self.assertFalse(pooled.is_closed)
+
+    def test_get_linkedin_client_is_a_singleton(self):
+        self.assertIs(linkedin.get_linkedin_client(), linkedin.get_linkedin_client())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,235 @@
+"""V6 Editor batch review tests.
+
+Covers:
+- run_editor_batch reaches the same outcomes as the per-item loop
+- Drafts load with one IN query; all outcomes apply in one UPDATE and commit
+- Items whose claim was lost mid-review are left untouched
+- Items without a draft are released unchanged
+- The process-pool path returns the same verdicts as in-process review
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_editor_batch_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models import (
+    Base,
+    ContentPipelineItem,
+    Draft,
+    DraftStatus,
+    PipelineStatus,
+    PostFormat,
+    PostTone,
+)
+from app.services.agents import editor
+from app.services.agents.editor import review_batch, run_editor_batch
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+GOOD_POST = (
+    "In my experience, programmatic advertising in African markets has matured over the past decade. "
+    "Media buyers now evaluate several supply paths in real time, and AI bidding agents help them "
+    "identify the inventory sources that actually perform before spend is committed.\n\n"
+    "Measurement and attribution remain the hardest part of the conversation with finance teams.\n\n"
+    "#Adtech #AI"
+)
+BAD_POST = (
+    "Today I made a delicious pasta recipe with fresh tomatoes and basil. "
+    "The secret is to use slow roasted garlic and a pinch of sea salt."
+)
+
+
+class _BatchCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(ContentPipelineItem).delete()
+        self.db.query(Draft).delete()
+        self.db.commit()
+        self._created = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _item(self, content, revision_count=0, with_draft=True):
+        draft_id = None
+        if with_draft:
+            draft = Draft(
+                pillar_theme="Adtech fundamentals",
+                sub_theme="Programmatic buying",
+                format=PostFormat.text,
+                tone=PostTone.educational,
+                content_body=content,
+                status=DraftStatus.pending,
+            )
+            self.db.add(draft)
+            self.db.flush()
+            draft_id = draft.id
+        self._created += timedelta(seconds=1)
+        item = ContentPipelineItem(
+            status=PipelineStatus.review,
+            pillar_theme="Adtech fundamentals",
+            draft_id=draft_id,
+            revision_count=revision_count,
+            created_at=self._created,
+        )
+        self.db.add(item)
+        self.db.commit()
+        return item.id
+
+    def _get(self, item_id):
+        self.db.expire_all()
+        return self.db.get(ContentPipelineItem, item_id)
+
+
+class TestRunEditorBatch(_BatchCase):
+
+    def test_outcomes_match_per_item_semantics(self):
+        good = self._item(GOOD_POST)
+        bad = self._item(BAD_POST)
+        last_chance = self._item(BAD_POST, revision_count=2)
+
+        self.assertEqual(run_editor_batch(self.db, max_items=10, processes=0), 1)
+
+        item = self._get(good)
+        self.assertEqual(item.status, PipelineStatus.ready_to_publish)
+        self.assertEqual(item.fact_check_status, "passed")
+        self.assertEqual(item.quality_score, 1.0)
+
+        item = self._get(bad)
+        self.assertEqual(item.status, PipelineStatus.todo)
+        self.assertEqual(item.revision_count, 1)
+        self.assertEqual(item.fact_check_status, "failed")
+        self.assertIn("topical_relevance", item.last_error)
+
+        item = self._get(last_chance)
+        self.assertEqual(item.status, PipelineStatus.backlog)
+        self.assertEqual(item.revision_count, 3)
+
+        for item_id in (good, bad, last_chance):
+            item = self._get(item_id)
+            self.assertIsNone(item.claimed_by)
+            self.assertIsNone(item.claim_stage)
+
+    def test_one_draft_query_one_update_two_commits(self):
+        for n in range(6):
+            self._item(GOOD_POST if n % 2 else BAD_POST)
+        statements, commits = [], []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement.lstrip().split(" ")[0], executemany, statement))
+
+        def _commit(conn):
+            commits.append(1)
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        event.listen(engine, "commit", _commit)
+        try:
+            run_editor_batch(self.db, max_items=10, processes=0)
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+            event.remove(engine, "commit", _commit)
+
+        selects = [s for kind, _, s in statements if kind == "SELECT"]
+        updates = [(many, s) for kind, many, s in statements if kind == "UPDATE"]
+        self.assertEqual(len(selects), 1)
+        self.assertIn(" IN ", selects[0])
+        self.assertIn("drafts", selects[0])
+        # claim_batch's UPDATE ... RETURNING, then one executemany for every outcome
+        self.assertEqual(len(updates), 2)
+        self.assertTrue(updates[1][0])
+        self.assertEqual(len(commits), 2)
+
+    def test_item_whose_claim_was_lost_is_untouched(self):
+        kept = self._item(BAD_POST)
+        stolen = self._item(BAD_POST)
+        real_review = editor.review_batch
+
+        def _review_then_steal(jobs, processes=None, ctx=None):
+            other = Session()
+            other.query(ContentPipelineItem).filter_by(id=stolen).update({"claimed_by": "morgan-recovered"})
+            other.commit()
+            other.close()
+            return real_review(jobs, processes=processes, ctx=ctx)
+
+        with patch.object(editor, "review_batch", side_effect=_review_then_steal):
+            run_editor_batch(self.db, max_items=10, processes=0)
+
+        self.assertEqual(self._get(kept).status, PipelineStatus.todo)
+        item = self._get(stolen)
+        self.assertEqual(item.status, PipelineStatus.review)
+        self.assertEqual(item.revision_count, 0)
+        self.assertEqual(item.claimed_by, "morgan-recovered")
+
+    def test_lost_claim_is_not_counted_or_handed_off(self):
+        kept = self._item(GOOD_POST)
+        stolen = self._item(GOOD_POST)
+        real_review = editor.review_batch
+
+        def _review_then_steal(jobs, processes=None, ctx=None):
+            other = Session()
+            other.query(ContentPipelineItem).filter_by(id=stolen).update({"claimed_by": "morgan-recovered"})
+            other.commit()
+            other.close()
+            return real_review(jobs, processes=processes, ctx=ctx)
+
+        with patch.object(editor, "review_batch", side_effect=_review_then_steal), \
+                patch.object(editor, "on_transition") as handoff:
+            passed = run_editor_batch(self.db, max_items=10, processes=0)
+
+        self.assertEqual(passed, 1)
+        self.assertEqual([call.args[0] for call in handoff.call_args_list], [kept])
+        self.assertEqual(self._get(stolen).status, PipelineStatus.review)
+
+    def test_item_without_draft_is_released_unchanged(self):
+        orphan = self._item("", with_draft=False)
+        self.assertEqual(run_editor_batch(self.db, max_items=10, processes=0), 0)
+
+        item = self._get(orphan)
+        self.assertEqual(item.status, PipelineStatus.review)
+        self.assertEqual(item.revision_count, 0)
+        self.assertIsNone(item.claimed_by)
+
+    def test_no_review_items_returns_zero(self):
+        self.assertEqual(run_editor_batch(self.db, processes=0), 0)
+
+
+class TestReviewBatch(unittest.TestCase):
+
+    def test_process_pool_matches_in_process_review(self):
+        jobs = [
+            (content, ContentPipelineItem(id=uuid.uuid4(), pillar_theme="Adtech fundamentals"))
+            for content in (GOOD_POST, BAD_POST, GOOD_POST + " https://example.com", BAD_POST)
+        ]
+        in_process = review_batch(jobs, processes=0)
+        pooled = review_batch(jobs, processes=2)
+
+        self.assertEqual(
+            [(v.passed, v.quality_score, v.failure_summary) for v in pooled],
+            [(v.passed, v.quality_score, v.failure_summary) for v in in_process],
+        )
+        self.assertEqual([v.passed for v in pooled], [True, False, False, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
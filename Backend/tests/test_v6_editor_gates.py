@@ -0,0 +1,156 @@
+"""V6 Editor gate registry tests.
+
+Covers:
+- Every registered gate reports under its registry name, in registry order
+- Short-circuit mode stops at the first cheap failure and skips the rest
+- Full-report mode still runs and reports every gate
+- Cheap gates run before expensive ones; expensive gates run concurrently
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.config import settings
+from app.services.agents import editor
+from app.services.agents.editor import (
+    EDITOR_GATES,
+    EXPENSIVE_GATE_COST,
+    EditorGate,
+    GateResult,
+    review_content,
+)
+from app.services.product_context import ProductContext
+
+CTX = ProductContext(title="Head of Sales", experience_markers=["In my experience..."])
+
+GOOD_POST = (
+    "In my experience, programmatic advertising in African markets has matured over the past decade. "
+    "Media buyers now evaluate several supply paths in real time, and AI bidding agents help them "
+    "identify the inventory sources that actually perform before spend is committed.\n\n"
+    "Measurement and attribution remain the hardest part of the conversation with finance teams.\n\n"
+    "#Adtech #AI"
+)
+URL_POST = GOOD_POST + " Read more at https://example.com"
+
+
+def _fake_gate(name, cost, passed=True, delay=0.0, log=None):
+    def _check(gate_input):
+        if log is not None:
+            log.append(("start", name, time.perf_counter()))
+        time.sleep(delay)
+        if log is not None:
+            log.append(("end", name, time.perf_counter()))
+        return GateResult(gate_name=name, passed=passed, message="" if passed else f"{name} failed")
+
+    return EditorGate(name, cost, _check)
+
+
+class TestGateRegistry(unittest.TestCase):
+
+    def test_registry_names_match_reported_gates(self):
+        verdict = review_content(GOOD_POST, MagicMock(), CTX, mode="full")
+        self.assertEqual(
+            [g.gate_name for g in verdict.gate_results],
+            [gate.name for gate in EDITOR_GATES],
+        )
+        self.assertEqual(len(verdict.gate_results), 7)
+
+    def test_readability_is_the_expensive_gate(self):
+        expensive = [gate.name for gate in EDITOR_GATES if gate.expensive]
+        self.assertEqual(expensive, ["readability"])
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            review_content(GOOD_POST, MagicMock(), CTX, mode="fastest")
+
+
+class TestShortCircuit(unittest.TestCase):
+
+    def test_stops_at_first_cheap_failure_without_readability(self):
+        with patch.object(editor, "_check_readability") as readability:
+            verdict = review_content(URL_POST, MagicMock(), CTX, mode="short_circuit")
+
+        readability.assert_not_called()
+        self.assertFalse(verdict.passed)
+        self.assertTrue(verdict.short_circuited)
+        self.assertEqual(len(verdict.failed_gates), 1)
+        skipped = [g.gate_name for g in verdict.gate_results if g.skipped]
+        self.assertIn("readability", skipped)
+        self.assertNotIn("skipped", verdict.failure_summary)
+
+    def test_full_mode_reports_every_failure(self):
+        verdict = review_content(URL_POST, MagicMock(), CTX, mode="full")
+
+        self.assertFalse(verdict.short_circuited)
+        self.assertFalse(any(g.skipped for g in verdict.gate_results))
+        failed = {g.gate_name for g in verdict.failed_gates}
+        self.assertTrue({"guardrails", "no_external_urls"} <= failed)
+
+    def test_mode_defaults_to_setting(self):
+        with patch.object(settings, "editor_review_mode", "short_circuit"):
+            verdict = review_content(URL_POST, MagicMock(), CTX)
+        self.assertTrue(verdict.short_circuited)
+
+    def test_passing_content_runs_every_gate_in_either_mode(self):
+        for mode in ("full", "short_circuit"):
+            verdict = review_content(GOOD_POST, MagicMock(), CTX, mode=mode)
+            self.assertFalse(any(g.skipped for g in verdict.gate_results), mode)
+
+
+class TestExecutionOrder(unittest.TestCase):
+
+    def test_cheap_gates_run_before_expensive_in_short_circuit_mode(self):
+        log = []
+        gates = [
+            _fake_gate("slow", EXPENSIVE_GATE_COST, log=log),
+            _fake_gate("regex", 2, log=log),
+            _fake_gate("scan", 1, log=log),
+        ]
+        with patch.object(editor, "EDITOR_GATES", gates):
+            verdict = review_content(GOOD_POST, MagicMock(), CTX, mode="short_circuit")
+
+        started = [name for event, name, _ in log if event == "start"]
+        self.assertEqual(started, ["scan", "regex", "slow"])
+        self.assertEqual([g.gate_name for g in verdict.gate_results], ["slow", "regex", "scan"])
+
+    def test_expensive_gates_run_concurrently(self):
+        gates = [_fake_gate(f"slow-{i}", EXPENSIVE_GATE_COST, delay=0.2) for i in range(3)]
+        gates.append(_fake_gate("scan", 1))
+        with patch.object(editor, "EDITOR_GATES", gates):
+            started = time.perf_counter()
+            verdict = review_content(GOOD_POST, MagicMock(), CTX, mode="full")
+            elapsed = time.perf_counter() - started
+
+        self.assertTrue(verdict.passed)
+        self.assertLess(elapsed, 0.45)
+
+    def test_full_mode_overlaps_expensive_with_cheap_gates(self):
+        seen_threads = set()
+        lock = threading.Lock()
+
+        def _record(name, cost):
+            def _check(gate_input):
+                with lock:
+                    seen_threads.add((name, threading.current_thread() is threading.main_thread()))
+                return GateResult(gate_name=name, passed=True)
+            return EditorGate(name, cost, _check)
+
+        with patch.object(editor, "EDITOR_GATES", [_record("slow", EXPENSIVE_GATE_COST), _record("scan", 1)]):
+            review_content(GOOD_POST, MagicMock(), CTX, mode="full")
+
+        self.assertIn(("scan", True), seen_threads)
+        self.assertIn(("slow", False), seen_threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
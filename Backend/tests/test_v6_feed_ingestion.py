@@ -0,0 +1,185 @@
+"""V6 concurrent research feed ingestion tests.
+
+Covers:
+- Feeds are downloaded concurrently (runtime ~ slowest feed, not the sum)
+- ETag / Last-Modified are stored and sent back as conditional headers
+- 304 responses are not parsed and create nothing
+- Per-feed status, latency and bytes are recorded; one failing feed does not stop the rest
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_feed_ingestion_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.models import Base, FeedState, SourceMaterial
+from app.services import feed_fetcher, research_ingestion
+from app.services.research_ingestion import ingest_feeds
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+FETCH_LATENCY = 0.2
+
+
+def _rss(name, count=2):
+    items = "".join(
+        f"<item><title>{name} programmatic story {n}</title>"
+        f"<link>https://{name}.example.com/{n}</link>"
+        f"<description>Attribution and measurement notes {n}.</description></item>"
+        for n in range(count)
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel>'
+        f"<title>{name.title()} News</title>{items}</channel></rss>"
+    ).encode()
+
+
+class _FeedServer:
+    """MockTransport serving RSS with ETag/Last-Modified validators."""
+
+    def __init__(self, latency=0.0, failing=()):
+        self.latency = latency
+        self.failing = set(failing)
+        self.requests: list[httpx.Request] = []
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            name = request.url.host.split(".")[0]
+            if name in self.failing:
+                return httpx.Response(503)
+            etag = f'"{name}-v1"'
+            if request.headers.get("if-none-match") == etag:
+                return httpx.Response(304, headers={"etag": etag})
+            return httpx.Response(
+                200,
+                content=_rss(name),
+                headers={
+                    "content-type": "application/rss+xml",
+                    "etag": etag,
+                    "last-modified": "Fri, 16 Oct 2026 08:00:00 GMT",
+                },
+            )
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+FEEDS = [f"https://{name}.example.com/feed" for name in ("alpha", "beta", "gamma", "delta")]
+
+
+class TestFeedIngestion(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(SourceMaterial).delete()
+        self.db.query(FeedState).delete()
+        self.db.commit()
+        for name, value in (("llm_api_key", None), ("research_feed_concurrency", 8)):
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _ingest(self, server, feeds=FEEDS):
+        client = httpx.Client(transport=httpx.MockTransport(server))
+        with patch.object(feed_fetcher, "get_feed_client", return_value=client):
+            return ingest_feeds(self.db, feed_urls=feeds, max_items_per_feed=10)
+
+    def test_feeds_are_fetched_concurrently(self):
+        server = _FeedServer(latency=FETCH_LATENCY)
+        started = time.perf_counter()
+        created = self._ingest(server)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(created, 8)
+        self.assertEqual(server.peak, len(FEEDS))
+        self.assertLess(elapsed, FETCH_LATENCY * len(FEEDS) / 2)
+        names = {row.source_name for row in self.db.query(SourceMaterial).all()}
+        self.assertEqual(names, {"Alpha News", "Beta News", "Gamma News", "Delta News"})
+
+    def test_validators_are_stored_and_sent_back(self):
+        server = _FeedServer()
+        self._ingest(server)
+
+        state = self.db.get(FeedState, FEEDS[0])
+        self.assertEqual(state.etag, '"alpha-v1"')
+        self.assertEqual(state.last_modified, "Fri, 16 Oct 2026 08:00:00 GMT")
+        self.assertEqual(state.last_status, 200)
+        self.assertGreater(state.last_bytes, 0)
+        self.assertIsNotNone(state.last_latency_ms)
+
+        server.requests.clear()
+        self._ingest(server)
+        sent = {str(r.url): r.headers for r in server.requests}
+        self.assertEqual(sent[FEEDS[0]]["if-none-match"], '"alpha-v1"')
+        self.assertEqual(sent[FEEDS[0]]["if-modified-since"], "Fri, 16 Oct 2026 08:00:00 GMT")
+
+    def test_not_modified_feeds_are_not_parsed(self):
+        server = _FeedServer()
+        self._ingest(server)
+
+        with patch.object(research_ingestion.feedparser, "parse") as parse:
+            created = self._ingest(server)
+
+        self.assertEqual(created, 0)
+        parse.assert_not_called()
+        self.db.expire_all()
+        state = self.db.get(FeedState, FEEDS[1])
+        self.assertEqual(state.last_status, 304)
+        self.assertEqual(state.etag, '"beta-v1"')
+
+    def test_failing_feed_is_recorded_and_others_ingested(self):
+        server = _FeedServer(failing={"gamma"})
+        created = self._ingest(server)
+
+        self.assertEqual(created, 6)
+        state = self.db.get(FeedState, FEEDS[2])
+        self.assertEqual(state.last_status, 503)
+        self.assertEqual(state.last_error, "HTTP 503")
+        self.assertIsNone(state.etag)
+
+    def test_network_error_is_recorded(self):
+        def _refuse(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        created = self._ingest(_refuse, feeds=FEEDS[:1])
+
+        self.assertEqual(created, 0)
+        state = self.db.get(FeedState, FEEDS[0])
+        self.assertIsNone(state.last_status)
+        self.assertIn("ConnectError", state.last_error)
+
+
+if __name__ == "__main__":
+    unittest.main()
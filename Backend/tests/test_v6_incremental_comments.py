@@ -0,0 +1,256 @@
+"""V6 incremental comment fetching tests.
+
+Covers:
+- Pagination stops at the page that reaches the per-post cursor
+- Oldest-first pages are read in full and filtered by the cursor
+- Comments sharing the cursor's timestamp are compared on (created_at, id)
+- The poller persists the cursor and passes it on the next poll, and only
+  advances it once the comments are stored
+- Existence checks are one bulk IN query per page, not one per comment
+- comments.linkedin_comment_id is unique
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_incremental_comments_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.models import Base, Comment, PostFormat, PostTone, PublishedPost
+from app.services import engagement, linkedin
+from app.services.linkedin import LinkedInComment, fetch_recent_comments_for_post
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+T0 = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _row(n):
+    """Comment n was created n minutes after T0."""
+    return {
+        "id": f"c{n}",
+        "actor": {"name": f"Reader {n}"},
+        "message": f"Comment {n}",
+        "created": {"time": int((T0 + timedelta(minutes=n)).timestamp() * 1000)},
+    }
+
+
+class _PagedApi:
+    """MockTransport serving comment pages and counting requests."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        index = int(request.url.params["start"]) // 2
+        self.requests += 1
+        body = {"elements": self.pages[index]}
+        if index + 1 < len(self.pages):
+            body["paging"] = {"nextStart": (index + 1) * 2}
+        return httpx.Response(200, json=body)
+
+
+class _ApiCase(unittest.TestCase):
+
+    def setUp(self):
+        overrides = {
+            "linkedin_api_mode": "api",
+            "linkedin_api_token": "token",
+            "linkedin_mock_comments_json": "",
+            "linkedin_api_page_size": 2,
+        }
+        for name, value in overrides.items():
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _fetch(self, pages, **cursor):
+        api = _PagedApi(pages)
+        client = httpx.Client(transport=httpx.MockTransport(api))
+        comments = fetch_recent_comments_for_post("urn:li:share:1", _client=client, **cursor)
+        return [c.linkedin_comment_id for c in comments], api.requests
+
+
+class TestFetchWithCursor(_ApiCase):
+
+    NEWEST_FIRST = [[_row(9), _row(8)], [_row(7), _row(6)], [_row(5), _row(4)], [_row(3), _row(2)]]
+
+    def test_without_cursor_reads_every_page(self):
+        ids, requests = self._fetch(self.NEWEST_FIRST)
+        self.assertEqual(ids, ["c9", "c8", "c7", "c6", "c5", "c4", "c3", "c2"])
+        self.assertEqual(requests, 4)
+
+    def test_stops_at_page_reaching_timestamp_cursor(self):
+        ids, requests = self._fetch(self.NEWEST_FIRST, cursor_at=T0 + timedelta(minutes=6))
+        self.assertEqual(ids, ["c9", "c8", "c7"])
+        self.assertEqual(requests, 2)
+
+    def test_stops_at_cursor_id_without_timestamps(self):
+        pages = [[{k: v for k, v in _row(n).items() if k != "created"} for n in page_ns]
+                 for page_ns in ((9, 8), (7, 6), (5, 4))]
+        ids, requests = self._fetch(pages, cursor_id="c8")
+        self.assertEqual(ids, ["c9"])
+        self.assertEqual(requests, 1)
+
+    def test_nothing_new_costs_one_request(self):
+        ids, requests = self._fetch(self.NEWEST_FIRST, cursor_at=T0 + timedelta(minutes=9), cursor_id="c9")
+        self.assertEqual(ids, [])
+        self.assertEqual(requests, 1)
+
+    def test_oldest_first_pages_are_filtered_not_truncated(self):
+        oldest_first = [list(reversed(page)) for page in reversed(self.NEWEST_FIRST)]
+        ids, requests = self._fetch(oldest_first, cursor_at=T0 + timedelta(minutes=6))
+        self.assertEqual(ids, ["c7", "c8", "c9"])
+        self.assertEqual(requests, 4)
+
+    def test_same_timestamp_past_the_cursor_id_is_kept(self):
+        tied = [dict(_row(5), id=cid) for cid in ("c5-b", "c5-a")]
+        ids, _ = self._fetch([[_row(6), *tied], [_row(4)]], cursor_at=T0 + timedelta(minutes=5), cursor_id="c5-a")
+        self.assertEqual(ids, ["c6", "c5-b"])
+
+        newest = linkedin.newest_comment([linkedin._parse_comment_item(row) for row in tied])
+        self.assertEqual(newest.linkedin_comment_id, "c5-b")
+
+    def test_parses_comment_timestamps(self):
+        comment = linkedin._parse_comment_item(_row(5))
+        self.assertEqual(comment.created_at, T0 + timedelta(minutes=5))
+        iso = linkedin._parse_comment_item({"id": "x", "created_at": "2026-10-01T12:05:00Z"})
+        self.assertEqual(iso.created_at, T0 + timedelta(minutes=5))
+
+
+class TestPollerCursor(_ApiCase):
+
+    def setUp(self):
+        super().setUp()
+        for name, value in (("llm_mock_mode", True), ("linkedin_poll_concurrency", 2)):
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.db = Session()
+        self.db.query(Comment).delete()
+        self.db.query(PublishedPost).delete()
+        now = datetime.now(timezone.utc)
+        self.post = PublishedPost(
+            draft_id=uuid.uuid4(),
+            linkedin_post_id="urn:li:share:1",
+            published_at=now - timedelta(minutes=30),
+            comment_monitoring_until=now + timedelta(hours=47),
+            content_body="Post",
+            format=PostFormat.text,
+            tone=PostTone.educational,
+        )
+        self.db.add(self.post)
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    def _comments(self, *ns):
+        return [
+            LinkedInComment(
+                linkedin_comment_id=f"c{n}",
+                commenter_name="Reader",
+                comment_text="Good read on attribution windows.",
+                created_at=T0 + timedelta(minutes=n),
+            )
+            for n in ns
+        ]
+
+    def _poll(self, returned):
+        calls = []
+
+        def _fetch(linkedin_post_id, since_minutes=15, **cursor):
+            calls.append(cursor)
+            return returned
+
+        self.db.query(PublishedPost).update({PublishedPost.last_comment_poll_at: None})
+        self.db.commit()
+        with patch.object(engagement, "fetch_recent_comments_for_post", side_effect=_fetch):
+            result = engagement.poll_and_store_comments(self.db)
+        return result, calls[0]
+
+    def test_cursor_is_persisted_and_passed_back(self):
+        result, first_cursor = self._poll(self._comments(3, 2, 1))
+        self.assertEqual(first_cursor, {"cursor_at": None, "cursor_id": None})
+        self.assertEqual(result["new_comments"], 3)
+
+        self.db.refresh(self.post)
+        self.assertEqual(self.post.comment_cursor_id, "c3")
+
+        _, second_cursor = self._poll([])
+        self.assertEqual(second_cursor["cursor_id"], "c3")
+        self.assertEqual(second_cursor["cursor_at"], T0 + timedelta(minutes=3))
+
+        # An empty poll keeps the existing cursor.
+        self.db.refresh(self.post)
+        self.assertEqual(self.post.comment_cursor_id, "c3")
+
+    def test_failed_store_keeps_the_cursor(self):
+        self._poll(self._comments(1))
+        with patch.object(engagement, "_store_post_comments", side_effect=RuntimeError("db down")):
+            result, _ = self._poll(self._comments(3, 2))
+        self.assertEqual(result["errors"], 1)
+        self.db.refresh(self.post)
+        self.assertEqual(self.post.comment_cursor_id, "c1")
+
+        # The next poll still sees (and stores) the comments that failed
+        _, cursor = self._poll(self._comments(3, 2))
+        self.assertEqual(cursor["cursor_id"], "c1")
+        self.assertEqual(self.db.query(Comment).count(), 3)
+
+    def test_existence_check_is_one_query_per_page(self):
+        self._poll(self._comments(1))
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().startswith("SELECT comments.linkedin_comment_id \nFROM"):
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            result, _ = self._poll(self._comments(6, 5, 4, 3, 2, 1))
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+        self.assertEqual(result["new_comments"], 5)
+        # 6 comments at page size 2 -> 3 bulk lookups
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(all(" IN " in s for s in statements))
+
+    def test_linkedin_comment_id_is_unique(self):
+        for _ in range(2):
+            self.db.add(Comment(
+                published_post_id=self.post.id,
+                linkedin_comment_id="dup",
+                commenter_name="Reader",
+                comment_text="x",
+            ))
+        with self.assertRaises(IntegrityError):
+            self.db.commit()
+        self.db.rollback()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,298 @@
+"""V6 keyset pagination tests for the list endpoints.
+
+Covers:
+- Walking /drafts page by page returns every row once, ties on
+  created_at broken by id, with X-Next-Cursor absent on the last page
+- Page size caps and malformed cursors are rejected
+- Server-side filters on /drafts, /posts, /comments, /sources and
+  /pipeline/items
+- Each page is one indexed statement
+- /reports/summary counts posts, comments, drafts and sources in SQL
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_list_pagination_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db import get_db
+from app.main import app
+from app.models import (
+    Base,
+    Comment,
+    ContentPipelineItem,
+    Draft,
+    DraftStatus,
+    PipelineStatus,
+    PostFormat,
+    PostTone,
+    PublishedPost,
+    SourceMaterial,
+)
+from app.query_stats import query_budget
+from app.services.pagination import MAX_PAGE_SIZE, decode_cursor, encode_cursor, keyset_page
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+NOW = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _override_get_db():
+    db = Session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class _PagingCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        app.dependency_overrides[get_db] = _override_get_db
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        app.dependency_overrides.pop(get_db, None)
+
+    def setUp(self):
+        self.db = Session()
+        for model in (Comment, PublishedPost, ContentPipelineItem, Draft, SourceMaterial):
+            self.db.query(model).delete()
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    def _drafts(self, count, *, minutes_apart=1, **fields):
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "created_at": NOW - timedelta(minutes=n * minutes_apart),
+                "pillar_theme": "Adtech fundamentals",
+                "sub_theme": "Programmatic buying",
+                "format": PostFormat.text,
+                "tone": PostTone.educational,
+                "content_body": "Body",
+                "status": DraftStatus.pending,
+                "guardrail_check_passed": True,
+                **fields,
+            }
+            for n in range(count)
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(Draft), rows)
+        return [row["id"] for row in rows]
+
+    def _walk(self, path, limit):
+        """Follow X-Next-Cursor to the end; return the ids and page count."""
+        ids, pages, cursor = [], 0, None
+        while True:
+            sep = "&" if "?" in path else "?"
+            url = f"{path}{sep}limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+            resp = self.client.get(url)
+            self.assertEqual(resp.status_code, 200, resp.text)
+            ids.extend(row["id"] for row in resp.json())
+            pages += 1
+            cursor = resp.headers.get("x-next-cursor")
+            if not cursor:
+                return ids, pages
+
+
+class TestKeysetWalk(_PagingCase):
+
+    def test_walk_returns_every_row_once_newest_first(self):
+        self._drafts(7)
+        # Same created_at: order falls back to id
+        tied = self._drafts(5, minutes_apart=0)
+
+        ids, pages = self._walk("/drafts", limit=3)
+
+        self.assertEqual(pages, 4)
+        self.assertEqual(len(ids), 12)
+        self.assertEqual(len(set(ids)), 12)
+        tied_in_order = [i for i in ids if uuid.UUID(i) in tied]
+        self.assertEqual(tied_in_order, sorted(tied_in_order, reverse=True))
+
+    def test_exact_multiple_has_no_trailing_empty_page(self):
+        self._drafts(4)
+        ids, pages = self._walk("/drafts", limit=2)
+        self.assertEqual((len(ids), pages), (4, 2))
+
+    def test_each_page_is_one_statement(self):
+        self._drafts(10)
+        first = self.client.get("/drafts?limit=4")
+        with query_budget(1, engine):
+            resp = self.client.get(f"/drafts?limit=4&cursor={first.headers['x-next-cursor']}")
+        self.assertEqual(len(resp.json()), 4)
+
+    def test_caps_and_bad_cursors(self):
+        self.assertEqual(self.client.get(f"/drafts?limit={MAX_PAGE_SIZE + 1}").status_code, 422)
+        self.assertEqual(self.client.get("/drafts?limit=0").status_code, 422)
+        self.assertEqual(self.client.get("/drafts?cursor=not-a-cursor").status_code, 400)
+
+    def test_cursor_round_trip(self):
+        row_id = uuid.uuid4()
+        self.assertEqual(decode_cursor(encode_cursor(NOW, row_id)), (NOW, row_id))
+
+    def test_page_uses_the_keyset_index(self):
+        self._drafts(3)
+        with engine.connect() as conn:
+            query = Session(bind=conn).query(Draft)
+            rows, cursor = keyset_page(query, Draft.created_at, Draft.id, limit=1)
+            plan = conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN SELECT id FROM drafts WHERE (created_at, id) < (?, ?) "
+                "ORDER BY created_at DESC, id DESC LIMIT 2",
+                (NOW.strftime("%Y-%m-%d %H:%M:%S.%f"), rows[0].id.hex),
+            ).fetchall()
+        self.assertIsNotNone(cursor)
+        self.assertIn("ix_drafts_created", " ".join(str(step[-1]) for step in plan))
+
+
+class TestFilters(_PagingCase):
+
+    def test_draft_filters(self):
+        pending = self._drafts(2)
+        approved = self._drafts(2, status=DraftStatus.approved, pillar_theme="Agentic AI")
+
+        def ids(url):
+            return {uuid.UUID(row["id"]) for row in self.client.get(url).json()}
+
+        self.assertEqual(ids("/drafts?status=APPROVED"), set(approved))
+        self.assertEqual(ids("/drafts?pillar=Agentic%20AI"), set(approved))
+        after = (NOW - timedelta(seconds=30)).isoformat().replace("+00:00", "Z")
+        self.assertEqual(ids(f"/drafts?status=PENDING&created_after={after}"), {pending[0]})
+        self.assertEqual(self.client.get("/drafts?status=BOGUS").status_code, 422)
+
+    def _post(self, draft_id, **fields):
+        post = PublishedPost(
+            draft_id=draft_id, content_body="Body", format=PostFormat.text,
+            tone=PostTone.educational, **fields,
+        )
+        self.db.add(post)
+        self.db.commit()
+        return post.id
+
+    def test_post_and_comment_filters(self):
+        adtech = self._drafts(1)[0]
+        agentic = self._drafts(1, pillar_theme="Agentic AI")[0]
+        live = self._post(adtech, published_at=NOW)
+        queued = self._post(agentic)
+
+        self.assertEqual([r["id"] for r in self.client.get("/posts?pillar=Agentic%20AI").json()], [str(queued)])
+        self.assertEqual([r["id"] for r in self.client.get("/posts?published=true").json()], [str(live)])
+        due = self._post(adtech, scheduled_time=datetime.now(timezone.utc) - timedelta(minutes=1))
+        self.assertEqual([r["id"] for r in self.client.get("/posts?due=true").json()], [str(due)])
+
+        for n, escalated in enumerate((True, False, True)):
+            self.db.add(Comment(
+                published_post_id=live if n else queued, commenter_name=f"c{n}",
+                comment_text="Hi", escalated=escalated, auto_reply_sent=not escalated,
+                commented_at=NOW - timedelta(minutes=n),
+            ))
+        self.db.commit()
+
+        escalated = self.client.get("/comments?escalated=true").json()
+        self.assertEqual([c["commenter_name"] for c in escalated], ["c0", "c2"])
+        self.assertEqual([c["commenter_name"] for c in self.client.get("/comments?replied=true").json()], ["c1"])
+        self.assertEqual(len(self.client.get(f"/comments?post_id={live}").json()), 2)
+        ids, pages = self._walk("/comments", limit=1)
+        self.assertEqual((len(ids), pages), (3, 3))
+
+    def test_source_filters(self):
+        for n, pillar in enumerate(("Adtech fundamentals", "Agentic AI", "Agentic AI")):
+            self.db.add(SourceMaterial(
+                source_name="feed", title=f"t{n}", url=f"https://example.test/{n}",
+                pillar_theme=pillar, created_at=NOW - timedelta(minutes=n),
+            ))
+        self.db.commit()
+
+        titles = [s["title"] for s in self.client.get("/sources?pillar=Agentic%20AI").json()]
+        self.assertEqual(titles, ["t1", "t2"])
+
+    def test_pipeline_items_by_status_come_in_queue_order(self):
+        for n in range(5):
+            self.db.add(ContentPipelineItem(
+                status=PipelineStatus.todo if n % 2 == 0 else PipelineStatus.backlog,
+                pillar_theme="Agentic AI" if n == 4 else "Adtech fundamentals",
+                created_at=NOW + timedelta(minutes=n),
+            ))
+        self.db.commit()
+
+        ids, pages = self._walk("/pipeline/items?status=todo", limit=2)
+        self.assertEqual(pages, 2)
+        items = [self.db.get(ContentPipelineItem, uuid.UUID(i)) for i in ids]
+        self.assertEqual([i.created_at for i in items], sorted(i.created_at for i in items))
+        self.assertEqual(len(self.client.get("/pipeline/items?status=todo&pillar=Agentic%20AI").json()), 1)
+
+        newest_first = self.client.get("/pipeline/items?limit=5").json()
+        self.assertEqual(newest_first[0]["id"], ids[-1])
+        self.assertEqual(self.client.get("/pipeline/items?status=nope").status_code, 400)
+
+
+class TestDashboardSummary(_PagingCase):
+
+    def test_counts_without_listing_rows(self):
+        self._drafts(3)
+        draft_id = self._drafts(1, status=DraftStatus.approved)[0]
+        past = datetime.now(timezone.utc) - timedelta(hours=1)
+        posts = [
+            PublishedPost(draft_id=draft_id, content_body="Body", format=PostFormat.text,
+                          tone=PostTone.educational, **fields)
+            for fields in (
+                {"published_at": NOW, "impressions": 1200},
+                {"published_at": NOW, "impressions": 300},
+                {"scheduled_time": past},
+                {"scheduled_time": past + timedelta(days=2)},
+            )
+        ]
+        self.db.add_all(posts)
+        self.db.flush()
+        for n in range(3):
+            self.db.add(Comment(
+                published_post_id=posts[0].id, commenter_name=f"c{n}", comment_text="Hi",
+                escalated=n == 0, auto_reply_sent=n > 0,
+            ))
+        self.db.add(SourceMaterial(source_name="feed", title="t", url="https://example.test/t"))
+        self.db.commit()
+
+        with query_budget(4, engine):
+            summary = self.client.get("/reports/summary").json()
+
+        self.assertEqual(summary, {
+            "posts_total": 4,
+            "posts_published": 2,
+            "posts_unpublished": 2,
+            "posts_due_now": 1,
+            "total_impressions": 1500,
+            "comments_total": 3,
+            "comments_escalated": 1,
+            "comments_replied": 2,
+            "drafts_total": 4,
+            "drafts_pending": 3,
+            "sources_total": 1,
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,274 @@
+"""V6 LLM response cache tests.
+
+Covers:
+- Keys change with every request parameter
+- Memory LRU: hits, TTL expiry, byte-bounded eviction, oversize entries
+- SQLite backend: persistence across instances, byte-bounded eviction
+- Redis backend leaves the total budget to the server and says so
+- Backend errors degrade to misses
+- LLMClient serves repeats from cache; cache=False opts out, as draft
+  generation does
+- llm._call_claude (source summaries) uses the same cache
+- Counters exposed on /health/llm-cache and /health/full
+"""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.services import llm, llm_cache
+from app.services.llm_cache import LLMCache, MemoryLLMCache, SQLiteLLMCache, cache_key
+from app.services.llm_client import AsyncLLMClient, LLMClient, LLMResponse
+
+
+def _value(content="x"):
+    return {"content": content, "model": "m", "input_tokens": 1, "output_tokens": 1, "total_tokens": 2}
+
+
+class TestCacheKey(unittest.TestCase):
+
+    def test_every_parameter_changes_the_key(self):
+        base = ("model", "system", "user", 0.7, 800)
+        key = cache_key(*base)
+        self.assertEqual(key, cache_key(*base))
+        for i, changed in enumerate(["model-2", "system-2", "user-2", 0.5, 801]):
+            args = list(base)
+            args[i] = changed
+            self.assertNotEqual(key, cache_key(*args))
+
+
+class TestMemoryCache(unittest.TestCase):
+
+    def test_hit_miss_and_counters(self):
+        cache = MemoryLLMCache(ttl_seconds=60, max_bytes=10_000, max_entry_bytes=1_000)
+        self.assertIsNone(cache.get("k"))
+        cache.set("k", _value("hello"))
+        self.assertEqual(cache.get("k")["content"], "hello")
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stores"]), (1, 1, 1))
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+    def test_ttl_expiry(self):
+        cache = MemoryLLMCache(ttl_seconds=10, max_bytes=10_000, max_entry_bytes=1_000)
+        cache.set("k", _value())
+        with patch.object(llm_cache.time, "monotonic", return_value=time.monotonic() + 11):
+            self.assertIsNone(cache.get("k"))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        entry_size = len(llm_cache.json.dumps(_value("a")).encode())
+        cache = MemoryLLMCache(ttl_seconds=60, max_bytes=entry_size * 2, max_entry_bytes=1_000)
+        cache.set("a", _value("a"))
+        cache.set("b", _value("b"))
+        cache.get("a")  # a is now most recently used
+        cache.set("c", _value("c"))
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        stats = cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertLessEqual(stats["bytes"], entry_size * 2)
+
+    def test_oversize_entries_are_not_stored(self):
+        cache = MemoryLLMCache(ttl_seconds=60, max_bytes=10_000, max_entry_bytes=50)
+        cache.set("big", _value("x" * 100))
+        self.assertIsNone(cache.get("big"))
+        self.assertEqual(cache.stats()["oversize"], 1)
+
+    def test_backend_errors_become_misses(self):
+        class _Broken(LLMCache):
+            def _get(self, key):
+                raise ConnectionError("down")
+
+            def _set(self, key, raw):
+                raise ConnectionError("down")
+
+        cache = _Broken(ttl_seconds=60, max_bytes=1_000, max_entry_bytes=1_000)
+        cache.set("k", _value())
+        self.assertIsNone(cache.get("k"))
+        stats = cache.stats()
+        self.assertEqual((stats["errors"], stats["misses"], stats["stores"]), (2, 1, 0))
+
+
+class TestSQLiteCache(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def test_persists_across_instances(self):
+        SQLiteLLMCache(60, 10_000, 1_000, path=self.path).set("k", _value("kept"))
+        reopened = SQLiteLLMCache(60, 10_000, 1_000, path=self.path)
+        self.assertEqual(reopened.get("k")["content"], "kept")
+
+    def test_expired_entries_miss(self):
+        cache = SQLiteLLMCache(60, 10_000, 1_000, path=self.path)
+        cache.set("k", _value())
+        with patch.object(llm_cache.time, "time", return_value=time.time() + 61):
+            self.assertIsNone(cache.get("k"))
+
+    def test_evicts_by_total_bytes(self):
+        entry_size = len(llm_cache.json.dumps(_value("a")).encode())
+        cache = SQLiteLLMCache(60, entry_size * 2, 1_000, path=self.path)
+        for key in ("a", "b", "c"):
+            cache.set(key, _value(key))
+            time.sleep(0.01)
+
+        self.assertIsNone(cache.get("a"))
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["evictions"], 1)
+
+
+class TestRedisCache(unittest.TestCase):
+
+    def test_total_byte_budget_is_not_claimed(self):
+        cache = llm_cache.RedisLLMCache(60, 10_000, 1_000, url="redis://localhost:6379/0")
+        stats = cache.stats()
+        self.assertIsNone(stats["max_bytes"])
+        self.assertEqual(stats["max_entry_bytes"], 1_000)
+
+
+class _CacheCase(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = MemoryLLMCache(ttl_seconds=60, max_bytes=100_000, max_entry_bytes=10_000)
+        llm_cache.set_llm_cache(self.cache)
+        self.addCleanup(llm_cache.set_llm_cache, None)
+        for name, value in (("llm_mock_mode", False), ("llm_api_key", "test-key")):
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestLLMClientCaching(_CacheCase):
+
+    def setUp(self):
+        super().setUp()
+        self.api = AsyncMock(side_effect=lambda **kw: LLMResponse(
+            content=f"fresh: {kw['user_prompt']}",
+            model="claude",
+            input_tokens=5,
+            output_tokens=7,
+            total_tokens=12,
+        ))
+        patcher = patch.object(AsyncLLMClient, "_call_api_with_retry", self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = LLMClient(api_key="test-key")
+
+    def test_repeat_prompt_is_served_from_cache(self):
+        first = self.client.generate("summarise", system_prompt="sys", temperature=0.2)
+        second = self.client.generate("summarise", system_prompt="sys", temperature=0.2)
+
+        self.assertEqual(self.api.await_count, 1)
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.total_tokens, 12)
+
+    def test_different_parameters_miss(self):
+        self.client.generate("summarise", temperature=0.2)
+        self.client.generate("summarise", temperature=0.3)
+        self.client.generate("summarise", temperature=0.2, max_tokens=10)
+        self.assertEqual(self.api.await_count, 3)
+
+    def test_cache_false_opts_out(self):
+        self.client.generate("creative", cache=False)
+        self.client.generate("creative", cache=False)
+        self.assertEqual(self.api.await_count, 2)
+        self.assertEqual(self.cache.stats()["stores"], 0)
+
+    def test_mock_mode_is_never_cached(self):
+        with patch.object(settings, "llm_mock_mode", True):
+            self.client.generate("Adtech fundamentals")
+        self.assertEqual(self.cache.stats()["stores"], 0)
+
+    def test_draft_generation_is_never_cached(self):
+        from app.models import PostFormat, PostTone
+        from app.services.content_engine import ContentParameters, _generate_content
+        from app.services.content_pyramid import POST_ANGLES
+
+        params = ContentParameters("Adtech fundamentals", "Programmatic", PostFormat.text, PostTone.direct, POST_ANGLES[0])
+        # Attempts 2 and 3 of generate_draft send the same stricter prompt
+        _generate_content(params, stricter=True)
+        _generate_content(params, stricter=True)
+        self.assertEqual(self.api.await_count, 2)
+        self.assertEqual(self.cache.stats()["stores"], 0)
+
+    def test_failed_call_is_not_cached(self):
+        self.api.side_effect = RuntimeError("boom")
+        with self.assertRaises(RuntimeError):
+            self.client.generate("fails")
+        self.assertEqual(self.cache.stats()["stores"], 0)
+
+
+class TestSummaryCaching(_CacheCase):
+
+    def _response(self):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {
+            "model": "claude",
+            "content": [{"type": "text", "text": "A summary."}],
+            "usage": {"input_tokens": 10, "output_tokens": 3},
+        }
+        return response
+
+    def test_resummarising_a_source_hits_cache(self):
+        with patch.object(llm.httpx, "post", return_value=self._response()) as post, \
+                patch.object(settings, "llm_provider", "claude"):
+            first = llm.summarize_source("Feed", "Title", "Body text")
+            second = llm.summarize_source("Feed", "Title", "Body text")
+
+        self.assertEqual(first, "A summary.")
+        self.assertEqual(second, first)
+        self.assertEqual(post.call_count, 1)
+
+    def test_post_generation_opts_out(self):
+        from app.models import PostFormat, PostTone
+
+        with patch.object(llm.httpx, "post", return_value=self._response()) as post, \
+                patch.object(settings, "llm_provider", "claude"):
+            for _ in range(2):
+                llm.generate_linkedin_post(
+                    "Adtech fundamentals", "Programmatic", PostFormat.text, PostTone.direct, ""
+                )
+        self.assertEqual(post.call_count, 2)
+
+
+class TestHealthEndpoints(_CacheCase):
+
+    def test_llm_cache_counters_exposed(self):
+        from app.db import Base, engine
+        from app.main import app
+
+        Base.metadata.create_all(bind=engine)
+        self.cache.get("missing")
+        client = TestClient(app)
+
+        body = client.get("/health/llm-cache").json()
+        self.assertEqual(body["backend"], "memory")
+        self.assertEqual(body["misses"], 1)
+
+        full = client.get("/health/full").json()
+        self.assertEqual(full["checks"]["llm_cache"]["misses"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+"""V6 in-process metrics tests.
+
+Covers:
+- Counter / gauge / histogram exposition in the Prometheus text format
+- GET /metrics renders without touching the database
+- Agent runs, pipeline transitions (counted on commit only) and queue depth
+- LLM latency, retries and tokens from AsyncLLMClient
+- LinkedIn request latency and 429s
+- Webhook and Telegram delivery latency and outcomes
+- DB pool checkouts and occupancy
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_metrics_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app import db as app_db
+from app import metrics
+from app.config import settings
+from app.main import app
+from app.models import AuditLog, Base, ContentPipelineItem, PipelineStatus, PipelineTransition
+from app.query_stats import query_budget
+from app.services import telegram_service, webhook_service
+from app.services.agents.scout import run_scout
+from app.services.linkedin import LinkedInRateLimitError, _api_get
+from app.services.llm_client import AsyncLLMClient
+from app.services.pipeline import (
+    clear_pipeline_overview_cache,
+    get_pipeline_overview,
+    record_transitions,
+    transition,
+    transition_row,
+)
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+
+def _sample(name, **labels):
+    """Value of one exposed sample, or None if absent."""
+    label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    prefix = f"{metrics.METRIC_PREFIX}{name}{{{label_text}}} " if labels else f"{metrics.METRIC_PREFIX}{name} "
+    for line in metrics.render_metrics().splitlines():
+        if line.startswith(prefix):
+            return float(line[len(prefix):])
+    return None
+
+
+class TestExposition(unittest.TestCase):
+
+    def test_counter_and_gauge(self):
+        counter = metrics.Counter("jobs_total", "Jobs.", ["kind"])
+        counter.inc(kind='a "quoted"\nname')
+        counter.inc(2, kind="b")
+        self.assertEqual(counter.render().splitlines(), [
+            "# HELP linkedbrand_jobs_total Jobs.",
+            "# TYPE linkedbrand_jobs_total counter",
+            'linkedbrand_jobs_total{kind="a \\"quoted\\"\\nname"} 1',
+            'linkedbrand_jobs_total{kind="b"} 2',
+        ])
+        with self.assertRaises(ValueError):
+            counter.inc(other="x")
+
+        gauge = metrics.Gauge("depth", "Depth.")
+        gauge.set_function(lambda: None)
+        self.assertEqual(gauge.render().splitlines()[2:], [])
+        gauge.set_function(lambda: 4.5)
+        self.assertEqual(gauge.render().splitlines()[2:], ["linkedbrand_depth 4.5"])
+
+    def test_histogram_buckets_are_cumulative(self):
+        hist = metrics.Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            hist.observe(value)
+        self.assertEqual(hist.render().splitlines()[2:], [
+            'linkedbrand_latency_seconds_bucket{le="0.1"} 1',
+            'linkedbrand_latency_seconds_bucket{le="1"} 3',
+            'linkedbrand_latency_seconds_bucket{le="+Inf"} 4',
+            "linkedbrand_latency_seconds_sum 4.25",
+            "linkedbrand_latency_seconds_count 4",
+        ])
+
+    def test_endpoint_does_not_query_the_database(self):
+        client = TestClient(app)
+        with query_budget(0):
+            resp = client.get("/metrics")
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.headers["content-type"].startswith("text/plain; version=0.0.4"))
+        self.assertIn("# TYPE linkedbrand_agent_runs_total counter", resp.text)
+        self.assertIn("# TYPE linkedbrand_llm_request_duration_seconds histogram", resp.text)
+
+
+class TestPipelineMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(PipelineTransition).delete()
+        self.db.query(ContentPipelineItem).delete()
+        self.db.query(AuditLog).delete()
+        self.db.commit()
+        clear_pipeline_overview_cache()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_agent_runs_count_outcomes_and_duration(self):
+        runs = metrics.AGENT_RUNS.value(agent="scout", outcome="ok")
+        timed = metrics.AGENT_RUN_SECONDS.count(agent="scout")
+        run_scout(self.db, max_items=1)
+        self.assertEqual(metrics.AGENT_RUNS.value(agent="scout", outcome="ok"), runs + 1)
+        self.assertEqual(metrics.AGENT_RUN_SECONDS.count(agent="scout"), timed + 1)
+
+        @metrics.observe_agent_run("broken")
+        def broken():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            broken()
+        self.assertEqual(metrics.AGENT_RUNS.value(agent="broken", outcome="error"), 1)
+
+    def test_transitions_and_queue_depth(self):
+        item = ContentPipelineItem(status=PipelineStatus.backlog)
+        self.db.add(item)
+        self.db.commit()
+        before = metrics.PIPELINE_TRANSITIONS.value(from_status="BACKLOG", to_status="TODO")
+
+        transition(self.db, item.id, PipelineStatus.backlog, PipelineStatus.todo)
+        self.assertEqual(
+            metrics.PIPELINE_TRANSITIONS.value(from_status="BACKLOG", to_status="TODO"), before + 1,
+        )
+
+        # A transition whose transaction rolls back is never counted
+        writing = metrics.PIPELINE_TRANSITIONS.value(from_status="TODO", to_status="WRITING")
+        record_transitions(self.db, [
+            transition_row(item.id, PipelineStatus.todo, PipelineStatus.writing, 0, None, datetime.now(timezone.utc)),
+        ])
+        self.db.rollback()
+        self.assertEqual(metrics.PIPELINE_TRANSITIONS.value(from_status="TODO", to_status="WRITING"), writing)
+
+        get_pipeline_overview(self.db)
+        self.assertEqual(_sample("pipeline_items", status="TODO"), 1)
+        self.assertEqual(_sample("pipeline_items", status="BACKLOG"), 0)
+        self.assertIsNotNone(_sample("pipeline_queue_refreshed_timestamp_seconds"))
+
+
+class TestLLMMetrics(unittest.TestCase):
+
+    def setUp(self):
+        for name, value in (("llm_mock_mode", False), ("llm_api_key", "test-key")):
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_latency_retries_and_tokens(self):
+        responses = [
+            httpx.Response(529, headers={"retry-after": "0"}),
+            httpx.Response(200, json={
+                "model": "m", "content": [{"type": "text", "text": "ok"}],
+                "usage": {"input_tokens": 7, "output_tokens": 5},
+            }),
+        ]
+
+        async def _run():
+            client = AsyncLLMClient(base_url="https://llm.test/v1/messages")
+            client._http = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+            try:
+                return await client.generate("hi", cache=False)
+            finally:
+                await client.aclose()
+
+        timed = metrics.LLM_REQUEST_SECONDS.count()
+        retries = metrics.LLM_RETRIES.value(reason="529")
+        tokens_in = metrics.LLM_TOKENS.value(kind="input")
+        tokens_out = metrics.LLM_TOKENS.value(kind="output")
+
+        self.assertEqual(asyncio.run(_run()).content, "ok")
+        self.assertEqual(metrics.LLM_REQUEST_SECONDS.count(), timed + 2)
+        self.assertEqual(metrics.LLM_RETRIES.value(reason="529"), retries + 1)
+        self.assertGreaterEqual(metrics.LLM_REQUESTS.value(status="529"), 1)
+        self.assertEqual(metrics.LLM_TOKENS.value(kind="input"), tokens_in + 7)
+        self.assertEqual(metrics.LLM_TOKENS.value(kind="output"), tokens_out + 5)
+
+
+class TestDeliveryMetrics(unittest.TestCase):
+
+    def test_linkedin_429(self):
+        limited = metrics.LINKEDIN_RATE_LIMITED.value()
+        timed = metrics.LINKEDIN_REQUEST_SECONDS.count()
+        client = httpx.Client(transport=httpx.MockTransport(
+            lambda request: httpx.Response(429, headers={"retry-after": "0"}),
+        ))
+        try:
+            with patch.object(settings, "linkedin_api_retries", 0), self.assertRaises(LinkedInRateLimitError):
+                _api_get(client, "https://api.linkedin.test/rest/socialActions")
+        finally:
+            client.close()
+        self.assertEqual(metrics.LINKEDIN_RATE_LIMITED.value(), limited + 1)
+        self.assertEqual(metrics.LINKEDIN_REQUEST_SECONDS.count(), timed + 1)
+
+    def test_telegram_and_webhook_deliveries(self):
+        db = MagicMock()
+        sent = metrics.DELIVERIES.value(channel="telegram", outcome="delivered")
+        with patch.object(settings, "telegram_bot_token", "t"), \
+                patch.object(settings, "telegram_chat_id", "c"), \
+                patch.object(telegram_service.httpx, "post", return_value=httpx.Response(200)):
+            self.assertTrue(telegram_service.send_telegram_message(db, "hello", "test"))
+        self.assertEqual(metrics.DELIVERIES.value(channel="telegram", outcome="delivered"), sent + 1)
+
+        failed = metrics.DELIVERIES.value(channel="webhook", outcome="failed")
+        timed = metrics.DELIVERY_SECONDS.count(channel="webhook")
+        with patch.object(settings, "zapier_webhook_url", "https://hooks.test/x"), \
+                patch.object(webhook_service.httpx, "post", return_value=httpx.Response(500)), \
+                patch.object(webhook_service.time, "sleep"):
+            self.assertFalse(webhook_service.send_webhook(db, "post.publish_ready", {}))
+        self.assertEqual(metrics.DELIVERIES.value(channel="webhook", outcome="failed"), failed + 1)
+        self.assertEqual(metrics.DELIVERY_SECONDS.count(channel="webhook"), timed + webhook_service.MAX_RETRIES)
+
+
+class TestPoolMetrics(unittest.TestCase):
+
+    def tearDown(self):
+        metrics.instrument_pool(app_db.engine)
+
+    def test_checkouts_and_occupancy(self):
+        metrics.instrument_pool(engine)
+        checkouts = metrics.DB_POOL_CHECKOUTS.value()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            self.assertEqual(_sample("db_pool_checked_out"), 1)
+        self.assertEqual(metrics.DB_POOL_CHECKOUTS.value(), checkouts + 1)
+        self.assertEqual(_sample("db_pool_checked_out"), 0)
+        self.assertEqual(_sample("db_pool_size"), engine.pool.size())
+
+
+if __name__ == "__main__":
+    unittest.main()
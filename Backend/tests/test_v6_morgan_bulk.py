@@ -0,0 +1,222 @@
+"""V6 Morgan bulk recovery tests.
+
+Covers:
+- Stale claims are released in chunks: SELECT + UPDATE ... RETURNING +
+  one audit row per chunk, one commit each
+- Errored items are reset per status in chunks, honouring the auto-reset
+  limit and skipping claimed items
+- Dry-run mode reports the same records and writes nothing
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_morgan_bulk_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.models import AuditLog, Base, ContentPipelineItem, PipelineStatus
+from app.services.agents.morgan import (
+    MORGAN_MAX_AUTO_RESETS,
+    recover_stale_claims,
+    reset_errored_items,
+    run_morgan,
+)
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+
+class _Recorder:
+    """Collects statement verbs and commits issued against the test engine."""
+
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self._statement)
+        event.listen(engine, "commit", self._commit)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self._statement)
+        event.remove(engine, "commit", self._commit)
+
+    def _statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement.lstrip().split(" ")[0])
+
+    def _commit(self, conn):
+        self.commits += 1
+
+
+class _BulkCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(ContentPipelineItem).delete()
+        self.db.query(AuditLog).delete()
+        self.db.commit()
+        self.now = datetime.now(timezone.utc)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _seed(self, count, **fields):
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "created_at": self.now - timedelta(hours=3),
+                "updated_at": self.now - timedelta(hours=3),
+                "status": PipelineStatus.writing,
+                "revision_count": 0,
+                "max_revisions": 3,
+                **fields,
+            }
+            for _ in range(count)
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(ContentPipelineItem), rows)
+        return [row["id"] for row in rows]
+
+    def _stale(self, count, **fields):
+        return self._seed(
+            count,
+            claimed_by="writer-dead",
+            claim_stage="writing",
+            claimed_at=self.now - timedelta(hours=2),
+            claim_expires_at=self.now - timedelta(minutes=5),
+            claim_token=4,
+            **fields,
+        )
+
+    def _audits(self, action):
+        return [
+            json.loads(row.detail_json)
+            for row in self.db.query(AuditLog).filter(AuditLog.action == action).all()
+        ]
+
+
+class TestBulkClaimRecovery(_BulkCase):
+
+    def test_chunks_are_a_handful_of_statements(self):
+        self._stale(1200)
+        live = self._seed(3, claimed_by="writer-live", claim_stage="writing",
+                          claimed_at=self.now, claim_expires_at=self.now + timedelta(minutes=2))
+
+        with _Recorder() as rec:
+            recoveries = recover_stale_claims(self.db, chunk_size=500)
+
+        self.assertEqual(len(recoveries), 1200)
+        self.assertEqual(rec.statements, ["SELECT", "UPDATE", "INSERT"] * 3)
+        self.assertEqual(rec.commits, 3)
+        audits = self._audits("pipeline.stale_claims_recovered")
+        self.assertEqual(sorted(a["count"] for a in audits), [200, 500, 500])
+        self.assertEqual(
+            recoveries[0],
+            {
+                "item_id": recoveries[0]["item_id"],
+                "action": "stale_claim_released",
+                "previous_worker": "writer-dead",
+                "previous_stage": "writing",
+                "claim_token": 4,
+                "status": "writing",
+            },
+        )
+        self.assertEqual(
+            self.db.query(ContentPipelineItem).filter(ContentPipelineItem.claimed_by.is_not(None)).count(),
+            len(live),
+        )
+
+    def test_dry_run_writes_nothing(self):
+        self._stale(7)
+        with _Recorder() as rec:
+            recoveries = recover_stale_claims(self.db, dry_run=True, chunk_size=3)
+
+        self.assertEqual(len(recoveries), 7)
+        self.assertEqual(rec.statements, ["SELECT"])
+        self.assertEqual(rec.commits, 0)
+        self.assertEqual(
+            self.db.query(ContentPipelineItem).filter(ContentPipelineItem.claimed_by == "writer-dead").count(), 7,
+        )
+        self.assertEqual(self._audits("pipeline.stale_claims_recovered"), [])
+
+
+class TestBulkErrorReset(_BulkCase):
+
+    def _errored(self, count, status, **fields):
+        return self._seed(count, status=status, last_error="LLM timeout", **fields)
+
+    def test_resets_each_status_in_chunks(self):
+        writing = self._errored(5, PipelineStatus.writing)
+        review = self._errored(2, PipelineStatus.review)
+        ready = self._errored(1, PipelineStatus.ready_to_publish)
+        exhausted = self._errored(1, PipelineStatus.review, revision_count=3 + MORGAN_MAX_AUTO_RESETS)
+        claimed = self._errored(1, PipelineStatus.writing, claimed_by="writer-busy", claim_stage="writing",
+                                claimed_at=self.now, claim_expires_at=self.now + timedelta(minutes=2))
+        recent = self._seed(1, status=PipelineStatus.writing, last_error="x", updated_at=self.now)
+
+        with _Recorder() as rec:
+            resets = reset_errored_items(self.db, chunk_size=2)
+
+        self.assertEqual(len(resets), 8)
+        # WRITING: 2 + 2 + 1, REVIEW: 2 (+ an empty probe), READY_TO_PUBLISH: 1
+        self.assertEqual(rec.statements.count("UPDATE"), 5)
+        # One transition-log INSERT and one audit INSERT per chunk
+        self.assertEqual(rec.statements.count("INSERT"), 10)
+        self.assertEqual(len(self._audits("pipeline.errored_items_reset")), 5)
+
+        self.db.expire_all()
+
+        def _status(item_id):
+            return self.db.get(ContentPipelineItem, item_id).status
+
+        self.assertEqual({_status(i) for i in writing + review}, {PipelineStatus.todo})
+        self.assertEqual(_status(ready[0]), PipelineStatus.backlog)
+        for untouched in exhausted + claimed + recent:
+            item = self.db.get(ContentPipelineItem, untouched)
+            self.assertIsNotNone(item.last_error)
+            self.assertNotEqual(item.status, PipelineStatus.todo)
+        self.assertTrue(all(r["previous_error"] == "LLM timeout" for r in resets))
+
+    def test_dry_run_reports_without_resetting(self):
+        self._errored(3, PipelineStatus.writing)
+        resets = reset_errored_items(self.db, dry_run=True, chunk_size=1)
+
+        self.assertEqual([r["to_status"] for r in resets], ["todo"] * 3)
+        self.assertEqual(
+            self.db.query(ContentPipelineItem).filter(ContentPipelineItem.status == PipelineStatus.writing).count(), 3,
+        )
+        self.assertEqual(self._audits("pipeline.errored_items_reset"), [])
+
+    def test_run_morgan_dry_run(self):
+        self._stale(2)
+        self._errored(2, PipelineStatus.review)
+
+        result = run_morgan(self.db, dry_run=True)
+        self.assertTrue(result["dry_run"])
+        self.assertEqual((result["stale_claims_recovered"], result["errored_items_reset"]), (2, 2))
+
+        result = run_morgan(self.db)
+        self.assertEqual((result["stale_claims_recovered"], result["errored_items_reset"]), (2, 2))
+        self.assertEqual(run_morgan(self.db)["stale_claims_recovered"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -529,7 +529,7 @@ class TestPipelineAgentTriggerEndpoints(unittest.TestCase):
         self.assertEqual(data["agent"], "writer")
         self.assertIn("items_written", data)
 
-    @patch("app.services.agents.editor.run_editor", return_value=0)
+    @patch("app.services.agents.editor.run_editor_batch", return_value=0)
     def test_trigger_editor(self, mock_editor):
         """Should trigger Editor agent."""
         resp = self.client.post("/pipeline/run/editor")
@@ -656,9 +656,9 @@ class TestWorkerTaskRegistry(unittest.TestCase):
             self.assertTrue(callable(func), f"Task {name} is not callable")
 
     def test_total_task_count(self):
-        """TASK_REGISTRY should have 12 tasks (6 legacy + 6 V6)."""
+        """TASK_REGISTRY should have 15 tasks (6 legacy + 6 V6 + 2 per-item + claim recovery)."""
         from app.worker import TASK_REGISTRY
-        self.assertEqual(len(TASK_REGISTRY), 12)
+        self.assertEqual(len(TASK_REGISTRY), 15)
 
 
 if __name__ == "__main__":
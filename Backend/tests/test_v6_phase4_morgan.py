@@ -378,9 +378,9 @@ class TestWorkerMorganTask(unittest.TestCase):
         from app.worker import TASK_REGISTRY
         self.assertTrue(callable(TASK_REGISTRY["v6_run_morgan"]))
 
-    def test_total_tasks_is_12(self):
+    def test_total_tasks_is_15(self):
         from app.worker import TASK_REGISTRY
-        self.assertEqual(len(TASK_REGISTRY), 12)
+        self.assertEqual(len(TASK_REGISTRY), 15)
 
 
 if __name__ == "__main__":
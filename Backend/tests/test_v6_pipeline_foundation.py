@@ -230,9 +230,10 @@ class TestClaimLock(unittest.TestCase):
         item = create_pipeline_item(self.db, pillar_theme="Stale test")
         attempt_claim(self.db, item.id, "writing", "worker-old")
 
-        # Manually backdate the claim
+        # Manually let the claim's lease run out
         db_item = self.db.query(ContentPipelineItem).filter(ContentPipelineItem.id == item.id).first()
         db_item.claimed_at = datetime.now(timezone.utc) - timedelta(minutes=60)
+        db_item.claim_expires_at = datetime.now(timezone.utc) - timedelta(minutes=30)
         self.db.commit()
 
         stale = find_stale_claims(self.db, max_age_minutes=30)
@@ -0,0 +1,138 @@
+"""V6 pipeline overview aggregate tests.
+
+Covers:
+- Status, claimed, stale, errored and stuck counts from one aggregate
+- In-process cache reuse while nothing changes, refresh on any update
+- Morgan's health report built from the same single aggregate
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_overview_test.db")
+os.environ["DATABASE_URL"] = f"sqlite+pysqlite:///{DB_PATH}"
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, ContentPipelineItem, PipelineStatus
+from app.services.pipeline import clear_pipeline_overview_cache, get_pipeline_overview
+
+engine = create_engine(f"sqlite+pysqlite:///{DB_PATH}")
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+
+def _fresh_db():
+    clear_pipeline_overview_cache()
+    db = Session()
+    db.query(ContentPipelineItem).delete()
+    db.commit()
+    return db
+
+
+def _make_item(db, status, **kwargs):
+    item = ContentPipelineItem(status=status, pillar_theme="Adtech fundamentals", **kwargs)
+    db.add(item)
+    db.commit()
+    return item
+
+
+class _CountStatements:
+    def __enter__(self):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._inc)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self._inc)
+
+    def _inc(self, *args):
+        self.count += 1
+
+
+class TestOverviewAggregate(unittest.TestCase):
+
+    def test_counts_every_signal(self):
+        db = _fresh_db()
+        now = datetime.now(timezone.utc)
+        _make_item(db, PipelineStatus.backlog)
+        _make_item(db, PipelineStatus.done, last_error="ignored: terminal")
+        _make_item(db, PipelineStatus.todo, last_error="Writer timeout")
+        _make_item(db, PipelineStatus.review, claimed_by="editor-1", claimed_at=now - timedelta(minutes=90))
+        _make_item(db, PipelineStatus.writing, claimed_by="writer-1", claimed_at=now)
+        stuck = _make_item(db, PipelineStatus.ready_to_publish)
+        stuck.updated_at = now - timedelta(hours=5)
+        db.commit()
+
+        overview = get_pipeline_overview(db)
+
+        self.assertEqual(overview["total"], 6)
+        self.assertEqual(overview["status_counts"]["todo"], 1)
+        self.assertEqual(overview["status_counts"]["amplified"], 0)
+        self.assertEqual(overview["claimed"], 2)
+        self.assertEqual(overview["stale_claims"], 1)
+        self.assertEqual(overview["errored"], 1)
+        self.assertEqual(overview["stuck"], 1)
+        db.close()
+
+    def test_overview_is_one_aggregate_then_cached(self):
+        db = _fresh_db()
+        _make_item(db, PipelineStatus.todo)
+
+        with _CountStatements() as first:
+            get_pipeline_overview(db)
+        with _CountStatements() as second:
+            overview = get_pipeline_overview(db)
+
+        self.assertEqual(first.count, 2)   # MAX(updated_at) probe + aggregate
+        self.assertEqual(second.count, 1)  # probe only
+        self.assertEqual(overview["status_counts"]["todo"], 1)
+        db.close()
+
+    def test_cache_refreshes_after_update(self):
+        db = _fresh_db()
+        _make_item(db, PipelineStatus.todo)
+        self.assertEqual(get_pipeline_overview(db)["status_counts"]["review"], 0)
+
+        _make_item(db, PipelineStatus.review)
+
+        self.assertEqual(get_pipeline_overview(db)["status_counts"]["review"], 1)
+        db.close()
+
+    def test_cached_result_is_not_shared_mutable_state(self):
+        db = _fresh_db()
+        _make_item(db, PipelineStatus.todo)
+        get_pipeline_overview(db)["status_counts"]["todo"] = 99
+        self.assertEqual(get_pipeline_overview(db)["status_counts"]["todo"], 1)
+        db.close()
+
+
+class TestHealthReportUsesAggregate(unittest.TestCase):
+
+    def test_health_report_single_round_trip_when_cached(self):
+        db = _fresh_db()
+        _make_item(db, PipelineStatus.writing, last_error="boom")
+
+        from app.services.agents.morgan import generate_health_report
+        generate_health_report(db)
+        with _CountStatements() as counter:
+            report = generate_health_report(db)
+
+        self.assertEqual(counter.count, 1)
+        self.assertEqual(report["errored_items"], 1)
+        self.assertEqual(report["health_status"], "degraded")
+        db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,261 @@
+"""V6 pipeline scheduling tests.
+
+Covers:
+- Claims order by priority, then deadline, then age
+- Items whose next_run_at has not arrived are not claimed
+- Scout gives fresh news items news priority and a deadline
+- schedule_item and POST /pipeline/items/{id}/schedule
+- Queue depth / wait-time view (get_queue_stats, GET /pipeline/queue)
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_pipeline_scheduling_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import get_db
+from app.main import app
+from app.models import AuditLog, Base, ContentPipelineItem, PipelineStatus, SourceMaterial
+from app.services.agents.scout import NEWS_SHELF_LIFE_HOURS, run_scout
+from app.services.claim_lock import attempt_claim, claim_batch
+from app.services.pipeline import (
+    PRIORITY_EVERGREEN,
+    PRIORITY_NEWS,
+    PRIORITY_NORMAL,
+    PRIORITY_URGENT,
+    get_queue_stats,
+    get_unclaimed_items_by_status,
+    schedule_item,
+)
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+
+class _ScheduleCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(ContentPipelineItem).delete()
+        self.db.query(SourceMaterial).delete()
+        self.db.query(AuditLog).delete()
+        self.db.commit()
+        self.now = datetime.now(timezone.utc)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _item(self, name, status=PipelineStatus.todo, age_minutes=60, **kwargs):
+        item = ContentPipelineItem(
+            status=status,
+            pillar_theme="Adtech fundamentals",
+            topic_keyword=name,
+            created_at=self.now - timedelta(minutes=age_minutes),
+            updated_at=self.now - timedelta(minutes=age_minutes),
+            **kwargs,
+        )
+        self.db.add(item)
+        self.db.commit()
+        return item.id
+
+
+class TestClaimOrder(_ScheduleCase):
+
+    def test_priority_then_deadline_then_age(self):
+        self._item("evergreen-oldest", age_minutes=600, priority=PRIORITY_EVERGREEN)
+        self._item("normal-old", age_minutes=300)
+        self._item("normal-young", age_minutes=10)
+        self._item("normal-deadline", age_minutes=5, deadline_at=self.now + timedelta(hours=6))
+        self._item("news-late-deadline", age_minutes=20, priority=PRIORITY_NEWS,
+                   deadline_at=self.now + timedelta(hours=12))
+        self._item("news-soon-deadline", age_minutes=1, priority=PRIORITY_NEWS,
+                   deadline_at=self.now + timedelta(hours=2))
+        self._item("urgent", age_minutes=0, priority=PRIORITY_URGENT)
+
+        expected = [
+            "urgent", "news-soon-deadline", "news-late-deadline",
+            "normal-deadline", "normal-old", "normal-young", "evergreen-oldest",
+        ]
+        self.assertEqual(
+            [i.topic_keyword for i in get_unclaimed_items_by_status(self.db, PipelineStatus.todo)],
+            expected,
+        )
+        claimed = claim_batch(self.db, PipelineStatus.todo, "writing", "writer-1", limit=3)
+        self.assertEqual([i.topic_keyword for i in claimed], expected[:3])
+
+    def test_news_item_overtakes_evergreen_at_every_stage(self):
+        for status, stage in (
+            (PipelineStatus.review, "review"),
+            (PipelineStatus.ready_to_publish, "publish"),
+        ):
+            self._item("evergreen", status=status, age_minutes=120, priority=PRIORITY_EVERGREEN)
+            news = self._item("news", status=status, age_minutes=1, priority=PRIORITY_NEWS)
+            (first,) = claim_batch(self.db, status, stage, "agent-1", limit=1)
+            self.assertEqual(first.id, news)
+
+
+class TestNextRunAt(_ScheduleCase):
+
+    def test_future_items_are_not_claimed(self):
+        later = self._item("later", age_minutes=600, next_run_at=self.now + timedelta(hours=1))
+        due = self._item("due", age_minutes=10, next_run_at=self.now - timedelta(minutes=1))
+        fresh = self._item("fresh", age_minutes=5)
+
+        claimed = claim_batch(self.db, PipelineStatus.todo, "writing", "writer-1", limit=10)
+        self.assertEqual([i.id for i in claimed], [due, fresh])
+        self.assertNotIn(later, [i.id for i in get_unclaimed_items_by_status(self.db, PipelineStatus.todo)])
+
+    def test_status_claim_waits_for_next_run_at(self):
+        item_id = self._item("later", next_run_at=self.now + timedelta(hours=1))
+        self.assertFalse(attempt_claim(self.db, item_id, "writing", "writer-1", status=PipelineStatus.todo))
+
+        schedule_item(self.db, item_id, {"next_run_at": None})
+        self.assertTrue(attempt_claim(self.db, item_id, "writing", "writer-1", status=PipelineStatus.todo))
+
+
+class TestScheduleItem(_ScheduleCase):
+
+    def test_reschedule_changes_claim_order(self):
+        self._item("old", age_minutes=60)
+        young = self._item("young", age_minutes=1)
+
+        updated = schedule_item(self.db, young, {"priority": PRIORITY_URGENT})
+        self.assertEqual(updated.priority, PRIORITY_URGENT)
+        (first,) = claim_batch(self.db, PipelineStatus.todo, "writing", "writer-1", limit=1)
+        self.assertEqual(first.id, young)
+
+    def test_rejects_other_fields_and_missing_items(self):
+        item_id = self._item("x")
+        with self.assertRaises(ValueError):
+            schedule_item(self.db, item_id, {"status": PipelineStatus.done})
+        with self.assertRaises(ValueError):
+            schedule_item(self.db, uuid.uuid4(), {"priority": 1})
+
+
+class TestScoutScheduling(_ScheduleCase):
+
+    def _source(self, title, published_at):
+        self.db.add(SourceMaterial(
+            source_name="Feed",
+            title=title,
+            url=f"https://example.com/{uuid.uuid4()}",
+            published_at=published_at,
+            pillar_theme="Adtech fundamentals",
+            relevance_score=0.9,
+        ))
+        self.db.commit()
+
+    def test_fresh_news_gets_priority_and_deadline(self):
+        published = self.now - timedelta(hours=2)
+        self._source("Breaking: exchange merger", published)
+        self._source("Old explainer", self.now - timedelta(hours=NEWS_SHELF_LIFE_HOURS + 1))
+
+        items = {i.topic_keyword: i for i in run_scout(self.db)}
+
+        news = items["Breaking: exchange merger"]
+        self.assertEqual(news.priority, PRIORITY_NEWS)
+        self.assertAlmostEqual(
+            news.deadline_at.replace(tzinfo=timezone.utc).timestamp(),
+            (published + timedelta(hours=NEWS_SHELF_LIFE_HOURS)).timestamp(),
+            delta=1,
+        )
+        evergreen = items["Old explainer"]
+        self.assertEqual(evergreen.priority, PRIORITY_NORMAL)
+        self.assertIsNone(evergreen.deadline_at)
+
+
+class TestQueueStats(_ScheduleCase):
+
+    def test_depth_wait_and_overdue(self):
+        for minutes in (10, 20, 30, 40):
+            self._item(f"ready-{minutes}", age_minutes=minutes)
+        self._item("overdue", age_minutes=50, priority=PRIORITY_NEWS,
+                   deadline_at=self.now - timedelta(minutes=5))
+        self._item("deferred", next_run_at=self.now + timedelta(hours=1))
+        claimed = self._item("claimed")
+        attempt_claim(self.db, claimed, "writing", "writer-1")
+        self._item("review", status=PipelineStatus.review, age_minutes=15)
+        self._item("done", status=PipelineStatus.done)
+
+        stats = get_queue_stats(self.db)
+        todo = stats["queues"]["TODO"]
+        self.assertEqual((todo["ready"], todo["deferred"], todo["claimed"], todo["overdue"]), (5, 1, 1, 1))
+        self.assertAlmostEqual(todo["oldest_wait_seconds"], 50 * 60, delta=5)
+        self.assertAlmostEqual(todo["p50_wait_seconds"], 30 * 60, delta=5)
+        self.assertEqual(todo["by_priority"], {PRIORITY_NEWS: 1, PRIORITY_NORMAL: 4})
+        self.assertIsNotNone(todo["next_deadline"])
+        self.assertEqual(stats["queues"]["REVIEW"]["ready"], 1)
+        self.assertEqual(stats["queues"]["PUBLISHED"]["ready"], 0)
+        self.assertIsNone(stats["queues"]["PUBLISHED"]["p50_wait_seconds"])
+        self.assertNotIn("DONE", stats["queues"])
+
+
+def _override_get_db():
+    db = Session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class TestSchedulingEndpoints(_ScheduleCase):
+
+    @classmethod
+    def setUpClass(cls):
+        app.dependency_overrides[get_db] = _override_get_db
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        app.dependency_overrides.pop(get_db, None)
+
+    def test_schedule_endpoint_sets_only_sent_fields(self):
+        item_id = self._item("x", deadline_at=self.now + timedelta(hours=3))
+
+        resp = self.client.post(f"/pipeline/items/{item_id}/schedule", json={"priority": PRIORITY_NEWS})
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertEqual(data["priority"], PRIORITY_NEWS)
+        self.assertIsNotNone(data["deadline_at"])
+
+        resp = self.client.post(f"/pipeline/items/{item_id}/schedule", json={"deadline_at": None})
+        self.assertIsNone(resp.json()["deadline_at"])
+        self.assertEqual(self.db.query(AuditLog).filter(AuditLog.action == "pipeline.schedule").count(), 2)
+
+    def test_schedule_endpoint_errors(self):
+        item_id = self._item("x")
+        self.assertEqual(self.client.post(f"/pipeline/items/{item_id}/schedule", json={}).status_code, 400)
+        self.assertEqual(
+            self.client.post(f"/pipeline/items/{item_id}/schedule", json={"priority": None}).status_code, 400,
+        )
+        self.assertEqual(
+            self.client.post(f"/pipeline/items/{uuid.uuid4()}/schedule", json={"priority": 1}).status_code, 404,
+        )
+
+    def test_queue_endpoint(self):
+        self._item("ready")
+        resp = self.client.get("/pipeline/queue")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["queues"]["TODO"]["ready"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
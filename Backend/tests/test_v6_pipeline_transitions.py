@@ -0,0 +1,312 @@
+"""V6 pipeline transition log and analytics tests.
+
+Covers:
+- Every status change appends a pipeline_transitions row in its own commit;
+  failed moves leave no row
+- Editor batches and Morgan resets log their moves with one batched INSERT
+- Time-in-stage percentiles, revision loops and daily throughput
+  (get_pipeline_analytics, GET /pipeline/analytics); days are UTC days
+  on PostgreSQL too
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_pipeline_transitions_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from app.db import get_db
+from app.main import app
+from app.models import (
+    AuditLog,
+    Base,
+    ContentPipelineItem,
+    Draft,
+    PipelineStatus,
+    PipelineTransition,
+    PostFormat,
+    PostTone,
+)
+from app.services.agents.editor import run_editor_batch
+from app.services.agents.morgan import reset_errored_items
+from app.services.pipeline import (
+    TransitionError,
+    advance_item,
+    create_pipeline_item,
+    _utc_day,
+    get_pipeline_analytics,
+    transition,
+)
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+OFF_TOPIC_POST = (
+    "Today I made a delicious pasta recipe with fresh tomatoes and basil. "
+    "The secret is to use slow roasted garlic and a pinch of sea salt."
+)
+
+
+class _TransitionCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(PipelineTransition).delete()
+        self.db.query(ContentPipelineItem).delete()
+        self.db.query(Draft).delete()
+        self.db.query(AuditLog).delete()
+        self.db.commit()
+        self.now = datetime.now(timezone.utc)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _item(self, status, **kwargs):
+        item = ContentPipelineItem(status=status, pillar_theme="Adtech fundamentals", **kwargs)
+        self.db.add(item)
+        self.db.commit()
+        return item.id
+
+    def _log(self, item_id=None):
+        query = self.db.query(PipelineTransition)
+        if item_id is not None:
+            query = query.filter(PipelineTransition.item_id == item_id)
+        return [
+            (row.from_status, row.to_status, row.revision_count, row.actor)
+            for row in query.order_by(PipelineTransition.created_at).all()
+        ]
+
+
+class TestTransitionLog(_TransitionCase):
+
+    def test_created_item_logs_its_starting_status(self):
+        item = create_pipeline_item(self.db, topic_keyword="x", status=PipelineStatus.todo)
+        self.assertEqual(self._log(item.id), [(None, PipelineStatus.todo, 0, None)])
+
+    def test_transition_and_advance_item_log_in_the_same_commit(self):
+        item_id = self._item(PipelineStatus.backlog)
+        commits = []
+
+        def _commit(conn):
+            commits.append(1)
+
+        event.listen(engine, "commit", _commit)
+        try:
+            transition(self.db, item_id, PipelineStatus.backlog, PipelineStatus.todo)
+            self.assertEqual(self._log(item_id), [(PipelineStatus.backlog, PipelineStatus.todo, 0, None)])
+            self.assertEqual(len(commits), 1)
+
+            advance_item(self.db, item_id, PipelineStatus.todo, PipelineStatus.writing)
+            self.assertEqual(len(commits), 2)
+        finally:
+            event.remove(engine, "commit", _commit)
+
+        self.db.query(ContentPipelineItem).filter_by(id=item_id).update(
+            {"status": PipelineStatus.review, "claimed_by": "editor-1"},
+        )
+        self.db.commit()
+        advance_item(
+            self.db, item_id, PipelineStatus.review, PipelineStatus.todo,
+            worker_id="editor-1", bump_revision=True,
+        )
+        self.assertEqual(
+            self._log(item_id)[-1],
+            (PipelineStatus.review, PipelineStatus.todo, 1, "editor-1"),
+        )
+
+    def test_failed_moves_leave_no_row(self):
+        item_id = self._item(PipelineStatus.review, claimed_by="editor-2")
+        with self.assertRaises(TransitionError):
+            transition(self.db, item_id, PipelineStatus.todo, PipelineStatus.writing)
+        with self.assertRaises(TransitionError):
+            advance_item(
+                self.db, item_id, PipelineStatus.review, PipelineStatus.ready_to_publish,
+                worker_id="editor-other",
+            )
+        self.assertEqual(self._log(item_id), [])
+
+
+class TestBulkMovesLog(_TransitionCase):
+
+    def _review_item(self):
+        draft = Draft(
+            pillar_theme="Adtech fundamentals",
+            sub_theme="Programmatic buying",
+            format=PostFormat.text,
+            tone=PostTone.educational,
+            content_body=OFF_TOPIC_POST,
+        )
+        self.db.add(draft)
+        self.db.flush()
+        return self._item(PipelineStatus.review, draft_id=draft.id)
+
+    def test_editor_batch_logs_every_outcome_in_one_insert(self):
+        ids = [self._review_item() for _ in range(4)]
+        inserts = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if "pipeline_transitions" in statement:
+                inserts.append(executemany)
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            run_editor_batch(self.db, max_items=10, processes=0)
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+        self.assertEqual(inserts, [True])
+        for item_id in ids:
+            (row,) = self._log(item_id)
+            self.assertEqual(row[:3], (PipelineStatus.review, PipelineStatus.todo, 1))
+            self.assertTrue(row[3].startswith("editor"))
+
+    def test_morgan_resets_are_logged(self):
+        stale = self.now - timedelta(hours=2)
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "created_at": stale,
+                "updated_at": stale,
+                "status": PipelineStatus.writing,
+                "revision_count": 1,
+                "max_revisions": 3,
+                "last_error": "LLM timeout",
+            }
+            for _ in range(3)
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(ContentPipelineItem), rows)
+
+        self.assertEqual(len(reset_errored_items(self.db, chunk_size=2)), 3)
+        self.assertEqual(
+            self._log(),
+            [(PipelineStatus.writing, PipelineStatus.todo, 1, "morgan")] * 3,
+        )
+
+
+class TestAnalytics(_TransitionCase):
+
+    def _moves(self, *steps, start=None):
+        """Log one item's moves: steps are (to_status, minutes after the previous move)."""
+        item_id = self._item(steps[-1][0])
+        at = start or self.now - timedelta(days=1)
+        previous = None
+        rows = []
+        for to_status, minutes in steps:
+            at += timedelta(minutes=minutes)
+            rows.append({
+                "item_id": item_id, "from_status": previous, "to_status": to_status,
+                "revision_count": 0, "actor": None, "created_at": at,
+            })
+            previous = to_status
+        self.db.execute(insert(PipelineTransition), rows)
+        self.db.commit()
+        return item_id
+
+    def test_time_in_stage_percentiles(self):
+        S = PipelineStatus
+        for minutes in range(1, 21):
+            self._moves((S.backlog, 0), (S.todo, 5), (S.writing, 1), (S.review, minutes), (S.ready_to_publish, 3))
+        # Still in REVIEW: no completed stay
+        self._moves((S.todo, 0), (S.writing, 1), (S.review, 10))
+
+        stats = get_pipeline_analytics(self.db, days=7)["time_in_stage"]
+
+        self.assertEqual(stats["WRITING"]["count"], 21)
+        self.assertAlmostEqual(stats["WRITING"]["p50_seconds"], 10 * 60, delta=1)
+        self.assertAlmostEqual(stats["WRITING"]["p95_seconds"], 19 * 60, delta=1)
+        self.assertAlmostEqual(stats["WRITING"]["max_seconds"], 20 * 60, delta=1)
+        self.assertAlmostEqual(stats["BACKLOG"]["p95_seconds"], 5 * 60, delta=1)
+        self.assertEqual(stats["REVIEW"]["count"], 20)
+        self.assertNotIn("READY_TO_PUBLISH", stats)
+
+    def test_revision_loops(self):
+        S = PipelineStatus
+        self._moves((S.todo, 0), (S.writing, 1), (S.review, 1), (S.todo, 1),
+                    (S.writing, 1), (S.review, 1), (S.todo, 1), (S.writing, 1), (S.review, 1))
+        self._moves((S.todo, 0), (S.writing, 1), (S.review, 1), (S.todo, 1))
+        self._moves((S.todo, 0), (S.writing, 1), (S.review, 1), (S.ready_to_publish, 1))
+
+        loops = get_pipeline_analytics(self.db)["revision_loops"]
+        self.assertEqual(loops, {"loops": 3, "items_with_loops": 2, "max_loops_per_item": 2})
+
+    def test_throughput_per_day_and_window(self):
+        S = PipelineStatus
+        yesterday = (self.now - timedelta(days=1)).replace(hour=12)
+        self._moves((S.backlog, 0), (S.ready_to_publish, 1), (S.published, 1), (S.done, 1), start=yesterday)
+        self._moves((S.backlog, 0), start=yesterday)
+        self._moves((S.backlog, 0), (S.done, 1), start=self.now - timedelta(days=30))
+
+        result = get_pipeline_analytics(self.db, days=7)
+        self.assertEqual(
+            result["throughput"],
+            [{"day": yesterday.date().isoformat(), "created": 2, "published": 1, "done": 1}],
+        )
+
+    def test_throughput_days_are_utc_on_postgresql(self):
+        pg = MagicMock()
+        pg.get_bind.return_value.dialect.name = "postgresql"
+        compiled = _utc_day(pg, PipelineTransition.created_at).compile(dialect=postgresql.dialect())
+        self.assertEqual(str(compiled), "date(timezone(%(timezone_1)s, pipeline_transitions.created_at))")
+        self.assertEqual(compiled.params, {"timezone_1": "UTC"})
+
+    def test_empty_log(self):
+        result = get_pipeline_analytics(self.db)
+        self.assertEqual(result["time_in_stage"], {})
+        self.assertEqual(result["revision_loops"], {"loops": 0, "items_with_loops": 0, "max_loops_per_item": 0})
+        self.assertEqual(result["throughput"], [])
+
+
+def _override_get_db():
+    db = Session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class TestAnalyticsEndpoint(_TransitionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        app.dependency_overrides[get_db] = _override_get_db
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        app.dependency_overrides.pop(get_db, None)
+
+    def test_endpoint(self):
+        item = create_pipeline_item(self.db, status=PipelineStatus.todo)
+        transition(self.db, item.id, PipelineStatus.todo, PipelineStatus.writing)
+
+        resp = self.client.get("/pipeline/analytics?days=1")
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertEqual(data["window_days"], 1)
+        self.assertEqual(data["time_in_stage"]["TODO"]["count"], 1)
+        self.assertEqual(data["throughput"][0]["created"], 1)
+        self.assertEqual(self.client.get("/pipeline/analytics?days=0").status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
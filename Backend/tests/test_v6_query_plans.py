@@ -0,0 +1,210 @@
+"""V6 pipeline query-plan regression tests.
+
+Seeds a 100k-row content_pipeline_items table, runs the real pipeline,
+claim-lock and Morgan functions while capturing every statement they send
+to that table, then EXPLAINs each statement and fails if the plan falls
+back to a sequential scan of content_pipeline_items.
+
+Runs on SQLite by default.  Point PIPELINE_PLAN_TEST_DATABASE_URL at a
+scratch PostgreSQL database to check the PostgreSQL plans instead.
+"""
+
+import os
+import re
+import sys
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_query_plans_test.db")
+PLAN_DB_URL = os.environ.get("PIPELINE_PLAN_TEST_DATABASE_URL") or f"sqlite+pysqlite:///{DB_PATH}"
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, ContentPipelineItem, PipelineStatus
+
+SEED_ROWS = 100_000
+TABLE = ContentPipelineItem.__tablename__
+
+engine = create_engine(PLAN_DB_URL)
+Session = sessionmaker(bind=engine)
+
+_SQLITE_TABLE_SCAN = re.compile(rf"\bSCAN {TABLE}\b(?! USING)")
+_PG_SEQ_SCAN = re.compile(rf"Seq Scan on {TABLE}\b")
+
+
+def _seed():
+    """Seed a realistic history: mostly DONE rows plus a small active set."""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    now = datetime.now(timezone.utc)
+    old = now - timedelta(days=30)
+    active = [s for s in PipelineStatus if s is not PipelineStatus.done]
+    rows = []
+    for i in range(SEED_ROWS):
+        row = {
+            "id": uuid.uuid4(),
+            "created_at": old + timedelta(seconds=i),
+            "updated_at": old + timedelta(seconds=i),
+            "status": PipelineStatus.done,
+            "revision_count": 0,
+            "max_revisions": 3,
+            "claimed_by": None,
+            "claim_stage": None,
+            "claimed_at": None,
+            "claim_expires_at": None,
+            "last_error": None,
+        }
+        if i % 250 == 0:
+            row["status"] = active[(i // 250) % len(active)]
+        if i % 1000 == 0:
+            row["claimed_by"] = f"writer-{i}"
+            row["claim_stage"] = "writing"
+            row["claimed_at"] = now - timedelta(hours=2)
+            row["claim_expires_at"] = now - timedelta(hours=1)
+        elif i % 500 == 0:
+            row["last_error"] = "seeded error"
+        rows.append(row)
+
+    with engine.begin() as conn:
+        for start in range(0, len(rows), 10_000):
+            conn.execute(insert(ContentPipelineItem), rows[start:start + 10_000])
+        if engine.dialect.name == "postgresql":
+            conn.execute(text(f"ANALYZE {TABLE}"))
+        else:
+            conn.execute(text("ANALYZE"))
+
+
+class _StatementCapture:
+    """Record every statement touching the pipeline table."""
+
+    def __init__(self):
+        self.statements: list[tuple[str, object]] = []
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        head = statement.lstrip().upper()
+        if TABLE in statement and head.startswith(("SELECT", "UPDATE", "DELETE")):
+            self.statements.append((statement, parameters))
+
+
+def _plan(statement: str, parameters) -> str:
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).fetchall()
+            lines = [r[0] for r in rows]
+        else:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            lines = [r[-1] for r in rows]
+        conn.rollback()
+    return "\n".join(lines)
+
+
+def _is_sequential_scan(plan: str) -> bool:
+    pattern = _PG_SEQ_SCAN if engine.dialect.name == "postgresql" else _SQLITE_TABLE_SCAN
+    return any(pattern.search(line) for line in plan.splitlines())
+
+
+def setUpModule():
+    _seed()
+
+
+def tearDownModule():
+    engine.dispose()
+
+
+class TestPipelineQueryPlans(unittest.TestCase):
+    """Each hot pipeline query must be answered from an index."""
+
+    def setUp(self):
+        self.db = Session()
+
+    def tearDown(self):
+        self.db.rollback()
+        self.db.close()
+
+    def _assert_indexed(self, fn, *args, **kwargs):
+        with _StatementCapture() as capture:
+            fn(*args, **kwargs)
+        self.assertTrue(capture.statements, f"{fn.__name__} issued no pipeline queries")
+        for statement, parameters in capture.statements:
+            plan = _plan(statement, parameters)
+            self.assertFalse(
+                _is_sequential_scan(plan),
+                f"{fn.__name__} regressed to a sequential scan:\n{statement}\n--- plan ---\n{plan}",
+            )
+
+    # ── app/services/pipeline.py ────────────────────────────────────────────
+
+    def test_get_items_by_status(self):
+        from app.services.pipeline import get_items_by_status
+        self._assert_indexed(get_items_by_status, self.db, PipelineStatus.review)
+
+    def test_get_unclaimed_items_by_status(self):
+        from app.services.pipeline import get_unclaimed_items_by_status
+        self._assert_indexed(get_unclaimed_items_by_status, self.db, PipelineStatus.todo)
+
+    def test_get_queue_stats(self):
+        from app.services.pipeline import get_queue_stats
+        self._assert_indexed(get_queue_stats, self.db)
+
+    def test_get_pipeline_overview(self):
+        # The GROUP BY aggregate reads every row by design; only the cache
+        # probe that runs on every call must stay an index lookup.
+        from app.services.pipeline import clear_pipeline_overview_cache, get_pipeline_overview
+        clear_pipeline_overview_cache()
+        with _StatementCapture() as capture:
+            get_pipeline_overview(self.db)
+        self.assertEqual(len(capture.statements), 2)
+        probe, _aggregate = capture.statements
+        self.assertFalse(_is_sequential_scan(_plan(*probe)))
+
+    # ── app/services/claim_lock.py ──────────────────────────────────────────
+
+    def test_claim_batch(self):
+        from app.services.claim_lock import claim_batch
+        self._assert_indexed(claim_batch, self.db, PipelineStatus.todo, "writing", "plan-test", limit=3)
+
+    def test_find_stale_claims(self):
+        from app.services.claim_lock import find_stale_claims
+        self._assert_indexed(find_stale_claims, self.db, max_age_minutes=30)
+
+    # ── app/services/agents/morgan.py ───────────────────────────────────────
+
+    def test_recover_stale_claims(self):
+        from app.services.agents.morgan import recover_stale_claims
+        self._assert_indexed(recover_stale_claims, self.db, max_age_minutes=30)
+
+    def test_reset_errored_items(self):
+        from app.services.agents.morgan import reset_errored_items
+        self._assert_indexed(reset_errored_items, self.db)
+
+    def test_generate_health_report(self):
+        from app.services.agents.morgan import generate_health_report
+        self._assert_indexed(generate_health_report, self.db)
+
+
+class TestPlanDetector(unittest.TestCase):
+    """Guard the detector itself so a format change can't make tests vacuous."""
+
+    def test_unindexed_predicate_is_flagged(self):
+        plan = _plan(f"SELECT id FROM {TABLE} WHERE topic_keyword = 'x'", ())
+        self.assertTrue(_is_sequential_scan(plan), plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
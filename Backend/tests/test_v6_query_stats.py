@@ -0,0 +1,243 @@
+"""V6 SQL statement accounting tests.
+
+Covers:
+- track_queries scopes count statements and DB time; nested scopes roll up
+- Slow statements are logged and recorded on the scope
+- Each HTTP request logs its statement count with its request ID, and
+  JSONFormatter emits the db / task fields
+- Celery task signals open and log a scope per task
+- query_budget fails with the statement listing when a block goes over
+- Hot read endpoints stay within a fixed budget; recent sub-themes are
+  one statement, not one per post
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_query_stats_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app import query_stats
+from app.config import settings
+from app.db import get_db
+from app.logging_config import JSONFormatter
+from app.main import app
+from app.models import (
+    Base,
+    ContentPipelineItem,
+    Draft,
+    PipelineStatus,
+    PostFormat,
+    PostTone,
+    PublishedPost,
+)
+from app.query_stats import instrument_engine, query_budget, track_queries
+from app.services.content_pyramid import get_recent_sub_themes
+
+engine = instrument_engine(create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+))
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+
+class _Capture(logging.Handler):
+    """Keeps query_stats log records, formatted as JSON."""
+
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.setFormatter(JSONFormatter())
+        self.records = []
+        self.lines = []
+
+    def emit(self, record):
+        # Format now, as a real handler would: the request ID is only in context here
+        self.records.append(record)
+        self.lines.append(self.format(record))
+
+    def __enter__(self):
+        self._logger = logging.getLogger("app.query_stats")
+        self._level = self._logger.level
+        self._logger.setLevel(logging.DEBUG)
+        self._logger.addHandler(self)
+        return self
+
+    def __exit__(self, *exc):
+        self._logger.removeHandler(self)
+        self._logger.setLevel(self._level)
+
+    def json(self):
+        return [json.loads(line) for line in self.lines]
+
+
+def _override_get_db():
+    db = Session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class _StatsCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(PublishedPost).delete()
+        self.db.query(ContentPipelineItem).delete()
+        self.db.query(Draft).delete()
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    def _draft(self, sub_theme="Programmatic buying"):
+        draft = Draft(
+            pillar_theme="Adtech fundamentals",
+            sub_theme=sub_theme,
+            format=PostFormat.text,
+            tone=PostTone.educational,
+            content_body="Body",
+        )
+        self.db.add(draft)
+        self.db.flush()
+        return draft
+
+
+class TestScopes(_StatsCase):
+
+    def test_counts_statements_and_time(self):
+        with track_queries("outer") as outer:
+            self.db.execute(text("SELECT 1"))
+            with track_queries("inner") as inner:
+                self.db.execute(text("SELECT 2"))
+                self.db.execute(text("SELECT 3"))
+        self.assertEqual(inner.statements, 2)
+        self.assertEqual(outer.statements, 3)
+        self.assertGreater(outer.db_time_ms, 0)
+        self.assertIsNone(query_stats.current_query_stats())
+
+    def test_statements_outside_a_scope_are_not_counted(self):
+        self.db.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            pass
+        self.assertEqual(stats.statements, 0)
+
+    def test_slow_statements_are_logged_and_recorded(self):
+        with patch.object(settings, "db_slow_query_ms", 0), _Capture() as capture:
+            with track_queries() as stats:
+                self.db.execute(text("SELECT   1\n  AS one"))
+        self.assertEqual(stats.slow_count, 1)
+        self.assertEqual(stats.slow[0]["statement"], "SELECT 1 AS one")
+        (record,) = capture.records
+        self.assertEqual(record.levelno, logging.WARNING)
+        self.assertIn("Slow query", record.getMessage())
+
+
+class TestRequestStats(_StatsCase):
+
+    @classmethod
+    def setUpClass(cls):
+        app.dependency_overrides[get_db] = _override_get_db
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        app.dependency_overrides.pop(get_db, None)
+
+    def test_request_summary_carries_request_id_and_counts(self):
+        with _Capture() as capture:
+            resp = self.client.get("/drafts", headers={"X-Request-ID": "req-42"})
+        self.assertEqual(resp.status_code, 200)
+
+        (entry,) = [e for e in capture.json() if e["message"].startswith("GET /drafts")]
+        self.assertEqual(entry["request_id"], "req-42")
+        self.assertEqual(entry["db"]["statements"], 1)
+        self.assertIn("-> 200", entry["message"])
+        self.assertEqual(entry["level"], "INFO")
+
+    def test_heavy_request_logs_a_warning(self):
+        with patch.object(settings, "db_query_warn_count", 1), _Capture() as capture:
+            self.client.get("/drafts")
+        (record,) = [r for r in capture.records if r.getMessage().startswith("GET /drafts")]
+        self.assertEqual(record.levelno, logging.WARNING)
+
+    def test_hot_endpoints_stay_within_budget(self):
+        for n in range(5):
+            draft = self._draft(f"Theme {n}")
+            self.db.add(ContentPipelineItem(status=PipelineStatus.todo, draft_id=draft.id))
+        self.db.commit()
+
+        for path in ("/drafts", "/posts", "/pipeline/items", "/pipeline/items?status=todo"):
+            with self.subTest(path=path), query_budget(1, engine):
+                self.assertEqual(self.client.get(path).status_code, 200)
+
+
+class TestTaskStats(_StatsCase):
+
+    def test_task_signals_log_one_summary_per_task(self):
+        task = SimpleNamespace(name="v6_run_writer")
+        with _Capture() as capture:
+            query_stats._task_prerun(task_id="t-1", task=task)
+            self.db.execute(text("SELECT 1"))
+            self.db.execute(text("SELECT 2"))
+            query_stats._task_postrun(task_id="t-1", task=task, state="SUCCESS")
+            # A postrun without a matching prerun is ignored
+            query_stats._task_postrun(task_id="t-2", task=task)
+
+        (entry,) = capture.json()
+        self.assertEqual((entry["task"], entry["task_id"]), ("v6_run_writer", "t-1"))
+        self.assertEqual(entry["db"]["statements"], 2)
+        self.assertEqual(entry["message"][:26], "Task v6_run_writer SUCCESS")
+        self.assertIsNone(query_stats.current_query_stats())
+
+
+class TestQueryBudget(_StatsCase):
+
+    def test_within_budget(self):
+        with query_budget(2, engine) as seen:
+            self.db.execute(text("SELECT 1"))
+        self.assertEqual(len(seen), 1)
+
+    def test_over_budget_lists_the_statements(self):
+        with self.assertRaises(AssertionError) as ctx:
+            with query_budget(1, engine):
+                self.db.execute(text("SELECT 1"))
+                self.db.execute(text("SELECT 2"))
+        self.assertIn("2 statements > 1", str(ctx.exception))
+        self.assertIn("2. SELECT 2", str(ctx.exception))
+
+    def test_recent_sub_themes_is_one_statement(self):
+        now = datetime.now(timezone.utc)
+        for n in range(4):
+            draft = self._draft(f"Theme {n}")
+            self.db.add(PublishedPost(
+                draft_id=draft.id, content_body="Body", format=PostFormat.text,
+                tone=PostTone.educational, published_at=now,
+            ))
+        self.db.commit()
+        self.db.expire_all()
+
+        with query_budget(1, engine):
+            themes = get_recent_sub_themes(self.db)
+        self.assertEqual(sorted(themes), ["Theme 0", "Theme 1", "Theme 2", "Theme 3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""V6 deferred source summarisation tests.
+
+Covers:
+- ingest_feed_entries checks URLs with one IN query and inserts in bulk
+- New rows are stored immediately as summary_pending, with no LLM call inline
+- summarize_pending_sources runs LLM calls concurrently, outside any DB transaction
+- Batched prompts (several articles per request) and their per-article fallback
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_source_summaries_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.models import Base, SourceMaterial
+from app.services import llm
+from app.services.research_ingestion import ingest_feed_entries, summarize_pending_sources
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+LLM_LATENCY = 0.1
+
+
+def _entries(count, prefix="story"):
+    return [
+        {
+            "title": f"Retail media {prefix} {n}",
+            "link": f"https://news.example.com/{prefix}/{n}",
+            "summary": f"Programmatic measurement excerpt {n}.",
+            "published": "Fri, 16 Oct 2026 08:00:00 GMT",
+        }
+        for n in range(count)
+    ]
+
+
+class _SummaryCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(SourceMaterial).delete()
+        self.db.commit()
+        overrides = {
+            "llm_provider": "claude",
+            "llm_api_key": "test-key",
+            "research_summary_concurrency": 4,
+            "research_summary_batch_size": 1,
+        }
+        for name, value in overrides.items():
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.db.close()
+
+
+class TestIngestEntries(_SummaryCase):
+
+    def test_bulk_existence_check_and_insert_without_llm(self):
+        ingest_feed_entries(self.db, "Feed", _entries(3), max_items=10)
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement.lstrip().split(" ")[0], executemany, statement))
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            with patch.object(llm, "_call_claude") as call:
+                created = ingest_feed_entries(self.db, "Feed", _entries(10), max_items=10)
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+        self.assertEqual(created, 7)
+        call.assert_not_called()
+        selects = [s for kind, _, s in statements if kind == "SELECT"]
+        inserts = [(kind, many) for kind, many, _ in statements if kind == "INSERT"]
+        self.assertEqual(len(selects), 1)
+        self.assertIn(" IN ", selects[0])
+        self.assertEqual(inserts, [("INSERT", True)])
+
+        rows = self.db.query(SourceMaterial).all()
+        self.assertEqual(len(rows), 10)
+        self.assertTrue(all(row.summary_pending for row in rows))
+        row = self.db.query(SourceMaterial).filter_by(url="https://news.example.com/story/5").one()
+        self.assertEqual(row.summary_text, "Programmatic measurement excerpt 5.")
+        self.assertEqual(row.pillar_theme, "Adtech fundamentals")
+
+    def test_duplicate_links_within_a_feed_are_inserted_once(self):
+        entries = _entries(2) + _entries(2)
+        self.assertEqual(ingest_feed_entries(self.db, "Feed", entries, max_items=10), 2)
+
+    def test_without_llm_summaries_are_final(self):
+        with patch.object(settings, "llm_api_key", None):
+            ingest_feed_entries(self.db, "Feed", _entries(2), max_items=10)
+        self.assertFalse(any(row.summary_pending for row in self.db.query(SourceMaterial).all()))
+
+
+class TestSummarizePending(_SummaryCase):
+
+    def setUp(self):
+        super().setUp()
+        ingest_feed_entries(self.db, "Feed", _entries(8), max_items=10)
+        self.calls = []
+        self.in_transaction = []
+        self.lock = threading.Lock()
+
+    def _fake_claude(self, prompt, cache=True, max_tokens=llm.CLAUDE_MAX_TOKENS):
+        with self.lock:
+            self.calls.append(prompt)
+            self.in_transaction.append(self.db.in_transaction())
+        time.sleep(LLM_LATENCY)
+        if "JSON array" in prompt:
+            count = prompt.count("Article ")
+            return json.dumps([f"Batch summary {n}" for n in range(count)])
+        return "LLM summary."
+
+    def test_summaries_run_concurrently_outside_transactions(self):
+        started = time.perf_counter()
+        with patch.object(llm, "_call_claude", side_effect=self._fake_claude):
+            updated = summarize_pending_sources(self.db)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(updated, 8)
+        self.assertEqual(len(self.calls), 8)
+        self.assertLess(elapsed, LLM_LATENCY * 8 / 2)
+        self.assertEqual(set(self.in_transaction), {False})
+
+        self.db.expire_all()
+        rows = self.db.query(SourceMaterial).all()
+        self.assertTrue(all(not row.summary_pending for row in rows))
+        self.assertEqual({row.summary_text for row in rows}, {"LLM summary."})
+        # Nothing left to do
+        self.assertEqual(summarize_pending_sources(self.db), 0)
+
+    def test_batched_requests_cover_several_articles(self):
+        with patch.object(settings, "research_summary_batch_size", 3), \
+                patch.object(llm, "_call_claude", side_effect=self._fake_claude):
+            updated = summarize_pending_sources(self.db)
+
+        self.assertEqual(updated, 8)
+        # 8 articles in batches of 3 -> 3 requests (3 + 3 + 2)
+        self.assertEqual(len(self.calls), 3)
+        self.db.expire_all()
+        summaries = {row.summary_text for row in self.db.query(SourceMaterial).all()}
+        self.assertEqual(summaries, {"Batch summary 0", "Batch summary 1", "Batch summary 2"})
+
+    def test_mismatched_batch_falls_back_per_article(self):
+        def _short_batch(prompt, cache=True, max_tokens=llm.CLAUDE_MAX_TOKENS):
+            if "JSON array" in prompt:
+                return json.dumps(["only one"])
+            return "Single summary."
+
+        with patch.object(settings, "research_summary_batch_size", 4), \
+                patch.object(llm, "_call_claude", side_effect=_short_batch) as call:
+            summarize_pending_sources(self.db)
+
+        # 2 batch requests, then 8 single-article retries
+        self.assertEqual(call.call_count, 10)
+        self.db.expire_all()
+        summaries = {row.summary_text for row in self.db.query(SourceMaterial).all()}
+        self.assertEqual(summaries, {"Single summary."})
+
+    def test_limit_bounds_one_run(self):
+        with patch.object(llm, "_call_claude", side_effect=self._fake_claude):
+            self.assertEqual(summarize_pending_sources(self.db, limit=5), 5)
+            self.assertEqual(summarize_pending_sources(self.db, limit=5), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
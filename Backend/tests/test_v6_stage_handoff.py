@@ -0,0 +1,311 @@
+"""V6 stage handoff tests.
+
+Covers:
+- A committed transition enqueues the next agent's task for that item
+- Duplicate handoffs are suppressed; broker failures never break the transition
+- The handoff consumer claims by status, so repeats and moved items are no-ops
+- A failing consumer releases only its own claim, never a newer one
+- A handed-off item runs READY_TO_PUBLISH → DONE without any beat run
+- Writer failures back off via next_run_at and park in BACKLOG, never re-handed off
+- BACKLOG → DONE cycle-time percentiles
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_stage_handoff_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import worker
+from app.config import settings
+from app.models import (
+    Base,
+    ContentPipelineItem,
+    Draft,
+    PipelineStatus,
+    PostFormat,
+    PostTone,
+    PublishedPost,
+)
+from app.services.claim_lock import attempt_claim, force_release_claim
+from app.services.pipeline import advance_item, get_cycle_time_stats
+from app.services.stage_handoff import (
+    HANDOFF_TASK_NAME,
+    clear_handoff_dedup,
+    process_handed_off_item,
+)
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+
+class _HandoffCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(PublishedPost).delete()
+        self.db.query(ContentPipelineItem).delete()
+        self.db.query(Draft).delete()
+        self.db.commit()
+        clear_handoff_dedup()
+        patcher = patch.object(settings, "pipeline_handoff_enabled", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.celery = MagicMock()
+        patcher = patch.object(worker, "celery_app", self.celery)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _item(self, status, claimed_by=None, with_draft=False, **kwargs):
+        if with_draft:
+            draft = Draft(
+                pillar_theme="Adtech fundamentals",
+                sub_theme="Programmatic buying",
+                format=PostFormat.text,
+                tone=PostTone.educational,
+                content_body="In my experience, programmatic measurement is a finance conversation.",
+            )
+            self.db.add(draft)
+            self.db.flush()
+            kwargs["draft_id"] = draft.id
+        item = ContentPipelineItem(status=status, pillar_theme="Adtech fundamentals", **kwargs)
+        self.db.add(item)
+        self.db.commit()
+        if claimed_by:
+            attempt_claim(self.db, item.id, "stage", claimed_by)
+        self.db.refresh(item)
+        return item
+
+    def _sent(self):
+        return [call.kwargs.get("args") or call.args[1] for call in self.celery.send_task.call_args_list]
+
+
+class TestEnqueue(_HandoffCase):
+
+    def test_transition_enqueues_next_stage_once(self):
+        item = self._item(PipelineStatus.review, claimed_by="editor-1")
+        advance_item(
+            self.db, item.id, PipelineStatus.review, PipelineStatus.ready_to_publish,
+            worker_id="editor-1",
+        )
+
+        self.celery.send_task.assert_called_once()
+        self.assertEqual(self.celery.send_task.call_args.args[0], HANDOFF_TASK_NAME)
+        self.assertEqual(self._sent(), [[str(item.id), "READY_TO_PUBLISH"]])
+
+        # A repeat of the same transition (same revision) is suppressed
+        from app.services.stage_handoff import on_transition
+        self.assertFalse(on_transition(item.id, PipelineStatus.ready_to_publish, 0))
+        self.assertEqual(self.celery.send_task.call_count, 1)
+
+    def test_revision_loop_is_not_mistaken_for_a_duplicate(self):
+        item = self._item(PipelineStatus.review, claimed_by="editor-1")
+        advance_item(
+            self.db, item.id, PipelineStatus.review, PipelineStatus.todo,
+            worker_id="editor-1", bump_revision=True,
+        )
+        attempt_claim(self.db, item.id, "writing", "writer-1")
+        advance_item(
+            self.db, item.id, PipelineStatus.todo, PipelineStatus.writing,
+            worker_id="writer-1", release_claim=False,
+        )
+        advance_item(
+            self.db, item.id, PipelineStatus.writing, PipelineStatus.review, worker_id="writer-1",
+        )
+        self.assertEqual(
+            self._sent(),
+            [[str(item.id), "TODO"], [str(item.id), "REVIEW"]],
+        )
+
+    def test_kept_claims_and_agentless_statuses_do_not_enqueue(self):
+        item = self._item(PipelineStatus.todo, claimed_by="writer-1")
+        advance_item(
+            self.db, item.id, PipelineStatus.todo, PipelineStatus.writing,
+            worker_id="writer-1", release_claim=False,
+        )
+        advance_item(
+            self.db, item.id, PipelineStatus.writing, PipelineStatus.backlog, worker_id="writer-1",
+        )
+        self.celery.send_task.assert_not_called()
+
+    def test_disabled_handoff_sends_nothing(self):
+        item = self._item(PipelineStatus.backlog)
+        with patch.object(settings, "pipeline_handoff_enabled", False):
+            advance_item(self.db, item.id, PipelineStatus.backlog, PipelineStatus.todo)
+        self.celery.send_task.assert_not_called()
+
+    def test_broker_failure_does_not_break_the_transition(self):
+        self.celery.send_task.side_effect = ConnectionError("broker down")
+        item = self._item(PipelineStatus.backlog)
+
+        updated = advance_item(self.db, item.id, PipelineStatus.backlog, PipelineStatus.todo)
+        self.assertEqual(updated.status, PipelineStatus.todo)
+
+        # Not remembered as sent, so a later retry may enqueue it
+        self.celery.send_task.side_effect = None
+        from app.services.stage_handoff import on_transition
+        self.assertTrue(on_transition(item.id, PipelineStatus.todo, 0))
+
+
+class TestConsumer(_HandoffCase):
+
+    @patch("app.services.agents.publisher.send_telegram_message")
+    @patch("app.services.agents.publisher.send_webhook")
+    def test_repeat_delivery_is_a_no_op(self, _webhook, _telegram):
+        item = self._item(PipelineStatus.ready_to_publish, with_draft=True)
+
+        self.assertEqual(
+            process_handed_off_item(self.db, item.id, PipelineStatus.ready_to_publish),
+            "processed",
+        )
+        self.assertEqual(
+            process_handed_off_item(self.db, item.id, PipelineStatus.ready_to_publish),
+            "skipped:claimed_or_moved",
+        )
+        self.assertEqual(self.db.query(PublishedPost).count(), 1)
+
+    def test_claimed_item_is_left_to_its_owner(self):
+        item = self._item(PipelineStatus.review, claimed_by="editor-beat")
+        self.assertEqual(
+            process_handed_off_item(self.db, item.id, PipelineStatus.review),
+            "skipped:claimed_or_moved",
+        )
+        self.db.expire_all()
+        self.assertEqual(self.db.get(ContentPipelineItem, item.id).claimed_by, "editor-beat")
+
+    def test_failure_does_not_release_a_newer_claim(self):
+        item = self._item(PipelineStatus.review)
+
+        def _recovered_then_fail(db, claimed, worker_id):
+            force_release_claim(db, claimed.id)
+            attempt_claim(db, claimed.id, "review", "editor-beat")
+            raise RuntimeError("lease recovered mid-run")
+
+        with patch("app.services.agents.editor.process_one_item", side_effect=_recovered_then_fail):
+            with self.assertRaises(RuntimeError):
+                process_handed_off_item(self.db, item.id, PipelineStatus.review)
+
+        self.db.expire_all()
+        self.assertEqual(self.db.get(ContentPipelineItem, item.id).claimed_by, "editor-beat")
+
+    @patch("app.services.agents.promoter.send_telegram_message")
+    @patch("app.services.agents.publisher.send_telegram_message")
+    @patch("app.services.agents.publisher.send_webhook")
+    def test_chain_runs_to_done_without_beat(self, _webhook, _telegram, _promo_telegram):
+        consumer = Session()
+        self.addCleanup(consumer.close)
+
+        def _run_now(name, args):
+            item_id, status = args
+            process_handed_off_item(consumer, uuid.UUID(item_id), PipelineStatus(status))
+
+        self.celery.send_task.side_effect = _run_now
+        item = self._item(
+            PipelineStatus.review,
+            claimed_by="editor-1",
+            with_draft=True,
+            created_at=datetime.now(timezone.utc) - timedelta(minutes=5),
+        )
+        advance_item(
+            self.db, item.id, PipelineStatus.review, PipelineStatus.ready_to_publish,
+            worker_id="editor-1",
+        )
+
+        self.db.expire_all()
+        item = self.db.get(ContentPipelineItem, item.id)
+        self.assertEqual(item.status, PipelineStatus.done)
+        self.assertIsNotNone(item.completed_at)
+        self.assertEqual(
+            [args[1] for args in self._sent()],
+            ["READY_TO_PUBLISH", "PUBLISHED"],
+        )
+        stats = get_cycle_time_stats(self.db)
+        self.assertEqual(stats["completed"], 1)
+        self.assertGreaterEqual(stats["p50_seconds"], 5 * 60 - 1)
+
+    @patch("app.services.agents.writer.generate_draft", side_effect=RuntimeError("LLM down"))
+    def test_failing_writer_backs_off_and_parks_without_handoff(self, _generate):
+        consumer = Session()
+        self.addCleanup(consumer.close)
+
+        def _run_now(name, args):
+            item_id, status = args
+            process_handed_off_item(consumer, uuid.UUID(item_id), PipelineStatus(status))
+
+        self.celery.send_task.side_effect = _run_now
+        item = self._item(PipelineStatus.backlog)
+        advance_item(self.db, item.id, PipelineStatus.backlog, PipelineStatus.todo)
+
+        # One handoff for BACKLOG → TODO; the failure waits for its backoff
+        self.db.expire_all()
+        item = self.db.get(ContentPipelineItem, item.id)
+        self.assertEqual(self.celery.send_task.call_count, 1)
+        self.assertEqual((item.status, item.revision_count), (PipelineStatus.todo, 1))
+        first_retry = item.next_run_at.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)
+        self.assertGreater(first_retry, timedelta(seconds=settings.writer_retry_base_seconds - 5))
+        self.assertEqual(
+            process_handed_off_item(self.db, item.id, PipelineStatus.todo), "skipped:claimed_or_moved",
+        )
+
+        for _ in range(item.max_revisions):
+            item.next_run_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            self.db.commit()
+            process_handed_off_item(self.db, item.id, PipelineStatus.todo)
+            self.db.expire_all()
+            item = self.db.get(ContentPipelineItem, item.id)
+            if item.status == PipelineStatus.backlog:
+                break
+
+        self.assertEqual((item.status, item.revision_count), (PipelineStatus.backlog, item.max_revisions))
+        self.assertEqual(self.celery.send_task.call_count, 1)
+        self.assertEqual(_generate.call_count, item.max_revisions)
+
+
+class TestCycleTimeStats(_HandoffCase):
+
+    def test_percentiles_over_completed_window(self):
+        now = datetime.now(timezone.utc)
+        for hours in range(1, 21):
+            self._item(
+                PipelineStatus.done,
+                created_at=now - timedelta(hours=hours),
+                completed_at=now,
+            )
+        # Outside the window and not yet completed
+        self._item(PipelineStatus.done, created_at=now - timedelta(days=30), completed_at=now - timedelta(days=20))
+        self._item(PipelineStatus.review, created_at=now - timedelta(days=2))
+
+        stats = get_cycle_time_stats(self.db, days=7)
+        self.assertEqual(stats["completed"], 20)
+        self.assertAlmostEqual(stats["p50_seconds"], 10 * 3600, delta=5)
+        self.assertAlmostEqual(stats["p95_seconds"], 19 * 3600, delta=5)
+        self.assertAlmostEqual(stats["max_seconds"], 20 * 3600, delta=5)
+
+    def test_empty_window(self):
+        stats = get_cycle_time_stats(self.db)
+        self.assertEqual(stats["completed"], 0)
+        self.assertIsNone(stats["p50_seconds"])
+
+
+if __name__ == "__main__":
+    unittest.main()
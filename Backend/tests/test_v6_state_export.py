@@ -0,0 +1,217 @@
+"""V6 streaming state export / import tests.
+
+Covers:
+- Default export is still the single JSON document the dashboard saves
+- NDJSON (plain and gzipped) export round-trips through /admin/import-state
+- Per-table and since-timestamp incremental exports
+- Import upserts by primary key and rejects truncated or foreign files
+  without writing anything
+- Output is chunked rather than built as one string
+"""
+
+import gzip
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_state_export_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import get_db
+from app.main import app
+from app.models import (
+    AppConfig,
+    AuditLog,
+    Base,
+    Comment,
+    Draft,
+    DraftStatus,
+    EngagementMetric,
+    LearningWeight,
+    NotificationLog,
+    PostFormat,
+    PostTone,
+    PublishedPost,
+    SourceMaterial,
+)
+from app.services import state_export
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+NOW = datetime(2026, 10, 1, 12, 0)
+# Children first, for wiping
+ALL_MODELS = (
+    AuditLog, NotificationLog, EngagementMetric, Comment, PublishedPost,
+    Draft, SourceMaterial, LearningWeight, AppConfig,
+)
+
+
+def _override_get_db():
+    db = Session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _ndjson(body: bytes) -> list[dict]:
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+class TestStateExport(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        app.dependency_overrides[get_db] = _override_get_db
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        app.dependency_overrides.pop(get_db, None)
+
+    def setUp(self):
+        self.db = Session()
+        self._wipe()
+        self.db.add(AppConfig(id=1, kill_switch=True))
+        self.db.add(SourceMaterial(source_name="feed", title="t", url="https://example.test/a", created_at=NOW))
+        self.drafts = []
+        for n in range(3):
+            draft = Draft(
+                pillar_theme="Adtech fundamentals", sub_theme="Programmatic", format=PostFormat.text,
+                tone=PostTone.educational, content_body=f"Body {n}", status=DraftStatus.approved,
+                created_at=NOW - timedelta(days=n),
+            )
+            self.db.add(draft)
+            self.drafts.append(draft)
+        self.db.flush()
+        post = PublishedPost(
+            draft_id=self.drafts[0].id, content_body="Body 0", format=PostFormat.text,
+            tone=PostTone.educational, created_at=NOW, published_at=NOW,
+        )
+        self.db.add(post)
+        self.db.flush()
+        self.db.add(Comment(published_post_id=post.id, commenter_name="Ana", comment_text="Hi", commented_at=NOW))
+        self.db.add(EngagementMetric(published_post_id=post.id, impressions=10, collected_at=NOW))
+        self.db.commit()
+
+    def tearDown(self):
+        self._wipe()
+        self.db.close()
+
+    def _wipe(self):
+        for model in ALL_MODELS:
+            self.db.query(model).delete()
+        self.db.commit()
+
+    def test_default_export_is_the_json_document(self):
+        resp = self.client.get("/admin/export-state")
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.headers["content-type"].startswith("application/json"))
+        payload = resp.json()
+        self.assertEqual(payload["meta"]["mode"], "single-user")
+        self.assertEqual(
+            [key for key in payload if key not in ("generated_at", "meta")],
+            [table.key for table in state_export.EXPORT_TABLES],
+        )
+        self.assertEqual(len(payload["drafts"]), 3)
+        self.assertEqual(payload["drafts"][0]["status"], DraftStatus.approved.value)
+        self.assertTrue(payload["config"][0]["kill_switch"])
+
+    def test_gzipped_ndjson_round_trip(self):
+        resp = self.client.get("/admin/export-state?format=ndjson&gzip=true")
+        self.assertEqual(resp.headers["content-type"], "application/gzip")
+        self.assertIn(".ndjson.gz", resp.headers["content-disposition"])
+        body = resp.content
+        lines = _ndjson(gzip.decompress(body))
+        self.assertEqual(lines[0]["format"], state_export.EXPORT_FORMAT)
+        self.assertEqual(lines[-1]["counts"]["drafts"], 3)
+
+        self._wipe()
+        resp = self.client.post("/admin/import-state", content=body)
+        self.assertEqual(resp.status_code, 200, resp.text)
+        self.assertEqual(resp.json()["imported"]["drafts"], 3)
+
+        self.db.expire_all()
+        self.assertEqual(self.db.query(Draft).count(), 3)
+        restored = self.db.get(Draft, self.drafts[1].id)
+        self.assertEqual(restored.status, DraftStatus.approved)
+        self.assertEqual(restored.created_at, NOW - timedelta(days=1))
+        comment = self.db.query(Comment).one()
+        self.assertEqual(comment.published_post.draft_id, self.drafts[0].id)
+        self.assertTrue(self.db.get(AppConfig, 1).kill_switch)
+        self.assertEqual(self.db.query(AuditLog).filter_by(action="admin.import_state").count(), 1)
+
+    def test_incremental_export_for_selected_tables(self):
+        since = (NOW - timedelta(hours=12)).isoformat()
+        resp = self.client.get(f"/admin/export-state?format=ndjson&tables=drafts&tables=comments&since={since}")
+        lines = _ndjson(resp.content)
+        self.assertEqual(lines[0]["tables"], ["drafts", "comments"])
+        self.assertEqual({line["table"] for line in lines[1:-1]}, {"drafts", "comments"})
+        self.assertEqual(lines[-1]["counts"], {"drafts": 1, "comments": 1})
+
+        self.assertEqual(self.client.get("/admin/export-state?tables=users").status_code, 400)
+
+    def test_import_updates_existing_rows(self):
+        body = self.client.get("/admin/export-state?format=ndjson&tables=drafts").content
+        self.db.get(Draft, self.drafts[2].id).content_body = "Edited"
+        self.db.query(Draft).filter(Draft.id == self.drafts[0].id).delete()
+        self.db.query(PublishedPost).delete(synchronize_session=False)
+        self.db.commit()
+
+        resp = self.client.post("/admin/import-state", content=body)
+        self.assertEqual(resp.json()["imported"], {"drafts": 3})
+        self.db.expire_all()
+        self.assertEqual(self.db.query(Draft).count(), 3)
+        self.assertEqual(self.db.get(Draft, self.drafts[2].id).content_body, "Body 2")
+
+    def test_bad_imports_write_nothing(self):
+        body = self.client.get("/admin/export-state?format=ndjson").content
+        self._wipe()
+
+        truncated = b"\n".join(body.splitlines()[:-1])
+        resp = self.client.post("/admin/import-state", content=truncated)
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn("truncated", resp.json()["detail"])
+
+        legacy = self.client.post("/admin/import-state", content=b'{"generated_at": "x", "drafts": []}')
+        self.assertEqual(legacy.status_code, 400)
+
+        self.db.expire_all()
+        self.assertEqual(self.db.query(Draft).count(), 0)
+        self.assertEqual(self.db.query(SourceMaterial).count(), 0)
+
+    def test_rows_are_streamed_in_chunks(self):
+        pieces = (f"{n:08d}\n" for n in range(20_000))
+        chunks = list(state_export.iter_chunks(pieces))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) < 2 * state_export.CHUNK_BYTES for chunk in chunks))
+
+        compressed = list(state_export.iter_chunks((f"{n:08d}\n" for n in range(20_000)), compress=True))
+        self.assertEqual(gzip.decompress(b"".join(compressed)), b"".join(chunks))
+
+        header = {"format": state_export.EXPORT_FORMAT, "version": state_export.EXPORT_VERSION}
+        stream = io.BytesIO((json.dumps(header) + '\n{"end": true}\n').encode())
+        self.assertEqual(state_export.import_state_stream(self.db, stream), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
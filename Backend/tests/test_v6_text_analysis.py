@@ -0,0 +1,171 @@
+"""V6 single-pass text analysis tests.
+
+Covers:
+- Overlapping and prefix phrases are all reported, tagged by gate
+- Matches agree with the naive `phrase in lowered` checks they replace
+- The Editor's guardrail gate gives the same verdict as validate_post
+- review_content scans the post once; the matcher is rebuilt only for a new context
+- Small matchers scan with str.find, large ones with the automaton; both
+  report the same hits
+- Above the direct-scan size, scan cost stays flat as the phrase lists grow
+"""
+
+import os
+import random
+import sys
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.agents import editor
+from app.services.guardrails import validate_post
+from app.services.product_context import ProductContext
+from app.services import text_analysis
+from app.services.text_analysis import DIRECT_SCAN_MAX_PHRASES, PhraseMatcher
+
+POST = (
+    "In my experience, programmatic buyers said the best attribution model is the one "
+    "your finance team trusts. Over the past year I have seen retail media budgets grow."
+)
+
+
+def _context(**overrides):
+    values = {
+        "title": "Head of Sales",
+        "banned_phrases": ["leverage (as verb)", "game changer"],
+        "engagement_bait": ["Agree or disagree?", "Share this with someone who..."],
+        "experience_markers": ["In my experience...", "One lesson I learned..."],
+        "banned_claims": ["Guaranteed outcomes or ROI promises"],
+        "out_of_scope_topics": ["Cryptocurrency, blockchain, or Web3"],
+    }
+    values.update(overrides)
+    return ProductContext(**values)
+
+
+class TestPhraseMatcher(unittest.TestCase):
+
+    def test_overlapping_and_prefix_phrases_are_all_found(self):
+        matcher = PhraseMatcher({
+            "first_person": ["i have", "i have seen", "have seen"],
+            "domain": ["ai", "media", "retail media"],
+        })
+        scan = matcher.scan(POST)
+
+        self.assertEqual(scan.found("first_person"), ["i have", "i have seen", "have seen"])
+        self.assertEqual(scan.found("domain"), ["ai", "media", "retail media"])
+        # "ai" inside "said" and "trusts"... substring semantics are kept
+        self.assertGreaterEqual(sum(1 for h in scan.hits if h.phrase == "ai"), 1)
+        self.assertTrue(all(POST.lower()[h.start:].startswith(h.phrase) for h in scan.hits))
+
+    def test_phrase_in_several_gates_is_tagged_for_each(self):
+        matcher = PhraseMatcher({"banned_phrase": ["the best"], "unsupported_claim": ["the best"]})
+        self.assertEqual(set(matcher.scan(POST).gates()), {"banned_phrase", "unsupported_claim"})
+
+    def test_found_follows_registration_order_and_custom_keys(self):
+        matcher = PhraseMatcher()
+        matcher.add("claims", "year", key="second")
+        matcher.add("claims", "programmatic", key="first")
+        self.assertEqual(matcher.scan(POST).found("claims"), ["second", "first"])
+
+    def test_matches_agree_with_naive_substring_checks(self):
+        rng = random.Random(7)
+        words = "the best ai media said attribution in my experience i have seen roi of agent".split()
+        phrases = sorted({" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(200)})
+        matcher = PhraseMatcher({"gate": phrases})
+        for _ in range(50):
+            text = " ".join(rng.choice(words) for _ in range(40)).upper()
+            expected = [p for p in phrases if p in text.lower()]
+            self.assertEqual(matcher.scan(text).found("gate"), expected)
+
+    def test_direct_and_automaton_scans_agree(self):
+        rng = random.Random(11)
+        words = "the best ai media said attribution in my experience i have seen roi of agent".split()
+        phrases = sorted({" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(150)})
+        direct = PhraseMatcher({"gate": phrases, "other": phrases[::3]}).compile()
+        with patch.object(text_analysis, "DIRECT_SCAN_MAX_PHRASES", 0):
+            automaton = PhraseMatcher({"gate": phrases, "other": phrases[::3]}).compile()
+        self.assertTrue(direct._direct)
+        self.assertFalse(automaton._direct)
+        for _ in range(20):
+            text = " ".join(rng.choice(words) for _ in range(40))
+            self.assertEqual(direct.scan(text).hits, automaton.scan(text).hits)
+            self.assertEqual(direct.scan(text).gates(), automaton.scan(text).gates())
+
+    def test_no_phrases_matches_nothing(self):
+        self.assertEqual(PhraseMatcher().scan(POST).hits, [])
+
+
+class TestGuardrailAndEditorGates(unittest.TestCase):
+
+    def test_validate_post_uses_compiled_lists(self):
+        result = validate_post("This deep dive is a GAME CHANGER. Follow for more at HTTPS://x.io")
+        self.assertIn("BANNED_PHRASE:game changer", result.violations)
+        self.assertIn("BANNED_PHRASE:deep dive", result.violations)
+        self.assertIn("ENGAGEMENT_BAIT_LANGUAGE", result.violations)
+        self.assertIn("EXTERNAL_LINK_IN_BODY", result.violations)
+
+    def test_guardrail_gate_matches_validate_post(self):
+        ctx = _context(banned_phrases=["north star"], engagement_bait=["Agree or disagree?"])
+        for content, passed in (
+            ("Retail media measurement is a north star now. Agree or disagree?", True),
+            ("Retail media measurement is a game changer.", False),
+        ):
+            gate = editor._check_guardrails(content, scan=editor.scan_content(content, ctx))
+            self.assertEqual(gate.passed, passed, content)
+            self.assertEqual(gate.passed, validate_post(content).passed, content)
+
+    def test_factual_accuracy_hits_are_tagged(self):
+        ctx = _context()
+        # Key words keep their punctuation, as in the original substring check
+        content = "As CEO I promise guaranteed outcomes or roi. Cryptocurrency, blockchain, and Web3 too."
+        scan = editor.scan_content(content, ctx)
+        gate = editor._check_factual_accuracy(content, ctx, scan)
+
+        self.assertFalse(gate.passed)
+        self.assertIn("Claims title 'ceo'", gate.message)
+        self.assertIn("Potentially banned claim: Guaranteed outcomes or ROI promises", gate.message)
+        self.assertIn("Out-of-scope topic: Cryptocurrency, blockchain, or Web3", gate.message)
+
+    def test_review_scans_content_once(self):
+        ctx = _context()
+        with patch.object(PhraseMatcher, "scan", autospec=True, side_effect=PhraseMatcher.scan) as scan:
+            verdict = editor.review_content(POST, MagicMock(), ctx=ctx)
+        self.assertEqual(scan.call_count, 1)
+        self.assertEqual(len(verdict.gate_results), 7)
+
+    def test_matcher_is_compiled_once_per_context(self):
+        ctx = _context()
+        first = editor.get_editor_phrases(ctx)
+        self.assertIs(editor.get_editor_phrases(ctx), first)
+        self.assertIsNot(editor.get_editor_phrases(_context()), first)
+
+
+class TestScanCostIsFlat(unittest.TestCase):
+
+    def _best_scan_seconds(self, phrase_count):
+        rng = random.Random(phrase_count)
+        alphabet = "abcdefghijklmnopqrstuvwxyz "
+        phrases = {"".join(rng.choice(alphabet) for _ in range(rng.randint(6, 20))) for _ in range(phrase_count)}
+        matcher = PhraseMatcher({"gate": phrases}).compile()
+        text = POST * 8
+        best = float("inf")
+        for _ in range(10):
+            started = time.perf_counter()
+            matcher.scan(text)
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    def test_tenfold_more_phrases_costs_about_the_same(self):
+        small = self._best_scan_seconds(DIRECT_SCAN_MAX_PHRASES * 2)
+        large = self._best_scan_seconds(DIRECT_SCAN_MAX_PHRASES * 20)
+        self.assertLess(large, small * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
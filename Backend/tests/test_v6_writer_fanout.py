@@ -0,0 +1,322 @@
+"""V6 Writer fan-out tests.
+
+Covers:
+- run_writer_fanout claims TODO items and dispatches one write_item per item
+- The in-flight limit bounds claims across all dispatchers and handoff tasks
+- Failed dispatches release their claim; expired claims skip generation
+- Each task carries its claim token and never generates for or releases a newer claim
+- Per-item tasks generate side by side instead of one after another
+- write_item is registered on the writer queue with per-item time limits
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "personal_brand_v6_writer_fanout_test.db")
+os.environ["APP_ENV"] = "test"
+os.environ["TELEGRAM_BOT_TOKEN"] = ""
+os.environ["TELEGRAM_CHAT_ID"] = ""
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import worker
+from app.config import settings
+from app.models import Base, ContentPipelineItem, Draft, PipelineStatus, PostFormat, PostTone
+from app.services.agents import writer
+from app.services.agents.writer import run_writer, run_writer_fanout, write_item
+from app.services.claim_lock import attempt_claim, force_release_claim
+from app.services.stage_handoff import clear_handoff_dedup, on_transition
+
+engine = create_engine(
+    f"sqlite+pysqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False, "timeout": 30},
+)
+Base.metadata.drop_all(engine)
+Base.metadata.create_all(engine)
+Session = sessionmaker(bind=engine)
+
+LLM_LATENCY = 0.2
+
+
+class _FanoutCase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = Session()
+        self.db.query(ContentPipelineItem).delete()
+        self.db.query(Draft).delete()
+        self.db.commit()
+        for name, value in {"writer_max_in_flight": 4, "writer_fanout_batch": 10}.items():
+            patcher = patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.generated = []
+        self.lock = threading.Lock()
+        for target, fake in (
+            ("generate_draft", self._fake_generate),
+            ("select_research_context", lambda db, pillar: ("", [])),
+        ):
+            patcher = patch.object(writer, target, side_effect=fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _fake_generate(self, db, research_context, pillar_override, sub_theme_override):
+        time.sleep(LLM_LATENCY)
+        draft = Draft(
+            pillar_theme=pillar_override,
+            sub_theme=sub_theme_override or "Programmatic buying",
+            format=PostFormat.text,
+            tone=PostTone.educational,
+            content_body="In my experience, retail media measurement starts with finance.",
+        )
+        db.add(draft)
+        db.commit()
+        with self.lock:
+            self.generated.append(draft.id)
+        return SimpleNamespace(success=True, draft=draft, error_message=None)
+
+    def _seed(self, count):
+        base = datetime.now(timezone.utc) - timedelta(hours=1)
+        items = [
+            ContentPipelineItem(
+                status=PipelineStatus.todo,
+                pillar_theme="Adtech fundamentals",
+                created_at=base + timedelta(seconds=n),
+            )
+            for n in range(count)
+        ]
+        self.db.add_all(items)
+        self.db.commit()
+        return [item.id for item in items]
+
+
+class TestDispatch(_FanoutCase):
+
+    def test_one_dispatch_per_claimed_item(self):
+        ids = self._seed(3)
+        dispatch = MagicMock()
+
+        self.assertEqual(run_writer_fanout(self.db, dispatch), 3)
+
+        self.assertEqual({call.args[0] for call in dispatch.call_args_list}, set(ids))
+        worker_ids = {call.args[1] for call in dispatch.call_args_list}
+        self.assertEqual(len(worker_ids), 1)
+        (worker_id,) = worker_ids
+        self.db.expire_all()
+        tokens = {call.args[0]: call.args[2] for call in dispatch.call_args_list}
+        for item_id in ids:
+            item = self.db.get(ContentPipelineItem, item_id)
+            self.assertEqual((item.claimed_by, item.claim_stage), (worker_id, "writing"))
+            self.assertEqual(item.claim_token, tokens[item_id])
+        self.assertEqual(self.generated, [])
+
+    def test_in_flight_limit_bounds_claims(self):
+        ids = self._seed(6)
+        for item_id in ids[:3]:
+            attempt_claim(self.db, item_id, "writing", "writer-busy")
+
+        dispatch = MagicMock()
+        self.assertEqual(run_writer_fanout(self.db, dispatch), 1)
+        self.assertEqual(run_writer_fanout(self.db, dispatch), 0)
+        self.assertEqual(dispatch.call_count, 1)
+
+    def test_failed_dispatch_releases_claim(self):
+        (item_id,) = self._seed(1)
+        dispatch = MagicMock(side_effect=ConnectionError("broker down"))
+
+        self.assertEqual(run_writer_fanout(self.db, dispatch), 0)
+        self.db.expire_all()
+        self.assertIsNone(self.db.get(ContentPipelineItem, item_id).claimed_by)
+
+
+class TestWriteItem(_FanoutCase):
+
+    def test_dispatched_item_is_written(self):
+        (item_id,) = self._seed(1)
+        dispatched = []
+        run_writer_fanout(self.db, lambda *args: dispatched.append(args))
+
+        self.assertEqual(write_item(self.db, *dispatched[0]), "processed")
+        self.db.expire_all()
+        item = self.db.get(ContentPipelineItem, item_id)
+        self.assertEqual(item.status, PipelineStatus.review)
+        self.assertEqual(item.draft_id, self.generated[0])
+        self.assertIsNone(item.claimed_by)
+
+    def test_expired_claim_skips_generation(self):
+        self._seed(1)
+        dispatched = []
+        run_writer_fanout(self.db, lambda *args: dispatched.append(args))
+        force_release_claim(self.db, dispatched[0][0])  # Morgan recovered it
+
+        self.assertEqual(write_item(self.db, *dispatched[0]), "skipped:claim_lost")
+        self.assertEqual(self.generated, [])
+
+    def test_reclaimed_item_is_not_written_for_the_old_token(self):
+        self._seed(1)
+        dispatched = []
+        run_writer_fanout(self.db, lambda *args: dispatched.append(args))
+        item_id, worker_id, token = dispatched[0]
+        force_release_claim(self.db, item_id)
+        attempt_claim(self.db, item_id, "writing", worker_id)
+
+        self.assertEqual(write_item(self.db, item_id, worker_id, token), "skipped:claim_lost")
+        self.assertEqual(self.generated, [])
+
+    def test_pipeline_off_releases_only_the_dispatched_claim(self):
+        self._seed(1)
+        dispatched = []
+        run_writer_fanout(self.db, lambda *args: dispatched.append(args))
+        item_id, worker_id, token = dispatched[0]
+        force_release_claim(self.db, item_id)
+        attempt_claim(self.db, item_id, "writing", worker_id)
+        self.db.expire_all()
+        newer = self.db.get(ContentPipelineItem, item_id).claim_token
+
+        with patch.object(worker, "_get_db_session", side_effect=Session), \
+                patch.object(worker, "_check_should_run_v6", return_value=False):
+            self.assertEqual(worker._task_write_item(str(item_id), worker_id, token), "skipped:pipeline_mode")
+            self.db.expire_all()
+            self.assertEqual(self.db.get(ContentPipelineItem, item_id).claim_token, newer)
+            self.assertEqual(self.db.get(ContentPipelineItem, item_id).claimed_by, worker_id)
+
+            worker._task_write_item(str(item_id), worker_id, newer)
+        self.db.expire_all()
+        self.assertIsNone(self.db.get(ContentPipelineItem, item_id).claimed_by)
+
+    def test_handoff_delivery_claims_for_itself(self):
+        (item_id,) = self._seed(1)
+        self.assertEqual(write_item(self.db, item_id), "processed")
+        self.assertEqual(write_item(self.db, item_id), "skipped:claimed_or_moved")
+
+    def test_handoffs_beyond_the_in_flight_limit_wait_for_the_dispatcher(self):
+        ids = self._seed(10)
+        active, peak = [0], [0]
+        generate = self._fake_generate
+
+        def _counting_generate(*args, **kwargs):
+            with self.lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            try:
+                return generate(*args, **kwargs)
+            finally:
+                with self.lock:
+                    active[0] -= 1
+
+        results = []
+        threads = []
+
+        def _task(item_id):
+            db = Session()
+            try:
+                results.append(write_item(db, uuid.UUID(item_id)))
+            finally:
+                db.close()
+
+        def _send_task(name, args, queue):
+            threads.append(threading.Thread(target=_task, args=(args[0],)))
+            threads[-1].start()
+
+        clear_handoff_dedup()
+        celery = MagicMock()
+        celery.send_task.side_effect = _send_task
+        with patch.object(writer, "generate_draft", side_effect=_counting_generate), \
+                patch.object(worker, "celery_app", celery), \
+                patch.object(settings, "pipeline_handoff_enabled", True), \
+                patch.object(settings, "writer_fanout_enabled", True):
+            for item_id in ids:
+                on_transition(item_id, PipelineStatus.todo, 0)
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(results), 10)
+        self.assertLessEqual(peak[0], settings.writer_max_in_flight)
+        self.assertGreaterEqual(results.count("skipped:no_slot"), 10 - settings.writer_max_in_flight)
+        self.db.expire_all()
+        waiting = [self.db.get(ContentPipelineItem, item_id) for item_id in ids]
+        waiting = [item for item in waiting if item.status == PipelineStatus.todo]
+        self.assertEqual(len(waiting), results.count("skipped:no_slot"))
+        self.assertTrue(all(item.claimed_by is None for item in waiting))
+
+    def test_per_item_tasks_overlap_generation(self):
+        count = 4
+        self._seed(count)
+        dispatched = []
+        run_writer_fanout(self.db, lambda *args: dispatched.append(args))
+
+        def _task(item_id, worker_id, claim_token):
+            db = Session()
+            try:
+                write_item(db, item_id, worker_id, claim_token)
+            finally:
+                db.close()
+
+        threads = [threading.Thread(target=_task, args=args) for args in dispatched]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        fanout_elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(self.generated), count)
+        self.assertLess(fanout_elapsed, LLM_LATENCY * count / 2)
+
+        # The sequential path pays every latency in turn
+        self._seed(count)
+        started = time.perf_counter()
+        run_writer(self.db, max_items=count)
+        self.assertGreaterEqual(time.perf_counter() - started, LLM_LATENCY * count)
+
+
+class TestRegistration(unittest.TestCase):
+
+    def test_write_item_task_has_queue_and_time_limits(self):
+        if worker.celery_app is None:
+            self.skipTest("Celery not installed")
+        task = worker.celery_app.tasks["v6_write_item"]
+        self.assertEqual(task.soft_time_limit, settings.writer_item_soft_time_limit_seconds)
+        self.assertEqual(task.time_limit, settings.writer_item_time_limit_seconds)
+        self.assertEqual(
+            worker.celery_app.conf.task_routes["v6_write_item"]["queue"],
+            settings.writer_queue,
+        )
+
+    def test_todo_handoff_goes_to_writer_queue_in_fanout_mode(self):
+        clear_handoff_dedup()
+        celery = MagicMock()
+        with patch.object(worker, "celery_app", celery), \
+                patch.object(settings, "pipeline_handoff_enabled", True), \
+                patch.object(settings, "writer_fanout_enabled", True):
+            item_id = uuid.uuid4()
+            self.assertTrue(on_transition(item_id, PipelineStatus.todo, 1))
+
+        celery.send_task.assert_called_once_with(
+            "v6_write_item", args=[str(item_id)], queue=settings.writer_queue,
+        )
+
+    def test_beat_writer_task_dispatches_in_fanout_mode(self):
+        with patch.object(settings, "writer_fanout_enabled", True), \
+                patch.object(worker, "_get_db_session", side_effect=Session), \
+                patch.object(worker, "_check_should_run_v6", return_value=True), \
+                patch("app.services.agents.writer.run_writer_fanout", return_value=2) as fanout:
+            self.assertEqual(worker.TASK_REGISTRY["v6_run_writer"](), 2)
+        self.assertIs(fanout.call_args.kwargs["dispatch"], worker._dispatch_write_item)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,6 +33,55 @@ function mockJson(data) {
   });
 }
 
+function isDuePost(post) {
+  return !post.published_at && Boolean(post.scheduled_time) && Date.parse(post.scheduled_time) <= Date.now();
+}
+
+// Mirror the backend list filters so views can ask for filtered pages
+const LIST_FILTERS = {
+  status: (row, value) => String(row.status).toUpperCase() === value.toUpperCase(),
+  escalated: (row, value) => Boolean(row.escalated) === (value === 'true'),
+  replied: (row, value) => Boolean(row.auto_reply_sent) === (value === 'true'),
+  published: (row, value) => Boolean(row.published_at) === (value === 'true'),
+  due: (row, value) => value !== 'true' || isDuePost(row),
+};
+
+// One page of rows; the cursor is the offset of the next page
+function mockPage(rows, params) {
+  const filtered = rows.filter((row) =>
+    Object.entries(LIST_FILTERS).every(([key, matches]) => !params.has(key) || matches(row, params.get(key))),
+  );
+  const offset = Number(params.get('cursor') || 0);
+  const limit = Number(params.get('limit') || 50);
+  const next = offset + limit < filtered.length ? String(offset + limit) : null;
+  const data = filtered.slice(offset, offset + limit);
+  return Promise.resolve({
+    ok: true,
+    status: 200,
+    statusText: 'OK',
+    headers: new Headers(next ? { 'X-Next-Cursor': next } : {}),
+    json: async () => data,
+    text: async () => JSON.stringify(data),
+  });
+}
+
+function mockSummary(state) {
+  const published = state.posts.filter((post) => Boolean(post.published_at)).length;
+  return {
+    posts_total: state.posts.length,
+    posts_published: published,
+    posts_unpublished: state.posts.length - published,
+    posts_due_now: state.posts.filter(isDuePost).length,
+    total_impressions: state.posts.reduce((sum, post) => sum + Number(post.impressions || 0), 0),
+    comments_total: state.comments.length,
+    comments_escalated: state.comments.filter((comment) => comment.escalated).length,
+    comments_replied: state.comments.filter((comment) => comment.auto_reply_sent).length,
+    drafts_total: state.drafts.length,
+    drafts_pending: state.drafts.filter((draft) => draft.status === 'PENDING').length,
+    sources_total: state.sources.length,
+  };
+}
+
 function createApiState(overrides = {}) {
   const baseDraft = {
     id: '11111111-1111-1111-1111-111111111111',
@@ -102,7 +151,7 @@ function setupMockApi(overrides = {}) {
     const parsed = new URL(url);
     const method = (options.method || 'GET').toUpperCase();
     const path = parsed.pathname;
-    calls.push({ method, path, body: options.body || null });
+    calls.push({ method, path, query: parsed.searchParams, body: options.body || null });
 
     // Auth endpoints
     if (method === 'GET' && path === '/auth/me') return mockJson(mockUser);
@@ -116,7 +165,7 @@ function setupMockApi(overrides = {}) {
       return mockJson({ status: 'ok', checks: { database: { ok: true }, redis: { ok: true } } });
     }
     if (method === 'GET' && path === '/health/readiness') return mockJson({ ready: true });
-    if (method === 'GET' && path === '/drafts') return mockJson(state.drafts);
+    if (method === 'GET' && path === '/drafts') return mockPage(state.drafts, parsed.searchParams);
     if (method === 'POST' && path === '/drafts') {
       const payload = JSON.parse(options.body || '{}');
       const created = {
@@ -162,7 +211,7 @@ function setupMockApi(overrides = {}) {
       }
       return mockJson(state.drafts.find((draft) => draft.id === draftId) || state.baseDraft);
     }
-    if (method === 'GET' && path === '/posts') return mockJson(state.posts);
+    if (method === 'GET' && path === '/posts') return mockPage(state.posts, parsed.searchParams);
     if (method === 'POST' && path === '/posts/publish-due') return mockJson({ processed: 0 });
     if (method === 'POST' && path.endsWith('/confirm-manual-publish')) {
       const postId = path.split('/')[2];
@@ -177,7 +226,7 @@ function setupMockApi(overrides = {}) {
       state.posts = state.posts.map((post) => (post.id === postId ? { ...post, ...payload } : post));
       return mockJson(state.posts.find((post) => post.id === postId) || {});
     }
-    if (method === 'GET' && path === '/comments') return mockJson(state.comments);
+    if (method === 'GET' && path === '/comments') return mockPage(state.comments, parsed.searchParams);
     if (method === 'POST' && path === '/comments') {
       const payload = JSON.parse(options.body || '{}');
       const created = {
@@ -193,7 +242,7 @@ function setupMockApi(overrides = {}) {
       state.comments = [created, ...state.comments];
       return mockJson(created);
     }
-    if (method === 'GET' && path === '/sources') return mockJson(state.sources);
+    if (method === 'GET' && path === '/sources') return mockPage(state.sources, parsed.searchParams);
     if (method === 'POST' && path === '/sources/ingest') {
       state.sources = [
         {
@@ -210,6 +259,7 @@ function setupMockApi(overrides = {}) {
     if (method === 'GET' && path === '/learning/weights') return mockJson(state.learning);
     if (method === 'POST' && path === '/learning/recompute') return mockJson(state.learning);
     if (method === 'GET' && path === '/reports/daily') return mockJson(state.report);
+    if (method === 'GET' && path === '/reports/summary') return mockJson(mockSummary(state));
     if (method === 'POST' && path === '/reports/daily/send') {
       return mockJson({ sent: true, date: '2026-02-08' });
     }
@@ -258,7 +308,7 @@ function setupMockApi(overrides = {}) {
 
     // Pipeline endpoints
     if (method === 'GET' && path === '/pipeline/overview') return mockJson(state.pipelineOverview);
-    if (method === 'GET' && path === '/pipeline/items') return mockJson(state.pipelineItems);
+    if (method === 'GET' && path === '/pipeline/items') return mockPage(state.pipelineItems, parsed.searchParams);
     if (method === 'GET' && path === '/pipeline/health') return mockJson(state.pipelineHealth);
     if (method === 'POST' && path.startsWith('/pipeline/run/')) {
       const agent = path.split('/').pop();
@@ -877,7 +927,7 @@ describe('App', () => {
 
   it('filters publish queue by selected state', async () => {
     const now = Date.now();
-    setupMockApi({
+    const { calls } = setupMockApi({
       posts: [
         {
           id: 'due-aaaaaaaa',
@@ -911,6 +961,47 @@ describe('App', () => {
       expect(screen.queryByText('publishe')).not.toBeInTheDocument();
       expect(screen.getAllByText(/due now/i).length).toBeGreaterThan(0);
     });
+    expect(calls.some((call) => call.path === '/posts' && call.query.get('due') === 'true')).toBe(true);
+  });
+
+  it('pages the publish queue with load more and takes counts from the summary', async () => {
+    const posts = Array.from({ length: 7 }, (_, n) => ({
+      id: `queued-${n}-aaaaaaaa`,
+      draft_id: `draft-${n}`,
+      scheduled_time: new Date(Date.now() + 3600_000).toISOString(),
+      published_at: null,
+    }));
+    const { calls } = setupMockApi({ posts });
+    render(<AppWithAuth />);
+
+    await waitFor(() => expect(screen.getByText('Posts tracked: 7')).toBeInTheDocument());
+    expect(screen.getByText('queued-4')).toBeInTheDocument();
+    expect(screen.queryByText('queued-5')).not.toBeInTheDocument();
+    expect(calls.some((call) => call.path === '/reports/summary')).toBe(true);
+    expect(calls.some((call) => call.path === '/comments' || call.path === '/sources')).toBe(false);
+
+    fireEvent.click(screen.getByRole('button', { name: 'Load more' }));
+
+    await waitFor(() => expect(screen.getByText('queued-6')).toBeInTheDocument());
+    expect(screen.queryByRole('button', { name: 'Load more' })).not.toBeInTheDocument();
+    expect(calls.some((call) => call.path === '/posts' && call.query.get('cursor') === '5')).toBe(true);
+  });
+
+  it('asks for pending drafts and escalated comments by filter', async () => {
+    const { calls } = setupMockApi();
+    render(<AppWithAuth />);
+
+    await openView('Content');
+    await waitFor(() => expect(screen.getByText('Pending: 0')).toBeInTheDocument());
+    expect(calls.some((call) => call.path === '/drafts' && call.query.get('status') === 'PENDING')).toBe(true);
+
+    await openView('Engagement');
+    await waitFor(() => expect(screen.getByText('Comments stored')).toBeInTheDocument());
+    fireEvent.click(screen.getByRole('button', { name: 'escalated' }));
+
+    await waitFor(() => {
+      expect(calls.some((call) => call.path === '/comments' && call.query.get('escalated') === 'true')).toBe(true);
+    });
   });
 
   it('restores active view from localStorage on reload', async () => {
@@ -0,0 +1,66 @@
+import { api } from '../services/api';
+
+function page(rows, nextCursor = null) {
+  return Promise.resolve({
+    ok: true,
+    status: 200,
+    statusText: 'OK',
+    headers: new Headers(nextCursor ? { 'X-Next-Cursor': nextCursor } : {}),
+    json: async () => rows,
+    text: async () => JSON.stringify(rows),
+  });
+}
+
+describe('api list endpoints', () => {
+  beforeEach(() => {
+    localStorage.setItem('auth.accessToken', 'mock-access-token');
+  });
+
+  it('fetches one page and returns the next cursor', async () => {
+    const urls = [];
+    global.fetch = vi.fn(async (url) => {
+      urls.push(new URL(url));
+      return page([{ id: 'a' }, { id: 'b' }], 'c1');
+    });
+
+    const result = await api.drafts();
+
+    expect(result).toEqual({ rows: [{ id: 'a' }, { id: 'b' }], nextCursor: 'c1' });
+    expect(urls).toHaveLength(1);
+    expect(urls[0].pathname).toBe('/drafts');
+    expect(urls[0].search).toBe('');
+  });
+
+  it('passes filters and the cursor as query parameters', async () => {
+    const urls = [];
+    global.fetch = vi.fn(async (url) => {
+      urls.push(new URL(url));
+      return page([{ id: 'x' }]);
+    });
+
+    const result = await api.drafts({ status: 'PENDING', limit: 5, cursor: 'c1', pillar: null });
+
+    expect(result.nextCursor).toBeNull();
+    expect(urls[0].searchParams.get('status')).toBe('PENDING');
+    expect(urls[0].searchParams.get('limit')).toBe('5');
+    expect(urls[0].searchParams.get('cursor')).toBe('c1');
+    expect(urls[0].searchParams.has('pillar')).toBe(false);
+  });
+
+  it('sends boolean filters as true/false', async () => {
+    const urls = [];
+    global.fetch = vi.fn(async (url) => {
+      urls.push(new URL(url));
+      return page([]);
+    });
+
+    await api.comments({ escalated: true });
+    await api.posts({ published: false });
+    await api.pipelineItems({ status: 'TODO' });
+
+    expect(urls.map((url) => url.pathname)).toEqual(['/comments', '/posts', '/pipeline/items']);
+    expect(urls[0].searchParams.get('escalated')).toBe('true');
+    expect(urls[1].searchParams.get('published')).toBe('false');
+    expect(urls[2].searchParams.get('status')).toBe('TODO');
+  });
+});
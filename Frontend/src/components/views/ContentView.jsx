@@ -16,6 +16,7 @@ const DRAFT_DEFAULTS = {
   image_url: '',
   carousel_document_url: '',
 };
+const PENDING_QUEUE_SIZE = 5;
 
 function countWords(text) {
   return (text || '').trim().split(/\s+/).filter(Boolean).length;
@@ -47,6 +48,9 @@ export default function ContentView() {
   const [fetchError, setFetchError] = useState('');
 
   const [drafts, setDrafts] = useState([]);
+  const [draftsCursor, setDraftsCursor] = useState(null);
+  const [pendingDrafts, setPendingDrafts] = useState([]);
+  const [summary, setSummary] = useState(null);
   const [selectedDraftId, setSelectedDraftId] = useState('');
   const [rejectReason, setRejectReason] = useState('Not aligned with strategy');
   const [manualDraft, setManualDraft] = useState(DRAFT_DEFAULTS);
@@ -54,10 +58,17 @@ export default function ContentView() {
   async function refreshDrafts() {
     setFetchError('');
     try {
-      const draftRes = await api.drafts();
-      setDrafts(draftRes);
-      if (!selectedDraftId && draftRes[0]?.id) {
-        setSelectedDraftId(draftRes[0].id);
+      const [draftRes, pendingRes, summaryRes] = await Promise.all([
+        api.drafts(),
+        api.drafts({ status: 'PENDING', limit: PENDING_QUEUE_SIZE }),
+        api.summary(),
+      ]);
+      setDrafts(draftRes.rows);
+      setDraftsCursor(draftRes.nextCursor);
+      setPendingDrafts(pendingRes.rows);
+      setSummary(summaryRes);
+      if (!selectedDraftId && draftRes.rows[0]?.id) {
+        setSelectedDraftId(draftRes.rows[0].id);
       }
     } catch (err) {
       setFetchError(String(err.message || err));
@@ -79,6 +90,19 @@ export default function ContentView() {
     }
   }
 
+  async function loadMoreDrafts() {
+    setLoading(true);
+    try {
+      const page = await api.drafts({ cursor: draftsCursor });
+      setDrafts((prev) => [...prev, ...page.rows]);
+      setDraftsCursor(page.nextCursor);
+    } catch (err) {
+      setError(String(err.message || err));
+    } finally {
+      setLoading(false);
+    }
+  }
+
   useEffect(() => {
     (async () => {
       await refreshDrafts();
@@ -87,8 +111,10 @@ export default function ContentView() {
     })();
   }, []);
 
-  const pendingDrafts = useMemo(() => drafts.filter((d) => d.status === 'PENDING'), [drafts]);
-  const selectedDraft = useMemo(() => drafts.find((d) => d.id === selectedDraftId) || pendingDrafts[0] || drafts[0] || null, [drafts, pendingDrafts, selectedDraftId]);
+  const selectedDraft = useMemo(
+    () => [...drafts, ...pendingDrafts].find((d) => d.id === selectedDraftId) || pendingDrafts[0] || drafts[0] || null,
+    [drafts, pendingDrafts, selectedDraftId],
+  );
 
   const publishChecklist = useMemo(() => {
     const content = selectedDraft?.content_body || '';
@@ -130,7 +156,7 @@ export default function ContentView() {
     return <LoadingSpinner label="Loading content..." />;
   }
 
-  if (fetchError && drafts.length === 0) {
+  if (fetchError && !summary) {
     return <ErrorMessage error={`Failed to load drafts: ${fetchError}`} onRetry={() => { setInitialLoading(true); refreshDrafts().finally(() => setInitialLoading(false)); }} />;
   }
 
@@ -147,11 +173,11 @@ export default function ContentView() {
       {error ? <div style={{ background: C.dangerMuted, color: C.danger, border: `1px solid ${C.border}`, borderRadius: '8px', padding: '10px 12px', fontSize: '13px' }}>{error}</div> : null}
 
       <div style={{ background: C.surface, border: `1px solid ${C.border}`, borderRadius: '8px', padding: '16px', display: 'grid', gap: '8px' }}>
-        <div style={{ fontSize: '12px', color: C.textMuted }}>Pending: {pendingDrafts.length}</div>
+        <div style={{ fontSize: '12px', color: C.textMuted }}>Pending: {summary?.drafts_pending ?? 0}</div>
         {pendingDrafts.length === 0 ? (
           <EmptyState title="No pending drafts" message="Click 'Generate' to create a new draft for review." />
         ) : null}
-        {pendingDrafts.slice(0, 5).map((draft) => (
+        {pendingDrafts.map((draft) => (
           <div key={draft.id} style={{ border: `1px solid ${C.border}`, borderRadius: '6px', padding: '10px', display: 'flex', justifyContent: 'space-between', alignItems: 'center' }}>
             <div>
               <strong style={{ color: C.text, fontSize: '13px' }}>{draft.pillar_theme}</strong>
@@ -173,7 +199,7 @@ export default function ContentView() {
         <div style={{ background: C.surface, border: `1px solid ${C.border}`, borderRadius: '8px', overflow: 'hidden' }}>
           <div style={{ padding: '14px 16px', borderBottom: `1px solid ${C.border}` }}>
             <span style={{ fontSize: '12px', color: C.textMuted, fontWeight: 600, textTransform: 'uppercase', letterSpacing: '0.05em' }}>
-              Drafts ({drafts.length})
+              Drafts ({summary?.drafts_total ?? 0})
             </span>
           </div>
           {drafts.map((draft) => (
@@ -203,6 +229,11 @@ export default function ContentView() {
               </p>
             </button>
           ))}
+          {draftsCursor ? (
+            <div style={{ padding: '12px 16px' }}>
+              <Button disabled={loading} variant="ghost" size="sm" onClick={loadMoreDrafts}>Load more</Button>
+            </div>
+          ) : null}
         </div>
 
         <div style={{ background: C.surface, border: `1px solid ${C.border}`, borderRadius: '8px', overflow: 'hidden', display: 'flex', flexDirection: 'column' }}>
@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from 'react';
+import { useEffect, useMemo, useRef, useState } from 'react';
 import { api } from '../../services/api';
 import { C } from '../../constants/theme';
 import Button from '../ui/Button';
@@ -11,6 +11,13 @@ import EmptyState from '../shared/EmptyState';
 const METRIC_DEFAULTS = { impressions: 1000, reactions: 40, comments_count: 8, shares: 3 };
 const ALERT_SNOOZE_KEY = 'app.dashboard.alertSnoozes';
 const SNOOZE_MS = 2 * 60 * 60 * 1000;
+const QUEUE_PAGE_SIZE = 5;
+const QUEUE_FILTER_PARAMS = {
+  all: {},
+  due_now: { due: true },
+  unpublished: { published: false },
+  published: { published: true },
+};
 
 function isDueNow(post) {
   if (!post || post.published_at || !post.scheduled_time) {
@@ -43,10 +50,10 @@ export default function DashboardView() {
   const [health, setHealth] = useState(null);
   const [readiness, setReadiness] = useState(null);
   const [adminConfig, setAdminConfig] = useState(null);
-  const [drafts, setDrafts] = useState([]);
-  const [posts, setPosts] = useState([]);
-  const [comments, setComments] = useState([]);
-  const [sources, setSources] = useState([]);
+  const [summary, setSummary] = useState(null);
+  const [recentPosts, setRecentPosts] = useState([]);
+  const [queuePosts, setQueuePosts] = useState([]);
+  const [queueCursor, setQueueCursor] = useState(null);
   const [report, setReport] = useState(null);
 
   const [publishUrl, setPublishUrl] = useState('https://linkedin.com/feed/update/urn:li:activity:');
@@ -70,32 +77,41 @@ export default function DashboardView() {
       return {};
     }
   });
+  const queueFilterRef = useRef(publishFilter);
+
+  // Load the first page of the queue for a filter, or append the page after cursor
+  async function loadQueue(filter, cursor = null) {
+    queueFilterRef.current = filter;
+    const page = await api.posts({ ...QUEUE_FILTER_PARAMS[filter], limit: QUEUE_PAGE_SIZE, cursor });
+    if (queueFilterRef.current !== filter) {
+      return;
+    }
+    setQueuePosts((prev) => (cursor ? [...prev, ...page.rows] : page.rows));
+    setQueueCursor(page.nextCursor);
+  }
 
   async function refreshData() {
     setFetchError('');
     try {
-      const [healthRes, readinessRes, adminConfigRes, draftsRes, postsRes, commentsRes, sourcesRes, reportRes] = await Promise.all([
+      const [healthRes, readinessRes, adminConfigRes, summaryRes, recentPostsRes, reportRes] = await Promise.all([
         api.health(),
         api.readiness(),
         api.adminConfig(),
-        api.drafts(),
+        api.summary(),
         api.posts(),
-        api.comments(),
-        api.sources(),
         api.dailyReport(),
+        loadQueue(publishFilter),
       ]);
 
       setHealth(healthRes);
       setReadiness(readinessRes);
       setAdminConfig(adminConfigRes);
-      setDrafts(draftsRes);
-      setPosts(postsRes);
-      setComments(commentsRes);
-      setSources(sourcesRes);
+      setSummary(summaryRes);
+      setRecentPosts(recentPostsRes.rows);
       setReport(reportRes);
 
-      if (!metricsTargetPostId && postsRes[0]?.id) {
-        setMetricsTargetPostId(postsRes[0].id);
+      if (!metricsTargetPostId && recentPostsRes.rows[0]?.id) {
+        setMetricsTargetPostId(recentPostsRes.rows[0].id);
       }
     } catch (err) {
       setFetchError(String(err.message || err));
@@ -117,6 +133,26 @@ export default function DashboardView() {
     }
   }
 
+  async function changeQueueFilter(filter) {
+    setPublishFilter(filter);
+    try {
+      await loadQueue(filter);
+    } catch (err) {
+      setError(String(err.message || err));
+    }
+  }
+
+  async function loadMoreQueue() {
+    setLoading(true);
+    try {
+      await loadQueue(publishFilter, queueCursor);
+    } catch (err) {
+      setError(String(err.message || err));
+    } finally {
+      setLoading(false);
+    }
+  }
+
   useEffect(() => {
     (async () => {
       await refreshData();
@@ -162,7 +198,8 @@ export default function DashboardView() {
 
     await api.approveDraft(demoDraft.id);
 
-    const refreshedPosts = await api.posts();
+    // Newest first, so the post created on approval is on the first page
+    const { rows: refreshedPosts } = await api.posts();
     const targetPost = refreshedPosts.find((post) => post.draft_id === demoDraft.id) || refreshedPosts[0];
     if (!targetPost) {
       throw new Error('No published post record created after draft approval');
@@ -181,33 +218,15 @@ export default function DashboardView() {
     await api.sendDailyReport();
   }
 
-  const publishQueueSummary = useMemo(() => {
-    const dueNow = posts.filter((post) => isDueNow(post)).length;
-    const unpublished = posts.filter((post) => !post.published_at).length;
-    const published = posts.filter((post) => Boolean(post.published_at)).length;
-    return {
-      total: posts.length,
-      dueNow,
-      unpublished,
-      published,
-    };
-  }, [posts]);
-
-  const filteredPosts = useMemo(() => {
-    if (publishFilter === 'unpublished') {
-      return posts.filter((post) => !post.published_at);
-    }
-    if (publishFilter === 'published') {
-      return posts.filter((post) => Boolean(post.published_at));
-    }
-    if (publishFilter === 'due_now') {
-      return posts.filter((post) => isDueNow(post));
-    }
-    return posts;
-  }, [posts, publishFilter]);
+  const publishQueueSummary = {
+    total: summary?.posts_total ?? 0,
+    dueNow: summary?.posts_due_now ?? 0,
+    unpublished: summary?.posts_unpublished ?? 0,
+    published: summary?.posts_published ?? 0,
+  };
 
-  const totalImpressions = posts.reduce((sum, post) => sum + Number(post.impressions || 0), 0);
-  const escalatedCount = comments.filter((comment) => comment.escalated).length;
+  const totalImpressions = Number(summary?.total_impressions ?? 0);
+  const escalatedCount = summary?.comments_escalated ?? 0;
   const operationalAlerts = useMemo(() => {
     const alerts = [];
     if (adminConfig?.kill_switch) {
@@ -292,7 +311,7 @@ export default function DashboardView() {
         <MetricCard label="Posts tracked" value={publishQueueSummary.total} />
         <MetricCard label="Impressions" value={totalImpressions.toLocaleString()} />
         <MetricCard label="Escalated comments" value={escalatedCount} accent={C.danger} />
-        <MetricCard label="Sources" value={sources.length} />
+        <MetricCard label="Sources" value={summary?.sources_total ?? 0} />
       </div>
 
       <OperationalAlerts
@@ -325,7 +344,7 @@ export default function DashboardView() {
           <select
             aria-label="Queue filter"
             value={publishFilter}
-            onChange={(e) => setPublishFilter(e.target.value)}
+            onChange={(e) => changeQueueFilter(e.target.value)}
             style={{ background: C.bg, border: `1px solid ${C.border}`, color: C.text, borderRadius: '6px', padding: '8px' }}
           >
             <option value="all">All</option>
@@ -335,14 +354,14 @@ export default function DashboardView() {
           </select>
         </label>
 
-        {posts.length === 0 ? (
+        {publishQueueSummary.total === 0 ? (
           <EmptyState
             title="No posts yet"
             message="Generate and approve a draft to create your first post. Use 'Bootstrap demo' for a quick start."
           />
         ) : (
           <div style={{ display: 'grid', gap: '8px' }}>
-            {filteredPosts.slice(0, 5).map((post) => (
+            {queuePosts.map((post) => (
               <div key={post.id} style={{ border: `1px solid ${C.border}`, borderRadius: '6px', padding: '10px', display: 'flex', justifyContent: 'space-between', alignItems: 'center' }}>
                 <div style={{ fontSize: '12px', color: C.textMuted }}>
                   <strong style={{ color: C.text }}>{post.id.slice(0, 8)}</strong>
@@ -351,6 +370,9 @@ export default function DashboardView() {
                 <Button disabled={loading} size="sm" onClick={() => withAction('Manual publish confirmed', () => api.confirmPublish(post.id, `${publishUrl}${Date.now()}`))}>Confirm publish</Button>
               </div>
             ))}
+            {queueCursor ? (
+              <Button disabled={loading} variant="ghost" size="sm" onClick={loadMoreQueue}>Load more</Button>
+            ) : null}
           </div>
         )}
 
@@ -364,7 +386,7 @@ export default function DashboardView() {
               style={{ background: C.bg, border: `1px solid ${C.border}`, color: C.text, borderRadius: '6px', padding: '8px' }}
             >
               <option value="">Select post</option>
-              {posts.map((post) => (
+              {recentPosts.map((post) => (
                 <option key={post.id} value={post.id}>{post.id}</option>
               ))}
             </select>
@@ -404,7 +426,7 @@ export default function DashboardView() {
           <span style={{ fontSize: '13px', color: C.text, fontWeight: 600 }}>Sources</span>
           <Button disabled={loading} onClick={() => withAction('Sources ingested', () => api.ingestSources(feedInput.split(',').map((s) => s.trim()).filter(Boolean)))}>Ingest</Button>
         </div>
-        <div style={{ fontSize: '12px', color: C.textMuted }}>Sources: {sources.length}</div>
+        <div style={{ fontSize: '12px', color: C.textMuted }}>Sources: {summary?.sources_total ?? 0}</div>
         <label style={{ fontSize: '12px', color: C.textMuted, display: 'grid', gap: '4px' }}>
           Feed URLs (comma separated)
           <textarea rows={3} value={feedInput} onChange={(e) => setFeedInput(e.target.value)} style={{ background: C.bg, border: `1px solid ${C.border}`, color: C.text, borderRadius: '6px', padding: '8px' }} />
@@ -413,7 +435,7 @@ export default function DashboardView() {
 
       <div style={{ background: C.surface, border: `1px solid ${C.border}`, borderRadius: '8px', padding: '16px' }}>
         <span style={{ fontSize: '13px', color: C.text, fontWeight: 600 }}>Draft inventory</span>
-        <div style={{ fontSize: '12px', color: C.textMuted, marginTop: '6px' }}>Pending: {drafts.filter((d) => d.status === 'PENDING').length}</div>
+        <div style={{ fontSize: '12px', color: C.textMuted, marginTop: '6px' }}>Pending: {summary?.drafts_pending ?? 0}</div>
       </div>
     </div>
   );
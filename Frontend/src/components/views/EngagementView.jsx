@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import { api } from '../../services/api';
 import { C } from '../../constants/theme';
 import Button from '../ui/Button';
@@ -8,6 +8,12 @@ import LoadingSpinner from '../shared/LoadingSpinner';
 import ErrorMessage from '../shared/ErrorMessage';
 import EmptyState from '../shared/EmptyState';
 
+const COMMENT_FILTER_PARAMS = {
+  all: {},
+  escalated: { escalated: true },
+  replied: { replied: true },
+};
+
 export default function EngagementView() {
   const [initialLoading, setInitialLoading] = useState(true);
   const [loading, setLoading] = useState(false);
@@ -16,7 +22,9 @@ export default function EngagementView() {
   const [fetchError, setFetchError] = useState('');
 
   const [comments, setComments] = useState([]);
+  const [commentsCursor, setCommentsCursor] = useState(null);
   const [posts, setPosts] = useState([]);
+  const [summary, setSummary] = useState(null);
   const [engagementStatus, setEngagementStatus] = useState(null);
 
   const [filter, setFilter] = useState('all');
@@ -28,19 +36,33 @@ export default function EngagementView() {
     commenter_profile_url: '',
   });
 
+  const filterRef = useRef(filter);
+
+  // Load the first page of comments for a filter, or append the page after cursor
+  async function loadComments(nextFilter, cursor = null) {
+    filterRef.current = nextFilter;
+    const page = await api.comments({ ...COMMENT_FILTER_PARAMS[nextFilter], cursor });
+    if (filterRef.current !== nextFilter) {
+      return;
+    }
+    setComments((prev) => (cursor ? [...prev, ...page.rows] : page.rows));
+    setCommentsCursor(page.nextCursor);
+  }
+
   async function refreshData() {
     setFetchError('');
     try {
-      const [commentsRes, postsRes, engagementStatusRes] = await Promise.all([
-        api.comments(),
+      const [postsRes, summaryRes, engagementStatusRes] = await Promise.all([
         api.posts(),
+        api.summary(),
         api.engagementStatus(),
+        loadComments(filter),
       ]);
-      setComments(commentsRes);
-      setPosts(postsRes);
+      setPosts(postsRes.rows);
+      setSummary(summaryRes);
       setEngagementStatus(engagementStatusRes);
-      if (!commentInput.published_post_id && postsRes[0]?.id) {
-        setCommentInput((prev) => ({ ...prev, published_post_id: postsRes[0].id }));
+      if (!commentInput.published_post_id && postsRes.rows[0]?.id) {
+        setCommentInput((prev) => ({ ...prev, published_post_id: postsRes.rows[0].id }));
       }
     } catch (err) {
       setFetchError(String(err.message || err));
@@ -62,6 +84,26 @@ export default function EngagementView() {
     }
   }
 
+  async function changeFilter(nextFilter) {
+    setFilter(nextFilter);
+    try {
+      await loadComments(nextFilter);
+    } catch (err) {
+      setError(String(err.message || err));
+    }
+  }
+
+  async function loadMoreComments() {
+    setLoading(true);
+    try {
+      await loadComments(filter, commentsCursor);
+    } catch (err) {
+      setError(String(err.message || err));
+    } finally {
+      setLoading(false);
+    }
+  }
+
   useEffect(() => {
     (async () => {
       await refreshData();
@@ -69,18 +111,13 @@ export default function EngagementView() {
     })();
   }, []);
 
-  const escalatedComments = useMemo(() => comments.filter((comment) => comment.escalated), [comments]);
-  const filteredComments = useMemo(() => {
-    if (filter === 'escalated') return comments.filter((comment) => comment.escalated);
-    if (filter === 'replied') return comments.filter((comment) => comment.auto_reply_sent);
-    return comments;
-  }, [comments, filter]);
+  const escalatedCount = summary?.comments_escalated ?? 0;
 
   if (initialLoading) {
     return <LoadingSpinner label="Loading engagement..." />;
   }
 
-  if (fetchError && comments.length === 0) {
+  if (fetchError && !summary) {
     return <ErrorMessage error={`Failed to load engagement: ${fetchError}`} onRetry={() => { setInitialLoading(true); refreshData().finally(() => setInitialLoading(false)); }} />;
   }
 
@@ -97,8 +134,8 @@ export default function EngagementView() {
       {error ? <div style={{ background: C.dangerMuted, color: C.danger, border: `1px solid ${C.border}`, borderRadius: '8px', padding: '10px 12px', fontSize: '13px' }}>{error}</div> : null}
 
       <div style={{ display: 'grid', gridTemplateColumns: 'repeat(3, 1fr)', gap: '16px' }}>
-        <MetricCard label="Comments stored" value={comments.length} />
-        <MetricCard label="Escalated" value={escalatedComments.length} accent={C.danger} />
+        <MetricCard label="Comments stored" value={summary?.comments_total ?? 0} />
+        <MetricCard label="Escalated" value={escalatedCount} accent={C.danger} />
         <MetricCard label="Due for poll" value={engagementStatus?.due_total ?? '-'} />
       </div>
 
@@ -107,7 +144,7 @@ export default function EngagementView() {
           {['all', 'escalated', 'replied'].map((f) => (
             <button
               key={f}
-              onClick={() => setFilter(f)}
+              onClick={() => changeFilter(f)}
               style={{
                 padding: '6px 14px',
                 border: 'none',
@@ -126,11 +163,11 @@ export default function EngagementView() {
         </div>
 
         <div style={{ display: 'grid', gap: '12px', marginTop: '12px' }}>
-          <div style={{ fontSize: '12px', color: C.textMuted }}>Escalated comments: {escalatedComments.length}</div>
-          {filteredComments.length === 0 ? (
+          <div style={{ fontSize: '12px', color: C.textMuted }}>Escalated comments: {escalatedCount}</div>
+          {comments.length === 0 ? (
             <EmptyState title="No comments" message="Comments will appear here once engagement polling detects them on published posts." />
           ) : null}
-          {filteredComments.map((comment) => (
+          {comments.map((comment) => (
             <div key={comment.id} style={{ background: C.bg, border: `1px solid ${comment.escalated ? 'rgba(248,113,113,0.2)' : C.border}`, borderRadius: '8px', padding: '12px' }}>
               <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'flex-start', marginBottom: '8px' }}>
                 <div>
@@ -146,6 +183,9 @@ export default function EngagementView() {
               <p style={{ fontSize: '13px', color: C.textMuted, margin: 0 }}>{comment.comment_text}</p>
             </div>
           ))}
+          {commentsCursor ? (
+            <Button disabled={loading} variant="ghost" size="sm" onClick={loadMoreComments}>Load more</Button>
+          ) : null}
         </div>
       </div>
 
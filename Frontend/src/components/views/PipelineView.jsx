@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import { api } from '../../services/api';
 import { C, formatDate, formatTime, truncate } from '../../constants/theme';
 import Button from '../ui/Button';
@@ -13,6 +13,8 @@ const PIPELINE_STATUSES = [
   'READY_TO_PUBLISH', 'PUBLISHED', 'AMPLIFIED', 'DONE',
 ];
 
+const ITEMS_PAGE_SIZE = 20;
+
 const AGENTS = [
   { id: 'scout', label: 'Scout', description: 'Scan sources and seed backlog' },
   { id: 'writer', label: 'Writer', description: 'Generate drafts from TODO items' },
@@ -42,21 +44,38 @@ export default function PipelineView() {
 
   const [overview, setOverview] = useState(null);
   const [items, setItems] = useState([]);
+  const [itemsCursor, setItemsCursor] = useState(null);
   const [health, setHealth] = useState(null);
   const [pipelineMode, setPipelineMode] = useState(null);
   const [statusFilter, setStatusFilter] = useState('all');
 
+  const statusFilterRef = useRef(statusFilter);
+
+  // Load the first page of items for a status, or append the page after cursor
+  async function loadItems(status, cursor = null) {
+    statusFilterRef.current = status;
+    const page = await api.pipelineItems({
+      status: status === 'all' ? null : status,
+      limit: ITEMS_PAGE_SIZE,
+      cursor,
+    });
+    if (statusFilterRef.current !== status) {
+      return;
+    }
+    setItems((prev) => (cursor ? [...prev, ...page.rows] : page.rows));
+    setItemsCursor(page.nextCursor);
+  }
+
   async function refreshData() {
     setFetchError('');
     try {
-      const [overviewRes, itemsRes, healthRes, configRes] = await Promise.all([
+      const [overviewRes, healthRes, configRes] = await Promise.all([
         api.pipelineOverview(),
-        api.pipelineItems(),
         api.pipelineHealth(),
         api.adminConfig(),
+        loadItems(statusFilter),
       ]);
       setOverview(overviewRes);
-      setItems(itemsRes);
       setHealth(healthRes);
       setPipelineMode(configRes?.pipeline_mode || 'LEGACY');
     } catch (err) {
@@ -79,6 +98,26 @@ export default function PipelineView() {
     }
   }
 
+  async function changeStatusFilter(status) {
+    setStatusFilter(status);
+    try {
+      await loadItems(status);
+    } catch (err) {
+      setError(String(err.message || err));
+    }
+  }
+
+  async function loadMoreItems() {
+    setLoading(true);
+    try {
+      await loadItems(statusFilter, itemsCursor);
+    } catch (err) {
+      setError(String(err.message || err));
+    } finally {
+      setLoading(false);
+    }
+  }
+
   useEffect(() => {
     (async () => {
       await refreshData();
@@ -86,11 +125,6 @@ export default function PipelineView() {
     })();
   }, []);
 
-  const filteredItems = useMemo(() => {
-    if (statusFilter === 'all') return items;
-    return items.filter((item) => item.status === statusFilter);
-  }, [items, statusFilter]);
-
   const statusCounts = overview?.status_counts || {};
 
   if (initialLoading) {
@@ -185,7 +219,7 @@ export default function PipelineView() {
             return (
               <button
                 key={status}
-                onClick={() => setStatusFilter(isActive ? 'all' : status)}
+                onClick={() => changeStatusFilter(isActive ? 'all' : status)}
                 style={{
                   flex: 1,
                   padding: '10px 6px',
@@ -251,7 +285,7 @@ export default function PipelineView() {
             <select
               aria-label="Pipeline status filter"
               value={statusFilter}
-              onChange={(e) => setStatusFilter(e.target.value)}
+              onChange={(e) => changeStatusFilter(e.target.value)}
               style={{ background: C.bg, border: `1px solid ${C.border}`, color: C.text, borderRadius: '6px', padding: '6px 8px', fontSize: '12px' }}
             >
               <option value="all">All statuses</option>
@@ -262,14 +296,14 @@ export default function PipelineView() {
           </div>
         </div>
 
-        {filteredItems.length === 0 ? (
+        {items.length === 0 ? (
           <EmptyState
             title="No pipeline items"
             message="Run the Scout agent to seed the pipeline backlog from research sources."
           />
         ) : (
           <div style={{ display: 'grid', gap: '8px' }}>
-            {filteredItems.slice(0, 20).map((item) => (
+            {items.map((item) => (
               <div
                 key={item.id}
                 style={{
@@ -315,6 +349,9 @@ export default function PipelineView() {
                 </div>
               </div>
             ))}
+            {itemsCursor ? (
+              <Button disabled={loading} variant="ghost" size="sm" onClick={loadMoreItems}>Load more</Button>
+            ) : null}
           </div>
         )}
       </div>
@@ -92,7 +92,8 @@ async function refreshAccessToken() {
   return data.access_token;
 }
 
-async function request(path, options = {}, skipAuth = false) {
+// Send an authenticated request and return the raw Response (throws on non-2xx)
+async function send(path, options = {}, skipAuth = false) {
   const headers = { ...(options.headers || {}) };
 
   if (options.body !== undefined && !headers['Content-Type']) {
@@ -165,12 +166,37 @@ async function request(path, options = {}, skipAuth = false) {
     throw new Error(`API ${response.status} ${response.statusText}: ${body}`);
   }
 
+  return response;
+}
+
+async function request(path, options = {}, skipAuth = false) {
+  const response = await send(path, options, skipAuth);
   if (response.status === 204) {
     return null;
   }
   return response.json();
 }
 
+// List endpoints return one page; the next page's cursor is in this header
+const NEXT_CURSOR_HEADER = 'X-Next-Cursor';
+
+// Fetch one page of a list endpoint. Filters and the cursor go in the query
+// string; pass the returned nextCursor back as params.cursor for the next page.
+async function requestPage(path, params = {}) {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== '') {
+      query.set(key, String(value));
+    }
+  });
+  const queryString = query.toString();
+  const response = await send(queryString ? `${path}?${queryString}` : path);
+  return {
+    rows: await response.json(),
+    nextCursor: response.headers?.get(NEXT_CURSOR_HEADER) || null,
+  };
+}
+
 export const api = {
   // Auth endpoints
   login: async (emailOrUsername, password) => {
@@ -239,13 +265,13 @@ export const api = {
   readiness: () => request('/health/readiness', {}, true),
 
   // Protected endpoints
-  drafts: () => request('/drafts'),
+  drafts: (params) => requestPage('/drafts', params),
   createDraft: (payload) => request('/drafts', { method: 'POST', body: JSON.stringify(payload) }),
   generateDraft: () => request('/drafts/generate', { method: 'POST' }),
   approveDraft: (id) => request(`/drafts/${id}/approve`, { method: 'POST', body: JSON.stringify({}) }),
   rejectDraft: (id, reason) => request(`/drafts/${id}/reject`, { method: 'POST', body: JSON.stringify({ reason }) }),
 
-  posts: () => request('/posts'),
+  posts: (params) => requestPage('/posts', params),
   publishDue: () => request('/posts/publish-due', { method: 'POST' }),
   confirmPublish: (id, linkedinPostUrl) =>
     request(`/posts/${id}/confirm-manual-publish`, {
@@ -254,18 +280,19 @@ export const api = {
     }),
   updateMetrics: (id, payload) => request(`/posts/${id}/metrics`, { method: 'POST', body: JSON.stringify(payload) }),
 
-  comments: () => request('/comments'),
+  comments: (params) => requestPage('/comments', params),
   createComment: (payload) => request('/comments', { method: 'POST', body: JSON.stringify(payload) }),
   pollEngagement: () => request('/engagement/poll', { method: 'POST' }),
   engagementStatus: () => request('/engagement/status'),
 
-  sources: () => request('/sources'),
+  sources: (params) => requestPage('/sources', params),
   ingestSources: (feedUrls) => request('/sources/ingest', { method: 'POST', body: JSON.stringify({ feed_urls: feedUrls }) }),
 
   learningWeights: () => request('/learning/weights'),
   recomputeLearning: () => request('/learning/recompute', { method: 'POST' }),
 
   dailyReport: () => request('/reports/daily'),
+  summary: () => request('/reports/summary'),
   sendDailyReport: () => request('/reports/daily/send', { method: 'POST' }),
 
   adminConfig: () => request('/admin/config'),
@@ -281,7 +308,7 @@ export const api = {
 
   // Pipeline endpoints
   pipelineOverview: () => request('/pipeline/overview'),
-  pipelineItems: (status) => request(`/pipeline/items${status ? `?status=${status}` : ''}`),
+  pipelineItems: (params) => requestPage('/pipeline/items', params),
   pipelineItem: (id) => request(`/pipeline/items/${id}`),
   pipelineTransition: (id, toStatus) => request(`/pipeline/items/${id}/transition`, { method: 'POST', body: JSON.stringify({ to_status: toStatus }) }),
   pipelineHealth: () => request('/pipeline/health'),